@@ -1,5 +1,5 @@
-from .mpesa_client import MpesaClient
+from .mpesa_client import AsyncMpesaClient, MpesaClient
 
-__all__ = ["MpesaClient"]
+__all__ = ["AsyncMpesaClient", "MpesaClient"]
 
 __version__ = "2.0.0"
@@ -7,9 +7,10 @@ from .schemas import (
     AccountBalanceTimeoutCallback,
     AccountBalanceTimeoutCallbackResponse,
 )
-from .account_balance import AccountBalance
+from .account_balance import AsyncAccountBalance, AccountBalance
 
 __all__ = [
+    "AsyncAccountBalance",
     "AccountBalance",
     "AccountBalanceRequest",
     "AccountBalanceResponse",
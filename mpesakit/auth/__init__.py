@@ -1,4 +1,22 @@
 from .access_token import AccessToken
-from .token_manager import TokenManager
+from .token_store import InMemoryTokenStore, SQLiteTokenStore, TokenStore
+from .token_manager import AsyncTokenManager, TokenManager
+from .token_registry import (
+    AsyncTenantTokenManager,
+    AsyncTokenRegistry,
+    TenantTokenManager,
+    TokenRegistry,
+)
 
-__all__ = ["AccessToken", "TokenManager"]
+__all__ = [
+    "AccessToken",
+    "AsyncTenantTokenManager",
+    "AsyncTokenManager",
+    "AsyncTokenRegistry",
+    "InMemoryTokenStore",
+    "SQLiteTokenStore",
+    "TenantTokenManager",
+    "TokenManager",
+    "TokenRegistry",
+    "TokenStore",
+]
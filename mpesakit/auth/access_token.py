@@ -1,22 +1,55 @@
 """This module defines the AccessToken class, representing an access token."""
 
-from pydantic import BaseModel, ConfigDict
-from datetime import datetime, timedelta
-from typing import ClassVar
+import time
+from pydantic import BaseModel, ConfigDict, PrivateAttr
+from datetime import datetime
+from typing import Any, ClassVar
 
 
 class AccessToken(BaseModel):
-    """Represents an access token with its value, creation time, and expiration duration."""
+    """Represents an access token with its value, creation time, and expiration duration.
+
+    Expiry is tracked against the monotonic clock, anchored once when the token is
+    created, so wall-clock adjustments on the host cannot make a stale token look
+    valid or a fresh token look expired.
+    """
 
     token: str
     creation_datetime: datetime
     expiration_time: int = 3600  # in seconds, default value
     model_config: ClassVar[ConfigDict] = {"arbitrary_types_allowed": True}
 
-    def is_expired(self) -> bool:
-        """Check if the token is expired based on creation time and expiration time."""
-        current_time = datetime.now()
-        expiration_datetime = self.creation_datetime + timedelta(
-            seconds=self.expiration_time
-        )
-        return current_time > expiration_datetime
+    _created_monotonic: float = PrivateAttr(default=0.0)
+
+    def model_post_init(self, __context: Any) -> None:
+        """Anchor the creation time to the monotonic clock."""
+        now = datetime.now(self.creation_datetime.tzinfo)
+        age = max((now - self.creation_datetime).total_seconds(), 0.0)
+        self._created_monotonic = time.monotonic() - age
+
+    def age(self) -> float:
+        """Return the number of seconds elapsed since the token was created."""
+        return time.monotonic() - self._created_monotonic
+
+    def remaining(self) -> float:
+        """Return the number of seconds left before the token expires."""
+        return self.expiration_time - self.age()
+
+    def is_expired(self, skew_seconds: float = 0.0) -> bool:
+        """Check if the token is expired based on creation time and expiration time.
+
+        Args:
+            skew_seconds (float): Safety margin subtracted from the token lifetime, so a
+                token about to expire is treated as already expired. Capped at half the
+                lifetime so short-lived tokens remain usable.
+        """
+        skew = min(skew_seconds, self.expiration_time / 2)
+        return self.remaining() <= skew
+
+    def refresh_delay(self, refresh_ratio: float) -> float:
+        """Return the seconds to wait before the token should be proactively renewed.
+
+        Args:
+            refresh_ratio (float): Fraction of the lifetime after which to renew, e.g. 0.8.
+        """
+        return max(self.expiration_time * refresh_ratio - self.age(), 0.0)
@@ -1,86 +1,539 @@
 """TokenManager: Handles retrieval, storage, and refreshing of access tokens for M-Pesa API authentication."""
 
+import asyncio
 import base64
+import hashlib
+import threading
+import weakref
 from datetime import datetime
-from pydantic import BaseModel, PrivateAttr, ConfigDict
-from typing import Optional, ClassVar
+from pydantic import BaseModel, Field, PrivateAttr, ConfigDict
+from typing import Any, Dict, Optional, ClassVar
 
-from mpesakit.http_client import HttpClient
+from mpesakit.http_client import AsyncHttpClient, HttpClient
+from mpesakit.http_client.fork import register_after_fork
+from mpesakit.http_client.loop_clients import LoopLocal
+from mpesakit.http_client.timeouts import (
+    check_deadline,
+    deadline_exceeded,
+    remaining_time,
+)
 from mpesakit.auth import AccessToken
 from mpesakit.errors import MpesaError, MpesaApiException
+from .token_store import InMemoryTokenStore, TokenStore
+
+OAUTH_URL = "/oauth/v1/generate"
+OAUTH_PARAMS = {"grant_type": "client_credentials"}
+
+# Minimum pause between background refreshes, and the pause after a failed one.
+_MIN_REFRESH_INTERVAL = 1.0
+_REFRESH_RETRY_INTERVAL = 5.0
+
+
+def _basic_auth_header(consumer_key: str, consumer_secret: str) -> str:
+    credentials = f"{consumer_key}:{consumer_secret}"
+    encoded_credentials = base64.b64encode(credentials.encode("utf-8")).decode("utf-8")
+    return f"Basic {encoded_credentials}"
+
+
+def _translate_auth_error(e: MpesaApiException) -> MpesaApiException:
+    """Maps the empty-bodied 400 returned for bad credentials to a descriptive error."""
+    if e.error.status_code == 400 and (
+        e.error.error_message is None or len(e.error.error_message) == 0
+    ):
+        return MpesaApiException(
+            MpesaError(
+                error_code="AUTH_INVALID_CREDENTIALS",
+                error_message="Invalid credentials provided. Please check your consumer key and secret.",
+                status_code=400,
+            )
+        )
+    return e
+
+
+def _access_token_from_response(response: Dict[str, Any]) -> AccessToken:
+    token = response.get("access_token")
+    expires_in = int(response.get("expires_in", 3600))
+
+    if not token:
+        raise MpesaApiException(
+            MpesaError(
+                error_code="TOKEN_MISSING",
+                error_message="No access token returned by Mpesa API.",
+                status_code=None,
+                raw_response=response,
+            )
+        )
+
+    return AccessToken(
+        token=token,
+        creation_datetime=datetime.now(),
+        expiration_time=expires_in,
+    )
+
+
+def _token_store_key(consumer_key: str, http_client: Any) -> str:
+    """Derives the store key for a consumer key without storing the key itself."""
+    base_url = getattr(http_client, "base_url", "")
+    return hashlib.sha256(f"{base_url}|{consumer_key}".encode("utf-8")).hexdigest()
+
+
+def _is_reusable(
+    token: Optional[AccessToken],
+    stale_token: Optional[str],
+    expiry_skew: float,
+    refresh_ratio: Optional[float] = None,
+) -> bool:
+    """Whether a cached or stored token can be used instead of fetching a new one.
+
+    Args:
+        token: Candidate token.
+        stale_token: Token value known to be rejected; never reused.
+        expiry_skew: Safety margin before expiry, in seconds.
+        refresh_ratio: If given, tokens already due for proactive renewal are rejected.
+    """
+    if token is None or token.token == stale_token or token.is_expired(expiry_skew):
+        return False
+    return refresh_ratio is None or token.refresh_delay(refresh_ratio) > 0
+
+
+def _acquire_store_lock(store: TokenStore, key: str) -> str:
+    """Takes the store's refresh lock for key, waiting no longer than the deadline.
+
+    Raises:
+        MpesaApiException: With error code DEADLINE_EXCEEDED if the current
+            deadline passes first, or TOKEN_LOCK_TIMEOUT if the store gives up.
+    """
+    try:
+        return store.acquire(key, remaining_time())
+    except MpesaApiException as e:
+        if e.error_code == "TOKEN_LOCK_TIMEOUT" and remaining_time() == 0.0:
+            raise deadline_exceeded() from None
+        raise
+
+
+def _run_refresher(
+    manager_ref: "weakref.ReferenceType[TokenManager]", stop: threading.Event
+) -> None:
+    """Background thread body; exits once stopped or the manager is garbage collected."""
+    delay = 0.0
+    while not stop.wait(delay):
+        manager = manager_ref()
+        if manager is None:
+            return
+        try:
+            delay = manager._refresh_ahead()
+        except Exception:
+            delay = _REFRESH_RETRY_INTERVAL
+        del manager
+
+
+async def _run_async_refresher(
+    manager_ref: "weakref.ReferenceType[AsyncTokenManager]",
+) -> None:
+    """Background task body; exits once cancelled or the manager is garbage collected."""
+    delay = 0.0
+    while True:
+        await asyncio.sleep(delay)
+        manager = manager_ref()
+        if manager is None:
+            return
+        try:
+            delay = await manager._refresh_ahead()
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            delay = _REFRESH_RETRY_INTERVAL
+        del manager
 
 
 class TokenManager(BaseModel):
-    """Handles retrieval, storage, and refreshing of access tokens for M-Pesa API authentication."""
+    """Handles retrieval, storage, and refreshing of access tokens for M-Pesa API authentication.
+
+    TokenManager is safe to share between threads. Refreshes are single-flight: when
+    the cached token is missing or expired, exactly one caller requests a new token
+    while concurrent callers wait for, and reuse, its result.
+
+    Tokens are treated as expired ``expiry_skew`` seconds early. Calling
+    ``start_background_refresh()`` additionally renews the token in a daemon thread
+    once ``refresh_ratio`` of its lifetime has elapsed, so requests on the hot path
+    never wait for the OAuth round-trip.
+
+    Tokens are read through ``token_store``. Pass a shared store, such as a
+    SQLiteTokenStore, to reuse one token across processes; refreshes are then
+    coordinated through the store's lock so only one process refreshes at a time.
+    """
 
     consumer_key: str
     consumer_secret: str
     http_client: HttpClient
+    refresh_ratio: float = Field(default=0.8, gt=0, le=1)
+    expiry_skew: float = Field(default=60.0, ge=0)
+    token_store: TokenStore = Field(default_factory=InMemoryTokenStore)
 
     _access_token: Optional[AccessToken] = PrivateAttr(default=None)
+    _previous_token: Optional[str] = PrivateAttr(default=None)
+    _refresh_lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
+    _generation: int = PrivateAttr(default=0)
+    _refresher: Optional[threading.Thread] = PrivateAttr(default=None)
+    _stop_refresher: threading.Event = PrivateAttr(default_factory=threading.Event)
 
     model_config: ClassVar[ConfigDict] = {"arbitrary_types_allowed": True}
 
+    def model_post_init(self, __context: Any) -> None:
+        """Register with the HTTP client so it can replace tokens the API rejects."""
+        self.http_client.register_token_source(self)
+        register_after_fork(self)
+
     def _get_basic_auth_header(self) -> str:
-        credentials = f"{self.consumer_key}:{self.consumer_secret}"
-        encoded_credentials = base64.b64encode(credentials.encode("utf-8")).decode(
-            "utf-8"
+        return _basic_auth_header(self.consumer_key, self.consumer_secret)
+
+    def has_issued(self, token: str) -> bool:
+        """Whether token is the current or the previous token handed out by this manager."""
+        access_token = self._access_token
+        return token == self._previous_token or (
+            access_token is not None and token == access_token.token
         )
-        return f"Basic {encoded_credentials}"
 
-    def get_token(self, force_refresh: bool = False) -> str:
+    def get_token(
+        self, force_refresh: bool = False, stale_token: Optional[str] = None
+    ) -> str:
         """Retrieves the access token, refreshing it if necessary.
 
         Args:
             force_refresh (bool): If True, forces a refresh of the token even if it is not expired.
+            stale_token (Optional[str]): With force_refresh, the token that was rejected.
+                The refresh is skipped if the cached token has already replaced it.
 
         Returns:
             str: The access token string.
+
+        Raises:
+            MpesaApiException: With error code DEADLINE_EXCEEDED if the current
+                deadline passes before a refresh could start.
         """
         # Check if the token is already available and not expired
+        access_token = self._access_token
         if (
-            self._access_token
-            and not self._access_token.is_expired()
+            access_token
+            and not access_token.is_expired(self.expiry_skew)
             and not force_refresh
         ):
-            return self._access_token.token
+            return access_token.token
+
+        seen_generation = self._generation
+        if force_refresh and stale_token is None and access_token:
+            stale_token = access_token.token
+        remaining = remaining_time()
+        if not self._refresh_lock.acquire(timeout=-1 if remaining is None else remaining):
+            raise deadline_exceeded()
+        try:
+            # Another caller may have refreshed the token while we were waiting.
+            access_token = self._access_token
+            if (
+                access_token
+                and not access_token.is_expired(self.expiry_skew)
+                and (
+                    not force_refresh
+                    or self._generation != seen_generation
+                    or access_token.token != stale_token
+                )
+            ):
+                return access_token.token
+
+            check_deadline()
+            return self._load_or_refresh(stale_token)
+        finally:
+            self._refresh_lock.release()
+
+    def start_background_refresh(self) -> None:
+        """Start renewing the token proactively in a background daemon thread.
+
+        The token is fetched straight away if none is cached, then renewed each time
+        ``refresh_ratio`` of its lifetime has elapsed. Failed refreshes are retried
+        after a short pause while the current token stays in use. Calling this while
+        the refresher is already running has no effect.
+        """
+        if self._refresher is not None and self._refresher.is_alive():
+            return
+        self._stop_refresher = threading.Event()
+        self._refresher = threading.Thread(
+            target=_run_refresher,
+            args=(weakref.ref(self), self._stop_refresher),
+            name="mpesakit-token-refresher",
+            daemon=True,
+        )
+        self._refresher.start()
+
+    def stop_background_refresh(self, timeout: Optional[float] = None) -> None:
+        """Stop the background refresher started by start_background_refresh().
+
+        Args:
+            timeout (Optional[float]): Maximum seconds to wait for the thread to exit.
+        """
+        self._stop_refresher.set()
+        if self._refresher is not None:
+            self._refresher.join(timeout)
+            self._refresher = None
+
+    def _after_fork(self) -> None:
+        """Resets the refresh lock and refresher in a forked child, keeping the token.
+
+        The lock may have been held by another thread of the parent at fork time,
+        and the refresher thread does not exist in the child; it is restarted if it
+        was running.
+        """
+        was_refreshing = self._refresher is not None
+        self._refresh_lock = threading.Lock()
+        self._refresher = None
+        self._stop_refresher = threading.Event()
+        if was_refreshing:
+            self.start_background_refresh()
+
+    def _refresh_ahead(self) -> float:
+        """Renew the token if it is due and return the seconds until the next renewal."""
+        with self._refresh_lock:
+            access_token = self._access_token
+            if access_token is None or access_token.refresh_delay(self.refresh_ratio) <= 0:
+                stale_token = access_token.token if access_token else None
+                self._load_or_refresh(stale_token, self.refresh_ratio)
+                access_token = self._access_token
+            if access_token is None:
+                return _REFRESH_RETRY_INTERVAL
+            return max(
+                access_token.refresh_delay(self.refresh_ratio), _MIN_REFRESH_INTERVAL
+            )
+
+    def _load_or_refresh(
+        self, stale_token: Optional[str], refresh_ratio: Optional[float] = None
+    ) -> str:
+        """Adopts a usable token from the store, or fetches one under the store lock.
+
+        Must be called with _refresh_lock held.
+        """
+        key = _token_store_key(self.consumer_key, self.http_client)
+        stored = self.token_store.load(key)
+        if stored is None or not _is_reusable(
+            stored, stale_token, self.expiry_skew, refresh_ratio
+        ):
+            handle = _acquire_store_lock(self.token_store, key)
+            try:
+                # Another process may have refreshed while we waited for the lock.
+                stored = self.token_store.load(key)
+                if stored is None or not _is_reusable(
+                    stored, stale_token, self.expiry_skew, refresh_ratio
+                ):
+                    stored = self._fetch_token()
+                    self.token_store.save(key, stored)
+            finally:
+                self.token_store.release(key, handle)
+
+        if self._access_token is not None and self._access_token.token != stored.token:
+            self._previous_token = self._access_token.token
+        self._access_token = stored
+        self._generation += 1
+        return stored.token
 
-        url = "/oauth/v1/generate"
-        params = {"grant_type": "client_credentials"}
+    def _fetch_token(self) -> AccessToken:
         headers = {"Authorization": self._get_basic_auth_header()}
 
         try:
-            response = self.http_client.get(url, headers=headers, params=params)
+            response = self.http_client.get(
+                OAUTH_URL, headers=headers, params=OAUTH_PARAMS
+            )
         except MpesaApiException as e:
-            if e.error.status_code == 400 and (
-                e.error.error_message is None or len(e.error.error_message) == 0
-            ):
-                raise MpesaApiException(
-                    MpesaError(
-                        error_code="AUTH_INVALID_CREDENTIALS",
-                        error_message="Invalid credentials provided. Please check your consumer key and secret.",
-                        status_code=400,
-                    )
-                ) from e  # Preserve traceback
-            # Re-raise other errors as-is
-            raise
+            translated = _translate_auth_error(e)
+            if translated is e:
+                # Re-raise other errors as-is
+                raise
+            raise translated from e  # Preserve traceback
+
+        return _access_token_from_response(response)
 
-        token = response.get("access_token")
-        expires_in = int(response.get("expires_in", 3600))
 
-        if not token:
-            raise MpesaApiException(
-                MpesaError(
-                    error_code="TOKEN_MISSING",
-                    error_message="No access token returned by Mpesa API.",
-                    status_code=None,
-                    raw_response=response,
+class AsyncTokenManager(BaseModel):
+    """Asynchronous counterpart of TokenManager for use with an AsyncHttpClient.
+
+    Retrieves, caches and refreshes access tokens without blocking the event loop.
+    Refreshes are single-flight among the tasks of one event loop. Tasks on
+    different loops wait for a refresh of their own loop; the token store's lock
+    serializes those, and each one after the first adopts the token it stored
+    rather than fetching another. ``start_background_refresh()`` renews the token
+    ahead of expiry in an asyncio task. Token store operations run in a worker
+    thread so they never block the loop.
+    """
+
+    consumer_key: str
+    consumer_secret: str
+    http_client: AsyncHttpClient
+    refresh_ratio: float = Field(default=0.8, gt=0, le=1)
+    expiry_skew: float = Field(default=60.0, ge=0)
+    token_store: TokenStore = Field(default_factory=InMemoryTokenStore)
+
+    _access_token: Optional[AccessToken] = PrivateAttr(default=None)
+    _previous_token: Optional[str] = PrivateAttr(default=None)
+    _refresh_locks: LoopLocal[asyncio.Lock] = PrivateAttr(
+        default_factory=lambda: LoopLocal(asyncio.Lock)
+    )
+    _generation: int = PrivateAttr(default=0)
+    _refresher: Optional["asyncio.Task[None]"] = PrivateAttr(default=None)
+
+    model_config: ClassVar[ConfigDict] = {"arbitrary_types_allowed": True}
+
+    def model_post_init(self, __context: Any) -> None:
+        """Register with the HTTP client so it can replace tokens the API rejects."""
+        self.http_client.register_token_source(self)
+        register_after_fork(self)
+
+    def _get_basic_auth_header(self) -> str:
+        return _basic_auth_header(self.consumer_key, self.consumer_secret)
+
+    def has_issued(self, token: str) -> bool:
+        """Whether token is the current or the previous token handed out by this manager."""
+        access_token = self._access_token
+        return token == self._previous_token or (
+            access_token is not None and token == access_token.token
+        )
+
+    async def get_token(
+        self, force_refresh: bool = False, stale_token: Optional[str] = None
+    ) -> str:
+        """Retrieves the access token, refreshing it if necessary.
+
+        Args:
+            force_refresh (bool): If True, forces a refresh of the token even if it is not expired.
+            stale_token (Optional[str]): With force_refresh, the token that was rejected.
+                The refresh is skipped if the cached token has already replaced it.
+
+        Returns:
+            str: The access token string.
+
+        Raises:
+            MpesaApiException: With error code DEADLINE_EXCEEDED if the current
+                deadline passes before a refresh could start.
+        """
+        access_token = self._access_token
+        if (
+            access_token
+            and not access_token.is_expired(self.expiry_skew)
+            and not force_refresh
+        ):
+            return access_token.token
+
+        seen_generation = self._generation
+        if force_refresh and stale_token is None and access_token:
+            stale_token = access_token.token
+        refresh_lock = self._refresh_locks.get()
+        try:
+            await asyncio.wait_for(refresh_lock.acquire(), remaining_time())
+        except asyncio.TimeoutError:
+            raise deadline_exceeded() from None
+        try:
+            # Another caller may have refreshed the token while we were waiting.
+            access_token = self._access_token
+            if (
+                access_token
+                and not access_token.is_expired(self.expiry_skew)
+                and (
+                    not force_refresh
+                    or self._generation != seen_generation
+                    or access_token.token != stale_token
                 )
-            )
+            ):
+                return access_token.token
+
+            check_deadline()
+            return await self._load_or_refresh(stale_token)
+        finally:
+            refresh_lock.release()
 
-        self._access_token = AccessToken(
-            token=token,
-            creation_datetime=datetime.now(),
-            expiration_time=expires_in,
+    def start_background_refresh(self) -> None:
+        """Start renewing the token proactively in an asyncio task.
+
+        Must be called from a running event loop. Behaves like
+        TokenManager.start_background_refresh().
+        """
+        if self._refresher is not None and not self._refresher.done():
+            return
+        self._refresher = asyncio.get_running_loop().create_task(
+            _run_async_refresher(weakref.ref(self)),
+            name="mpesakit-token-refresher",
         )
-        return self._access_token.token
+
+    async def stop_background_refresh(self) -> None:
+        """Cancel the background refresher task and wait for it to finish."""
+        refresher, self._refresher = self._refresher, None
+        if refresher is None:
+            return
+        refresher.cancel()
+        try:
+            await refresher
+        except asyncio.CancelledError:
+            pass
+
+    def _after_fork(self) -> None:
+        """Resets the refresh locks and refresher in a forked child, keeping the token.
+
+        The refresher task belonged to the parent's event loop; call
+        start_background_refresh() again from the child's loop to renew ahead.
+        """
+        self._refresh_locks = LoopLocal(asyncio.Lock)
+        self._refresher = None
+
+    async def _refresh_ahead(self) -> float:
+        """Renew the token if it is due and return the seconds until the next renewal."""
+        async with self._refresh_locks.get():
+            access_token = self._access_token
+            if access_token is None or access_token.refresh_delay(self.refresh_ratio) <= 0:
+                stale_token = access_token.token if access_token else None
+                await self._load_or_refresh(stale_token, self.refresh_ratio)
+                access_token = self._access_token
+            if access_token is None:
+                return _REFRESH_RETRY_INTERVAL
+            return max(
+                access_token.refresh_delay(self.refresh_ratio), _MIN_REFRESH_INTERVAL
+            )
+
+    async def _load_or_refresh(
+        self, stale_token: Optional[str], refresh_ratio: Optional[float] = None
+    ) -> str:
+        """Adopts a usable token from the store, or fetches one under the store lock.
+
+        Must be called with the refresh lock of the running loop held.
+        """
+        store = self.token_store
+        key = _token_store_key(self.consumer_key, self.http_client)
+        stored = await asyncio.to_thread(store.load, key)
+        if stored is None or not _is_reusable(
+            stored, stale_token, self.expiry_skew, refresh_ratio
+        ):
+            handle = await asyncio.to_thread(_acquire_store_lock, store, key)
+            try:
+                stored = await asyncio.to_thread(store.load, key)
+                if stored is None or not _is_reusable(
+                    stored, stale_token, self.expiry_skew, refresh_ratio
+                ):
+                    stored = await self._fetch_token()
+                    await asyncio.to_thread(store.save, key, stored)
+            finally:
+                await asyncio.to_thread(store.release, key, handle)
+
+        if self._access_token is not None and self._access_token.token != stored.token:
+            self._previous_token = self._access_token.token
+        self._access_token = stored
+        self._generation += 1
+        return stored.token
+
+    async def _fetch_token(self) -> AccessToken:
+        headers = {"Authorization": self._get_basic_auth_header()}
+
+        try:
+            response = await self.http_client.get(
+                OAUTH_URL, headers=headers, params=OAUTH_PARAMS
+            )
+        except MpesaApiException as e:
+            translated = _translate_auth_error(e)
+            if translated is e:
+                raise
+            raise translated from e
+
+        return _access_token_from_response(response)
@@ -0,0 +1,337 @@
+"""TokenRegistry: Serves access tokens for many M-Pesa apps over one shared HTTP client.
+
+A registry holds the credentials of every tenant (one consumer key/secret pair per
+paybill or till) and lazily creates a TokenManager for a tenant the first time it
+is used. Managers of tenants that have been idle for ``idle_ttl`` seconds, or that
+fall off the end of the ``max_tenants`` LRU, are dropped to keep memory bounded; a
+dropped tenant is recreated on its next use, reusing its token from the token store
+if the store still holds it. The default in-memory store keeps the tokens of the
+``max_tenants`` most recently used tenants, and unregistering a tenant deletes its
+token from the store.
+
+The tenant a call is made for is chosen per call, not per client:
+
+    registry = TokenRegistry(http_client)
+    registry.register("key-1", "secret-1")
+    client = MpesaClient(token_registry=registry)
+
+    with registry.tenant("key-1"):
+        client.stk_push(...)
+"""
+
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Callable, Dict, Generic, Iterator, Optional, TypeVar, Union
+
+from pydantic import PrivateAttr
+
+from mpesakit.errors import MpesaError, MpesaApiException
+from mpesakit.http_client import AsyncHttpClient, HttpClient
+from mpesakit.http_client.fork import register_after_fork
+from .token_manager import AsyncTokenManager, TokenManager, _token_store_key
+from .token_store import InMemoryTokenStore, TokenStore
+
+_current_tenant: ContextVar[Optional[str]] = ContextVar(
+    "mpesakit_current_tenant", default=None
+)
+
+_Manager = TypeVar("_Manager", TokenManager, AsyncTokenManager)
+
+
+class _Entry(Generic[_Manager]):
+    __slots__ = ("manager", "last_used")
+
+    manager: _Manager
+    last_used: float
+
+    def __init__(self, manager: _Manager, last_used: float) -> None:
+        self.manager = manager
+        self.last_used = last_used
+
+
+class _BaseTokenRegistry(ABC, Generic[_Manager]):
+    """Credential bookkeeping and LRU/TTL caching shared by both registries."""
+
+    def __init__(
+        self,
+        http_client: Union[HttpClient, AsyncHttpClient],
+        max_tenants: int = 1024,
+        idle_ttl: Optional[float] = 3600.0,
+        token_store: Optional[TokenStore] = None,
+        secret_resolver: Optional[Callable[[str], Optional[str]]] = None,
+    ) -> None:
+        """Initializes an empty registry.
+
+        Args:
+            http_client: HTTP client shared by every tenant.
+            max_tenants (int): Maximum number of token managers kept in memory.
+            idle_ttl (Optional[float]): Seconds after which an unused tenant's manager is
+                dropped. None keeps managers until they are pushed out of the LRU.
+            token_store (Optional[TokenStore]): Store shared by all tenants' managers.
+                Defaults to a new InMemoryTokenStore holding max_tenants tokens.
+            secret_resolver (Optional[Callable[[str], Optional[str]]]): Called with a
+                consumer key that was not registered, e.g. to look its secret up in a
+                vault. Returns None if the consumer key is unknown.
+        """
+        if max_tenants < 1:
+            raise ValueError("max_tenants must be at least 1.")
+        self.http_client = http_client
+        self.max_tenants = max_tenants
+        self.idle_ttl = idle_ttl
+        self.token_store = token_store or InMemoryTokenStore(max_tokens=max_tenants)
+        self.secret_resolver = secret_resolver
+
+        self._secrets: Dict[str, str] = {}
+        self._managers: "OrderedDict[str, _Entry[_Manager]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.token_manager: _Manager = self._create_proxy()
+        register_after_fork(self)
+
+    def _after_fork(self) -> None:
+        """Replaces the lock, which a parent thread may hold, in a forked child."""
+        self._lock = threading.Lock()
+
+    def register(self, consumer_key: str, consumer_secret: str) -> None:
+        """Adds a tenant, or replaces the secret of an existing one."""
+        with self._lock:
+            if self._secrets.get(consumer_key) != consumer_secret:
+                self._discard(consumer_key)
+            self._secrets[consumer_key] = consumer_secret
+
+    def unregister(self, consumer_key: str) -> None:
+        """Removes a tenant, its cached token manager and its stored token."""
+        with self._lock:
+            self._secrets.pop(consumer_key, None)
+            self._discard(consumer_key)
+        self.token_store.delete(_token_store_key(consumer_key, self.http_client))
+
+    @contextmanager
+    def tenant(self, consumer_key: str) -> Iterator[None]:
+        """Routes calls made within the with-block to the given tenant.
+
+        The selection is held in a context variable, so it is local to the current
+        thread or asyncio task and can be nested.
+        """
+        token = _current_tenant.set(consumer_key)
+        try:
+            yield
+        finally:
+            _current_tenant.reset(token)
+
+    def current_tenant(self) -> str:
+        """Returns the consumer key selected with tenant().
+
+        Raises:
+            MpesaApiException: If no tenant is selected.
+        """
+        consumer_key = _current_tenant.get()
+        if consumer_key is None:
+            raise MpesaApiException(
+                MpesaError(
+                    error_code="TENANT_NOT_SELECTED",
+                    error_message="No tenant selected. Wrap the call in `with registry.tenant(consumer_key):`.",
+                    status_code=None,
+                )
+            )
+        return consumer_key
+
+    def get(self, consumer_key: Optional[str] = None) -> _Manager:
+        """Returns the token manager for a tenant, creating it if needed.
+
+        Args:
+            consumer_key (Optional[str]): Tenant to look up; defaults to the current tenant.
+
+        Raises:
+            MpesaApiException: If the tenant is unknown or none is selected.
+        """
+        if consumer_key is None:
+            consumer_key = self.current_tenant()
+        now = time.monotonic()
+        with self._lock:
+            self._evict_idle(now)
+            entry = self._managers.get(consumer_key)
+            if entry is not None:
+                entry.last_used = now
+                self._managers.move_to_end(consumer_key)
+                return entry.manager
+
+        consumer_secret = self._resolve_secret(consumer_key)
+        with self._lock:
+            # Another thread may have created the manager while the secret was resolved.
+            entry = self._managers.get(consumer_key)
+            if entry is None:
+                entry = _Entry(self._create_manager(consumer_key, consumer_secret), now)
+                self._managers[consumer_key] = entry
+                while len(self._managers) > self.max_tenants:
+                    self._stop(self._managers.popitem(last=False)[1].manager)
+            entry.last_used = now
+            self._managers.move_to_end(consumer_key)
+            return entry.manager
+
+    def __len__(self) -> int:
+        """Returns the number of token managers currently held in memory."""
+        return len(self._managers)
+
+    def _resolve_secret(self, consumer_key: str) -> str:
+        consumer_secret = self._secrets.get(consumer_key)
+        if consumer_secret is None and self.secret_resolver is not None:
+            consumer_secret = self.secret_resolver(consumer_key)
+        if consumer_secret is None:
+            raise MpesaApiException(
+                MpesaError(
+                    error_code="UNKNOWN_TENANT",
+                    error_message="No credentials registered for the selected consumer key.",
+                    status_code=None,
+                )
+            )
+        return consumer_secret
+
+    def _evict_idle(self, now: float) -> None:
+        """Drops managers idle for longer than idle_ttl. Must hold _lock."""
+        if self.idle_ttl is None:
+            return
+        while self._managers:
+            consumer_key, entry = next(iter(self._managers.items()))
+            if now - entry.last_used <= self.idle_ttl:
+                return
+            del self._managers[consumer_key]
+            self._stop(entry.manager)
+
+    def _discard(self, consumer_key: str) -> None:
+        """Drops the manager for consumer_key if one is cached. Must hold _lock."""
+        entry = self._managers.pop(consumer_key, None)
+        if entry is not None:
+            self._stop(entry.manager)
+
+    @abstractmethod
+    def _create_manager(self, consumer_key: str, consumer_secret: str) -> _Manager:
+        """Creates the token manager of a tenant."""
+
+    @abstractmethod
+    def _stop(self, manager: _Manager) -> None:
+        """Stops the background work of a manager that is dropped."""
+
+    @abstractmethod
+    def _create_proxy(self) -> _Manager:
+        """Creates the manager forwarding calls to the current tenant."""
+
+
+class TokenRegistry(_BaseTokenRegistry[TokenManager]):
+    """Thread-safe registry of TokenManagers for many tenants sharing one HttpClient.
+
+    Pass the registry to MpesaClient(token_registry=...) and select the tenant for
+    each call with ``registry.tenant(consumer_key)``.
+    """
+
+    http_client: HttpClient
+    token_manager: "TenantTokenManager"
+
+    def get_token(self, force_refresh: bool = False) -> str:
+        """Returns an access token for the current tenant."""
+        return self.get().get_token(force_refresh=force_refresh)
+
+    def _create_manager(self, consumer_key: str, consumer_secret: str) -> TokenManager:
+        return TokenManager(
+            consumer_key=consumer_key,
+            consumer_secret=consumer_secret,
+            http_client=self.http_client,
+            token_store=self.token_store,
+        )
+
+    def _stop(self, manager: TokenManager) -> None:
+        manager.stop_background_refresh(timeout=0)
+
+    def _create_proxy(self) -> "TenantTokenManager":
+        proxy = TenantTokenManager(http_client=self.http_client)
+        proxy._registry = self
+        return proxy
+
+
+class AsyncTokenRegistry(_BaseTokenRegistry[AsyncTokenManager]):
+    """Registry of AsyncTokenManagers for many tenants sharing one AsyncHttpClient.
+
+    Pass the registry to AsyncMpesaClient(token_registry=...). The tenant selected
+    with ``registry.tenant(consumer_key)`` is inherited by tasks created inside it.
+    """
+
+    http_client: AsyncHttpClient
+    token_manager: "AsyncTenantTokenManager"
+
+    async def get_token(self, force_refresh: bool = False) -> str:
+        """Returns an access token for the current tenant."""
+        return await self.get().get_token(force_refresh=force_refresh)
+
+    def _create_manager(
+        self, consumer_key: str, consumer_secret: str
+    ) -> AsyncTokenManager:
+        return AsyncTokenManager(
+            consumer_key=consumer_key,
+            consumer_secret=consumer_secret,
+            http_client=self.http_client,
+            token_store=self.token_store,
+        )
+
+    def _stop(self, manager: AsyncTokenManager) -> None:
+        refresher = manager._refresher
+        manager._refresher = None
+        if refresher is not None:
+            refresher.cancel()
+
+    def _create_proxy(self) -> "AsyncTenantTokenManager":
+        proxy = AsyncTenantTokenManager(http_client=self.http_client)
+        proxy._registry = self
+        return proxy
+
+
+class TenantTokenManager(TokenManager):
+    """TokenManager that forwards every call to the current tenant of a TokenRegistry.
+
+    Service facades hold a single instance of this class, so one set of facades
+    serves every tenant in the registry.
+    """
+
+    consumer_key: str = ""
+    consumer_secret: str = ""
+
+    _registry: TokenRegistry = PrivateAttr()
+
+    def get_token(
+        self, force_refresh: bool = False, stale_token: Optional[str] = None
+    ) -> str:
+        """Retrieves the access token of the current tenant."""
+        return self._registry.get().get_token(force_refresh, stale_token)
+
+    def start_background_refresh(self) -> None:
+        """Start background refresh for the current tenant's token manager."""
+        self._registry.get().start_background_refresh()
+
+    def stop_background_refresh(self, timeout: Optional[float] = None) -> None:
+        """Stop background refresh for the current tenant's token manager."""
+        self._registry.get().stop_background_refresh(timeout)
+
+
+class AsyncTenantTokenManager(AsyncTokenManager):
+    """AsyncTokenManager that forwards every call to the current tenant of an AsyncTokenRegistry."""
+
+    consumer_key: str = ""
+    consumer_secret: str = ""
+
+    _registry: AsyncTokenRegistry = PrivateAttr()
+
+    async def get_token(
+        self, force_refresh: bool = False, stale_token: Optional[str] = None
+    ) -> str:
+        """Retrieves the access token of the current tenant."""
+        return await self._registry.get().get_token(force_refresh, stale_token)
+
+    def start_background_refresh(self) -> None:
+        """Start background refresh for the current tenant's token manager."""
+        self._registry.get().start_background_refresh()
+
+    async def stop_background_refresh(self) -> None:
+        """Stop background refresh for the current tenant's token manager."""
+        await self._registry.get().stop_background_refresh()
@@ -0,0 +1,312 @@
+"""Token stores: Shared storage for access tokens used by TokenManager.
+
+A token store lets several TokenManager instances, including ones living in different
+worker processes, share a single OAuth token instead of each minting their own. Stores
+also provide a per-key lock so that only one of those managers refreshes at a time.
+"""
+
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from contextlib import closing, contextmanager
+from datetime import datetime
+from typing import Dict, Iterator, Optional, Tuple
+
+from mpesakit.errors import MpesaError, MpesaApiException
+from mpesakit.http_client.fork import register_after_fork
+from .access_token import AccessToken
+
+
+class TokenStore(ABC):
+    """Abstract storage backend for access tokens, keyed by an opaque string."""
+
+    @abstractmethod
+    def load(self, key: str) -> Optional[AccessToken]:
+        """Returns the stored token for key, or None if there is none."""
+        pass
+
+    @abstractmethod
+    def save(self, key: str, token: AccessToken) -> None:
+        """Stores token under key, replacing any previous token."""
+        pass
+
+    def delete(self, key: str) -> None:
+        """Removes the token stored under key, if any.
+
+        The default does nothing, for stores whose entries expire on their own.
+        """
+
+    @abstractmethod
+    def acquire(self, key: str, timeout: Optional[float] = None) -> str:
+        """Blocks until the refresh lock for key is held and returns a release handle.
+
+        Args:
+            key (str): Key whose refresh lock to take.
+            timeout (Optional[float]): Longest wait in seconds; None leaves the
+                wait to the store.
+
+        Raises:
+            MpesaApiException: With error code TOKEN_LOCK_TIMEOUT if the lock could
+                not be taken in time.
+        """
+        pass
+
+    @abstractmethod
+    def release(self, key: str, handle: str) -> None:
+        """Releases a refresh lock previously obtained with acquire()."""
+        pass
+
+    @contextmanager
+    def lock(self, key: str, timeout: Optional[float] = None) -> Iterator[None]:
+        """Holds the refresh lock for key for the duration of the with-block.
+
+        Takes the same arguments as acquire().
+        """
+        handle = self.acquire(key, timeout)
+        try:
+            yield
+        finally:
+            self.release(key, handle)
+
+
+def _lock_timeout() -> MpesaApiException:
+    return MpesaApiException(
+        MpesaError(
+            error_code="TOKEN_LOCK_TIMEOUT",
+            error_message="Timed out waiting for another refresh of the access token to finish.",
+            status_code=None,
+        )
+    )
+
+
+class _KeyLock:
+    """The refresh lock of a key and the number of callers holding or awaiting it."""
+
+    __slots__ = ("lock", "users")
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.users = 0
+
+
+class InMemoryTokenStore(TokenStore):
+    """Process-local token store; the default used by TokenManager.
+
+    Sharing one instance between several TokenManagers lets them reuse a token within
+    a single process. Use SQLiteTokenStore to share tokens between processes.
+    """
+
+    def __init__(self, max_tokens: Optional[int] = None) -> None:
+        """Initializes an empty in-memory store.
+
+        Args:
+            max_tokens (Optional[int]): Number of tokens kept; the least recently
+                used ones are dropped beyond it. None keeps every token.
+        """
+        if max_tokens is not None and max_tokens < 1:
+            raise ValueError("max_tokens must be at least 1.")
+        self.max_tokens = max_tokens
+        self._tokens: "OrderedDict[str, AccessToken]" = OrderedDict()
+        self._locks: Dict[str, _KeyLock] = {}
+        self._held: Dict[str, _KeyLock] = {}
+        self._guard = threading.Lock()
+        register_after_fork(self)
+
+    def _after_fork(self) -> None:
+        """Drops the refresh locks, which parent threads may hold, in a forked child."""
+        self._locks = {}
+        self._held = {}
+        self._guard = threading.Lock()
+
+    def load(self, key: str) -> Optional[AccessToken]:
+        """Returns the stored token for key, or None if there is none."""
+        with self._guard:
+            token = self._tokens.get(key)
+            if token is not None:
+                self._tokens.move_to_end(key)
+            return token
+
+    def save(self, key: str, token: AccessToken) -> None:
+        """Stores token under key, replacing any previous token."""
+        with self._guard:
+            self._tokens[key] = token
+            self._tokens.move_to_end(key)
+            while self.max_tokens is not None and len(self._tokens) > self.max_tokens:
+                self._forget(next(iter(self._tokens)))
+
+    def delete(self, key: str) -> None:
+        """Removes the token stored under key, if any."""
+        with self._guard:
+            self._forget(key)
+
+    def _forget(self, key: str) -> None:
+        """Drops the token of key. Must hold _guard."""
+        self._tokens.pop(key, None)
+
+    def acquire(self, key: str, timeout: Optional[float] = None) -> str:
+        """Blocks until the refresh lock for key is held and returns a release handle.
+
+        A key's lock exists only while callers are holding or waiting for it.
+
+        Args:
+            key (str): Key whose refresh lock to take.
+            timeout (Optional[float]): Longest wait in seconds; None waits as long
+                as needed.
+
+        Raises:
+            MpesaApiException: With error code TOKEN_LOCK_TIMEOUT if the lock could
+                not be taken within timeout.
+        """
+        with self._guard:
+            key_lock = self._locks.setdefault(key, _KeyLock())
+            key_lock.users += 1
+        if not key_lock.lock.acquire(timeout=-1 if timeout is None else timeout):
+            with self._guard:
+                self._leave(key, key_lock)
+            raise _lock_timeout()
+        handle = uuid.uuid4().hex
+        with self._guard:
+            self._held[handle] = key_lock
+        return handle
+
+    def release(self, key: str, handle: str) -> None:
+        """Releases a refresh lock previously obtained with acquire()."""
+        with self._guard:
+            key_lock = self._held.pop(handle)
+        key_lock.lock.release()
+        with self._guard:
+            self._leave(key, key_lock)
+
+    def _leave(self, key: str, key_lock: _KeyLock) -> None:
+        """Drops key_lock once its last caller is done with it. Must hold _guard."""
+        key_lock.users -= 1
+        if key_lock.users == 0 and self._locks.get(key) is key_lock:
+            del self._locks[key]
+
+
+class SQLiteTokenStore(TokenStore):
+    """Token store backed by a SQLite database file shared between processes.
+
+    Point every worker process (e.g. gunicorn or uvicorn workers) at the same file so
+    they share one token. Refresh locks are leases stored in the database: a lock held
+    by a crashed process is taken over once its lease expires.
+
+    The database holds live bearer tokens, so it is created readable by the owner only.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        lock_timeout: float = 30.0,
+        lock_lease: float = 30.0,
+        poll_interval: float = 0.05,
+    ) -> None:
+        """Initializes the store, creating the database schema if needed.
+
+        Args:
+            path (str): Path of the SQLite database file.
+            lock_timeout (float): Maximum seconds to wait for a refresh lock.
+            lock_lease (float): Seconds after which an unreleased lock is considered abandoned.
+            poll_interval (float): Seconds between attempts to take a busy lock.
+        """
+        self.path = path
+        self.lock_timeout = lock_timeout
+        self.lock_lease = lock_lease
+        self.poll_interval = poll_interval
+
+        if not os.path.exists(path):
+            os.close(os.open(path, os.O_CREAT | os.O_WRONLY, 0o600))
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS mpesakit_tokens ("
+                "key TEXT PRIMARY KEY, token TEXT NOT NULL, "
+                "created_at REAL NOT NULL, expires_in INTEGER NOT NULL)"
+            )
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS mpesakit_token_locks ("
+                "key TEXT PRIMARY KEY, owner TEXT NOT NULL, expires_at REAL NOT NULL)"
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.path, timeout=self.lock_timeout)
+
+    def load(self, key: str) -> Optional[AccessToken]:
+        """Returns the stored token for key, or None if there is none."""
+        with closing(self._connect()) as conn:
+            row: Optional[Tuple[str, float, int]] = conn.execute(
+                "SELECT token, created_at, expires_in FROM mpesakit_tokens WHERE key = ?",
+                (key,),
+            ).fetchone()
+        if row is None:
+            return None
+        token, created_at, expires_in = row
+        return AccessToken(
+            token=token,
+            creation_datetime=datetime.fromtimestamp(created_at),
+            expiration_time=expires_in,
+        )
+
+    def save(self, key: str, token: AccessToken) -> None:
+        """Stores token under key, replacing any previous token."""
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO mpesakit_tokens (key, token, created_at, expires_in) "
+                "VALUES (?, ?, ?, ?)",
+                (
+                    key,
+                    token.token,
+                    token.creation_datetime.timestamp(),
+                    token.expiration_time,
+                ),
+            )
+
+    def delete(self, key: str) -> None:
+        """Removes the token stored under key, if any."""
+        with closing(self._connect()) as conn, conn:
+            conn.execute("DELETE FROM mpesakit_tokens WHERE key = ?", (key,))
+
+    def acquire(self, key: str, timeout: Optional[float] = None) -> str:
+        """Blocks until the refresh lock for key is held and returns a release handle.
+
+        Args:
+            key (str): Key whose refresh lock to take.
+            timeout (Optional[float]): Longest wait in seconds, if shorter than
+                lock_timeout.
+
+        Raises:
+            MpesaApiException: With error code TOKEN_LOCK_TIMEOUT if the lock could
+                not be taken in time.
+        """
+        owner = uuid.uuid4().hex
+        wait = self.lock_timeout if timeout is None else min(timeout, self.lock_timeout)
+        deadline = time.monotonic() + wait
+        while True:
+            now = time.time()
+            with closing(self._connect()) as conn, conn:
+                conn.execute(
+                    "DELETE FROM mpesakit_token_locks WHERE key = ? AND expires_at < ?",
+                    (key, now),
+                )
+                inserted = conn.execute(
+                    "INSERT OR IGNORE INTO mpesakit_token_locks (key, owner, expires_at) "
+                    "VALUES (?, ?, ?)",
+                    (key, owner, now + self.lock_lease),
+                ).rowcount
+            if inserted:
+                return owner
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise _lock_timeout()
+            time.sleep(min(self.poll_interval, remaining))
+
+    def release(self, key: str, handle: str) -> None:
+        """Releases a refresh lock previously obtained with acquire()."""
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                "DELETE FROM mpesakit_token_locks WHERE key = ? AND owner = ?",
+                (key, handle),
+            )
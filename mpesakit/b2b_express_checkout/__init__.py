@@ -5,9 +5,10 @@ from .schemas import (
     B2BExpressCallbackResponse,
 )
 
-from .b2b_express_checkout import B2BExpressCheckout
+from .b2b_express_checkout import AsyncB2BExpressCheckout, B2BExpressCheckout
 
 __all__ = [
+    "AsyncB2BExpressCheckout",
     "B2BExpressCheckout",
     "B2BExpressCheckoutRequest",
     "B2BExpressCheckoutResponse",
@@ -5,8 +5,8 @@ using the M-Pesa API. Requires a valid access token for authentication and uses
 """
 
 from pydantic import BaseModel, ConfigDict
-from mpesakit.auth import TokenManager
-from mpesakit.http_client import HttpClient
+from mpesakit.auth import AsyncTokenManager, TokenManager
+from mpesakit.http_client import AsyncHttpClient, HttpClient
 
 from .schemas import (
     B2BExpressCheckoutRequest,
@@ -49,3 +49,40 @@ class B2BExpressCheckout(BaseModel):
             url, json=request.model_dump(mode="json"), headers=headers
         )
         return B2BExpressCheckoutResponse(**response_data)
+
+
+class AsyncB2BExpressCheckout(BaseModel):
+    """Represents the asynchronous B2B Express Checkout API client for M-Pesa operations.
+
+    https://developer.safaricom.co.ke/APIs/B2BExpressCheckout
+
+    Attributes:
+        http_client (AsyncHttpClient): HTTP client for making requests to the M-Pesa API.
+        token_manager (AsyncTokenManager): Manages access tokens for authentication.
+    """
+
+    http_client: AsyncHttpClient
+    token_manager: AsyncTokenManager
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    async def ussd_push(
+        self, request: B2BExpressCheckoutRequest
+    ) -> B2BExpressCheckoutResponse:
+        """Initiates a B2B Express Checkout USSD Push transaction.
+
+        Args:
+            request (B2BExpressCheckoutRequest): The B2B Express Checkout request data.
+
+        Returns:
+            B2BExpressCheckoutResponse: Response from the M-Pesa API.
+        """
+        url = "/v1/ussdpush/get-msisdn"
+        headers = {
+            "Authorization": f"Bearer {await self.token_manager.get_token()}",
+            "Content-Type": "application/json",
+        }
+        response_data = await self.http_client.post(
+            url, json=request.model_dump(mode="json"), headers=headers
+        )
+        return B2BExpressCheckoutResponse(**response_data)
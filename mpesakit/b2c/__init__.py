@@ -8,9 +8,10 @@ from .schemas import (
     B2CTimeoutCallback,
     B2CTimeoutCallbackResponse,
 )
-from .b2c import B2C
+from .b2c import AsyncB2C, B2C
 
 __all__ = [
+    "AsyncB2C",
     "B2C",
     "B2CCommandIDType",
     "B2CRequest",
@@ -6,9 +6,10 @@ from .schemas import (
     B2CAccountTopUpTimeoutCallback,
     B2CAccountTopUpTimeoutCallbackResponse,
 )
-from .b2c_account_top_up import B2CAccountTopUp
+from .b2c_account_top_up import AsyncB2CAccountTopUp, B2CAccountTopUp
 
 __all__ = [
+    "AsyncB2CAccountTopUp",
     "B2CAccountTopUp",
     "B2CAccountTopUpRequest",
     "B2CAccountTopUpResponse",
@@ -5,8 +5,8 @@ using the M-Pesa API. Requires a valid access token for authentication and uses
 """
 
 from pydantic import BaseModel, ConfigDict
-from mpesakit.auth import TokenManager
-from mpesakit.http_client import HttpClient
+from mpesakit.auth import AsyncTokenManager, TokenManager
+from mpesakit.http_client import AsyncHttpClient, HttpClient
 
 from .schemas import (
     B2CAccountTopUpRequest,
@@ -47,3 +47,38 @@ class B2CAccountTopUp(BaseModel):
             url, json=request.model_dump(mode="json"), headers=headers
         )
         return B2CAccountTopUpResponse(**response_data)
+
+
+class AsyncB2CAccountTopUp(BaseModel):
+    """Represents the asynchronous B2C Account TopUp API client for M-Pesa operations.
+
+    https://developer.safaricom.co.ke/APIs/B2CAccountTopUp
+
+    Attributes:
+        http_client (AsyncHttpClient): HTTP client for making requests to the M-Pesa API.
+        token_manager (AsyncTokenManager): Manages access tokens for authentication.
+    """
+
+    http_client: AsyncHttpClient
+    token_manager: AsyncTokenManager
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    async def topup(self, request: B2CAccountTopUpRequest) -> B2CAccountTopUpResponse:
+        """Initiates a B2C Account TopUp transaction.
+
+        Args:
+            request (B2CAccountTopUpRequest): The B2C Account TopUp request data.
+
+        Returns:
+            B2CAccountTopUpResponse: Response from the M-Pesa API.
+        """
+        url = "/mpesa/b2b/v1/paymentrequest"
+        headers = {
+            "Authorization": f"Bearer {await self.token_manager.get_token()}",
+            "Content-Type": "application/json",
+        }
+        response_data = await self.http_client.post(
+            url, json=request.model_dump(mode="json"), headers=headers
+        )
+        return B2CAccountTopUpResponse(**response_data)
@@ -17,9 +17,10 @@ from .schemas import (
     InvoiceItem,
 )
 
-from .bill_manager import BillManager
+from .bill_manager import AsyncBillManager, BillManager
 
 __all__ = [
+    "AsyncBillManager",
     "BillManagerOptInRequest",
     "BillManagerOptInResponse",
     "BillManagerUpdateOptInRequest",
@@ -6,9 +6,10 @@ from .schemas import (
     BusinessBuyGoodsTimeoutCallback,
     BusinessBuyGoodsTimeoutCallbackResponse,
 )
-from .business_buy_goods import BusinessBuyGoods
+from .business_buy_goods import AsyncBusinessBuyGoods, BusinessBuyGoods
 
 __all__ = [
+    "AsyncBusinessBuyGoods",
     "BusinessBuyGoods",
     "BusinessBuyGoodsRequest",
     "BusinessBuyGoodsResponse",
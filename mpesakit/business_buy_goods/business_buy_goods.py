@@ -5,8 +5,8 @@ using the M-Pesa API. Requires a valid access token for authentication and uses
 """
 
 from pydantic import BaseModel, ConfigDict
-from mpesakit.auth import TokenManager
-from mpesakit.http_client import HttpClient
+from mpesakit.auth import AsyncTokenManager, TokenManager
+from mpesakit.http_client import AsyncHttpClient, HttpClient
 
 from .schemas import (
     BusinessBuyGoodsRequest,
@@ -45,3 +45,36 @@ class BusinessBuyGoods(BaseModel):
         }
         response_data = self.http_client.post(url, json=request.model_dump(by_alias=True), headers=headers)
         return BusinessBuyGoodsResponse(**response_data)
+
+
+class AsyncBusinessBuyGoods(BaseModel):
+    """Represents the asynchronous Business Buy Goods API client for M-Pesa operations.
+
+    https://developer.safaricom.co.ke/APIs/BusinessBuyGoods
+
+    Attributes:
+        http_client (AsyncHttpClient): HTTP client for making requests to the M-Pesa API.
+        token_manager (AsyncTokenManager): Manages access tokens for authentication.
+    """
+
+    http_client: AsyncHttpClient
+    token_manager: AsyncTokenManager
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    async def buy_goods(self, request: BusinessBuyGoodsRequest) -> BusinessBuyGoodsResponse:
+        """Initiates a Business Buy Goods transaction.
+
+        Args:
+            request (BusinessBuyGoodsRequest): The Business Buy Goods request data.
+
+        Returns:
+            BusinessBuyGoodsResponse: Response from the M-Pesa API.
+        """
+        url = "/mpesa/b2b/v1/paymentrequest"
+        headers = {
+            "Authorization": f"Bearer {await self.token_manager.get_token()}",
+            "Content-Type": "application/json",
+        }
+        response_data = await self.http_client.post(url, json=request.model_dump(by_alias=True), headers=headers)
+        return BusinessBuyGoodsResponse(**response_data)
@@ -6,9 +6,10 @@ from .schemas import (
     BusinessPayBillTimeoutCallback,
     BusinessPayBillTimeoutCallbackResponse,
 )
-from .business_paybill import BusinessPayBill
+from .business_paybill import AsyncBusinessPayBill, BusinessPayBill
 
 __all__ = [
+    "AsyncBusinessPayBill",
     "BusinessPayBill",
     "BusinessPayBillRequest",
     "BusinessPayBillResponse",
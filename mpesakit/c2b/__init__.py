@@ -7,9 +7,10 @@ from .schemas import (
     C2BValidationResultCodeType,
     C2BResponseType,
 )
-from .c2b import C2B
+from .c2b import AsyncC2B, C2B
 
 __all__ = [
+    "AsyncC2B",
     "C2BResponseType",
     "C2BRegisterUrlRequest",
     "C2BRegisterUrlResponse",
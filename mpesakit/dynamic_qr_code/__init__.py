@@ -1,4 +1,4 @@
-from .dynamic_qr_code import DynamicQRCode
+from .dynamic_qr_code import AsyncDynamicQRCode, DynamicQRCode
 from .schemas import (
     DynamicQRGenerateRequest,
     DynamicQRGenerateResponse,
@@ -6,6 +6,7 @@ from .schemas import (
 )
 
 __all__ = [
+    "AsyncDynamicQRCode",
     "DynamicQRCode",
     "DynamicQRGenerateRequest",
     "DynamicQRGenerateResponse",
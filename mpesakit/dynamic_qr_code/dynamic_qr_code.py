@@ -5,8 +5,8 @@ It requires a valid access token for authentication and uses the HttpClient for
 """
 
 from pydantic import BaseModel, ConfigDict
-from mpesakit.auth import TokenManager
-from mpesakit.http_client import HttpClient
+from mpesakit.auth import AsyncTokenManager, TokenManager
+from mpesakit.http_client import AsyncHttpClient, HttpClient
 
 from .schemas import (
     DynamicQRGenerateRequest,
@@ -47,3 +47,38 @@ class DynamicQRCode(BaseModel):
         response_data = self.http_client.post(url, json=request.model_dump(by_alias=True), headers=headers)
 
         return DynamicQRGenerateResponse(**response_data)
+
+
+class AsyncDynamicQRCode(BaseModel):
+    """Represents the asynchronous API client for generating a Dynamic M-Pesa QR code.
+
+    https://developer.safaricom.co.ke/APIs/DynamicQR
+
+    Attributes:
+        http_client (AsyncHttpClient): The HTTP client used to make requests to the M-Pesa API.
+        token_manager (AsyncTokenManager): The token manager for handling access tokens.
+    """
+
+    http_client: AsyncHttpClient
+    token_manager: AsyncTokenManager
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    async def generate(self, request: DynamicQRGenerateRequest) -> DynamicQRGenerateResponse:
+        """Generates a Dynamic M-Pesa QR Code.
+
+        Args:
+            request (DynamicQRGenerateRequest): The request data for generating the QR code.
+
+        Returns:
+            DynamicQRGenerateResponse: The response from the M-Pesa API after generating the QR code.
+        """
+        url = "/mpesa/qrcode/v1/generate"
+        headers = {
+            "Authorization": f"Bearer {await self.token_manager.get_token()}",
+            "Content-Type": "application/json",
+        }
+
+        response_data = await self.http_client.post(url, json=request.model_dump(by_alias=True), headers=headers)
+
+        return DynamicQRGenerateResponse(**response_data)
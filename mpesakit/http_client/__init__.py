@@ -1,5 +1,83 @@
 from .http_client import HttpClient,AsyncHttpClient
+from .cassette import AsyncCassetteHttpClient, Cassette, CassetteHttpClient
+from .circuit_breaker import (
+    CircuitBreaker,
+    CircuitBreakerPolicy,
+    CircuitBreakers,
+    CircuitBreakerStats,
+    CircuitState,
+)
+from .codec import (
+    JsonCodec,
+    MsgspecCodec,
+    OrjsonCodec,
+    StdlibJsonCodec,
+    default_codec,
+)
+from .cooldown import CooldownPolicy, Cooldowns
+from .concurrency import (
+    AIMDPolicy,
+    AsyncConcurrencyLimiter,
+    ConcurrencyLimiter,
+    ConcurrencyStats,
+)
+from .hedging import AsyncHedger, Hedger, HedgePolicy, HedgeStats
+from .loop_clients import LoopClientRegistry, LoopLocal
+from .middleware import AsyncMiddleware, Middleware, Request
+from .rate_limiter import AsyncRateLimiter, RateLimit, RateLimiter, TokenBucket
+from .response_limits import ResponseLimits
+from .retry import RetryPolicy, idempotency_key
+from .single_flight import AsyncSingleFlight, SingleFlight
+from .timeouts import Timeouts, current_deadline, remaining_time, request_deadline
+from .transport_metrics import TransportMetrics
 from .mpesa_http_client import MpesaHttpClient
 from .mpesa_async_http_client import MpesaAsyncHttpClient
 
-__all__ = ["HttpClient", "MpesaHttpClient","AsyncHttpClient","MpesaAsyncHttpClient"]
+__all__ = [
+    "HttpClient",
+    "MpesaHttpClient",
+    "AsyncHttpClient",
+    "MpesaAsyncHttpClient",
+    "AsyncCassetteHttpClient",
+    "Cassette",
+    "CassetteHttpClient",
+    "CircuitBreaker",
+    "CircuitBreakerPolicy",
+    "CircuitBreakers",
+    "CircuitBreakerStats",
+    "CircuitState",
+    "JsonCodec",
+    "MsgspecCodec",
+    "OrjsonCodec",
+    "StdlibJsonCodec",
+    "default_codec",
+    "CooldownPolicy",
+    "Cooldowns",
+    "AIMDPolicy",
+    "AsyncConcurrencyLimiter",
+    "ConcurrencyLimiter",
+    "ConcurrencyStats",
+    "AsyncHedger",
+    "Hedger",
+    "HedgePolicy",
+    "HedgeStats",
+    "LoopClientRegistry",
+    "LoopLocal",
+    "AsyncMiddleware",
+    "Middleware",
+    "Request",
+    "AsyncRateLimiter",
+    "RateLimit",
+    "RateLimiter",
+    "TokenBucket",
+    "ResponseLimits",
+    "RetryPolicy",
+    "idempotency_key",
+    "AsyncSingleFlight",
+    "SingleFlight",
+    "Timeouts",
+    "current_deadline",
+    "remaining_time",
+    "request_deadline",
+    "TransportMetrics",
+]
@@ -0,0 +1,383 @@
+"""Record/replay HTTP clients for offline tests and reproducible benchmarks.
+
+A CassetteHttpClient wrapping a real client forwards every request to it and
+records the request, its response or error and its latency to a cassette, a
+newline-delimited JSON file with one interaction per line:
+
+    with CassetteHttpClient("stk.ndjson", http_client=MpesaHttpClient()) as client:
+        run_payment_flow(MpesaClient(..., http_client=client))
+
+Without a client to wrap, requests are answered from the cassette instead,
+optionally delayed by the recorded latency divided by ``speed``:
+
+    client = CassetteHttpClient("stk.ndjson", speed=10.0)  # ten times as fast
+
+Requests match recorded ones on method, path and payload. Payload keys are sorted
+and volatile or secret fields such as Timestamp, Password, Passkey and
+SecurityCredential are dropped, both for matching and from what is written.
+Secrets in responses, such as the access token issued by the OAuth endpoint, are
+written as a placeholder, which is what replay then serves. Requests matching the
+same recording get its interactions in recorded order, starting over after the last.
+"""
+
+import asyncio
+import json
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Union
+
+from pydantic import BaseModel
+
+from mpesakit.errors import MpesaError, MpesaApiException
+from .http_client import AsyncHttpClient, HttpClient
+
+# Request fields that change between runs or must not be written to disk.
+VOLATILE_FIELDS: FrozenSet[str] = frozenset(
+    {
+        "Timestamp",
+        "Password",
+        "SecurityCredential",
+        "Passkey",
+        "Initiator",
+        "InitiatorName",
+        "InitiatorPassword",
+        "OriginatorConversationID",
+    }
+)
+
+# Response fields that must not be written to disk; recorded as REDACTED.
+SECRET_RESPONSE_FIELDS: FrozenSet[str] = frozenset({"access_token"})
+
+REDACTED = "REDACTED"
+
+
+class Interaction(BaseModel):
+    """A recorded request and its outcome.
+
+    Attributes:
+        method (str): HTTP method of the request.
+        url (str): Path of the request.
+        payload (Optional[Any]): Normalized body or query parameters.
+        response (Optional[Dict[str, Any]]): Response of a successful request.
+        error (Optional[MpesaError]): Error of a failed request.
+        latency (float): Seconds the request took when it was recorded.
+    """
+
+    method: str
+    url: str
+    payload: Optional[Any] = None
+    response: Optional[Dict[str, Any]] = None
+    error: Optional[MpesaError] = None
+    latency: float = 0.0
+
+
+class Cassette:
+    """Interactions stored in a newline-delimited JSON file. Thread-safe."""
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        ignore_fields: FrozenSet[str] = VOLATILE_FIELDS,
+        secret_fields: FrozenSet[str] = SECRET_RESPONSE_FIELDS,
+    ):
+        """Opens a cassette, loading the interactions already recorded to it.
+
+        Args:
+            path (Union[str, Path]): The cassette file; created when recording.
+            ignore_fields (FrozenSet[str]): Payload fields dropped for matching and
+                from recordings.
+            secret_fields (FrozenSet[str]): Response fields recorded as REDACTED.
+        """
+        self.path = Path(path)
+        self.ignore_fields = ignore_fields
+        self.secret_fields = secret_fields
+        self._lock = threading.Lock()
+        self._recorded: Dict[str, List[Interaction]] = {}
+        self._cursors: Dict[str, int] = {}
+        if self.path.exists():
+            with self.path.open(encoding="utf-8") as lines:
+                for line in lines:
+                    if line.strip():
+                        self._add(Interaction.model_validate_json(line))
+
+    def __len__(self) -> int:
+        """Number of recorded interactions."""
+        return sum(len(interactions) for interactions in self._recorded.values())
+
+    def normalize(self, payload: Optional[Any]) -> Optional[Any]:
+        """Returns payload decoded, if encoded, and without ignore_fields."""
+        if isinstance(payload, bytes):
+            payload = json.loads(payload)
+        return self._without_ignored(payload)
+
+    def record(
+        self,
+        method: str,
+        url: str,
+        payload: Optional[Any],
+        latency: float,
+        response: Optional[Dict[str, Any]] = None,
+        error: Optional[MpesaError] = None,
+    ) -> None:
+        """Appends an interaction to the cassette and its file, without its secrets."""
+        interaction = Interaction(
+            method=method,
+            url=url,
+            payload=self.normalize(payload),
+            response=self._redacted(response),
+            error=error,
+            latency=latency,
+        )
+        line = interaction.model_dump_json(exclude_none=True) + "\n"
+        with self._lock:
+            self._add(interaction)
+            with self.path.open("a", encoding="utf-8") as file:
+                file.write(line)
+
+    def play(self, method: str, url: str, payload: Optional[Any]) -> Interaction:
+        """Returns the next recorded interaction matching a request.
+
+        Raises:
+            MpesaApiException: With error code CASSETTE_MISS if nothing matching
+                was recorded.
+        """
+        key = self._key(method, url, self.normalize(payload))
+        with self._lock:
+            interactions = self._recorded.get(key)
+            if not interactions:
+                raise MpesaApiException(
+                    MpesaError(
+                        error_code="CASSETTE_MISS",
+                        error_message=f"No recorded interaction for {method} {url}.",
+                        status_code=None,
+                    )
+                )
+            cursor = self._cursors.get(key, 0)
+            self._cursors[key] = (cursor + 1) % len(interactions)
+        return interactions[cursor]
+
+    def _add(self, interaction: Interaction) -> None:
+        key = self._key(interaction.method, interaction.url, interaction.payload)
+        self._recorded.setdefault(key, []).append(interaction)
+
+    def _without_ignored(self, value: Any) -> Any:
+        if isinstance(value, dict):
+            return {
+                k: self._without_ignored(v)
+                for k, v in value.items()
+                if k not in self.ignore_fields
+            }
+        if isinstance(value, list):
+            return [self._without_ignored(v) for v in value]
+        return value
+
+    def _redacted(self, value: Any) -> Any:
+        if isinstance(value, dict):
+            return {
+                k: REDACTED if k in self.secret_fields else self._redacted(v)
+                for k, v in value.items()
+            }
+        if isinstance(value, list):
+            return [self._redacted(v) for v in value]
+        return value
+
+    @staticmethod
+    def _key(method: str, url: str, payload: Optional[Any]) -> str:
+        canonical = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
+        return f"{method} {url} {canonical}"
+
+
+def _replayed(interaction: Interaction) -> Dict[str, Any]:
+    if interaction.error is not None:
+        raise MpesaApiException(interaction.error.model_copy())
+    return dict(interaction.response or {})
+
+
+class CassetteHttpClient(HttpClient):
+    """HttpClient that records requests to, or replays them from, a cassette."""
+
+    def __init__(
+        self,
+        cassette: Union[Cassette, str, Path],
+        http_client: Optional[HttpClient] = None,
+        speed: Optional[float] = 1.0,
+    ):
+        """Initializes the client.
+
+        Args:
+            cassette (Union[Cassette, str, Path]): The cassette or its file.
+            http_client (Optional[HttpClient]): Client to forward requests to and
+                record. Without one, requests are replayed from the cassette.
+            speed (Optional[float]): When replaying, delay responses by their
+                recorded latency divided by speed, so 1.0 replays at recorded
+                speed and 10.0 ten times faster. None answers immediately.
+        """
+        self.cassette = cassette if isinstance(cassette, Cassette) else Cassette(cassette)
+        self.http_client = http_client
+        self.speed = speed
+
+    @property
+    def recording(self) -> bool:
+        """Whether requests are recorded rather than replayed."""
+        return self.http_client is not None
+
+    def __enter__(self) -> "CassetteHttpClient":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Closes the wrapped client, if it can be closed."""
+        close = getattr(self.http_client, "close", None)
+        if close is not None:
+            close()
+
+    def register_token_source(self, source: Any) -> None:
+        """Registers a token manager with the wrapped client, if any."""
+        if self.http_client is not None:
+            self.http_client.register_token_source(source)
+
+    def warm_up(self, connections: int = 1) -> None:
+        """Warms up the wrapped client, if any."""
+        if self.http_client is not None:
+            self.http_client.warm_up(connections)
+
+    def post(
+        self, url: str, json: Dict[str, Any], headers: Dict[str, str]
+    ) -> Dict[str, Any]:
+        """Sends or replays a POST request."""
+        inner = self.http_client
+        if inner is None:
+            return self._replay("POST", url, json)
+        return self._record("POST", url, json, lambda: inner.post(url, json, headers))
+
+    def get(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Dict[str, Any]:
+        """Sends or replays a GET request."""
+        inner = self.http_client
+        if inner is None:
+            return self._replay("GET", url, params)
+        return self._record("GET", url, params, lambda: inner.get(url, params, headers))
+
+    def _record(
+        self,
+        method: str,
+        url: str,
+        payload: Any,
+        send: Callable[[], Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        started = time.perf_counter()
+        try:
+            response = send()
+        except MpesaApiException as e:
+            self.cassette.record(
+                method, url, payload, time.perf_counter() - started, error=e.error
+            )
+            raise
+        self.cassette.record(
+            method, url, payload, time.perf_counter() - started, response=response
+        )
+        return response
+
+    def _replay(self, method: str, url: str, payload: Any) -> Dict[str, Any]:
+        interaction = self.cassette.play(method, url, payload)
+        if self.speed:
+            time.sleep(interaction.latency / self.speed)
+        return _replayed(interaction)
+
+
+class AsyncCassetteHttpClient(AsyncHttpClient):
+    """AsyncHttpClient that records requests to, or replays them from, a cassette.
+
+    Takes the same arguments as CassetteHttpClient, wrapping an AsyncHttpClient.
+    """
+
+    def __init__(
+        self,
+        cassette: Union[Cassette, str, Path],
+        http_client: Optional[AsyncHttpClient] = None,
+        speed: Optional[float] = 1.0,
+    ):
+        """Initializes the client; see CassetteHttpClient."""
+        self.cassette = cassette if isinstance(cassette, Cassette) else Cassette(cassette)
+        self.http_client = http_client
+        self.speed = speed
+
+    @property
+    def recording(self) -> bool:
+        """Whether requests are recorded rather than replayed."""
+        return self.http_client is not None
+
+    async def __aenter__(self) -> "AsyncCassetteHttpClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Closes the wrapped client, if it can be closed."""
+        aclose = getattr(self.http_client, "aclose", None)
+        if aclose is not None:
+            await aclose()
+
+    def register_token_source(self, source: Any) -> None:
+        """Registers a token manager with the wrapped client, if any."""
+        if self.http_client is not None:
+            self.http_client.register_token_source(source)
+
+    async def warm_up(self, connections: int = 1) -> None:
+        """Warms up the wrapped client, if any."""
+        if self.http_client is not None:
+            await self.http_client.warm_up(connections)
+
+    async def post(
+        self, url: str, json: Dict[str, Any], headers: Dict[str, str]
+    ) -> Dict[str, Any]:
+        """Sends or replays a POST request."""
+        if self.http_client is None:
+            return await self._replay("POST", url, json)
+        started = time.perf_counter()
+        try:
+            response = await self.http_client.post(url, json, headers)
+        except MpesaApiException as e:
+            self._record("POST", url, json, started, error=e.error)
+            raise
+        self._record("POST", url, json, started, response=response)
+        return response
+
+    async def get(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Dict[str, Any]:
+        """Sends or replays a GET request."""
+        if self.http_client is None:
+            return await self._replay("GET", url, params)
+        started = time.perf_counter()
+        try:
+            response = await self.http_client.get(url, params, headers)
+        except MpesaApiException as e:
+            self._record("GET", url, params, started, error=e.error)
+            raise
+        self._record("GET", url, params, started, response=response)
+        return response
+
+    def _record(
+        self, method: str, url: str, payload: Any, started: float, **outcome: Any
+    ) -> None:
+        self.cassette.record(
+            method, url, payload, time.perf_counter() - started, **outcome
+        )
+
+    async def _replay(self, method: str, url: str, payload: Any) -> Dict[str, Any]:
+        interaction = self.cassette.play(method, url, payload)
+        if self.speed:
+            await asyncio.sleep(interaction.latency / self.speed)
+        return _replayed(interaction)
@@ -0,0 +1,251 @@
+"""Per-endpoint circuit breakers for the M-Pesa HTTP clients.
+
+When an endpoint keeps failing, for example during a Daraja outage, its breaker
+opens and further requests to it fail immediately with a ``CIRCUIT_OPEN`` error
+instead of each waiting for a timeout. After ``reset_timeout`` seconds the breaker
+lets a limited number of probe requests through (half-open); a successful probe
+closes it again, a failed one re-opens it.
+
+Only transport failures and server errors count as failures. Business errors such
+as HTTP 400 show the endpoint is responsive and count as successes; errors raised
+before a request reached the endpoint are not counted at all.
+"""
+
+import threading
+import time
+from collections import deque
+from enum import Enum
+from typing import ClassVar, Deque, Dict, FrozenSet, Optional
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from mpesakit.errors import MpesaError, MpesaApiException
+
+from .fork import register_after_fork
+
+# Errors that indicate the endpoint itself is unhealthy.
+BREAKER_FAILURE_CODES: FrozenSet[str] = frozenset(
+    {
+        "REQUEST_TIMEOUT",
+        "CONNECTION_ERROR",
+        "REQUEST_FAILED",
+        "HTTP_500",
+        "HTTP_502",
+        "HTTP_503",
+        "HTTP_504",
+    }
+)
+
+
+class CircuitState(str, Enum):
+    """State of a circuit breaker."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreakerPolicy(BaseModel):
+    """Thresholds shared by the circuit breakers of an HTTP client.
+
+    Attributes:
+        failure_threshold (Optional[int]): Consecutive failures that open the breaker.
+        failure_rate_threshold (Optional[float]): Failure ratio over the last
+            ``window_size`` calls that opens the breaker.
+        window_size (int): Number of recent calls used to compute the failure rate.
+        minimum_calls (int): Calls required in the window before the failure rate
+            is considered.
+        reset_timeout (float): Seconds an open breaker waits before probing.
+        half_open_max_calls (int): Probe requests allowed through while half-open.
+        failure_codes (FrozenSet[str]): Error codes counted as failures.
+    """
+
+    failure_threshold: Optional[int] = Field(default=5, ge=1)
+    failure_rate_threshold: Optional[float] = Field(default=0.5, gt=0, le=1)
+    window_size: int = Field(default=20, ge=1)
+    minimum_calls: int = Field(default=10, ge=1)
+    reset_timeout: float = Field(default=30.0, ge=0)
+    half_open_max_calls: int = Field(default=1, ge=1)
+    failure_codes: FrozenSet[str] = BREAKER_FAILURE_CODES
+
+    model_config: ClassVar[ConfigDict] = {"frozen": True}
+
+
+class CircuitBreakerStats(BaseModel):
+    """Point-in-time view of a circuit breaker, e.g. for exporting as metrics."""
+
+    state: CircuitState
+    consecutive_failures: int
+    failure_rate: float
+    window_calls: int
+    times_opened: int
+
+
+class CircuitBreaker:
+    """Thread-safe circuit breaker guarding a single endpoint."""
+
+    def __init__(self, name: str, policy: Optional[CircuitBreakerPolicy] = None):
+        """Initializes a closed breaker.
+
+        Args:
+            name (str): Name of the guarded endpoint, used in error messages.
+            policy (Optional[CircuitBreakerPolicy]): Thresholds; defaults to CircuitBreakerPolicy().
+        """
+        self.name = name
+        self.policy = policy or CircuitBreakerPolicy()
+        self._lock = threading.Lock()
+        self._state = CircuitState.CLOSED
+        self._window: Deque[bool] = deque(maxlen=self.policy.window_size)
+        self._consecutive_failures = 0
+        self._opened_at = 0.0
+        self._half_open_calls = 0
+        self._times_opened = 0
+        register_after_fork(self)
+
+    def _after_fork(self) -> None:
+        """Frees the lock and trial calls held by threads a forked child lacks."""
+        self._lock = threading.Lock()
+        self._half_open_calls = 0
+
+    @property
+    def state(self) -> CircuitState:
+        """The current state, moving from open to half-open once reset_timeout elapsed."""
+        with self._lock:
+            return self._current_state()
+
+    def before_request(self) -> None:
+        """Reserves permission to send a request.
+
+        Raises:
+            MpesaApiException: With error code CIRCUIT_OPEN if the request must not be sent.
+        """
+        with self._lock:
+            state = self._current_state()
+            if state is CircuitState.CLOSED:
+                return
+            if (
+                state is CircuitState.HALF_OPEN
+                and self._half_open_calls < self.policy.half_open_max_calls
+            ):
+                self._half_open_calls += 1
+                return
+        raise MpesaApiException(
+            MpesaError(
+                error_code="CIRCUIT_OPEN",
+                error_message=f"Circuit breaker for {self.name} is open; request not sent.",
+                status_code=None,
+            )
+        )
+
+    def record_success(self) -> None:
+        """Records a request that reached a responsive endpoint."""
+        with self._lock:
+            if self._state is CircuitState.HALF_OPEN:
+                self._close()
+            self._consecutive_failures = 0
+            self._window.append(True)
+
+    def record_failure(self) -> None:
+        """Records a request that failed because the endpoint is unhealthy."""
+        with self._lock:
+            if self._state is CircuitState.HALF_OPEN:
+                self._open()
+                return
+            self._consecutive_failures += 1
+            self._window.append(False)
+            if self._state is CircuitState.CLOSED and self._should_open():
+                self._open()
+
+    def record_error(self, exc: MpesaApiException) -> None:
+        """Records a failed request, counting it as a failure only for failure_codes.
+
+        Errors raised before the endpoint answered, such as a client-side rate limit,
+        say nothing about its health and are not recorded.
+        """
+        if exc.error_code in self.policy.failure_codes:
+            self.record_failure()
+        elif exc.error.status_code is None:
+            self.release()
+        else:
+            self.record_success()
+
+    def release(self) -> None:
+        """Returns a permission from before_request() that produced no outcome."""
+        with self._lock:
+            if self._state is CircuitState.HALF_OPEN and self._half_open_calls > 0:
+                self._half_open_calls -= 1
+
+    def stats(self) -> CircuitBreakerStats:
+        """Returns a snapshot of the breaker's state and counters."""
+        with self._lock:
+            calls = len(self._window)
+            failures = calls - sum(self._window)
+            return CircuitBreakerStats(
+                state=self._current_state(),
+                consecutive_failures=self._consecutive_failures,
+                failure_rate=failures / calls if calls else 0.0,
+                window_calls=calls,
+                times_opened=self._times_opened,
+            )
+
+    def _current_state(self) -> CircuitState:
+        if (
+            self._state is CircuitState.OPEN
+            and time.monotonic() - self._opened_at >= self.policy.reset_timeout
+        ):
+            self._state = CircuitState.HALF_OPEN
+            self._half_open_calls = 0
+        return self._state
+
+    def _should_open(self) -> bool:
+        policy = self.policy
+        if (
+            policy.failure_threshold is not None
+            and self._consecutive_failures >= policy.failure_threshold
+        ):
+            return True
+        calls = len(self._window)
+        if policy.failure_rate_threshold is None or calls < policy.minimum_calls:
+            return False
+        return (calls - sum(self._window)) / calls >= policy.failure_rate_threshold
+
+    def _open(self) -> None:
+        self._state = CircuitState.OPEN
+        self._opened_at = time.monotonic()
+        self._times_opened += 1
+
+    def _close(self) -> None:
+        self._state = CircuitState.CLOSED
+        self._window.clear()
+        self._consecutive_failures = 0
+
+
+class CircuitBreakers:
+    """Circuit breakers of an HTTP client, one per URL path, created on first use."""
+
+    def __init__(self, policy: Optional[CircuitBreakerPolicy] = None):
+        """Initializes an empty set of breakers sharing one policy."""
+        self.policy = policy or CircuitBreakerPolicy()
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+        register_after_fork(self)
+
+    def _after_fork(self) -> None:
+        """Replaces the lock, which a thread of the parent process may have held."""
+        self._lock = threading.Lock()
+
+    def get(self, path: str) -> CircuitBreaker:
+        """Returns the breaker for a URL path."""
+        breaker = self._breakers.get(path)
+        if breaker is None:
+            with self._lock:
+                breaker = self._breakers.setdefault(
+                    path, CircuitBreaker(path, self.policy)
+                )
+        return breaker
+
+    def stats(self) -> Dict[str, CircuitBreakerStats]:
+        """Returns a snapshot of every breaker, keyed by URL path."""
+        with self._lock:
+            breakers = dict(self._breakers)
+        return {path: breaker.stats() for path, breaker in breakers.items()}
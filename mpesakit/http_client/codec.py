@@ -0,0 +1,99 @@
+"""Pluggable JSON codecs for M-Pesa API request and response bodies.
+
+The HTTP clients encode request bodies and decode responses with a JsonCodec. By
+default the fastest available implementation is used: orjson, then msgspec, then the
+standard library's json module. Neither orjson nor msgspec is required; install one
+of them to speed up large payloads such as bulk invoices.
+
+Request bodies may also be passed to the clients already encoded, as bytes, e.g. from
+``request.model_dump_json().encode()``, which skips building an intermediate dict.
+"""
+
+import importlib
+import json
+from abc import ABC, abstractmethod
+from typing import Any, Union
+
+
+class JsonCodec(ABC):
+    """Encodes and decodes JSON bodies."""
+
+    name: str = ""
+
+    @abstractmethod
+    def dumps(self, obj: Any) -> bytes:
+        """Encodes obj as UTF-8 JSON."""
+
+    @abstractmethod
+    def loads(self, data: Union[bytes, str]) -> Any:
+        """Decodes a JSON document.
+
+        Raises:
+            ValueError: If data is not valid JSON.
+        """
+
+
+class StdlibJsonCodec(JsonCodec):
+    """Codec using the standard library's json module."""
+
+    name = "json"
+
+    def dumps(self, obj: Any) -> bytes:
+        """Encodes obj as UTF-8 JSON."""
+        return json.dumps(obj, allow_nan=False).encode("utf-8")
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        """Decodes a JSON document."""
+        return json.loads(data)
+
+
+class OrjsonCodec(JsonCodec):
+    """Codec using orjson. Raises ImportError if orjson is not installed."""
+
+    name = "orjson"
+
+    def __init__(self) -> None:
+        """Imports orjson."""
+        self._orjson = importlib.import_module("orjson")
+
+    def dumps(self, obj: Any) -> bytes:
+        """Encodes obj as UTF-8 JSON."""
+        return self._orjson.dumps(obj)
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        """Decodes a JSON document."""
+        return self._orjson.loads(data)
+
+
+class MsgspecCodec(JsonCodec):
+    """Codec using msgspec. Raises ImportError if msgspec is not installed."""
+
+    name = "msgspec"
+
+    def __init__(self) -> None:
+        """Imports msgspec and creates a reusable encoder and decoder."""
+        msgspec = importlib.import_module("msgspec")
+        self._error = msgspec.DecodeError
+        self._encoder = msgspec.json.Encoder()
+        self._decoder = msgspec.json.Decoder()
+
+    def dumps(self, obj: Any) -> bytes:
+        """Encodes obj as UTF-8 JSON."""
+        return self._encoder.encode(obj)
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        """Decodes a JSON document."""
+        try:
+            return self._decoder.decode(data)
+        except self._error as e:
+            raise ValueError(str(e)) from e
+
+
+def default_codec() -> JsonCodec:
+    """Returns the fastest installed codec: orjson, msgspec or the standard library."""
+    for codec in (OrjsonCodec, MsgspecCodec):
+        try:
+            return codec()
+        except ImportError:
+            continue
+    return StdlibJsonCodec()
@@ -0,0 +1,369 @@
+"""Adaptive (AIMD) limits on the number of in-flight M-Pesa API requests.
+
+A fixed concurrency is either too low when Daraja is fast or overloads it when it is
+slow. The limiters here adapt the limit to the gateway's health:
+
+- While the p99 latency of recent requests stays under ``latency_target`` and their
+  error rate under ``max_error_rate``, the limit grows additively, by about
+  ``increase`` per round of ``limit`` completed requests.
+- When a request times out, is throttled or gets a 5xx response, the limit is
+  multiplied by ``backoff_ratio``. Requests already in flight when the limit was cut
+  do not cut it again, so a burst of failures counts as a single signal.
+
+Requests over the limit wait in a queue until a slot frees up.
+"""
+
+import asyncio
+import threading
+import time
+from collections import deque
+from typing import ClassVar, Deque, FrozenSet, Optional
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from mpesakit.errors import MpesaError, MpesaApiException
+
+from .fork import register_after_fork
+
+# Errors signalling that the gateway is overloaded.
+OVERLOAD_ERROR_CODES: FrozenSet[str] = frozenset(
+    {
+        "REQUEST_TIMEOUT",
+        "HTTP_429",
+        "HTTP_500",
+        "HTTP_502",
+        "HTTP_503",
+        "HTTP_504",
+    }
+)
+
+
+class AIMDPolicy(BaseModel):
+    """Tuning of an adaptive concurrency limiter.
+
+    Attributes:
+        initial_limit (int): Concurrency limit to start with.
+        min_limit (int): Lowest the limit may shrink to.
+        max_limit (int): Highest the limit may grow to.
+        increase (float): Additive growth per round of ``limit`` healthy requests.
+        backoff_ratio (float): Factor applied to the limit on an overload signal.
+        latency_target (float): p99 latency, in seconds, above which growth stops.
+        max_error_rate (float): Overload error rate above which growth stops.
+        window_size (int): Number of recent requests used for p99 and error rate.
+        overload_codes (FrozenSet[str]): Error codes treated as overload signals.
+    """
+
+    initial_limit: int = Field(default=10, ge=1)
+    min_limit: int = Field(default=1, ge=1)
+    max_limit: int = Field(default=200, ge=1)
+    increase: float = Field(default=1.0, gt=0)
+    backoff_ratio: float = Field(default=0.5, gt=0, lt=1)
+    latency_target: float = Field(default=5.0, gt=0)
+    max_error_rate: float = Field(default=0.05, ge=0, le=1)
+    window_size: int = Field(default=100, ge=1)
+    overload_codes: FrozenSet[str] = OVERLOAD_ERROR_CODES
+
+    model_config: ClassVar[ConfigDict] = {"frozen": True}
+
+
+class ConcurrencyStats(BaseModel):
+    """Point-in-time view of a concurrency limiter."""
+
+    limit: int
+    in_flight: int
+    queued: int
+    p99_latency: Optional[float]
+    error_rate: float
+
+
+class Permit:
+    """A slot held by one in-flight request."""
+
+    __slots__ = ("started", "generation")
+
+    def __init__(self, started: float, generation: int):
+        """Records when the request started and the limit generation it saw."""
+        self.started = started
+        self.generation = generation
+
+
+class _AIMDLimit:
+    """Limit arithmetic shared by both limiters. Not thread-safe on its own."""
+
+    def __init__(self, policy: AIMDPolicy):
+        self.policy = policy
+        self.limit = float(
+            min(max(policy.initial_limit, policy.min_limit), policy.max_limit)
+        )
+        self.in_flight = 0
+        self.generation = 0
+        self._latencies: Deque[float] = deque(maxlen=policy.window_size)
+        self._errors: Deque[bool] = deque(maxlen=policy.window_size)
+
+    def has_capacity(self) -> bool:
+        return self.in_flight < int(self.limit)
+
+    def take(self) -> Permit:
+        self.in_flight += 1
+        return Permit(time.monotonic(), self.generation)
+
+    def cancel(self, permit: Permit) -> None:
+        """Frees the slot of a request that was never sent."""
+        self.in_flight -= 1
+
+    def give_back(self, permit: Permit, error: Optional[MpesaApiException]) -> None:
+        if error is not None and error.error.status_code is None:
+            if error.error_code not in self.policy.overload_codes:
+                # Failed before reaching the API, e.g. a connection error.
+                self.cancel(permit)
+                return
+        self.in_flight -= 1
+        overloaded = error is not None and error.error_code in self.policy.overload_codes
+        self._errors.append(overloaded)
+        if overloaded:
+            if permit.generation == self.generation:
+                self.limit = max(
+                    self.limit * self.policy.backoff_ratio, self.policy.min_limit
+                )
+                self.generation += 1
+            return
+        self._latencies.append(time.monotonic() - permit.started)
+        if self._healthy():
+            self.limit = min(
+                self.limit + self.policy.increase / self.limit, self.policy.max_limit
+            )
+
+    def p99(self) -> Optional[float]:
+        if not self._latencies:
+            return None
+        ordered = sorted(self._latencies)
+        return ordered[min(int(len(ordered) * 0.99), len(ordered) - 1)]
+
+    def error_rate(self) -> float:
+        return sum(self._errors) / len(self._errors) if self._errors else 0.0
+
+    def _healthy(self) -> bool:
+        p99 = self.p99()
+        return (
+            p99 is not None
+            and p99 <= self.policy.latency_target
+            and self.error_rate() <= self.policy.max_error_rate
+        )
+
+    def stats(self, queued: int) -> ConcurrencyStats:
+        return ConcurrencyStats(
+            limit=int(self.limit),
+            in_flight=self.in_flight,
+            queued=queued,
+            p99_latency=self.p99(),
+            error_rate=self.error_rate(),
+        )
+
+
+def _max_wait(max_wait: Optional[float], deadline: Optional[float]) -> Optional[float]:
+    if deadline is not None:
+        remaining = max(deadline - time.monotonic(), 0.0)
+        max_wait = remaining if max_wait is None else min(max_wait, remaining)
+    return max_wait
+
+
+def _queue_timeout() -> MpesaApiException:
+    return MpesaApiException(
+        MpesaError(
+            error_code="CONCURRENCY_LIMITED",
+            error_message="Timed out waiting for a free request slot.",
+            status_code=None,
+        )
+    )
+
+
+class ConcurrencyLimiter:
+    """Thread-safe adaptive concurrency limiter for MpesaHttpClient."""
+
+    def __init__(
+        self, policy: Optional[AIMDPolicy] = None, max_wait: Optional[float] = None
+    ):
+        """Initializes the limiter.
+
+        Args:
+            policy (Optional[AIMDPolicy]): Tuning; defaults to AIMDPolicy().
+            max_wait (Optional[float]): Longest time a request waits for a slot before
+                failing with CONCURRENCY_LIMITED. None waits as long as needed.
+        """
+        self.policy = policy or AIMDPolicy()
+        self.max_wait = max_wait
+        self._state = _AIMDLimit(self.policy)
+        self._condition = threading.Condition()
+        self._queued = 0
+        register_after_fork(self)
+
+    def _after_fork(self) -> None:
+        """Frees the slots and lock held by threads a forked child lacks."""
+        self._condition = threading.Condition()
+        self._queued = 0
+        self._state.in_flight = 0
+
+    def acquire(self, deadline: Optional[float] = None) -> Permit:
+        """Blocks until the request may be sent and returns its permit.
+
+        Args:
+            deadline (Optional[float]): time.monotonic() value by which a slot must
+                be granted, in addition to max_wait.
+
+        Raises:
+            MpesaApiException: With error code CONCURRENCY_LIMITED if no slot frees
+                up in time.
+        """
+        with self._condition:
+            self._queued += 1
+            try:
+                if not self._condition.wait_for(
+                    self._state.has_capacity, timeout=_max_wait(self.max_wait, deadline)
+                ):
+                    raise _queue_timeout()
+            finally:
+                self._queued -= 1
+            return self._state.take()
+
+    def release(
+        self, permit: Permit, error: Optional[MpesaApiException] = None
+    ) -> None:
+        """Frees a slot and feeds the request's outcome into the limit.
+
+        Args:
+            permit (Permit): Permit returned by acquire().
+            error (Optional[MpesaApiException]): Error of a failed request, None on success.
+        """
+        with self._condition:
+            self._state.give_back(permit, error)
+            self._condition.notify_all()
+
+    def cancel(self, permit: Permit) -> None:
+        """Frees a slot without recording an outcome, e.g. for a cancelled request."""
+        with self._condition:
+            self._state.cancel(permit)
+            self._condition.notify_all()
+
+    @property
+    def limit(self) -> int:
+        """The current concurrency limit."""
+        return int(self._state.limit)
+
+    def stats(self) -> ConcurrencyStats:
+        """Returns the current limit, in-flight and queued requests, p99 and error rate."""
+        with self._condition:
+            return self._state.stats(self._queued)
+
+
+class AsyncConcurrencyLimiter:
+    """Adaptive concurrency limiter for MpesaAsyncHttpClient.
+
+    The limit is shared by all event loops using the limiter, also when they run in
+    different threads; a slot freed on one loop is handed to a request queued on
+    another through that loop's call_soon_threadsafe().
+    """
+
+    def __init__(
+        self, policy: Optional[AIMDPolicy] = None, max_wait: Optional[float] = None
+    ):
+        """Initializes the limiter; takes the same arguments as ConcurrencyLimiter."""
+        self.policy = policy or AIMDPolicy()
+        self.max_wait = max_wait
+        self._state = _AIMDLimit(self.policy)
+        self._lock = threading.Lock()
+        self._waiters: Deque["asyncio.Future[Permit]"] = deque()
+        register_after_fork(self)
+
+    def _after_fork(self) -> None:
+        """Frees the slots and lock held by event loops a forked child does not run."""
+        self._lock = threading.Lock()
+        self._waiters = deque()
+        self._state.in_flight = 0
+
+    async def acquire(self, deadline: Optional[float] = None) -> Permit:
+        """Waits until the request may be sent and returns its permit.
+
+        Takes the same arguments as ConcurrencyLimiter.acquire().
+
+        Raises:
+            MpesaApiException: With error code CONCURRENCY_LIMITED if no slot frees
+                up in time.
+        """
+        with self._lock:
+            if not self._waiters and self._state.has_capacity():
+                return self._state.take()
+            waiter: "asyncio.Future[Permit]" = (
+                asyncio.get_running_loop().create_future()
+            )
+            self._waiters.append(waiter)
+        try:
+            return await asyncio.wait_for(
+                waiter, timeout=_max_wait(self.max_wait, deadline)
+            )
+        except BaseException as e:
+            if waiter.done() and not waiter.cancelled():
+                # A slot was handed over just as the wait ended; pass it on.
+                self.cancel(waiter.result())
+            if isinstance(e, asyncio.TimeoutError):
+                raise _queue_timeout() from None
+            raise
+        finally:
+            with self._lock:
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
+
+    def release(
+        self, permit: Permit, error: Optional[MpesaApiException] = None
+    ) -> None:
+        """Frees a slot and feeds the request's outcome into the limit.
+
+        Args:
+            permit (Permit): Permit returned by acquire().
+            error (Optional[MpesaApiException]): Error of a failed request, None on success.
+        """
+        with self._lock:
+            self._state.give_back(permit, error)
+            self._wake_waiters()
+
+    def cancel(self, permit: Permit) -> None:
+        """Frees a slot without recording an outcome, e.g. for a cancelled request."""
+        with self._lock:
+            self._state.cancel(permit)
+            self._wake_waiters()
+
+    @property
+    def limit(self) -> int:
+        """The current concurrency limit."""
+        return int(self._state.limit)
+
+    def stats(self) -> ConcurrencyStats:
+        """Returns the current limit, in-flight and queued requests, p99 and error rate."""
+        with self._lock:
+            return self._state.stats(len(self._waiters))
+
+    def _wake_waiters(self) -> None:
+        """Hands free slots to queued requests in arrival order. Must hold _lock."""
+        try:
+            running: Optional[asyncio.AbstractEventLoop] = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        while self._waiters and self._state.has_capacity():
+            waiter = self._waiters.popleft()
+            if waiter.done():
+                continue
+            permit = self._state.take()
+            loop = waiter.get_loop()
+            if loop is running:
+                waiter.set_result(permit)
+                continue
+            try:
+                loop.call_soon_threadsafe(self._hand_over, waiter, permit)
+            except RuntimeError:  # the waiter's loop is closed
+                self._state.cancel(permit)
+
+    def _hand_over(self, waiter: "asyncio.Future[Permit]", permit: Permit) -> None:
+        """Completes waiter with permit on its own loop, or passes the slot on."""
+        if waiter.done():
+            self.cancel(permit)
+        else:
+            waiter.set_result(permit)
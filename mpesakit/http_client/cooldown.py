@@ -0,0 +1,161 @@
+"""Shared back-off after the M-Pesa API throttles a client.
+
+When Daraja throttles a request, with HTTP 429, with a spike-arrest or quota error
+code, or with a 503 carrying a ``Retry-After`` header, the HTTP client records a
+cool-down for that endpoint. Until the cool-down ends, every thread or task using
+the client waits before sending to the endpoint, so the client backs off once
+instead of each request running into the throttle on its own.
+
+The cool-down lasts as long as ``Retry-After`` asks, or ``default_delay`` seconds
+without one, and never longer than ``max_delay``. A request whose deadline would
+pass during the cool-down is abandoned right away with ``DEADLINE_EXCEEDED``.
+"""
+
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, ClassVar, Dict, FrozenSet, Mapping, Optional
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from .fork import register_after_fork
+
+# HTTP statuses whose Retry-After header is honoured.
+THROTTLING_STATUS_CODES: FrozenSet[int] = frozenset({429, 503})
+
+# Daraja error codes for spike arrest and quota violations.
+THROTTLING_ERROR_CODES: FrozenSet[str] = frozenset({"500.003.02", "500.003.03"})
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Returns the seconds to wait from a Retry-After header.
+
+    Args:
+        value (Optional[str]): Header value, either delay-seconds or an HTTP-date.
+
+    Returns:
+        Optional[float]: Seconds from now, at least zero; None if value is missing
+            or malformed.
+    """
+    if value is None:
+        return None
+    value = value.strip()
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max((when - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+
+class CooldownPolicy(BaseModel):
+    """Configures how long an HTTP client backs off from a throttled endpoint.
+
+    Attributes:
+        default_delay (float): Cool-down in seconds when a throttling response has
+            no Retry-After header.
+        max_delay (float): Longest cool-down in seconds, whatever Retry-After asks.
+        status_codes (FrozenSet[int]): HTTP statuses whose Retry-After is honoured.
+            HTTP 429 starts a cool-down even without one.
+        error_codes (FrozenSet[str]): Daraja ``errorCode`` values that mean the
+            client is throttled.
+    """
+
+    default_delay: float = Field(default=1.0, ge=0)
+    max_delay: float = Field(default=60.0, ge=0)
+    status_codes: FrozenSet[int] = THROTTLING_STATUS_CODES
+    error_codes: FrozenSet[str] = THROTTLING_ERROR_CODES
+
+    model_config: ClassVar[ConfigDict] = {"frozen": True}
+
+    def delay_for(
+        self,
+        status_code: int,
+        body: Mapping[str, Any],
+        retry_after: Optional[str] = None,
+    ) -> Optional[float]:
+        """Returns the cool-down caused by a response, or None if it was not throttled.
+
+        Args:
+            status_code (int): HTTP status of the response.
+            body (Mapping[str, Any]): Decoded response body.
+            retry_after (Optional[str]): The response's Retry-After header.
+        """
+        delay = (
+            parse_retry_after(retry_after)
+            if status_code in self.status_codes
+            else None
+        )
+        if delay is None and (
+            status_code == 429 or body.get("errorCode") in self.error_codes
+        ):
+            delay = self.default_delay
+        if delay is None:
+            return None
+        return min(delay, self.max_delay)
+
+
+class Cooldowns:
+    """Cool-downs of an HTTP client, one per URL path, shared by all its callers."""
+
+    def __init__(self, policy: Optional[CooldownPolicy] = None):
+        """Initializes the cool-downs; policy defaults to CooldownPolicy()."""
+        self.policy = policy or CooldownPolicy()
+        self._lock = threading.Lock()
+        self._until: Dict[str, float] = {}
+        register_after_fork(self)
+
+    def _after_fork(self) -> None:
+        """Replaces the lock, which a thread of the parent process may have held."""
+        self._lock = threading.Lock()
+
+    def remaining(self, path: str) -> float:
+        """Seconds until requests to path may be sent again; 0 if not cooling down."""
+        until = self._until.get(path)
+        if until is None:
+            return 0.0
+        remaining = until - time.monotonic()
+        if remaining > 0:
+            return remaining
+        with self._lock:
+            if self._until.get(path) == until:
+                del self._until[path]
+        return 0.0
+
+    def record(self, path: str, delay: float) -> None:
+        """Holds requests to path for delay seconds, unless already held longer."""
+        until = time.monotonic() + delay
+        with self._lock:
+            self._until[path] = max(until, self._until.get(path, until))
+
+    def record_response(
+        self,
+        path: str,
+        status_code: int,
+        body: Mapping[str, Any],
+        retry_after: Optional[str] = None,
+    ) -> Optional[float]:
+        """Starts a cool-down for path if the response shows the client is throttled.
+
+        Takes the same arguments as CooldownPolicy.delay_for(), after path.
+
+        Returns:
+            Optional[float]: The cool-down in seconds, or None if none was started.
+        """
+        delay = self.policy.delay_for(status_code, body, retry_after)
+        if delay:
+            self.record(path, delay)
+        return delay
+
+    def stats(self) -> Dict[str, float]:
+        """Returns the seconds left of every active cool-down, keyed by URL path."""
+        with self._lock:
+            paths = list(self._until)
+        remaining = {path: self.remaining(path) for path in paths}
+        return {path: seconds for path, seconds in remaining.items() if seconds > 0}
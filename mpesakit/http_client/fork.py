@@ -0,0 +1,30 @@
+"""Keeps clients usable in processes forked after they were created.
+
+Pre-fork servers such as gunicorn with ``--preload`` create objects in a master
+process and fork the workers from it. Each worker inherits the master's open
+connections, which it must not share, and any lock another thread of the master
+held at fork time stays locked in the worker forever. Objects registered with
+register_after_fork() rebuild such state in every child process right after
+os.fork(), through their ``_after_fork()`` method, while keeping the rest of their
+state, such as a still valid access token.
+"""
+
+import os
+import weakref
+from typing import Any
+
+_registered: "weakref.WeakValueDictionary[int, Any]" = weakref.WeakValueDictionary()
+
+
+def register_after_fork(obj: Any) -> None:
+    """Has obj._after_fork() called in each child process forked while obj lives."""
+    _registered[id(obj)] = obj
+
+
+def _after_fork_in_child() -> None:
+    for obj in list(_registered.values()):
+        obj._after_fork()
+
+
+if hasattr(os, "register_at_fork"):  # Not available on Windows, which cannot fork.
+    os.register_at_fork(after_in_child=_after_fork_in_child)
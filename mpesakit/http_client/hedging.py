@@ -0,0 +1,297 @@
+"""Hedged requests for read-only M-Pesa API calls.
+
+A single slow Daraja node can hold a request for the full client timeout. With
+hedging, a read-only request that has not been answered after the path's typical
+latency (a percentile of recent requests) is sent a second time; whichever copy
+succeeds first is used.
+
+MpesaAsyncHttpClient cancels the losing copy. MpesaHttpClient cannot interrupt a
+request once it is sent, so the losing copy is left to finish in the background.
+It sends both copies from worker threads, originals and hedges from separate
+pools so that requests never queue behind hedges.
+
+Hedging is opt-in and limited to read-only paths: OAuth token generation, STK push
+queries and transaction status queries. Money-moving endpoints can never be hedged.
+Extra load is capped by a budget: hedges never exceed ``budget`` times the number of
+hedgeable requests.
+"""
+
+import asyncio
+import contextvars
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import (
+    Awaitable,
+    Callable,
+    ClassVar,
+    Deque,
+    Dict,
+    FrozenSet,
+    List,
+    Optional,
+    TypeVar,
+)
+
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+from .fork import register_after_fork
+
+T = TypeVar("T")
+
+# Read-only requests that may be sent twice concurrently.
+HEDGEABLE_PATHS: FrozenSet[str] = frozenset(
+    {
+        "/oauth/v1/generate",
+        "/mpesa/stkpushquery/v1/query",
+        "/mpesa/transactionstatus/v1/query",
+    }
+)
+
+# Requests that move money; a duplicate could pay twice.
+MONEY_MOVING_PATHS: FrozenSet[str] = frozenset(
+    {
+        "/mpesa/stkpush/v1/processrequest",
+        "/mpesa/b2c/v3/paymentrequest",
+        "/mpesa/b2b/v1/paymentrequest",
+        "/mpesa/b2b/v1/remittax",
+        "/mpesa/reversal/v1/request",
+        "/standingorder/v1/createStandingOrderExternal",
+    }
+)
+
+
+class HedgePolicy(BaseModel):
+    """Configures when read-only requests are hedged.
+
+    Attributes:
+        delay_percentile (float): Latency percentile of recent requests to a path
+            after which a hedge is sent, e.g. 0.95 for p95.
+        initial_delay (float): Hedge delay in seconds until ``min_samples`` requests
+            to a path have completed.
+        min_delay (float): Lower bound of the hedge delay in seconds.
+        min_samples (int): Completed requests needed before the percentile is used.
+        window_size (int): Number of recent latencies kept per path.
+        budget (float): Maximum ratio of hedges to hedgeable requests.
+        hedgeable_paths (FrozenSet[str]): Paths that may be hedged. Must not include
+            money-moving endpoints.
+    """
+
+    delay_percentile: float = Field(default=0.95, gt=0, lt=1)
+    initial_delay: float = Field(default=1.0, gt=0)
+    min_delay: float = Field(default=0.05, ge=0)
+    min_samples: int = Field(default=20, ge=1)
+    window_size: int = Field(default=200, ge=1)
+    budget: float = Field(default=0.05, ge=0, le=1)
+    hedgeable_paths: FrozenSet[str] = HEDGEABLE_PATHS
+
+    model_config: ClassVar[ConfigDict] = {"frozen": True}
+
+    @field_validator("hedgeable_paths")
+    @classmethod
+    def _exclude_money_moving(cls, paths: FrozenSet[str]) -> FrozenSet[str]:
+        money_moving = paths & MONEY_MOVING_PATHS
+        if money_moving:
+            raise ValueError(
+                f"Money-moving endpoints cannot be hedged: {', '.join(sorted(money_moving))}"
+            )
+        return paths
+
+
+class HedgeStats(BaseModel):
+    """Counters of a hedger, e.g. for exporting as metrics.
+
+    Attributes:
+        requests (int): Hedgeable requests made.
+        hedges (int): Duplicate requests sent.
+        hedge_wins (int): Hedges that succeeded before the original request.
+        budget_exhausted (int): Hedges skipped because the budget was used up.
+    """
+
+    requests: int = 0
+    hedges: int = 0
+    hedge_wins: int = 0
+    budget_exhausted: int = 0
+
+
+class _BaseHedger:
+    """Latency tracking and budget shared by Hedger and AsyncHedger."""
+
+    def __init__(self, policy: Optional[HedgePolicy] = None):
+        """Initializes the hedger.
+
+        Args:
+            policy (Optional[HedgePolicy]): When to hedge; defaults to HedgePolicy().
+        """
+        self.policy = policy or HedgePolicy()
+        self._lock = threading.Lock()
+        self._latencies: Dict[str, Deque[float]] = {}
+        self._stats = HedgeStats()
+        register_after_fork(self)
+
+    def _after_fork(self) -> None:
+        """Replaces the lock, which a thread of the parent process may have held."""
+        self._lock = threading.Lock()
+
+    def applies_to(self, url: str) -> bool:
+        """Whether requests to url are hedged."""
+        return url in self.policy.hedgeable_paths
+
+    def delay_for(self, url: str) -> float:
+        """Seconds to wait for an answer before hedging a request to url."""
+        with self._lock:
+            latencies = sorted(self._latencies.get(url, ()))
+        if len(latencies) < self.policy.min_samples:
+            delay = self.policy.initial_delay
+        else:
+            index = int(len(latencies) * self.policy.delay_percentile)
+            delay = latencies[min(index, len(latencies) - 1)]
+        return max(delay, self.policy.min_delay)
+
+    def stats(self) -> HedgeStats:
+        """Returns a snapshot of the hedging counters."""
+        with self._lock:
+            return self._stats.model_copy()
+
+    def _start(self) -> float:
+        with self._lock:
+            self._stats.requests += 1
+        return time.monotonic()
+
+    def _try_hedge(self) -> bool:
+        """Spends budget on a hedge, if any is left."""
+        with self._lock:
+            stats = self._stats
+            if stats.hedges + 1 > self.policy.budget * stats.requests:
+                stats.budget_exhausted += 1
+                return False
+            stats.hedges += 1
+            return True
+
+    def _finish(self, url: str, started: float, hedge_won: bool) -> None:
+        with self._lock:
+            latencies = self._latencies.get(url)
+            if latencies is None:
+                latencies = self._latencies[url] = deque(
+                    maxlen=self.policy.window_size
+                )
+            latencies.append(time.monotonic() - started)
+            if hedge_won:
+                self._stats.hedge_wins += 1
+
+
+class Hedger(_BaseHedger):
+    """Hedges requests of MpesaHttpClient using pools of worker threads."""
+
+    def __init__(self, policy: Optional[HedgePolicy] = None, max_workers: int = 32):
+        """Initializes the hedger.
+
+        Args:
+            policy (Optional[HedgePolicy]): When to hedge; defaults to HedgePolicy().
+            max_workers (int): Threads sending original requests, and as many again
+                sending hedges. Set this to at least the number of threads sharing
+                the client.
+        """
+        super().__init__(policy)
+        self.max_workers = max_workers
+        self._originals = self._new_executor("mpesakit-hedged")
+        self._hedges = self._new_executor("mpesakit-hedge")
+
+    def _new_executor(self, thread_name_prefix: str) -> ThreadPoolExecutor:
+        return ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix=thread_name_prefix
+        )
+
+    def _after_fork(self) -> None:
+        """Replaces the worker threads and lock, which a forked child lacks."""
+        super()._after_fork()
+        self._originals = self._new_executor("mpesakit-hedged")
+        self._hedges = self._new_executor("mpesakit-hedge")
+
+    def call(self, url: str, attempt: Callable[[], T]) -> T:
+        """Runs attempt, running it a second time if it is slow to answer.
+
+        Args:
+            url (str): Path of the request, used to look up its latency.
+            attempt (Callable[[], T]): Sends the request once.
+
+        Returns:
+            T: The result of the first copy to succeed.
+
+        Raises:
+            Exception: The error of the first copy to fail, if every copy failed.
+        """
+        started = self._start()
+        primary = _submit(self._originals, attempt)
+        futures = [primary]
+        if not wait(futures, timeout=self.delay_for(url)).done and self._try_hedge():
+            futures.append(_submit(self._hedges, attempt))
+        winner = _first_success(futures)
+        self._finish(url, started, winner is not primary and winner.exception() is None)
+        return winner.result()
+
+    def close(self) -> None:
+        """Stops the worker threads once in-flight requests have finished."""
+        self._originals.shutdown(wait=False)
+        self._hedges.shutdown(wait=False)
+
+
+def _submit(executor: ThreadPoolExecutor, attempt: Callable[[], T]) -> "Future[T]":
+    # Run in a copy of the caller's context so tenant and idempotency settings apply.
+    return executor.submit(contextvars.copy_context().run, attempt)
+
+
+def _first_success(futures: "List[Future[T]]") -> "Future[T]":
+    """Waits for the first future to succeed, or for all of them to fail.
+
+    A copy still running once another succeeded is left to finish on its own.
+    """
+    pending = set(futures)
+    failed: "Optional[Future[T]]" = None
+    while pending:
+        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            if future.exception() is None:
+                for loser in pending:
+                    loser.cancel()
+                return future
+            failed = failed or future
+    return failed if failed is not None else futures[0]
+
+
+class AsyncHedger(_BaseHedger):
+    """Hedges requests of MpesaAsyncHttpClient; the losing copy is cancelled."""
+
+    async def call(self, url: str, attempt: Callable[[], Awaitable[T]]) -> T:
+        """Awaits attempt, starting it a second time if it is slow to answer.
+
+        Takes the same arguments as Hedger.call().
+        """
+        started = self._start()
+        tasks: "List[asyncio.Future[T]]" = [asyncio.ensure_future(attempt())]
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=self.delay_for(url))
+            if not done and self._try_hedge():
+                tasks.append(asyncio.ensure_future(attempt()))
+            winner = await _first_success_async(tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+        self._finish(url, started, winner is not tasks[0] and winner.exception() is None)
+        return winner.result()
+
+
+async def _first_success_async(
+    tasks: "List[asyncio.Future[T]]",
+) -> "asyncio.Future[T]":
+    """Waits for the first task to succeed, or for all of them to fail."""
+    pending = set(tasks)
+    failed: "Optional[asyncio.Future[T]]" = None
+    while pending:
+        done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+        for task in done:
+            if task.exception() is None:
+                return task
+            failed = failed or task
+    return failed if failed is not None else tasks[0]
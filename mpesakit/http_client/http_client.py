@@ -10,6 +10,17 @@ from abc import ABC, abstractmethod
 class HttpClient(ABC):
     """Abstract base HTTP client for making GET and POST requests."""
 
+    def register_token_source(self, source: Any) -> None:
+        """Called by each TokenManager using this client; does nothing by default.
+
+        Implementations may keep the manager to refresh tokens rejected by the API.
+        """
+        pass
+
+    def warm_up(self, connections: int = 1) -> None:
+        """Opens connections ahead of the first request; does nothing by default."""
+        pass
+
     @abstractmethod
     def post(
         self, url: str, json: Dict[str, Any], headers: Dict[str, str]
@@ -35,6 +46,17 @@ class AsyncHttpClient(ABC):
     essential for interacting with the Mpesa API non-blockingly.
     """
 
+    def register_token_source(self, source: Any) -> None:
+        """Called by each AsyncTokenManager using this client; does nothing by default.
+
+        Implementations may keep the manager to refresh tokens rejected by the API.
+        """
+        pass
+
+    async def warm_up(self, connections: int = 1) -> None:
+        """Opens connections ahead of the first request; does nothing by default."""
+        pass
+
     @abstractmethod
     async def post(
         self, url: str, json: Dict[str, Any], headers: Dict[str, str]
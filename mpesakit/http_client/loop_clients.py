@@ -0,0 +1,143 @@
+"""One pooled httpx client per event loop for MpesaAsyncHttpClient.
+
+An httpx.AsyncClient and its pooled connections belong to the event loop that
+first used them, and fail with "attached to a different loop" errors on any other.
+Applications running several loops, such as a FastAPI server next to Celery tasks
+that each call ``asyncio.run()``, can still share one MpesaAsyncHttpClient, with
+its token, circuit breakers and limits: a LoopClientRegistry creates a client for
+each loop on first use in it, which all requests on that loop then share.
+
+A loop's client is closed when the loop shuts down, from the loop's
+``shutdown_asyncgens()``, which ``asyncio.run()`` and most servers call before
+closing a loop. Clients of loops closed without it are dropped once their loop
+is found closed.
+
+Other state bound to a loop, such as the asyncio lock serializing the token
+refreshes of an AsyncTokenManager, is kept per loop in a LoopLocal.
+"""
+
+import asyncio
+import threading
+import weakref
+from typing import AsyncGenerator, Callable, Dict, Generic, List, TypeVar
+
+import httpx
+
+from .fork import register_after_fork
+
+T = TypeVar("T")
+
+
+class LoopLocal(Generic[T]):
+    """A value per event loop, created on first use in each loop. Thread-safe.
+
+    The value of a loop is dropped when the loop is garbage collected.
+    """
+
+    def __init__(self, factory: Callable[[], T]) -> None:
+        """Initializes the holder.
+
+        Args:
+            factory (Callable[[], T]): Creates the value of a loop.
+        """
+        self._factory = factory
+        self._lock = threading.Lock()
+        self._values: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, T]" = (
+            weakref.WeakKeyDictionary()
+        )
+        register_after_fork(self)
+
+    def _after_fork(self) -> None:
+        """Replaces the lock, which a thread of the parent process may have held."""
+        self._lock = threading.Lock()
+
+    def get(self) -> T:
+        """Returns the value of the running event loop, creating it on first use.
+
+        Raises:
+            RuntimeError: If no event loop is running in the current thread.
+        """
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            value = self._values.get(loop)
+            if value is None:
+                value = self._values[loop] = self._factory()
+            return value
+
+
+class LoopClientRegistry:
+    """The httpx clients of an MpesaAsyncHttpClient, one per event loop. Thread-safe."""
+
+    def __init__(self, factory: Callable[[], httpx.AsyncClient]) -> None:
+        """Initializes an empty registry.
+
+        Args:
+            factory (Callable[[], httpx.AsyncClient]): Creates the client of a loop.
+        """
+        self._factory = factory
+        self._lock = threading.Lock()
+        self._clients: Dict[asyncio.AbstractEventLoop, httpx.AsyncClient] = {}
+        self._closers: Dict[asyncio.AbstractEventLoop, AsyncGenerator[None, None]] = {}
+
+    def get(self) -> httpx.AsyncClient:
+        """Returns the client of the running event loop, creating it on first use.
+
+        Raises:
+            RuntimeError: If no event loop is running in the current thread.
+        """
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            client = self._clients.get(loop)
+            if client is None:
+                self._drop_closed_loops()
+                client = self._clients[loop] = self._factory()
+                closer = self._closers[loop] = self._close_at_shutdown(loop, client)
+                _register_with_loop(closer)
+            return client
+
+    def clients(self) -> List[httpx.AsyncClient]:
+        """Returns the clients of all event loops."""
+        with self._lock:
+            return list(self._clients.values())
+
+    async def aclose(self) -> None:
+        """Closes the client of the running event loop, if it has one.
+
+        A later request on the loop creates a new client.
+        """
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            closer = self._closers.get(loop)
+        if closer is not None:
+            await closer.aclose()
+
+    async def _close_at_shutdown(
+        self, loop: asyncio.AbstractEventLoop, client: httpx.AsyncClient
+    ) -> AsyncGenerator[None, None]:
+        """Suspends until the loop shuts down its async generators or aclose()."""
+        try:
+            yield
+        finally:
+            with self._lock:
+                if self._clients.get(loop) is client:
+                    del self._clients[loop]
+                    del self._closers[loop]
+            await client.aclose()
+
+    def _drop_closed_loops(self) -> None:
+        for loop in [loop for loop in self._clients if loop.is_closed()]:
+            del self._clients[loop]
+            del self._closers[loop]
+
+
+def _register_with_loop(closer: AsyncGenerator[None, None]) -> None:
+    """Runs closer up to its yield, so the running loop will finalize it.
+
+    The loop tracks each async generator from its first iteration on and closes
+    the ones still suspended in shutdown_asyncgens(). The generator only yields, so
+    its first step completes without awaiting and can be driven synchronously.
+    """
+    try:
+        closer.asend(None).send(None)
+    except StopIteration:
+        pass
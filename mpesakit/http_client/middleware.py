@@ -0,0 +1,459 @@
+"""Request middleware for the M-Pesa HTTP clients.
+
+Every request made by MpesaHttpClient or MpesaAsyncHttpClient passes through an
+ordered chain of middlewares before it is sent. A middleware receives the Request
+and the next handler of the chain; it may inspect or replace the request, time the
+call, skip it, and inspect, replace or raise instead of its response:
+
+    class Timing(Middleware):
+        def __call__(self, request, call_next):
+            started = time.perf_counter()
+            try:
+                return call_next(request)
+            finally:
+                metrics.observe(request.url, time.perf_counter() - started)
+
+    client = MpesaHttpClient(middlewares=[Timing()])
+
+Middlewares given to a client run first, in order, and see each call once. The
+client's own features follow, themselves implemented as the middlewares below:
+single-flight, retries, hedging, cool-downs, rate limiting, circuit breaking,
+the replay of requests whose token was revoked and concurrency limiting. Features
+that are not configured are left out of the chain, and the chain is composed once,
+when the client is created, so a request only passes through what it needs.
+"""
+
+import asyncio
+import time
+from abc import ABC, abstractmethod
+from typing import Any, Awaitable, Callable, Dict, Optional, Sequence, Union
+
+from mpesakit.errors import MpesaApiException
+from .circuit_breaker import CircuitBreakers
+from .concurrency import AsyncConcurrencyLimiter, ConcurrencyLimiter
+from .cooldown import Cooldowns
+from .hedging import AsyncHedger, Hedger
+from .rate_limiter import AsyncRateLimiter, RateLimiter, shortcode_of
+from .retry import RetryPolicy
+from .single_flight import AsyncSingleFlight, SingleFlight, request_key
+from .timeouts import current_deadline, deadline_exceeded, remaining_time
+from .token_refresh import (
+    TokenSources,
+    bearer_token,
+    is_invalid_token_error,
+    with_bearer_token,
+)
+
+
+class Request:
+    """A request on its way through the middleware chain.
+
+    Attributes:
+        method (str): HTTP method, "GET" or "POST".
+        url (str): Path of the endpoint, relative to the API base URL.
+        headers (Dict[str, str]): Request headers.
+        json (Optional[Union[Dict[str, Any], bytes]]): Body of a POST request,
+            either as a dict or already encoded.
+        params (Optional[Dict[str, Any]]): Query parameters of a GET request.
+    """
+
+    __slots__ = ("method", "url", "headers", "json", "params")
+
+    def __init__(
+        self,
+        method: str,
+        url: str,
+        headers: Dict[str, str],
+        json: Optional[Union[Dict[str, Any], bytes]] = None,
+        params: Optional[Dict[str, Any]] = None,
+    ):
+        """Initializes the request; see the class attributes."""
+        self.method = method
+        self.url = url
+        self.headers = headers
+        self.json = json
+        self.params = params
+
+    @property
+    def payload(self) -> Optional[Any]:
+        """The body of a POST request, or the query parameters of a GET request."""
+        return self.json if self.json is not None else self.params
+
+    def replace(self, **changes: Any) -> "Request":
+        """Returns a copy of the request with the given attributes changed."""
+        values = {name: getattr(self, name) for name in self.__slots__}
+        values.update(changes)
+        return Request(**values)
+
+    def __repr__(self) -> str:
+        return f"Request({self.method} {self.url})"
+
+
+Handler = Callable[[Request], Dict[str, Any]]
+AsyncHandler = Callable[[Request], Awaitable[Dict[str, Any]]]
+
+
+class Middleware(ABC):
+    """Wraps the requests of MpesaHttpClient; see the module docstring."""
+
+    @abstractmethod
+    def __call__(self, request: Request, call_next: Handler) -> Dict[str, Any]:
+        """Handles a request, usually by passing it on to call_next.
+
+        Args:
+            request (Request): The request.
+            call_next (Handler): The rest of the chain, ending with the transport.
+
+        Returns:
+            Dict[str, Any]: The decoded response.
+        """
+
+
+class AsyncMiddleware(ABC):
+    """Wraps the requests of MpesaAsyncHttpClient; see the module docstring."""
+
+    @abstractmethod
+    async def __call__(
+        self, request: Request, call_next: AsyncHandler
+    ) -> Dict[str, Any]:
+        """Handles a request, usually by awaiting call_next; see Middleware."""
+
+
+def chain(middlewares: Sequence[Middleware], handler: Handler) -> Handler:
+    """Composes middlewares around handler; the first middleware is the outermost."""
+    for middleware in reversed(middlewares):
+        handler = _link(middleware, handler)
+    return handler
+
+
+def async_chain(
+    middlewares: Sequence[AsyncMiddleware], handler: AsyncHandler
+) -> AsyncHandler:
+    """Composes async middlewares around handler; the first one is the outermost."""
+    for middleware in reversed(middlewares):
+        handler = _async_link(middleware, handler)
+    return handler
+
+
+def _link(middleware: Middleware, call_next: Handler) -> Handler:
+    return lambda request: middleware(request, call_next)
+
+
+def _async_link(middleware: AsyncMiddleware, call_next: AsyncHandler) -> AsyncHandler:
+    # A coroutine function, not a lambda, so tenacity and others recognise it as async.
+    async def handler(request: Request) -> Dict[str, Any]:
+        return await middleware(request, call_next)
+
+    return handler
+
+
+def _cooldown_delay(cooldowns: Cooldowns, url: str) -> float:
+    """Seconds to wait before sending to url; raises if that outlasts the deadline."""
+    delay = cooldowns.remaining(url)
+    if delay > 0:
+        time_left = remaining_time()
+        if time_left is not None and delay >= time_left:
+            raise deadline_exceeded()
+    return delay
+
+
+class SingleFlightMiddleware(Middleware):
+    """Shares the response of an identical in-flight query; see SingleFlight."""
+
+    def __init__(self, single_flight: SingleFlight):
+        """Initializes the middleware with the coalescer to use."""
+        self.single_flight = single_flight
+
+    def __call__(self, request: Request, call_next: Handler) -> Dict[str, Any]:
+        """Runs the request, unless an identical one is in flight."""
+        if not self.single_flight.applies_to(request.url):
+            return call_next(request)
+        key = request_key(request.method, request.url, request.headers, request.payload)
+        return self.single_flight.do(key, lambda: call_next(request))
+
+
+class AsyncSingleFlightMiddleware(AsyncMiddleware):
+    """Shares the response of an identical in-flight query; see AsyncSingleFlight."""
+
+    def __init__(self, single_flight: AsyncSingleFlight):
+        """Initializes the middleware with the coalescer to use."""
+        self.single_flight = single_flight
+
+    async def __call__(
+        self, request: Request, call_next: AsyncHandler
+    ) -> Dict[str, Any]:
+        """Runs the request, unless an identical one is in flight."""
+        if not self.single_flight.applies_to(request.url):
+            return await call_next(request)
+        key = request_key(request.method, request.url, request.headers, request.payload)
+        return await self.single_flight.do(key, lambda: call_next(request))
+
+
+class RetryMiddleware(Middleware):
+    """Retries transient failures according to a RetryPolicy."""
+
+    def __init__(self, policy: RetryPolicy):
+        """Initializes the middleware with the retry policy to apply."""
+        self.policy = policy
+
+    def __call__(self, request: Request, call_next: Handler) -> Dict[str, Any]:
+        """Runs the request, retrying it if the policy allows."""
+        if not self.policy.allows_retry(request.method, request.url):
+            return call_next(request)
+        return self.policy.retrying()(call_next, request)
+
+
+class AsyncRetryMiddleware(AsyncMiddleware):
+    """Retries transient failures according to a RetryPolicy."""
+
+    def __init__(self, policy: RetryPolicy):
+        """Initializes the middleware with the retry policy to apply."""
+        self.policy = policy
+
+    async def __call__(
+        self, request: Request, call_next: AsyncHandler
+    ) -> Dict[str, Any]:
+        """Runs the request, retrying it if the policy allows."""
+        if not self.policy.allows_retry(request.method, request.url):
+            return await call_next(request)
+        return await self.policy.async_retrying()(call_next, request)
+
+
+class HedgingMiddleware(Middleware):
+    """Hedges slow read-only requests; see Hedger."""
+
+    def __init__(self, hedger: Hedger):
+        """Initializes the middleware with the hedger to use."""
+        self.hedger = hedger
+
+    def __call__(self, request: Request, call_next: Handler) -> Dict[str, Any]:
+        """Runs the request, sending a second copy if it is slow to answer."""
+        if not self.hedger.applies_to(request.url):
+            return call_next(request)
+        return self.hedger.call(request.url, lambda: call_next(request))
+
+
+class AsyncHedgingMiddleware(AsyncMiddleware):
+    """Hedges slow read-only requests; see AsyncHedger."""
+
+    def __init__(self, hedger: AsyncHedger):
+        """Initializes the middleware with the hedger to use."""
+        self.hedger = hedger
+
+    async def __call__(
+        self, request: Request, call_next: AsyncHandler
+    ) -> Dict[str, Any]:
+        """Runs the request, sending a second copy if it is slow to answer."""
+        if not self.hedger.applies_to(request.url):
+            return await call_next(request)
+        return await self.hedger.call(request.url, lambda: call_next(request))
+
+
+class CooldownMiddleware(Middleware):
+    """Holds requests to an endpoint until its cool-down ends; see Cooldowns."""
+
+    def __init__(self, cooldowns: Cooldowns):
+        """Initializes the middleware with the client's cool-downs."""
+        self.cooldowns = cooldowns
+
+    def __call__(self, request: Request, call_next: Handler) -> Dict[str, Any]:
+        """Waits out the endpoint's cool-down, then runs the request."""
+        delay = _cooldown_delay(self.cooldowns, request.url)
+        if delay > 0:
+            time.sleep(delay)
+        return call_next(request)
+
+
+class AsyncCooldownMiddleware(AsyncMiddleware):
+    """Holds requests to an endpoint until its cool-down ends; see Cooldowns."""
+
+    def __init__(self, cooldowns: Cooldowns):
+        """Initializes the middleware with the client's cool-downs."""
+        self.cooldowns = cooldowns
+
+    async def __call__(
+        self, request: Request, call_next: AsyncHandler
+    ) -> Dict[str, Any]:
+        """Waits out the endpoint's cool-down, then runs the request."""
+        delay = _cooldown_delay(self.cooldowns, request.url)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return await call_next(request)
+
+
+class RateLimitMiddleware(Middleware):
+    """Applies client-side rate limits; see RateLimiter."""
+
+    def __init__(self, rate_limiter: RateLimiter):
+        """Initializes the middleware with the rate limiter to consult."""
+        self.rate_limiter = rate_limiter
+
+    def __call__(self, request: Request, call_next: Handler) -> Dict[str, Any]:
+        """Waits for a permit within the current deadline, then runs the request."""
+        self.rate_limiter.acquire(
+            request.url, shortcode_of(request.json), deadline=current_deadline()
+        )
+        return call_next(request)
+
+
+class AsyncRateLimitMiddleware(AsyncMiddleware):
+    """Applies client-side rate limits; see AsyncRateLimiter."""
+
+    def __init__(self, rate_limiter: AsyncRateLimiter):
+        """Initializes the middleware with the rate limiter to consult."""
+        self.rate_limiter = rate_limiter
+
+    async def __call__(
+        self, request: Request, call_next: AsyncHandler
+    ) -> Dict[str, Any]:
+        """Waits for a permit within the current deadline, then runs the request."""
+        await self.rate_limiter.acquire(
+            request.url, shortcode_of(request.json), deadline=current_deadline()
+        )
+        return await call_next(request)
+
+
+class CircuitBreakerMiddleware(Middleware):
+    """Fails requests to an unhealthy endpoint fast; see CircuitBreaker."""
+
+    def __init__(self, circuit_breakers: CircuitBreakers):
+        """Initializes the middleware with the client's circuit breakers."""
+        self.circuit_breakers = circuit_breakers
+
+    def __call__(self, request: Request, call_next: Handler) -> Dict[str, Any]:
+        """Runs the request if the endpoint's breaker allows, recording the outcome."""
+        breaker = self.circuit_breakers.get(request.url)
+        breaker.before_request()
+        try:
+            response = call_next(request)
+        except MpesaApiException as e:
+            breaker.record_error(e)
+            raise
+        except BaseException:
+            breaker.release()
+            raise
+        breaker.record_success()
+        return response
+
+
+class AsyncCircuitBreakerMiddleware(AsyncMiddleware):
+    """Fails requests to an unhealthy endpoint fast; see CircuitBreaker."""
+
+    def __init__(self, circuit_breakers: CircuitBreakers):
+        """Initializes the middleware with the client's circuit breakers."""
+        self.circuit_breakers = circuit_breakers
+
+    async def __call__(
+        self, request: Request, call_next: AsyncHandler
+    ) -> Dict[str, Any]:
+        """Runs the request if the endpoint's breaker allows, recording the outcome."""
+        breaker = self.circuit_breakers.get(request.url)
+        breaker.before_request()
+        try:
+            response = await call_next(request)
+        except MpesaApiException as e:
+            breaker.record_error(e)
+            raise
+        except BaseException:
+            breaker.release()
+            raise
+        breaker.record_success()
+        return response
+
+
+class ConcurrencyLimitMiddleware(Middleware):
+    """Keeps in-flight requests within an adaptive limit; see ConcurrencyLimiter."""
+
+    def __init__(self, limiter: ConcurrencyLimiter):
+        """Initializes the middleware with the limiter to use."""
+        self.limiter = limiter
+
+    def __call__(self, request: Request, call_next: Handler) -> Dict[str, Any]:
+        """Runs the request once a slot is free, feeding its outcome to the limit."""
+        limiter = self.limiter
+        permit = limiter.acquire(deadline=current_deadline())
+        try:
+            response = call_next(request)
+        except MpesaApiException as e:
+            limiter.release(permit, e)
+            raise
+        except BaseException:
+            limiter.cancel(permit)
+            raise
+        limiter.release(permit)
+        return response
+
+
+class AsyncConcurrencyLimitMiddleware(AsyncMiddleware):
+    """Keeps in-flight requests within an adaptive limit; see AsyncConcurrencyLimiter."""
+
+    def __init__(self, limiter: AsyncConcurrencyLimiter):
+        """Initializes the middleware with the limiter to use."""
+        self.limiter = limiter
+
+    async def __call__(
+        self, request: Request, call_next: AsyncHandler
+    ) -> Dict[str, Any]:
+        """Runs the request once a slot is free, feeding its outcome to the limit."""
+        limiter = self.limiter
+        permit = await limiter.acquire(deadline=current_deadline())
+        try:
+            response = await call_next(request)
+        except MpesaApiException as e:
+            limiter.release(permit, e)
+            raise
+        except BaseException:
+            limiter.cancel(permit)
+            raise
+        limiter.release(permit)
+        return response
+
+
+class TokenRefreshMiddleware(Middleware):
+    """Replays a request once if its access token was rejected as revoked."""
+
+    def __init__(self, token_sources: TokenSources):
+        """Initializes the middleware with the token managers of the client."""
+        self.token_sources = token_sources
+
+    def __call__(self, request: Request, call_next: Handler) -> Dict[str, Any]:
+        """Runs the request, replaying it with a fresh token if the token was rejected."""
+        try:
+            return call_next(request)
+        except MpesaApiException as e:
+            stale_token = bearer_token(request.headers)
+            if stale_token is None or not is_invalid_token_error(e.error):
+                raise
+            source = self.token_sources.find(stale_token)
+            if source is None:
+                raise
+            token = source.get_token(force_refresh=True, stale_token=stale_token)
+        return call_next(
+            request.replace(headers=with_bearer_token(request.headers, token))
+        )
+
+
+class AsyncTokenRefreshMiddleware(AsyncMiddleware):
+    """Replays a request once if its access token was rejected as revoked."""
+
+    def __init__(self, token_sources: TokenSources):
+        """Initializes the middleware with the token managers of the client."""
+        self.token_sources = token_sources
+
+    async def __call__(
+        self, request: Request, call_next: AsyncHandler
+    ) -> Dict[str, Any]:
+        """Runs the request, replaying it with a fresh token if the token was rejected."""
+        try:
+            return await call_next(request)
+        except MpesaApiException as e:
+            stale_token = bearer_token(request.headers)
+            if stale_token is None or not is_invalid_token_error(e.error):
+                raise
+            source = self.token_sources.find(stale_token)
+            if source is None:
+                raise
+            token = await source.get_token(force_refresh=True, stale_token=stale_token)
+        return await call_next(
+            request.replace(headers=with_bearer_token(request.headers, token))
+        )
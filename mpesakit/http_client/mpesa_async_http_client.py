@@ -1,10 +1,47 @@
 """MpesaAsyncHttpClient: An asynchronous client for making HTTP requests to the M-Pesa API."""
 
-from typing import Dict, Any, Optional
+import asyncio
+import threading
+import weakref
+from typing import Dict, Any, List, Optional, Sequence, Union
 import httpx
 
 from mpesakit.errors import MpesaError, MpesaApiException
 from .http_client import AsyncHttpClient
+from .circuit_breaker import CircuitBreakerPolicy, CircuitBreakers
+from .codec import JsonCodec, default_codec
+from .cooldown import CooldownPolicy, Cooldowns
+from .fork import register_after_fork
+from .concurrency import AsyncConcurrencyLimiter
+from .hedging import AsyncHedger
+from .loop_clients import LoopClientRegistry
+from .middleware import (
+    AsyncCircuitBreakerMiddleware,
+    AsyncConcurrencyLimitMiddleware,
+    AsyncCooldownMiddleware,
+    AsyncHandler,
+    AsyncHedgingMiddleware,
+    AsyncMiddleware,
+    AsyncRateLimitMiddleware,
+    AsyncRetryMiddleware,
+    AsyncSingleFlightMiddleware,
+    AsyncTokenRefreshMiddleware,
+    Request,
+    async_chain,
+)
+from .rate_limiter import AsyncRateLimiter
+from .response_limits import (
+    CHUNK_SIZE,
+    ResponseLimits,
+    aread_limited,
+    decode_body,
+    response_too_large,
+)
+from .retry import RetryPolicy
+from .single_flight import AsyncSingleFlight
+from .timeouts import Timeouts, check_deadline, deadline_exceeded, remaining_time
+from .token_refresh import TokenSources
+from .transport_metrics import MeteredAsyncTransport, TransportMetrics
 
 
 class MpesaAsyncHttpClient(AsyncHttpClient):
@@ -13,86 +50,248 @@ class MpesaAsyncHttpClient(AsyncHttpClient):
     This client handles asynchronous GET and POST requests using the httpx library.
     It supports both sandbox and production environments.
 
+    A request rejected because its access token was revoked is replayed once with a
+    fresh token from the AsyncTokenManager that issued it.
+
+    Requests made within request_deadline(), or through a service method called with
+    ``timeout=`` or ``deadline=``, are abandoned once the deadline has passed.
+
+    When an endpoint throttles the client, e.g. with HTTP 429 and Retry-After, all
+    requests to it wait out one shared cool-down before being sent.
+
+    Response bodies are read as a stream and no further than response_limits allows.
+
+    The client can be shared by several event loops, e.g. across ``asyncio.run()``
+    calls: each loop gets its own pool of connections on first use, which is
+    closed when the loop shuts down. Its concurrency limit holds across all loops,
+    token managers refresh on any of them, and single-flight coalesces requests
+    made on the same loop.
+
     Attributes:
         base_url (str): The base URL for the M-Pesa API.
+        retry_policy (RetryPolicy): How transient failures are retried.
+        circuit_breakers (CircuitBreakers): Per-endpoint circuit breakers.
+        cooldowns (Cooldowns): Per-endpoint back-off after throttling responses.
+        rate_limiter (Optional[AsyncRateLimiter]): Limiter consulted before each request.
+        concurrency_limiter (Optional[AsyncConcurrencyLimiter]): Adaptive limit on
+            in-flight requests.
+        hedger (Optional[AsyncHedger]): Hedges slow read-only requests.
+        single_flight (Optional[AsyncSingleFlight]): Coalesces identical in-flight queries.
+        codec (JsonCodec): Encodes request bodies and decodes responses.
+        timeouts (Timeouts): Default timeouts of a request.
+        endpoint_timeouts (Dict[str, Timeouts]): Timeouts of requests to specific paths.
+        middlewares (List[AsyncMiddleware]): Middlewares wrapping every request, outermost
+            first; see add_middleware().
+        response_limits (ResponseLimits): How much of a response is read and kept.
     """
 
     base_url: str
-    _client: httpx.AsyncClient
+    retry_policy: RetryPolicy
+    circuit_breakers: CircuitBreakers
+    cooldowns: Cooldowns
+    rate_limiter: Optional[AsyncRateLimiter]
+    concurrency_limiter: Optional[AsyncConcurrencyLimiter]
+    hedger: Optional[AsyncHedger]
+    single_flight: Optional[AsyncSingleFlight]
+    codec: JsonCodec
+    timeouts: Timeouts
+    endpoint_timeouts: Dict[str, Timeouts]
+    middlewares: List[AsyncMiddleware]
+    response_limits: ResponseLimits
+    transport_metrics: TransportMetrics
+    _clients: LoopClientRegistry
+    _token_sources: TokenSources
+    _handler: AsyncHandler
+
+    def __init__(
+        self,
+        env: str = "sandbox",
+        retry_policy: Optional[RetryPolicy] = None,
+        circuit_breaker_policy: Optional[CircuitBreakerPolicy] = None,
+        rate_limiter: Optional[AsyncRateLimiter] = None,
+        concurrency_limiter: Optional[AsyncConcurrencyLimiter] = None,
+        hedger: Optional[AsyncHedger] = None,
+        single_flight: Optional[AsyncSingleFlight] = None,
+        codec: Optional[JsonCodec] = None,
+        timeouts: Optional[Timeouts] = None,
+        endpoint_timeouts: Optional[Dict[str, Timeouts]] = None,
+        cooldown_policy: Optional[CooldownPolicy] = None,
+        middlewares: Optional[Sequence[AsyncMiddleware]] = None,
+        base_url: Optional[str] = None,
+        response_limits: Optional[ResponseLimits] = None,
+    ):
+        """Initializes the MpesaAsyncHttpClient with the specified environment.
+
+        Args:
+            env (str): The environment to use, either 'sandbox' or 'production'.
+            retry_policy (Optional[RetryPolicy]): How transient failures are retried.
+                Defaults to RetryPolicy(), which retries only idempotent calls.
+            circuit_breaker_policy (Optional[CircuitBreakerPolicy]): Thresholds of the
+                per-endpoint circuit breakers. Defaults to CircuitBreakerPolicy().
+            rate_limiter (Optional[AsyncRateLimiter]): Client-side rate limits to apply
+                before sending. Defaults to no limiting.
+            concurrency_limiter (Optional[AsyncConcurrencyLimiter]): Adaptive (AIMD)
+                limit on in-flight requests. Defaults to no limit.
+            hedger (Optional[AsyncHedger]): Sends a second copy of slow read-only
+                requests. Defaults to no hedging.
+            single_flight (Optional[AsyncSingleFlight]): Lets concurrent identical queries
+                share one request. Defaults to no coalescing.
+            codec (Optional[JsonCodec]): JSON codec for request and response bodies.
+                Defaults to the fastest installed one, see default_codec().
+            timeouts (Optional[Timeouts]): Default request timeouts. Defaults to
+                Timeouts(), 10 seconds each.
+            endpoint_timeouts (Optional[Dict[str, Timeouts]]): Timeouts overriding
+                the defaults for requests to the given paths, e.g.
+                {"/mpesa/b2c/v3/paymentrequest": Timeouts(read=30)}.
+            cooldown_policy (Optional[CooldownPolicy]): How long to back off from an
+                endpoint that throttled the client. Defaults to CooldownPolicy().
+            middlewares (Optional[Sequence[AsyncMiddleware]]): Middlewares wrapping every
+                request, outermost first. They run before the client's own retry,
+                rate limiting and circuit breaking, which are middlewares too.
+            base_url (Optional[str]): Overrides the API address chosen by env, e.g.
+                to send requests to a local MockDarajaServer.
+            response_limits (Optional[ResponseLimits]): Caps on the size of response
+                bodies read. Defaults to ResponseLimits(), 1 MiB per response.
+        """
+        self.base_url = (base_url or self._resolve_base_url(env)).rstrip("/")
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.circuit_breakers = CircuitBreakers(circuit_breaker_policy)
+        self.cooldowns = Cooldowns(cooldown_policy)
+        self.rate_limiter = rate_limiter
+        self.concurrency_limiter = concurrency_limiter
+        self.hedger = hedger
+        self.single_flight = single_flight
+        self.codec = codec or default_codec()
+        self.timeouts = timeouts or Timeouts()
+        self.endpoint_timeouts = dict(endpoint_timeouts or {})
+        self.response_limits = response_limits or ResponseLimits()
+        self.transport_metrics = TransportMetrics()
+        self._transports: "weakref.WeakSet[MeteredAsyncTransport]" = weakref.WeakSet()
+        self._transports_lock = threading.Lock()
+        self._clients = LoopClientRegistry(self._build_client)
+        self._token_sources = TokenSources()
+        self.middlewares = list(middlewares or ())
+        self._handler = self._build_handler()
+        register_after_fork(self)
+
+    def _after_fork(self) -> None:
+        """Gives a forked child its own connection pool.
 
-    def __init__(self, env: str = "sandbox"):
-        """Initializes the MpesaAsyncHttpClient with the specified environment."""
-        self.base_url = self._resolve_base_url(env)
-        self._client = httpx.AsyncClient(base_url=self.base_url)
+        The inherited clients are dropped without closing them, as their
+        connections are still in use by the parent process.
+        """
+        self.transport_metrics = TransportMetrics()
+        self._transports = weakref.WeakSet()
+        self._transports_lock = threading.Lock()
+        self._clients = LoopClientRegistry(self._build_client)
 
     def _resolve_base_url(self, env: str) -> str:
         if env.lower() == "production":
             return "https://api.safaricom.co.ke"
         return "https://sandbox.safaricom.co.ke"
 
+    @property
+    def _client(self) -> httpx.AsyncClient:
+        """The httpx client of the running event loop."""
+        return self._clients.get()
 
-    async def __aenter__(self):
-        return self
+    def _build_client(self) -> httpx.AsyncClient:
+        transport = MeteredAsyncTransport(self.transport_metrics)
+        with self._transports_lock:
+            self._transports.add(transport)
+        return httpx.AsyncClient(base_url=self.base_url, transport=transport)
 
-    async def __aexit__(self, exc_type, exc_val, exc_tb):
-        await self._client.aclose()
+    def transport_stats(self) -> Dict[str, Any]:
+        """Returns a snapshot of the connection pool and transport counters.
 
+        Cheap enough to be scraped by a metrics exporter; see transport_metrics
+        for the keys of the returned dict.
+        """
+        active = idle = 0
+        with self._transports_lock:
+            transports = list(self._transports)
+        for transport in transports:
+            loop_active, loop_idle = transport.connection_counts()
+            active += loop_active
+            idle += loop_idle
+        return self.transport_metrics.snapshot(idle, active)
 
-    async def post(
-        self, url: str, json: Dict[str, Any], headers: Dict[str, str]
-    ) -> Dict[str, Any]:
-        """Sends an asynchronous POST request to the M-Pesa API."""
-        try:
 
-            response = await self._client.post(
-                url, json=json, headers=headers, timeout=10
-            )
+    async def __aenter__(self):
+        return self
 
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.aclose()
 
-            try:
-                response_data = response.json()
-            except ValueError:
-                response_data = {"errorMessage": response.text.strip() or ""}
 
-            if not response.is_success:
-                error_message = response_data.get("errorMessage", "")
-                raise MpesaApiException(
-                    MpesaError(
-                        error_code=f"HTTP_{response.status_code}",
-                        error_message=error_message,
-                        status_code=response.status_code,
-                        raw_response=response_data,
-                    )
-                )
+    async def warm_up(self, connections: int = 1) -> None:
+        """Opens pooled connections to the M-Pesa API ahead of the first request.
 
-            return response_data
+        Resolves the API host and completes the TCP and TLS handshakes of up to
+        ``connections`` concurrent connections, which then stay in the pool for reuse.
 
-        except httpx.TimeoutException:
-            raise MpesaApiException(
-                MpesaError(
-                    error_code="REQUEST_TIMEOUT",
-                    error_message="Request to Mpesa timed out.",
-                    status_code=None,
+        Args:
+            connections (int): Number of connections to open.
+
+        Raises:
+            MpesaApiException: With error code CONNECTION_ERROR if the API cannot
+                be reached.
+        """
+        try:
+            await asyncio.gather(
+                *(
+                    self._client.head("/", timeout=self._httpx_timeout(self.timeouts))
+                    for _ in range(connections)
                 )
             )
-        except httpx.ConnectError:
+        except httpx.HTTPError as e:
             raise MpesaApiException(
                 MpesaError(
                     error_code="CONNECTION_ERROR",
-                    error_message="Failed to connect to Mpesa API. Check network or URL.",
+                    error_message=f"Could not connect to Mpesa API during warm-up: {e}",
                     status_code=None,
                 )
             )
-        except httpx.HTTPError as e:
 
-            raise MpesaApiException(
-                MpesaError(
-                    error_code="REQUEST_FAILED",
-                    error_message=f"HTTP request failed: {str(e)}",
-                    status_code=None,
-                    raw_response=None,
-                )
-            )
+    def add_middleware(self, middleware: AsyncMiddleware) -> None:
+        """Adds a middleware inside those already added, before the built-in ones.
+
+        The feature settings of the client, such as rate_limiter or hedger, are
+        turned into middlewares when the client is created; changing those
+        attributes afterwards has no effect.
+        """
+        self.middlewares.append(middleware)
+        self._handler = self._build_handler()
+
+    def _build_handler(self) -> AsyncHandler:
+        """Composes the middlewares and built-in features around _send()."""
+        builtins: List[AsyncMiddleware] = []
+        if self.single_flight is not None:
+            builtins.append(AsyncSingleFlightMiddleware(self.single_flight))
+        if self.retry_policy.max_attempts > 1:
+            builtins.append(AsyncRetryMiddleware(self.retry_policy))
+        if self.hedger is not None:
+            builtins.append(AsyncHedgingMiddleware(self.hedger))
+        builtins.append(AsyncCooldownMiddleware(self.cooldowns))
+        if self.rate_limiter is not None:
+            builtins.append(AsyncRateLimitMiddleware(self.rate_limiter))
+        builtins.append(AsyncCircuitBreakerMiddleware(self.circuit_breakers))
+        builtins.append(AsyncTokenRefreshMiddleware(self._token_sources))
+        # Innermost, so a permit is held only while a request is on the wire: the
+        # token refresh of a rejected request needs a permit of its own.
+        if self.concurrency_limiter is not None:
+            builtins.append(AsyncConcurrencyLimitMiddleware(self.concurrency_limiter))
+        return async_chain([*self.middlewares, *builtins], self._send)
+
+    def register_token_source(self, source: Any) -> None:
+        """Registers a token manager so requests rejected for its tokens can be replayed."""
+        self._token_sources.register(source)
+
+    async def post(
+        self, url: str, json: Union[Dict[str, Any], bytes], headers: Dict[str, str]
+    ) -> Dict[str, Any]:
+        """Sends an asynchronous POST request to the M-Pesa API."""
+        return await self._request("POST", url, headers, json=json)
 
     async def get(
         self,
@@ -101,34 +300,91 @@ class MpesaAsyncHttpClient(AsyncHttpClient):
         headers: Optional[Dict[str, str]] = None,
     ) -> Dict[str, Any]:
         """Sends an asynchronous GET request to the M-Pesa API."""
-        try:
-            if headers is None:
-                headers = {}
+        if headers is None:
+            headers = {}
+        return await self._request("GET", url, headers, params=params)
 
-            response = await self._client.get(
-                url, params=params, headers=headers, timeout=10
-            )
+    def _timeouts_for(self, url: str) -> Timeouts:
+        """Timeouts of a request to url, capped by the time left until the deadline."""
+        timeouts = self.endpoint_timeouts.get(url, self.timeouts)
+        return timeouts.capped(remaining_time())
+
+    @staticmethod
+    def _httpx_timeout(timeouts: Timeouts) -> httpx.Timeout:
+        return httpx.Timeout(
+            connect=timeouts.connect,
+            read=timeouts.read,
+            write=timeouts.write,
+            pool=timeouts.pool,
+        )
+
+    async def _request(
+        self, method: str, url: str, headers: Dict[str, str], **kwargs: Any
+    ) -> Dict[str, Any]:
+        """Sends a request through the middleware chain."""
+        check_deadline()
+        return await self._handler(Request(method, url, headers, **kwargs))
 
+    async def _send(self, request: Request) -> Dict[str, Any]:
+        """Sends a request over the network; the innermost handler of the chain."""
+        check_deadline()
+        url, headers = request.url, request.headers
+        timeout = self._httpx_timeout(self._timeouts_for(url))
+        kwargs: Dict[str, Any] = {}
+        bytes_sent = 0
+        try:
+            body = request.json
+            if body is not None:
+                kwargs["content"] = (
+                    body if isinstance(body, bytes) else self.codec.dumps(body)
+                )
+                bytes_sent = len(kwargs["content"])
+                headers = {**headers, "Content-Type": "application/json"}
+            if request.params is not None:
+                kwargs["params"] = request.params
+            client = self._client
+            outgoing = client.build_request(
+                request.method, url, headers=headers, timeout=timeout, **kwargs
+            )
+            response = await client.send(outgoing, stream=True)
+            limit = self.response_limits.body_limit(is_error=not response.is_success)
             try:
-                response_data = response.json()
-            except ValueError:
-                response_data = {"errorMessage": response.text.strip() or ""}
+                content, truncated = await aread_limited(
+                    response.aiter_bytes(CHUNK_SIZE), limit
+                )
+            finally:
+                await response.aclose()
+            self.transport_metrics.request_finished(
+                response.status_code, bytes_sent, len(content)
+            )
+            if truncated and response.is_success:
+                raise response_too_large(response.status_code, limit)
+
+            response_data = decode_body(self.codec, content, truncated)
 
             if not response.is_success:
+                self.cooldowns.record_response(
+                    url,
+                    response.status_code,
+                    response_data,
+                    response.headers.get("Retry-After"),
+                )
                 error_message = response_data.get("errorMessage", "")
                 raise MpesaApiException(
                     MpesaError(
                         error_code=f"HTTP_{response.status_code}",
                         error_message=error_message,
                         status_code=response.status_code,
-                        raw_response=response_data,
+                        raw_response=self.response_limits.raw_response(response_data),
                     )
                 )
 
             return response_data
 
-
         except httpx.TimeoutException:
+            self.transport_metrics.request_finished(None, bytes_sent)
+            if remaining_time() == 0.0:
+                raise deadline_exceeded()
             raise MpesaApiException(
                 MpesaError(
                     error_code="REQUEST_TIMEOUT",
@@ -137,6 +393,7 @@ class MpesaAsyncHttpClient(AsyncHttpClient):
                 )
             )
         except httpx.ConnectError:
+            self.transport_metrics.request_finished(None, bytes_sent)
             raise MpesaApiException(
                 MpesaError(
                     error_code="CONNECTION_ERROR",
@@ -145,6 +402,7 @@ class MpesaAsyncHttpClient(AsyncHttpClient):
                 )
             )
         except httpx.HTTPError as e:
+            self.transport_metrics.request_finished(None, bytes_sent)
             raise MpesaApiException(
                 MpesaError(
                     error_code="REQUEST_FAILED",
@@ -155,5 +413,8 @@ class MpesaAsyncHttpClient(AsyncHttpClient):
             )
 
     async def aclose(self):
-        """Manually close the underlying httpx client connection pool."""
-        await self._client.aclose()
+        """Manually close the connection pool of the running event loop.
+
+        Pools of other event loops are closed when those loops shut down.
+        """
+        await self._clients.aclose()
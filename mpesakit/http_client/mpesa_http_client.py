@@ -3,11 +3,45 @@
 Handles GET and POST requests with error handling for common HTTP issues.
 """
 
-from typing import Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional, Sequence, Tuple, Union
 import requests
 
 from mpesakit.errors import MpesaError, MpesaApiException
 from .http_client import HttpClient
+from .circuit_breaker import CircuitBreakerPolicy, CircuitBreakers
+from .codec import JsonCodec, default_codec
+from .cooldown import CooldownPolicy, Cooldowns
+from .fork import register_after_fork
+from .concurrency import ConcurrencyLimiter
+from .hedging import Hedger
+from .middleware import (
+    CircuitBreakerMiddleware,
+    ConcurrencyLimitMiddleware,
+    CooldownMiddleware,
+    Handler,
+    HedgingMiddleware,
+    Middleware,
+    RateLimitMiddleware,
+    Request,
+    RetryMiddleware,
+    SingleFlightMiddleware,
+    TokenRefreshMiddleware,
+    chain,
+)
+from .rate_limiter import RateLimiter
+from .response_limits import (
+    CHUNK_SIZE,
+    ResponseLimits,
+    decode_body,
+    read_limited,
+    response_too_large,
+)
+from .retry import RetryPolicy
+from .single_flight import SingleFlight
+from .timeouts import Timeouts, check_deadline, deadline_exceeded, remaining_time
+from .token_refresh import TokenSources
+from .transport_metrics import MeteredHTTPAdapter, TransportMetrics
 
 
 class MpesaHttpClient(HttpClient):
@@ -16,90 +50,271 @@ class MpesaHttpClient(HttpClient):
     This client handles GET and POST requests, including error handling for common HTTP issues.
     It supports both sandbox and production environments.
 
+    Requests are sent through a persistent ``requests.Session`` so TCP connections and
+    TLS sessions to the M-Pesa API are reused across calls instead of being set up on
+    every request. The client should be closed when no longer needed, either explicitly
+    with ``close()`` or by using it as a context manager.
+
+    A request rejected because its access token was revoked is replayed once with a
+    fresh token from the TokenManager that issued it.
+
+    Requests made within request_deadline(), or through a service method called with
+    ``timeout=`` or ``deadline=``, are abandoned once the deadline has passed.
+
+    When an endpoint throttles the client, e.g. with HTTP 429 and Retry-After, all
+    requests to it wait out one shared cool-down before being sent.
+
+    Response bodies are read as a stream and no further than response_limits allows.
+
     Attributes:
         base_url (str): The base URL for the M-Pesa API, depending on the environment.
+        retry_policy (RetryPolicy): How transient failures are retried.
+        circuit_breakers (CircuitBreakers): Per-endpoint circuit breakers.
+        cooldowns (Cooldowns): Per-endpoint back-off after throttling responses.
+        rate_limiter (Optional[RateLimiter]): Limiter consulted before each request.
+        concurrency_limiter (Optional[ConcurrencyLimiter]): Adaptive limit on in-flight requests.
+        hedger (Optional[Hedger]): Hedges slow read-only requests.
+        single_flight (Optional[SingleFlight]): Coalesces identical in-flight queries.
+        codec (JsonCodec): Encodes request bodies and decodes responses.
+        timeouts (Timeouts): Default timeouts of a request.
+        endpoint_timeouts (Dict[str, Timeouts]): Timeouts of requests to specific paths.
+        middlewares (List[Middleware]): Middlewares wrapping every request, outermost
+            first; see add_middleware().
+        response_limits (ResponseLimits): How much of a response is read and kept.
     """
 
     base_url: str
+    retry_policy: RetryPolicy
+    circuit_breakers: CircuitBreakers
+    cooldowns: Cooldowns
+    rate_limiter: Optional[RateLimiter]
+    concurrency_limiter: Optional[ConcurrencyLimiter]
+    hedger: Optional[Hedger]
+    single_flight: Optional[SingleFlight]
+    codec: JsonCodec
+    timeouts: Timeouts
+    endpoint_timeouts: Dict[str, Timeouts]
+    middlewares: List[Middleware]
+    response_limits: ResponseLimits
+    transport_metrics: TransportMetrics
+    _session: requests.Session
+    _pool_options: Tuple[int, int, bool]
+    _token_sources: TokenSources
+    _handler: Handler
 
-    def __init__(self, env: str = "sandbox"):
+    def __init__(
+        self,
+        env: str = "sandbox",
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        retry_policy: Optional[RetryPolicy] = None,
+        circuit_breaker_policy: Optional[CircuitBreakerPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        concurrency_limiter: Optional[ConcurrencyLimiter] = None,
+        hedger: Optional[Hedger] = None,
+        single_flight: Optional[SingleFlight] = None,
+        codec: Optional[JsonCodec] = None,
+        timeouts: Optional[Timeouts] = None,
+        endpoint_timeouts: Optional[Dict[str, Timeouts]] = None,
+        cooldown_policy: Optional[CooldownPolicy] = None,
+        middlewares: Optional[Sequence[Middleware]] = None,
+        base_url: Optional[str] = None,
+        response_limits: Optional[ResponseLimits] = None,
+    ):
         """Initializes the MpesaHttpClient with the specified environment.
 
         Args:
             env (str): The environment to use, either 'sandbox' or 'production'.
                 Defaults to 'sandbox'.
+            pool_connections (int): Number of host connection pools to cache.
+            pool_maxsize (int): Maximum number of connections kept alive per host.
+                Set this to at least the number of threads sharing the client.
+            pool_block (bool): If True, requests wait for a free connection when the
+                pool is exhausted instead of opening extra, non-pooled connections.
+            retry_policy (Optional[RetryPolicy]): How transient failures are retried.
+                Defaults to RetryPolicy(), which retries only idempotent calls.
+            circuit_breaker_policy (Optional[CircuitBreakerPolicy]): Thresholds of the
+                per-endpoint circuit breakers. Defaults to CircuitBreakerPolicy().
+            rate_limiter (Optional[RateLimiter]): Client-side rate limits to apply
+                before sending. Defaults to no limiting.
+            concurrency_limiter (Optional[ConcurrencyLimiter]): Adaptive (AIMD) limit on
+                in-flight requests. Defaults to no limit.
+            hedger (Optional[Hedger]): Sends a second copy of slow read-only
+                requests. Defaults to no hedging.
+            single_flight (Optional[SingleFlight]): Lets concurrent identical queries
+                share one request. Defaults to no coalescing.
+            codec (Optional[JsonCodec]): JSON codec for request and response bodies.
+                Defaults to the fastest installed one, see default_codec().
+            timeouts (Optional[Timeouts]): Default request timeouts. Defaults to
+                Timeouts(), 10 seconds each. Only connect and read apply to this
+                client.
+            endpoint_timeouts (Optional[Dict[str, Timeouts]]): Timeouts overriding
+                the defaults for requests to the given paths, e.g.
+                {"/mpesa/b2c/v3/paymentrequest": Timeouts(read=30)}.
+            cooldown_policy (Optional[CooldownPolicy]): How long to back off from an
+                endpoint that throttled the client. Defaults to CooldownPolicy().
+            middlewares (Optional[Sequence[Middleware]]): Middlewares wrapping every
+                request, outermost first. They run before the client's own retry,
+                rate limiting and circuit breaking, which are middlewares too.
+            base_url (Optional[str]): Overrides the API address chosen by env, e.g.
+                to send requests to a local MockDarajaServer.
+            response_limits (Optional[ResponseLimits]): Caps on the size of response
+                bodies read. Defaults to ResponseLimits(), 1 MiB per response.
         """
-        self.base_url = self._resolve_base_url(env)
+        self.base_url = (base_url or self._resolve_base_url(env)).rstrip("/")
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.circuit_breakers = CircuitBreakers(circuit_breaker_policy)
+        self.cooldowns = Cooldowns(cooldown_policy)
+        self.rate_limiter = rate_limiter
+        self.concurrency_limiter = concurrency_limiter
+        self.hedger = hedger
+        self.single_flight = single_flight
+        self.codec = codec or default_codec()
+        self.timeouts = timeouts or Timeouts()
+        self.endpoint_timeouts = dict(endpoint_timeouts or {})
+        self.response_limits = response_limits or ResponseLimits()
+        self.transport_metrics = TransportMetrics()
+        self._pool_options = (pool_connections, pool_maxsize, pool_block)
+        self._session = self._build_session(*self._pool_options)
+        self._token_sources = TokenSources()
+        self.middlewares = list(middlewares or ())
+        self._handler = self._build_handler()
+        register_after_fork(self)
 
     def _resolve_base_url(self, env: str) -> str:
         if env.lower() == "production":
             return "https://api.safaricom.co.ke"
         return "https://sandbox.safaricom.co.ke"
 
-    def post(
-        self, url: str, json: Dict[str, Any], headers: Dict[str, str]
-    ) -> Dict[str, Any]:
-        """Sends a POST request to the M-Pesa API.
+    def _build_session(
+        self, pool_connections: int, pool_maxsize: int, pool_block: bool
+    ) -> requests.Session:
+        adapter = MeteredHTTPAdapter(
+            self.transport_metrics,
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+        )
+        session = requests.Session()
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
 
-        Args:
-            url (str): The endpoint URL to send the POST request to.
-            json (Dict[str, Any]): The JSON payload to include in the request body.
-            headers (Dict[str, str]): The headers to include in the request.
+    def __enter__(self) -> "MpesaHttpClient":
+        return self
 
-        Returns:
-            Dict[str, Any]: The JSON response from the M-Pesa API.
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
 
-        Raises:
-            MpesaApiException: If the request fails or returns an error response.
+    def close(self) -> None:
+        """Closes the underlying session and releases all pooled connections."""
+        self._session.close()
+
+    def _after_fork(self) -> None:
+        """Gives a forked child its own connection pool.
+
+        The inherited session is dropped without closing it, as its connections
+        are still in use by the parent process.
         """
-        try:
-            full_url = f"{self.base_url}{url}"
-            response = requests.post(full_url, json=json, headers=headers, timeout=10)
+        self.transport_metrics = TransportMetrics()
+        self._session = self._build_session(*self._pool_options)
 
-            try:
-                response_data = response.json()
-            except ValueError:
-                response_data = {"errorMessage": response.text.strip() or ""}
+    def transport_stats(self) -> Dict[str, Any]:
+        """Returns a snapshot of the connection pool and transport counters.
 
-            if not response.ok:
-                error_message = response_data.get("errorMessage", "")
-                raise MpesaApiException(
-                    MpesaError(
-                        error_code=f"HTTP_{response.status_code}",
-                        error_message=error_message,
-                        status_code=response.status_code,
-                        raw_response=response_data,
-                    )
-                )
+        Cheap enough to be scraped by a metrics exporter; see transport_metrics
+        for the keys of the returned dict.
+        """
+        adapter = self._session.get_adapter(self.base_url)
+        idle = adapter.idle_connections() if isinstance(adapter, MeteredHTTPAdapter) else 0
+        return self.transport_metrics.snapshot(idle)
 
-            return response_data
+    def warm_up(self, connections: int = 1) -> None:
+        """Opens pooled connections to the M-Pesa API ahead of the first request.
 
-        except requests.Timeout:
-            raise MpesaApiException(
-                MpesaError(
-                    error_code="REQUEST_TIMEOUT",
-                    error_message="Request to Mpesa timed out.",
-                    status_code=None,
-                )
-            )
-        except requests.ConnectionError:
-            raise MpesaApiException(
-                MpesaError(
-                    error_code="CONNECTION_ERROR",
-                    error_message="Failed to connect to Mpesa API. Check network or URL.",
-                    status_code=None,
-                )
-            )
+        Resolves the API host and completes the TCP and TLS handshakes of up to
+        ``connections`` concurrent connections, which then stay in the pool for
+        reuse. Connections beyond pool_maxsize are not kept.
+
+        Args:
+            connections (int): Number of connections to open.
+
+        Raises:
+            MpesaApiException: With error code CONNECTION_ERROR if the API cannot
+                be reached.
+        """
+        with ThreadPoolExecutor(max_workers=max(connections, 1)) as pool:
+            opened = [pool.submit(self._open_connection) for _ in range(connections)]
+            for future in opened:
+                future.result()
+
+    def _open_connection(self) -> None:
+        try:
+            timeout = (self.timeouts.connect, self.timeouts.read)
+            self._session.head(self.base_url, timeout=timeout).close()
         except requests.RequestException as e:
             raise MpesaApiException(
                 MpesaError(
-                    error_code="REQUEST_FAILED",
-                    error_message=f"HTTP request failed: {str(e)}",
+                    error_code="CONNECTION_ERROR",
+                    error_message=f"Could not connect to Mpesa API during warm-up: {e}",
                     status_code=None,
-                    raw_response=None,
                 )
             )
 
+    def add_middleware(self, middleware: Middleware) -> None:
+        """Adds a middleware inside those already added, before the built-in ones.
+
+        The feature settings of the client, such as rate_limiter or hedger, are
+        turned into middlewares when the client is created; changing those
+        attributes afterwards has no effect.
+        """
+        self.middlewares.append(middleware)
+        self._handler = self._build_handler()
+
+    def _build_handler(self) -> Handler:
+        """Composes the middlewares and built-in features around _send()."""
+        builtins: List[Middleware] = []
+        if self.single_flight is not None:
+            builtins.append(SingleFlightMiddleware(self.single_flight))
+        if self.retry_policy.max_attempts > 1:
+            builtins.append(RetryMiddleware(self.retry_policy))
+        if self.hedger is not None:
+            builtins.append(HedgingMiddleware(self.hedger))
+        builtins.append(CooldownMiddleware(self.cooldowns))
+        if self.rate_limiter is not None:
+            builtins.append(RateLimitMiddleware(self.rate_limiter))
+        builtins.append(CircuitBreakerMiddleware(self.circuit_breakers))
+        builtins.append(TokenRefreshMiddleware(self._token_sources))
+        # Innermost, so a permit is held only while a request is on the wire: the
+        # token refresh of a rejected request needs a permit of its own.
+        if self.concurrency_limiter is not None:
+            builtins.append(ConcurrencyLimitMiddleware(self.concurrency_limiter))
+        return chain([*self.middlewares, *builtins], self._send)
+
+    def register_token_source(self, source: Any) -> None:
+        """Registers a token manager so requests rejected for its tokens can be replayed."""
+        self._token_sources.register(source)
+
+    def post(
+        self, url: str, json: Union[Dict[str, Any], bytes], headers: Dict[str, str]
+    ) -> Dict[str, Any]:
+        """Sends a POST request to the M-Pesa API.
+
+        Args:
+            url (str): The endpoint URL to send the POST request to.
+            json (Union[Dict[str, Any], bytes]): The JSON payload to include in the
+                request body, either as a dict or already encoded.
+            headers (Dict[str, str]): The headers to include in the request.
+
+        Returns:
+            Dict[str, Any]: The JSON response from the M-Pesa API.
+
+        Raises:
+            MpesaApiException: If the request fails or returns an error response.
+        """
+        return self._request("POST", url, headers, json=json)
+
     def get(
         self,
         url: str,
@@ -119,34 +334,86 @@ class MpesaHttpClient(HttpClient):
         Raises:
             MpesaApiException: If the request fails or returns an error response.
         """
-        try:
-            if headers is None:
-                headers = {}
-            full_url = f"{self.base_url}{url}"
+        if headers is None:
+            headers = {}
+        return self._request("GET", url, headers, params=params)
+
+    def _timeouts_for(self, url: str) -> Timeouts:
+        """Timeouts of a request to url, capped by the time left until the deadline."""
+        timeouts = self.endpoint_timeouts.get(url, self.timeouts)
+        return timeouts.capped(remaining_time())
 
-            response = requests.get(
-                full_url, params=params, headers=headers, timeout=10
-            )  # Add timeout
+    def _request(
+        self, method: str, url: str, headers: Dict[str, str], **kwargs: Any
+    ) -> Dict[str, Any]:
+        """Sends a request through the middleware chain."""
+        check_deadline()
+        return self._handler(Request(method, url, headers, **kwargs))
 
+    def _send(self, request: Request) -> Dict[str, Any]:
+        """Sends a request over the network; the innermost handler of the chain."""
+        check_deadline()
+        url, headers = request.url, request.headers
+        timeouts = self._timeouts_for(url)
+        kwargs: Dict[str, Any] = {}
+        bytes_sent = 0
+        try:
+            full_url = f"{self.base_url}{url}"
+            send = self._session.post if request.method == "POST" else self._session.get
+            body = request.json
+            if body is not None:
+                kwargs["data"] = (
+                    body if isinstance(body, bytes) else self.codec.dumps(body)
+                )
+                bytes_sent = len(kwargs["data"])
+                headers = {**headers, "Content-Type": "application/json"}
+            if request.params is not None:
+                kwargs["params"] = request.params
+            response = send(
+                full_url,
+                headers=headers,
+                timeout=(timeouts.connect, timeouts.read),
+                stream=True,
+                **kwargs,
+            )
+            limit = self.response_limits.body_limit(is_error=not response.ok)
             try:
-                response_data = response.json()
-            except ValueError:
-                response_data = {"errorMessage": response.text.strip() or ""}
+                content, truncated = read_limited(
+                    response.iter_content(CHUNK_SIZE), limit
+                )
+            finally:
+                response.close()
+            self.transport_metrics.request_finished(
+                response.status_code, bytes_sent, len(content)
+            )
+            if truncated and response.ok:
+                raise response_too_large(response.status_code, limit)
+
+            response_data = decode_body(self.codec, content, truncated)
 
             if not response.ok:
+                self.cooldowns.record_response(
+                    url,
+                    response.status_code,
+                    response_data,
+                    response.headers.get("Retry-After"),
+                )
                 error_message = response_data.get("errorMessage", "")
                 raise MpesaApiException(
                     MpesaError(
                         error_code=f"HTTP_{response.status_code}",
                         error_message=error_message,
                         status_code=response.status_code,
-                        raw_response=response_data,
+                        raw_response=self.response_limits.raw_response(response_data),
                     )
                 )
 
             return response_data
 
         except requests.Timeout:
+            self.transport_metrics.request_finished(None, bytes_sent)
+            if remaining_time() == 0.0:
+                raise deadline_exceeded()
             raise MpesaApiException(
                 MpesaError(
                     error_code="REQUEST_TIMEOUT",
@@ -155,6 +422,7 @@ class MpesaHttpClient(HttpClient):
                 )
             )
         except requests.ConnectionError:
+            self.transport_metrics.request_finished(None, bytes_sent)
             raise MpesaApiException(
                 MpesaError(
                     error_code="CONNECTION_ERROR",
@@ -163,6 +431,7 @@ class MpesaHttpClient(HttpClient):
                 )
             )
         except requests.RequestException as e:
+            self.transport_metrics.request_finished(None, bytes_sent)
             raise MpesaApiException(
                 MpesaError(
                     error_code="REQUEST_FAILED",
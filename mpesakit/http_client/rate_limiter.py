@@ -0,0 +1,254 @@
+"""Client-side rate limiting for M-Pesa API requests.
+
+Daraja enforces transactions-per-second limits per product and shortcode; going over
+them costs a round-trip that ends in a throttling error. A RateLimiter keeps requests
+under configured limits with token buckets:
+
+- ``path_limits`` limit each URL path, separately for every shortcode by default,
+  e.g. STK push requests per paybill.
+- ``shortcode_limits`` limit all requests made for a shortcode, across paths.
+
+The HTTP clients consult their limiter before each request. A request that cannot
+get through within ``max_wait`` seconds fails with a ``RATE_LIMITED`` error without
+being sent; ``max_wait=None`` blocks until the request is allowed, and
+``max_wait=0`` never waits.
+"""
+
+import asyncio
+import threading
+import time
+from typing import Any, ClassVar, Dict, List, Mapping, Optional, Tuple
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from mpesakit.errors import MpesaError, MpesaApiException
+
+from .fork import register_after_fork
+
+# Request body fields that carry the shortcode a request is made for.
+SHORTCODE_FIELDS: Tuple[str, ...] = (
+    "BusinessShortCode",
+    "ShortCode",
+    "shortcode",
+    "PartyA",
+    "primaryShortCode",
+)
+
+
+def shortcode_of(payload: Any) -> Optional[str]:
+    """Returns the shortcode a request body is made for, if it names one.
+
+    Bodies passed already encoded are not inspected.
+    """
+    if not isinstance(payload, Mapping):
+        return None
+    for field in SHORTCODE_FIELDS:
+        value = payload.get(field)
+        if value is not None:
+            return str(value)
+    return None
+
+
+class RateLimit(BaseModel):
+    """A sustained request rate with an allowance for bursts.
+
+    Attributes:
+        rate (float): Requests allowed per second.
+        burst (Optional[float]): Requests that may be sent back-to-back after an idle
+            period. Defaults to ``rate`` (at least 1).
+    """
+
+    rate: float = Field(gt=0)
+    burst: Optional[float] = Field(default=None, ge=1)
+
+    model_config: ClassVar[ConfigDict] = {"frozen": True}
+
+
+class TokenBucket:
+    """Thread-safe token bucket enforcing a single RateLimit."""
+
+    def __init__(self, limit: RateLimit):
+        """Initializes a full bucket."""
+        self.limit = limit
+        self.capacity = limit.burst if limit.burst is not None else max(limit.rate, 1.0)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+        register_after_fork(self)
+
+    def _after_fork(self) -> None:
+        """Replaces the lock, which a thread of the parent process may have held."""
+        self._lock = threading.Lock()
+
+    def reserve(self, max_wait: Optional[float] = None) -> Optional[float]:
+        """Takes a token, possibly one that only becomes available in the future.
+
+        Args:
+            max_wait (Optional[float]): Longest acceptable wait in seconds; None for no limit.
+
+        Returns:
+            Optional[float]: Seconds to wait before the token may be used, or None
+                (and nothing taken) if that would exceed max_wait.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.capacity, self._tokens + (now - self._updated) * self.limit.rate
+            )
+            self._updated = now
+            wait = max(1.0 - self._tokens, 0.0) / self.limit.rate
+            if max_wait is not None and wait > max_wait:
+                return None
+            self._tokens -= 1.0
+            return wait
+
+    def refund(self) -> None:
+        """Returns a token taken by reserve() that will not be used."""
+        with self._lock:
+            self._tokens = min(self.capacity, self._tokens + 1.0)
+
+
+class _BaseRateLimiter:
+    """Bucket bookkeeping shared by RateLimiter and AsyncRateLimiter."""
+
+    def __init__(
+        self,
+        path_limits: Optional[Dict[str, RateLimit]] = None,
+        shortcode_limits: Optional[Dict[str, RateLimit]] = None,
+        per_shortcode: bool = True,
+        max_wait: Optional[float] = None,
+    ):
+        """Initializes the limiter.
+
+        Args:
+            path_limits (Optional[Dict[str, RateLimit]]): Limits keyed by URL path.
+            shortcode_limits (Optional[Dict[str, RateLimit]]): Limits keyed by
+                shortcode, shared by all paths.
+            per_shortcode (bool): If True, each shortcode gets its own bucket for a
+                path limit; if False, all shortcodes share the path's bucket.
+            max_wait (Optional[float]): Default longest wait for acquire(), in
+                seconds. None waits as long as needed.
+        """
+        self.path_limits = dict(path_limits or {})
+        self.shortcode_limits = dict(shortcode_limits or {})
+        self.per_shortcode = per_shortcode
+        self.max_wait = max_wait
+        self._buckets: Dict[Tuple[str, Optional[str]], TokenBucket] = {}
+        self._lock = threading.Lock()
+        register_after_fork(self)
+
+    def _after_fork(self) -> None:
+        """Replaces the lock, which a thread of the parent process may have held."""
+        self._lock = threading.Lock()
+
+    def try_acquire(self, path: str, shortcode: Optional[str] = None) -> bool:
+        """Takes a permit only if one is available right now."""
+        return self._reserve(path, shortcode, 0.0) is not None
+
+    def _reserve(
+        self, path: str, shortcode: Optional[str], max_wait: Optional[float]
+    ) -> Optional[float]:
+        """Reserves a permit from every applicable bucket, or from none of them."""
+        reserved: List[TokenBucket] = []
+        longest = 0.0
+        for bucket in self._buckets_for(path, shortcode):
+            wait = bucket.reserve(max_wait)
+            if wait is None:
+                for taken in reserved:
+                    taken.refund()
+                return None
+            reserved.append(bucket)
+            longest = max(longest, wait)
+        return longest
+
+    def _max_wait(
+        self, timeout: Optional[float], deadline: Optional[float]
+    ) -> Optional[float]:
+        max_wait = self.max_wait if timeout is None else timeout
+        if deadline is not None:
+            remaining = max(deadline - time.monotonic(), 0.0)
+            max_wait = remaining if max_wait is None else min(max_wait, remaining)
+        return max_wait
+
+    def _buckets_for(self, path: str, shortcode: Optional[str]) -> List[TokenBucket]:
+        buckets = []
+        path_limit = self.path_limits.get(path)
+        if path_limit is not None:
+            key = (path, shortcode if self.per_shortcode else None)
+            buckets.append(self._bucket(key, path_limit))
+        shortcode_limit = self.shortcode_limits.get(shortcode) if shortcode else None
+        if shortcode_limit is not None:
+            buckets.append(self._bucket(("", shortcode), shortcode_limit))
+        return buckets
+
+    def _bucket(self, key: Tuple[str, Optional[str]], limit: RateLimit) -> TokenBucket:
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            with self._lock:
+                bucket = self._buckets.setdefault(key, TokenBucket(limit))
+        return bucket
+
+    @staticmethod
+    def _rate_limited(path: str) -> MpesaApiException:
+        return MpesaApiException(
+            MpesaError(
+                error_code="RATE_LIMITED",
+                error_message=f"Client-side rate limit for {path} reached; request not sent.",
+                status_code=None,
+            )
+        )
+
+
+class RateLimiter(_BaseRateLimiter):
+    """Thread-safe rate limiter for MpesaHttpClient; see the module docstring."""
+
+    def acquire(
+        self,
+        path: str,
+        shortcode: Optional[str] = None,
+        timeout: Optional[float] = None,
+        deadline: Optional[float] = None,
+    ) -> None:
+        """Blocks until a request to path for shortcode is allowed.
+
+        Args:
+            path (str): URL path of the request.
+            shortcode (Optional[str]): Shortcode the request is made for.
+            timeout (Optional[float]): Longest wait in seconds; defaults to max_wait.
+            deadline (Optional[float]): time.monotonic() value by which the permit
+                must be granted.
+
+        Raises:
+            MpesaApiException: With error code RATE_LIMITED if no permit is
+                available in time.
+        """
+        wait = self._reserve(path, shortcode, self._max_wait(timeout, deadline))
+        if wait is None:
+            raise self._rate_limited(path)
+        if wait > 0:
+            time.sleep(wait)
+
+
+class AsyncRateLimiter(_BaseRateLimiter):
+    """Rate limiter for MpesaAsyncHttpClient; waits without blocking the event loop."""
+
+    async def acquire(
+        self,
+        path: str,
+        shortcode: Optional[str] = None,
+        timeout: Optional[float] = None,
+        deadline: Optional[float] = None,
+    ) -> None:
+        """Waits until a request to path for shortcode is allowed.
+
+        Takes the same arguments as RateLimiter.acquire().
+
+        Raises:
+            MpesaApiException: With error code RATE_LIMITED if no permit is
+                available in time.
+        """
+        wait = self._reserve(path, shortcode, self._max_wait(timeout, deadline))
+        if wait is None:
+            raise self._rate_limited(path)
+        if wait > 0:
+            await asyncio.sleep(wait)
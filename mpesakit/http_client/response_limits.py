@@ -0,0 +1,114 @@
+"""Bounds on how much of a response the M-Pesa HTTP clients read into memory.
+
+Responses are read as a stream and abandoned as soon as they grow past the limits
+of ResponseLimits, so a proxy or gateway answering with a multi-megabyte error
+page cannot exhaust the memory of the process:
+
+    client = MpesaHttpClient(
+        response_limits=ResponseLimits(max_body_size=256 * 1024, keep_raw_response=False)
+    )
+
+A successful response larger than ``max_body_size`` fails with a
+``RESPONSE_TOO_LARGE`` error. The body of an error response is cut off after
+``max_error_body_size`` bytes and reported as text in the error message.
+"""
+
+from typing import Any, AsyncIterable, ClassVar, Dict, Iterable, Optional, Tuple
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from mpesakit.errors import MpesaApiException, MpesaError
+
+from .codec import JsonCodec
+
+# Size of the chunks in which response bodies are read.
+CHUNK_SIZE = 16 * 1024
+
+# Fields of an error response that are kept when raw responses are not retained;
+# the clients themselves need errorCode to detect revoked access tokens.
+_RETAINED_ERROR_FIELDS = ("requestId", "errorCode")
+
+_TRUNCATED_MARKER = " [truncated]"
+
+
+class ResponseLimits(BaseModel):
+    """How much of a response the HTTP clients read and keep.
+
+    Attributes:
+        max_body_size (Optional[int]): Largest response body accepted, in bytes.
+            None reads bodies of any size.
+        max_error_body_size (int): Bytes of an error response body read before
+            the rest is discarded.
+        keep_raw_response (bool): Whether errors keep the decoded error body in
+            MpesaError.raw_response. When False only its requestId and errorCode
+            are kept, which saves holding on to the body of every failed call.
+    """
+
+    max_body_size: Optional[int] = Field(default=1024 * 1024, gt=0)
+    max_error_body_size: int = Field(default=4 * 1024, gt=0)
+    keep_raw_response: bool = True
+
+    model_config: ClassVar[ConfigDict] = {"frozen": True}
+
+    def body_limit(self, is_error: bool) -> Optional[int]:
+        """Returns the number of bytes to read of a success or an error response."""
+        if not is_error:
+            return self.max_body_size
+        if self.max_body_size is None:
+            return self.max_error_body_size
+        return min(self.max_body_size, self.max_error_body_size)
+
+    def raw_response(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Returns what an error keeps of the decoded error body."""
+        if self.keep_raw_response:
+            return data
+        return {key: data[key] for key in _RETAINED_ERROR_FIELDS if key in data}
+
+
+def read_limited(chunks: Iterable[bytes], limit: Optional[int]) -> Tuple[bytes, bool]:
+    """Reads chunks until more than limit bytes arrived.
+
+    Returns:
+        Tuple[bytes, bool]: At most limit bytes of the body, and whether the body
+            was longer than that.
+    """
+    body = bytearray()
+    for chunk in chunks:
+        body += chunk
+        if limit is not None and len(body) > limit:
+            return bytes(body[:limit]), True
+    return bytes(body), False
+
+
+async def aread_limited(
+    chunks: AsyncIterable[bytes], limit: Optional[int]
+) -> Tuple[bytes, bool]:
+    """Reads chunks until more than limit bytes arrived; async read_limited()."""
+    body = bytearray()
+    async for chunk in chunks:
+        body += chunk
+        if limit is not None and len(body) > limit:
+            return bytes(body[:limit]), True
+    return bytes(body), False
+
+
+def decode_body(codec: JsonCodec, body: bytes, truncated: bool) -> Dict[str, Any]:
+    """Decodes a response body, falling back to its text as the error message."""
+    if not truncated:
+        try:
+            return codec.loads(body)
+        except ValueError:
+            pass
+    text = body.decode("utf-8", errors="replace").strip()
+    return {"errorMessage": text + _TRUNCATED_MARKER if truncated else text}
+
+
+def response_too_large(status_code: int, limit: Optional[int]) -> MpesaApiException:
+    """The error raised for a successful response longer than limit bytes."""
+    return MpesaApiException(
+        MpesaError(
+            error_code="RESPONSE_TOO_LARGE",
+            error_message=f"Response from Mpesa API is larger than {limit} bytes.",
+            status_code=status_code,
+        )
+    )
@@ -0,0 +1,167 @@
+"""Retry policy for transient M-Pesa API failures.
+
+Failed requests are retried with exponential backoff and full jitter, bounded by a
+maximum number of attempts and a total time budget.
+
+Retries are idempotency-aware. Calls that do not move money (OAuth, queries and QR
+code generation) are retried by default. Money-moving calls, such as STK push or
+B2C payments, may have reached M-Pesa even when the response was lost, so they are
+only retried when the caller supplies an idempotency key, confirming that a
+duplicate is safe (for example because callbacks are de-duplicated on
+OriginatorConversationID):
+
+    with idempotency_key(originator_conversation_id):
+        client.b2c.send_payment(...)
+
+No retry is started if its backoff would end after the current request deadline,
+see request_deadline().
+"""
+
+import time
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import ClassVar, FrozenSet, Iterator, Optional
+
+from pydantic import BaseModel, ConfigDict, Field
+from tenacity import (
+    AsyncRetrying,
+    RetryCallState,
+    Retrying,
+    retry_if_exception,
+    stop_after_attempt,
+    stop_before_delay,
+    stop_never,
+    wait_random_exponential,
+)
+from tenacity.stop import stop_base
+
+from mpesakit.errors import MpesaApiException
+from .timeouts import current_deadline
+
+# Requests that are safe to send more than once.
+IDEMPOTENT_PATHS: FrozenSet[str] = frozenset(
+    {
+        "/oauth/v1/generate",
+        "/mpesa/stkpushquery/v1/query",
+        "/mpesa/transactionstatus/v1/query",
+        "/mpesa/accountbalance/v1/query",
+        "/mpesa/qrcode/v1/generate",
+    }
+)
+
+# Errors that are likely to succeed when the request is sent again.
+RETRYABLE_ERROR_CODES: FrozenSet[str] = frozenset(
+    {
+        "REQUEST_TIMEOUT",
+        "CONNECTION_ERROR",
+        "HTTP_429",
+        "HTTP_500",
+        "HTTP_502",
+        "HTTP_503",
+        "HTTP_504",
+    }
+)
+
+_idempotency_key: ContextVar[Optional[str]] = ContextVar(
+    "mpesakit_idempotency_key", default=None
+)
+
+
+@contextmanager
+def idempotency_key(key: str) -> Iterator[None]:
+    """Marks requests made within the with-block as safe to retry.
+
+    Args:
+        key (str): Identifier of the operation, such as its OriginatorConversationID.
+    """
+    token = _idempotency_key.set(key)
+    try:
+        yield
+    finally:
+        _idempotency_key.reset(token)
+
+
+def current_idempotency_key() -> Optional[str]:
+    """Returns the idempotency key set with idempotency_key(), if any."""
+    return _idempotency_key.get()
+
+
+class stop_before_deadline(stop_base):
+    """Stops retrying if the next backoff would end after the current deadline."""
+
+    def __call__(self, retry_state: RetryCallState) -> bool:
+        """Whether to give up instead of sleeping before the next attempt."""
+        deadline = current_deadline()
+        if deadline is None:
+            return False
+        return time.monotonic() + (retry_state.upcoming_sleep or 0.0) >= deadline
+
+
+class RetryPolicy(BaseModel):
+    """Configures how MpesaHttpClient and MpesaAsyncHttpClient retry failed requests.
+
+    Attributes:
+        max_attempts (int): Maximum number of attempts, including the first one.
+            Set to 1 to disable retries.
+        backoff_base (float): Upper bound, in seconds, of the first backoff; each
+            further backoff doubles it. The actual wait is drawn uniformly from zero
+            to that bound (full jitter).
+        backoff_max (float): Maximum upper bound of a single backoff, in seconds.
+        total_timeout (Optional[float]): Time budget in seconds for all attempts and
+            backoffs. No retry is started if its backoff would exceed the budget.
+        retryable_errors (FrozenSet[str]): Error codes of MpesaApiException to retry.
+        idempotent_paths (FrozenSet[str]): Request paths retried without an
+            idempotency key. GET requests are always considered idempotent.
+    """
+
+    max_attempts: int = Field(default=3, ge=1)
+    backoff_base: float = Field(default=0.5, gt=0)
+    backoff_max: float = Field(default=8.0, gt=0)
+    total_timeout: Optional[float] = Field(default=30.0, gt=0)
+    retryable_errors: FrozenSet[str] = RETRYABLE_ERROR_CODES
+    idempotent_paths: FrozenSet[str] = IDEMPOTENT_PATHS
+
+    model_config: ClassVar[ConfigDict] = {"frozen": True}
+
+    def allows_retry(self, method: str, url: str) -> bool:
+        """Whether a request may be retried at all, based on its idempotency."""
+        if self.max_attempts < 2:
+            return False
+        return (
+            method == "GET"
+            or url in self.idempotent_paths
+            or current_idempotency_key() is not None
+        )
+
+    def is_retryable(self, exc: BaseException) -> bool:
+        """Whether a failed attempt should be retried."""
+        return (
+            isinstance(exc, MpesaApiException)
+            and exc.error_code in self.retryable_errors
+        )
+
+    def retrying(self) -> Retrying:
+        """Builds a tenacity controller implementing this policy."""
+        return Retrying(**self._tenacity_kwargs())
+
+    def async_retrying(self) -> AsyncRetrying:
+        """Builds an asyncio tenacity controller implementing this policy."""
+        return AsyncRetrying(**self._tenacity_kwargs())
+
+    def _tenacity_kwargs(self) -> dict:
+        stop_on_time = (
+            stop_before_delay(self.total_timeout)
+            if self.total_timeout is not None
+            else stop_never
+        )
+        return {
+            "stop": stop_after_attempt(self.max_attempts)
+            | stop_on_time
+            | stop_before_deadline(),
+            "wait": wait_random_exponential(
+                multiplier=self.backoff_base, max=self.backoff_max
+            ),
+            "retry": retry_if_exception(self.is_retryable),
+            "reraise": True,
+        }
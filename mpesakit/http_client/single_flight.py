@@ -0,0 +1,200 @@
+"""Coalescing of identical in-flight read-only M-Pesa API requests.
+
+Services often query the same CheckoutRequestID or TransactionID at nearly the same
+time, e.g. from a webhook handler and a reconciliation job. With single-flight, a
+query that is identical to one already in flight does not send a request of its own:
+it waits for the in-flight one and receives a copy of its response, or its error.
+
+Requests are identical when they have the same method, path, credentials and
+canonical (key-sorted) payload. Only read-only queries are coalesced. A caller waits
+for a shared query no longer than its own deadline, see request_deadline(), and the
+deadline of the caller that sent it does not cut it short for the others: async
+shared queries run without a deadline, and a thread whose shared query was abandoned
+at its sender's deadline sends the query again itself.
+"""
+
+import asyncio
+import copy
+import json
+import threading
+from typing import Any, Awaitable, Callable, Dict, FrozenSet, Optional, TypeVar
+
+from mpesakit.errors import MpesaApiException
+
+from .fork import register_after_fork
+from .loop_clients import LoopLocal
+from .timeouts import deadline_exceeded, remaining_time, without_deadline
+
+T = TypeVar("T")
+
+# Read-only queries that may share a single response.
+COALESCED_PATHS: FrozenSet[str] = frozenset(
+    {
+        "/mpesa/stkpushquery/v1/query",
+        "/mpesa/transactionstatus/v1/query",
+    }
+)
+
+
+def request_key(
+    method: str, url: str, headers: Dict[str, str], payload: Optional[Any]
+) -> str:
+    """Returns a key that is equal for requests that must get the same response."""
+    if isinstance(payload, bytes):
+        canonical = payload.decode("utf-8", "replace")
+    else:
+        canonical = json.dumps(
+            payload, sort_keys=True, separators=(",", ":"), default=str
+        )
+    return f"{method} {url} {headers.get('Authorization', '')} {canonical}"
+
+
+class _Call:
+    """A request in flight and, once it completes, its outcome."""
+
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class _BaseSingleFlight:
+    """Settings and counters shared by SingleFlight and AsyncSingleFlight."""
+
+    def __init__(self, paths: FrozenSet[str] = COALESCED_PATHS):
+        """Initializes the coalescer.
+
+        Args:
+            paths (FrozenSet[str]): Paths whose identical requests are coalesced.
+        """
+        self.paths = paths
+        self.coalesced = 0
+
+    def applies_to(self, url: str) -> bool:
+        """Whether identical requests to url are coalesced."""
+        return url in self.paths
+
+
+class SingleFlight(_BaseSingleFlight):
+    """Thread-safe request coalescer for MpesaHttpClient."""
+
+    def __init__(self, paths: FrozenSet[str] = COALESCED_PATHS):
+        """Initializes the coalescer; see _BaseSingleFlight."""
+        super().__init__(paths)
+        self._lock = threading.Lock()
+        self._calls: Dict[str, _Call] = {}
+        register_after_fork(self)
+
+    def _after_fork(self) -> None:
+        """Forgets the calls in flight, whose threads a forked child lacks."""
+        self._lock = threading.Lock()
+        self._calls = {}
+
+    def do(self, key: str, fn: Callable[[], T]) -> T:
+        """Runs fn, unless a call with the same key is in flight.
+
+        Args:
+            key (str): Identity of the request, see request_key().
+            fn (Callable[[], T]): Sends the request.
+
+        Returns:
+            T: The response; callers that joined an in-flight call get a copy.
+
+        Raises:
+            MpesaApiException: With error code DEADLINE_EXCEEDED if the current
+                deadline passes while waiting for an in-flight call.
+            BaseException: The error raised by the shared call.
+        """
+        while True:
+            with self._lock:
+                call = self._calls.get(key)
+                leader = call is None
+                if call is None:
+                    call = self._calls[key] = _Call()
+                else:
+                    self.coalesced += 1
+            if leader:
+                break
+            if not call.done.wait(remaining_time()):
+                raise deadline_exceeded()
+            if _abandoned_at_deadline(call.error):
+                continue  # The sender's deadline passed, not necessarily ours.
+            if call.error is not None:
+                raise call.error
+            return copy.deepcopy(call.result)
+
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+
+class AsyncSingleFlight(_BaseSingleFlight):
+    """Request coalescer for MpesaAsyncHttpClient.
+
+    Calls are coalesced with those made on the same event loop. The shared request
+    keeps running if the caller that started it is cancelled, so the others still
+    get its response.
+    """
+
+    def __init__(self, paths: FrozenSet[str] = COALESCED_PATHS):
+        """Initializes the coalescer; see _BaseSingleFlight."""
+        super().__init__(paths)
+        self._loop_tasks: "LoopLocal[Dict[str, asyncio.Future[Any]]]" = LoopLocal(dict)
+        register_after_fork(self)
+
+    def _after_fork(self) -> None:
+        """Forgets the calls in flight, whose event loops a forked child does not run."""
+        self._loop_tasks = LoopLocal(dict)
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[T]]) -> T:
+        """Awaits fn, unless a call with the same key is in flight.
+
+        Takes the same arguments as SingleFlight.do().
+        """
+        tasks = self._loop_tasks.get()
+        task = tasks.get(key)
+        leader = task is None
+        if task is None:
+            task = asyncio.ensure_future(_without_deadline(fn))
+            tasks[key] = task
+            task.add_done_callback(lambda done: _forget(tasks, key, done))
+        else:
+            self.coalesced += 1
+        remaining = remaining_time()
+        try:
+            result = await asyncio.wait_for(asyncio.shield(task), remaining)
+        except asyncio.TimeoutError:
+            if remaining is None or task.done():
+                raise
+            raise deadline_exceeded() from None
+        return result if leader else copy.deepcopy(result)
+
+
+def _abandoned_at_deadline(error: Optional[BaseException]) -> bool:
+    return (
+        isinstance(error, MpesaApiException)
+        and error.error_code == "DEADLINE_EXCEEDED"
+    )
+
+
+async def _without_deadline(fn: Callable[[], Awaitable[T]]) -> T:
+    with without_deadline():
+        return await fn()
+
+
+def _forget(
+    tasks: "Dict[str, asyncio.Future[Any]]", key: str, task: "asyncio.Future[Any]"
+) -> None:
+    if tasks.get(key) is task:
+        del tasks[key]
+    if not task.cancelled():
+        task.exception()  # retrieved, even if every caller was cancelled
@@ -0,0 +1,128 @@
+"""Request timeouts and per-call deadlines for the M-Pesa HTTP clients.
+
+Each HTTP request is bounded by Timeouts, configurable per endpoint. A deadline
+additionally bounds a whole call, including token refresh, retries and backoff,
+rate-limit and concurrency waits:
+
+    with request_deadline(timeout=2.5):
+        client.stk_push(...)
+
+Service methods accept the same ``timeout=`` and ``deadline=`` arguments. Deadlines
+are ``time.monotonic()`` values; nested deadlines never extend an enclosing one.
+Once a deadline has passed, requests are abandoned with a ``DEADLINE_EXCEEDED``
+error instead of being sent, and every request timeout is capped by the time left.
+"""
+
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import ClassVar, Iterator, Optional
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from mpesakit.errors import MpesaError, MpesaApiException
+
+_deadline: ContextVar[Optional[float]] = ContextVar("mpesakit_deadline", default=None)
+
+
+class Timeouts(BaseModel):
+    """Timeouts of a single HTTP request, in seconds.
+
+    Attributes:
+        connect (float): Time to establish a connection.
+        read (float): Time to wait for data from the server.
+        write (float): Time to send the request body. Only applied by the async client.
+        pool (float): Time to wait for a pooled connection. Only applied by the
+            async client.
+    """
+
+    connect: float = Field(default=10.0, gt=0)
+    read: float = Field(default=10.0, gt=0)
+    write: float = Field(default=10.0, gt=0)
+    pool: float = Field(default=10.0, gt=0)
+
+    model_config: ClassVar[ConfigDict] = {"frozen": True}
+
+    def capped(self, limit: Optional[float]) -> "Timeouts":
+        """Returns these timeouts, none of them longer than limit seconds.
+
+        Raises:
+            MpesaApiException: With error code DEADLINE_EXCEEDED if limit is not
+                positive, i.e. no time is left for the request.
+        """
+        if limit is None:
+            return self
+        if limit <= 0:
+            raise deadline_exceeded()
+        return Timeouts(
+            connect=min(self.connect, limit),
+            read=min(self.read, limit),
+            write=min(self.write, limit),
+            pool=min(self.pool, limit),
+        )
+
+
+@contextmanager
+def request_deadline(
+    timeout: Optional[float] = None, deadline: Optional[float] = None
+) -> Iterator[None]:
+    """Bounds the time that requests made within the with-block may take.
+
+    Args:
+        timeout (Optional[float]): Seconds from now.
+        deadline (Optional[float]): time.monotonic() value to finish by.
+
+    The earliest of timeout, deadline and any enclosing deadline applies. Without
+    timeout and deadline the enclosing deadline, if any, is kept.
+    """
+    candidates = [d for d in (current_deadline(), deadline) if d is not None]
+    if timeout is not None:
+        candidates.append(time.monotonic() + timeout)
+    token = _deadline.set(min(candidates) if candidates else None)
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+@contextmanager
+def without_deadline() -> Iterator[None]:
+    """Lifts the current deadline for the with-block.
+
+    For work shared by several callers, each of which bounds its own wait for it.
+    """
+    token = _deadline.set(None)
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def current_deadline() -> Optional[float]:
+    """Returns the deadline set with request_deadline(), if any."""
+    return _deadline.get()
+
+
+def remaining_time() -> Optional[float]:
+    """Returns the seconds left until the current deadline, or None without one."""
+    deadline = _deadline.get()
+    if deadline is None:
+        return None
+    return max(deadline - time.monotonic(), 0.0)
+
+
+def check_deadline() -> None:
+    """Raises DEADLINE_EXCEEDED if the current deadline has passed."""
+    if remaining_time() == 0.0:
+        raise deadline_exceeded()
+
+
+def deadline_exceeded() -> MpesaApiException:
+    """Returns the error raised for work abandoned at its deadline."""
+    return MpesaApiException(
+        MpesaError(
+            error_code="DEADLINE_EXCEEDED",
+            error_message="Deadline exceeded; request abandoned.",
+            status_code=None,
+        )
+    )
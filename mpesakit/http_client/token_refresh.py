@@ -0,0 +1,75 @@
+"""Support for replaying requests whose access token was rejected by the M-Pesa API.
+
+Daraja can revoke an access token before it expires. Token managers register with
+the HTTP client they use, so when a request fails because its bearer token was
+rejected, the client can find the manager that issued the token, have it refresh
+the token (single-flight), and replay the request once with the new token.
+"""
+
+import threading
+import weakref
+from typing import Any, Dict, List, Optional
+
+from mpesakit.errors import MpesaError
+
+from .fork import register_after_fork
+
+# Daraja reports an invalid or revoked access token with this code (and HTTP 404).
+REVOKED_CREDENTIAL_ERROR_CODE = "404.001.03"
+
+_BEARER_PREFIX = "Bearer "
+
+
+def is_invalid_token_error(error: MpesaError) -> bool:
+    """Whether an API error means the request's access token was rejected."""
+    if error.status_code == 401:
+        return True
+    raw_response = error.raw_response or {}
+    return raw_response.get("errorCode") == REVOKED_CREDENTIAL_ERROR_CODE
+
+
+def bearer_token(headers: Optional[Dict[str, str]]) -> Optional[str]:
+    """Returns the bearer token from an Authorization header, if there is one."""
+    authorization = (headers or {}).get("Authorization", "")
+    if not authorization.startswith(_BEARER_PREFIX):
+        return None
+    return authorization[len(_BEARER_PREFIX) :]
+
+
+def with_bearer_token(headers: Dict[str, str], token: str) -> Dict[str, str]:
+    """Returns a copy of headers carrying token in the Authorization header."""
+    return {**headers, "Authorization": f"{_BEARER_PREFIX}{token}"}
+
+
+class TokenSources:
+    """Weakly-held registry of the token managers using an HTTP client.
+
+    Registered managers provide ``has_issued(token)`` and
+    ``get_token(force_refresh, stale_token)``, which may be a coroutine function.
+    """
+
+    def __init__(self) -> None:
+        """Initializes an empty registry."""
+        self._sources: "weakref.WeakValueDictionary[int, Any]" = (
+            weakref.WeakValueDictionary()
+        )
+        self._lock = threading.Lock()
+        register_after_fork(self)
+
+    def _after_fork(self) -> None:
+        """Replaces the lock, which a thread of the parent process may have held."""
+        self._lock = threading.Lock()
+
+    def register(self, source: Any) -> None:
+        """Adds a token manager; it is dropped automatically once garbage collected."""
+        with self._lock:
+            self._sources[id(source)] = source
+
+    def find(self, token: str) -> Optional[Any]:
+        """Returns the registered token manager that issued token, if any."""
+        with self._lock:
+            sources: List[Any] = list(self._sources.values())
+        for source in sources:
+            if source.has_issued(token):
+                return source
+        return None
@@ -0,0 +1,299 @@
+"""Live connection pool and transport statistics of the HTTP clients.
+
+Each MpesaHttpClient and MpesaAsyncHttpClient counts, as requests happen, how
+connections are obtained from its pool and what goes over the wire. Its
+``transport_stats()`` returns a snapshot for a metrics exporter to scrape:
+
+    active_connections      connections currently serving a request
+    idle_connections        open connections waiting in the pool for reuse
+    connections_acquired    connections taken from the pool, one per request sent
+    connections_reused      of those, connections that were already open
+    connections_opened      of those, connections that had to be (re)opened
+    reuse_ratio             connections_reused / connections_acquired
+    tls_handshakes          TLS handshakes started for new connections
+    pool_wait_seconds       total time requests waited for a connection
+    pool_wait_seconds_max   longest wait for a connection
+    bytes_sent              bytes of request bodies sent
+    bytes_received          bytes of response bodies received
+    requests                responses by status class ("2xx", "4xx", ...), and
+                            "failed" for requests that got no response
+
+Time spent waiting for a connection grows when the pool is too small for the
+number of concurrent callers, while the time left over is spent on the network
+and by the M-Pesa API.
+
+The counters live in a TransportMetrics. The requests-based client takes them
+from a urllib3 pool manager that times each checkout, and the httpx-based client
+from httpcore's trace events.
+"""
+
+import threading
+import time
+import weakref
+from typing import Any, Dict, Iterable, Optional, Set, Tuple
+
+import httpx
+from requests.adapters import HTTPAdapter
+from urllib3 import HTTPConnectionPool, HTTPSConnectionPool, PoolManager
+
+# Trace events with which httpcore starts to use a connection for a request.
+_CONNECTION_START_EVENTS = frozenset(
+    {
+        "connection.connect_tcp.started",
+        "http11.send_request_headers.started",
+        "http2.send_request_headers.started",
+    }
+)
+
+# Trace events with which httpcore stops using a connection for a request.
+_CONNECTION_END_EVENTS = frozenset(
+    {
+        "http11.response_closed.complete",
+        "http11.response_closed.failed",
+        "http2.response_closed.complete",
+        "http2.response_closed.failed",
+    }
+)
+
+
+class TransportMetrics:
+    """Connection and request counters of an HTTP client. Thread-safe."""
+
+    def __init__(self) -> None:
+        """Initializes all counters to zero."""
+        self._lock = threading.Lock()
+        self._checked_out = 0
+        self._acquired = 0
+        self._reused = 0
+        self._tls_handshakes = 0
+        self._pool_wait = 0.0
+        self._pool_wait_max = 0.0
+        self._bytes_sent = 0
+        self._bytes_received = 0
+        self._requests: Dict[str, int] = {}
+
+    def connection_acquired(self, waited: float, reused: bool, tls: bool) -> None:
+        """Records a connection taken from the pool for a request.
+
+        Args:
+            waited (float): Seconds the request waited for the connection.
+            reused (bool): Whether the connection was already open.
+            tls (bool): Whether opening the connection starts a TLS handshake.
+        """
+        with self._lock:
+            self._checked_out += 1
+            self._acquired += 1
+            self._pool_wait += waited
+            self._pool_wait_max = max(self._pool_wait_max, waited)
+            if reused:
+                self._reused += 1
+            elif tls:
+                self._tls_handshakes += 1
+
+    def connection_released(self) -> None:
+        """Records a connection given back to the pool."""
+        with self._lock:
+            self._checked_out -= 1
+
+    def tls_handshake(self) -> None:
+        """Records a TLS handshake."""
+        with self._lock:
+            self._tls_handshakes += 1
+
+    def request_finished(
+        self, status_code: Optional[int], bytes_sent: int, bytes_received: int = 0
+    ) -> None:
+        """Records a request and the size of its bodies.
+
+        Args:
+            status_code (Optional[int]): HTTP status of the response; None if the
+                request failed without a response.
+            bytes_sent (int): Size of the request body.
+            bytes_received (int): Size of the response body.
+        """
+        status_class = f"{status_code // 100}xx" if status_code else "failed"
+        with self._lock:
+            self._requests[status_class] = self._requests.get(status_class, 0) + 1
+            self._bytes_sent += bytes_sent
+            self._bytes_received += bytes_received
+
+    def snapshot(self, idle: int, active: Optional[int] = None) -> Dict[str, Any]:
+        """Returns the counters as a dict; see the module docstring for its keys.
+
+        Args:
+            idle (int): Idle connections in the client's pool.
+            active (Optional[int]): Connections in use; defaults to the number of
+                connections acquired and not yet released.
+        """
+        with self._lock:
+            acquired, reused = self._acquired, self._reused
+            return {
+                "active_connections": self._checked_out if active is None else active,
+                "idle_connections": idle,
+                "connections_acquired": acquired,
+                "connections_reused": reused,
+                "connections_opened": acquired - reused,
+                "reuse_ratio": reused / acquired if acquired else 0.0,
+                "tls_handshakes": self._tls_handshakes,
+                "pool_wait_seconds": self._pool_wait,
+                "pool_wait_seconds_max": self._pool_wait_max,
+                "bytes_sent": self._bytes_sent,
+                "bytes_received": self._bytes_received,
+                "requests": dict(self._requests),
+            }
+
+
+class _MeteredPoolMixin:
+    """Times connection checkouts of a urllib3 connection pool."""
+
+    metrics: TransportMetrics
+
+    def _get_conn(self, timeout: Optional[float] = None) -> Any:
+        started = time.perf_counter()
+        conn = super()._get_conn(timeout)  # type: ignore[misc]
+        self.metrics.connection_acquired(
+            time.perf_counter() - started,
+            reused=getattr(conn, "sock", None) is not None,
+            tls=getattr(self, "scheme", None) == "https",
+        )
+        return conn
+
+    def _put_conn(self, conn: Any) -> None:
+        self.metrics.connection_released()
+        super()._put_conn(conn)  # type: ignore[misc]
+
+    def idle_connections(self) -> int:
+        """Number of open connections waiting in the pool."""
+        queue = getattr(getattr(self, "pool", None), "queue", ())
+        return sum(getattr(conn, "sock", None) is not None for conn in tuple(queue))
+
+
+class _MeteredHTTPConnectionPool(_MeteredPoolMixin, HTTPConnectionPool):
+    pass
+
+
+class _MeteredHTTPSConnectionPool(_MeteredPoolMixin, HTTPSConnectionPool):
+    pass
+
+
+class _MeteredPoolManager(PoolManager):
+    """PoolManager whose connection pools report to a TransportMetrics."""
+
+    def __init__(self, metrics: TransportMetrics, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self.metrics = metrics
+        self.pool_classes_by_scheme = {
+            "http": _MeteredHTTPConnectionPool,
+            "https": _MeteredHTTPSConnectionPool,
+        }
+        self._created: "weakref.WeakSet[Any]" = weakref.WeakSet()
+
+    def _new_pool(self, *args: Any, **kwargs: Any) -> HTTPConnectionPool:
+        pool = super()._new_pool(*args, **kwargs)
+        pool.metrics = self.metrics  # type: ignore[attr-defined]
+        self._created.add(pool)
+        return pool
+
+    def idle_connections(self) -> int:
+        """Number of open connections waiting in any of the pools."""
+        pools: Iterable[Any] = tuple(self._created)
+        return sum(pool.idle_connections() for pool in pools)
+
+
+class MeteredHTTPAdapter(HTTPAdapter):
+    """requests HTTPAdapter whose connection pools report to a TransportMetrics."""
+
+    def __init__(self, metrics: TransportMetrics, **kwargs: Any) -> None:
+        """Initializes the adapter; kwargs are passed on to HTTPAdapter."""
+        self.metrics = metrics
+        super().__init__(**kwargs)
+
+    def init_poolmanager(
+        self, connections: int, maxsize: int, block: bool = False, **pool_kwargs: Any
+    ) -> None:
+        """Creates a pool manager that reports to the adapter's metrics."""
+        self._pool_connections = connections
+        self._pool_maxsize = maxsize
+        self._pool_block = block
+        self.poolmanager = _MeteredPoolManager(
+            self.metrics,
+            num_pools=connections,
+            maxsize=maxsize,
+            block=block,
+            **pool_kwargs,
+        )
+
+    def idle_connections(self) -> int:
+        """Number of open connections waiting in the adapter's pools."""
+        return self.poolmanager.idle_connections()
+
+
+class MeteredAsyncTransport(httpx.AsyncHTTPTransport):
+    """httpx transport that reports to a TransportMetrics through trace events."""
+
+    def __init__(self, metrics: TransportMetrics, **kwargs: Any) -> None:
+        """Initializes the transport; kwargs are passed on to AsyncHTTPTransport."""
+        super().__init__(**kwargs)
+        self.metrics = metrics
+        self._active = 0
+        self._streams: Set[Any] = set()
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        """Sends request, tracing how it obtains and gives back a connection."""
+        metrics = self.metrics
+        started = time.perf_counter()
+        inner_trace = request.extensions.get("trace")
+        acquired = released = False
+
+        def release() -> None:
+            nonlocal released
+            if acquired and not released:
+                released = True
+                self._active -= 1
+
+        async def trace(event_name: str, info: Dict[str, Any]) -> None:
+            nonlocal acquired
+            if not acquired and event_name in _CONNECTION_START_EVENTS:
+                acquired = True
+                self._active += 1
+                metrics.connection_acquired(
+                    time.perf_counter() - started,
+                    reused=event_name != "connection.connect_tcp.started",
+                    tls=False,
+                )
+            elif event_name == "connection.start_tls.started":
+                metrics.tls_handshake()
+            elif event_name == "connection.connect_tcp.complete":
+                self._opened(info["return_value"])
+            elif event_name in _CONNECTION_END_EVENTS:
+                release()
+            if inner_trace is not None:
+                await inner_trace(event_name, info)
+
+        request.extensions = {**request.extensions, "trace": trace}
+        try:
+            return await super().handle_async_request(request)
+        except BaseException:
+            release()
+            raise
+
+    def _opened(self, stream: Any) -> None:
+        """Tracks the network stream of a new connection, forgetting closed ones."""
+        self._streams = {s for s in self._streams if _is_open(s)} | {stream}
+
+    def connection_counts(self) -> Tuple[int, int]:
+        """Returns the numbers of active and of idle connections in the pool.
+
+        Connections are tracked through the network streams that httpcore's
+        ``connection.connect_tcp`` trace events return; a connection is open while
+        the socket of its stream is.
+        """
+        open_connections = sum(_is_open(stream) for stream in tuple(self._streams))
+        active = min(self._active, open_connections)
+        return active, open_connections - active
+
+
+def _is_open(stream: Any) -> bool:
+    """Whether the socket of an httpcore network stream is still open."""
+    sock = stream.get_extra_info("socket")
+    return sock is not None and sock.fileno() != -1
@@ -1,8 +1,52 @@
 """MpesaClient: A unified client for M-PESA services."""
 
-from mpesakit.auth import TokenManager
-from mpesakit.http_client import MpesaHttpClient
+import contextvars
+import functools
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Type,
+    TypeVar,
+    Union,
+)
+
+from pydantic import BaseModel
+
+from mpesakit.auth import (
+    AsyncTokenManager,
+    AsyncTokenRegistry,
+    TokenManager,
+    TokenRegistry,
+)
+from mpesakit.http_client import (
+    AsyncHttpClient,
+    HttpClient,
+    MpesaAsyncHttpClient,
+    MpesaHttpClient,
+)
+from mpesakit.http_client.fork import register_after_fork
+from mpesakit.security import load_public_key
 from mpesakit.services import (
+    AsyncB2BService,
+    AsyncB2CService,
+    AsyncBalanceService,
+    AsyncBillService,
+    AsyncC2BService,
+    AsyncDynamicQRCodeService,
+    AsyncStkPushService,
+    AsyncRatibaService,
+    AsyncReversalService,
+    AsyncTaxService,
+    AsyncTransactionService,
     B2BService,
     B2CService,
     BalanceService,
@@ -16,20 +60,98 @@ from mpesakit.services import (
     TransactionService,
 )
 
+T = TypeVar("T")
+
+# Environments of the Daraja base URLs the bundled HTTP clients resolve to.
+_ENVIRONMENTS = {
+    "https://api.safaricom.co.ke": "production",
+    "https://sandbox.safaricom.co.ke": "sandbox",
+}
+
+
+def _environment_of(http_client: Any, default: str) -> str:
+    """The environment an HTTP client sends requests to, judged by its base URL.
+
+    Clients aimed at any other URL, such as a mock server, keep default.
+    """
+    base_url = str(getattr(http_client, "base_url", "")).rstrip("/")
+    return _ENVIRONMENTS.get(base_url, default)
+
+
+def _complete_models() -> None:
+    """Builds the validators of mpesakit models whose schema build was deferred."""
+    pending: List[Type[BaseModel]] = [BaseModel]
+    while pending:
+        for model in pending.pop().__subclasses__():
+            pending.append(model)
+            if model.__module__.startswith("mpesakit") and not model.__pydantic_complete__:
+                model.model_rebuild()
+
 
 class MpesaClient:
-    """Unified client for all M-PESA services."""
+    """Unified client for all M-PESA services.
+
+    Independent calls, such as hundreds of status queries, can be sent concurrently
+    with map() and submit(), which run them on a thread pool shared by the client:
+
+        for result in client.map("transactions.query", queries, max_workers=8):
+            ...
+    """
 
     def __init__(
-        self, consumer_key: str, consumer_secret: str, environment: str = "sandbox"
+        self,
+        consumer_key: Optional[str] = None,
+        consumer_secret: Optional[str] = None,
+        environment: str = "sandbox",
+        http_client: Optional[MpesaHttpClient] = None,
+        token_registry: Optional[TokenRegistry] = None,
+        max_workers: int = 10,
     ) -> None:
-        """Initialize the MpesaClient with all service facades."""
-        self.http_client = MpesaHttpClient(env=environment)
-        self.token_manager = TokenManager(
-            http_client=self.http_client,
-            consumer_key=consumer_key,
-            consumer_secret=consumer_secret,
-        )
+        """Initialize the MpesaClient with all service facades.
+
+        Args:
+            consumer_key: M-Pesa consumer key.
+            consumer_secret: M-Pesa consumer secret.
+            environment: Either 'sandbox' or 'production'. When an http_client
+                or token_registry is supplied, the environment of its base URL
+                takes precedence.
+            http_client: Optional pre-configured MpesaHttpClient, e.g. one with a
+                larger connection pool or shared between several clients. When
+                omitted, a client is created and owned by this MpesaClient.
+            token_registry: Optional TokenRegistry serving many consumer keys. When
+                given, the credentials and http_client arguments are ignored; the
+                registry's HTTP client is used and each call authenticates as the
+                tenant selected with ``token_registry.tenant(consumer_key)``.
+            max_workers: Threads running the calls of map() and submit(). Keep it
+                at or below the HTTP client's pool_maxsize, so every thread can
+                use a pooled connection.
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1.")
+        self.max_workers = max_workers
+        self._executor = self._new_executor()
+        self._owned_http_client: Optional[MpesaHttpClient] = None
+        self._token_registry = token_registry
+        self._ready = False
+        self.http_client: HttpClient
+        self.token_manager: TokenManager
+        if token_registry is not None:
+            self.http_client = token_registry.http_client
+            self.token_manager = token_registry.token_manager
+        elif consumer_key is None or consumer_secret is None:
+            raise ValueError(
+                "Either consumer_key and consumer_secret, or token_registry, must be provided."
+            )
+        else:
+            if http_client is None:
+                http_client = self._owned_http_client = MpesaHttpClient(env=environment)
+            self.http_client = http_client
+            self.token_manager = TokenManager(
+                http_client=self.http_client,
+                consumer_key=consumer_key,
+                consumer_secret=consumer_secret,
+            )
+        self.environment = _environment_of(self.http_client, environment)
 
         # express => M-PESA STK Push
         self.express = StkPushService(
@@ -87,3 +209,306 @@ class MpesaClient:
         self.ratiba = RatibaService(
             http_client=self.http_client, token_manager=self.token_manager
         )
+        register_after_fork(self)
+
+    def _new_executor(self) -> ThreadPoolExecutor:
+        return ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="mpesakit-client"
+        )
+
+    def _after_fork(self) -> None:
+        """Replaces the worker threads, which a forked child lacks."""
+        self._executor = self._new_executor()
+
+    def _resolve(self, method: Union[str, Callable[..., T]]) -> Callable[..., T]:
+        """Looks up a service method given by name, e.g. "transactions.query"."""
+        if callable(method):
+            return method
+        target: Any = self
+        for name in method.split("."):
+            target = getattr(target, name)
+        return target
+
+    def submit(
+        self, method: Union[str, Callable[..., T]], /, **kwargs: Any
+    ) -> "Future[T]":
+        """Starts a service method call on the client's thread pool.
+
+        The call runs in a copy of the caller's context, so request deadlines,
+        idempotency keys and the selected tenant apply to it.
+
+        Args:
+            method (Union[str, Callable[..., T]]): The service method, e.g.
+                ``client.transactions.query``, or its name on the client, e.g.
+                ``"transactions.query"``.
+            **kwargs: Arguments of the call.
+
+        Returns:
+            Future[T]: The call's result, or the exception it raised.
+        """
+        call = functools.partial(self._resolve(method), **kwargs)
+        return self._executor.submit(contextvars.copy_context().run, call)
+
+    def map(
+        self,
+        method: Union[str, Callable[..., T]],
+        kwargs_iterable: Iterable[Dict[str, Any]],
+        max_workers: Optional[int] = None,
+        ordered: bool = False,
+    ) -> Iterator[Union[T, Exception]]:
+        """Calls a service method once per set of arguments, concurrently.
+
+        Calls are started as the returned iterator is consumed, and at most
+        max_workers of them are in flight at a time, so kwargs_iterable may be a
+        long generator. A call that fails does not stop the others: its exception
+        is yielded in place of its result. Calls not yet finished are cancelled
+        if iteration stops early.
+
+        Args:
+            method (Union[str, Callable[..., T]]): The service method or its name
+                on the client; see submit().
+            kwargs_iterable (Iterable[Dict[str, Any]]): Arguments of each call.
+            max_workers (Optional[int]): Calls of this map in flight at a time.
+                Defaults to the client's max_workers; the client's thread pool
+                bounds all maps and submits together.
+            ordered (bool): Yield outcomes in the order of kwargs_iterable instead
+                of as the calls complete.
+
+        Yields:
+            Union[T, Exception]: The result of each call, or the exception it raised.
+        """
+        window = self.max_workers if max_workers is None else max_workers
+        if window < 1:
+            raise ValueError("max_workers must be at least 1.")
+        call = self._resolve(method)
+        arguments = iter(kwargs_iterable)
+        in_flight: Deque["Future[T]"] = deque()
+
+        def start_next() -> bool:
+            kwargs = next(arguments, None)
+            if kwargs is None:
+                return False
+            in_flight.append(self.submit(call, **kwargs))
+            return True
+
+        try:
+            while len(in_flight) < window and start_next():
+                pass
+            while in_flight:
+                if ordered:
+                    finished = [in_flight.popleft()]
+                else:
+                    done: Set["Future[T]"] = wait(
+                        in_flight, return_when=FIRST_COMPLETED
+                    ).done
+                    finished = [future for future in in_flight if future in done]
+                    for future in finished:
+                        in_flight.remove(future)
+                for future in finished:
+                    start_next()
+                    outcome = _outcome(future)
+                    yield outcome
+        finally:
+            for future in in_flight:
+                future.cancel()
+
+    @property
+    def ready(self) -> bool:
+        """Whether warm_up() has completed, e.g. to gate traffic in a health check."""
+        return self._ready
+
+    def warm_up(self, connections: int = 1, cert_path: Optional[str] = None) -> None:
+        """Does the one-off work of the first requests ahead of time.
+
+        Opens ``connections`` pooled connections to the API (DNS, TCP and TLS),
+        fetches an access token, loads the certificate used for security
+        credentials and builds any deferred model schemas, then marks the client
+        ready. With a token registry, tokens are fetched per tenant on first use.
+
+        Args:
+            connections (int): Number of connections to open, e.g. the number of
+                threads that will share the client.
+            cert_path (Optional[str]): Certificate used for security credentials;
+                defaults to the one bundled for the environment the HTTP client
+                sends requests to.
+
+        Raises:
+            MpesaApiException: If the API cannot be reached or the token request fails.
+        """
+        _complete_models()
+        load_public_key(self.environment, cert_path)
+        self.http_client.warm_up(connections)
+        if self._token_registry is None:
+            self.token_manager.get_token()
+        self._ready = True
+
+    def __enter__(self) -> "MpesaClient":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Release pooled connections held by the underlying HTTP client.
+
+        Calls started with map() or submit() are finished first. A client passed
+        in through ``http_client`` is left open, since it may be shared with other
+        MpesaClient instances.
+        """
+        self._executor.shutdown(wait=True)
+        if self._owned_http_client is not None:
+            self._owned_http_client.close()
+
+
+def _outcome(future: "Future[T]") -> Union[T, Exception]:
+    """Returns the result of a finished call, or the exception it raised."""
+    error = future.exception()
+    if error is None:
+        return future.result()
+    if isinstance(error, Exception):
+        return error
+    raise error
+
+
+class AsyncMpesaClient:
+    """Unified asynchronous client for all M-PESA services.
+
+    Mirrors MpesaClient, but every service method is a coroutine running on top of
+    MpesaAsyncHttpClient, so many requests can be kept in flight on one event loop.
+    """
+
+    def __init__(
+        self,
+        consumer_key: Optional[str] = None,
+        consumer_secret: Optional[str] = None,
+        environment: str = "sandbox",
+        http_client: Optional[MpesaAsyncHttpClient] = None,
+        token_registry: Optional[AsyncTokenRegistry] = None,
+    ) -> None:
+        """Initialize the AsyncMpesaClient with all asynchronous service facades.
+
+        Args:
+            consumer_key: M-Pesa consumer key.
+            consumer_secret: M-Pesa consumer secret.
+            environment: Either 'sandbox' or 'production'. When an http_client
+                or token_registry is supplied, the environment of its base URL
+                takes precedence.
+            http_client: Optional pre-configured MpesaAsyncHttpClient. When omitted,
+                a client is created and owned by this AsyncMpesaClient.
+            token_registry: Optional AsyncTokenRegistry serving many consumer keys;
+                see MpesaClient.
+        """
+        self._owned_http_client: Optional[MpesaAsyncHttpClient] = None
+        self._token_registry = token_registry
+        self._ready = False
+        self.http_client: AsyncHttpClient
+        self.token_manager: AsyncTokenManager
+        if token_registry is not None:
+            self.http_client = token_registry.http_client
+            self.token_manager = token_registry.token_manager
+        elif consumer_key is None or consumer_secret is None:
+            raise ValueError(
+                "Either consumer_key and consumer_secret, or token_registry, must be provided."
+            )
+        else:
+            if http_client is None:
+                http_client = self._owned_http_client = MpesaAsyncHttpClient(env=environment)
+            self.http_client = http_client
+            self.token_manager = AsyncTokenManager(
+                http_client=self.http_client,
+                consumer_key=consumer_key,
+                consumer_secret=consumer_secret,
+            )
+        self.environment = _environment_of(self.http_client, environment)
+
+        # express => M-PESA STK Push
+        self.express = AsyncStkPushService(
+            http_client=self.http_client, token_manager=self.token_manager
+        )
+        self.stk_push = self.express.push  # Alias for convenience
+        self.stk_query = self.express.query  # Alias for convenience
+
+        # b2c => M-PESA Business to Customer services
+        self.b2c = AsyncB2CService(
+            http_client=self.http_client, token_manager=self.token_manager
+        )
+
+        # b2b => M-PESA Business to Business services
+        self.b2b = AsyncB2BService(
+            http_client=self.http_client, token_manager=self.token_manager
+        )
+
+        # transaction => M-PESA Transaction status services
+        self.transactions = AsyncTransactionService(
+            http_client=self.http_client, token_manager=self.token_manager
+        )
+
+        # tax => M-PESA Tax services
+        self.tax = AsyncTaxService(
+            http_client=self.http_client, token_manager=self.token_manager
+        )
+
+        # balance => M-PESA Account balance services
+        self.balance = AsyncBalanceService(
+            http_client=self.http_client, token_manager=self.token_manager
+        )
+
+        # reversal => M-PESA Transaction reversal services
+        self.reversal = AsyncReversalService(
+            http_client=self.http_client, token_manager=self.token_manager
+        )
+
+        # bill => M-PESA Bill services
+        self.bill = AsyncBillService(
+            http_client=self.http_client, token_manager=self.token_manager
+        )
+
+        # dynamic_qr => M-PESA Dynamic QR services
+        self.dynamic_qr = AsyncDynamicQRCodeService(
+            http_client=self.http_client, token_manager=self.token_manager
+        )
+
+        # c2b => M-PESA Customer to Business services
+        self.c2b = AsyncC2BService(
+            http_client=self.http_client, token_manager=self.token_manager
+        )
+
+        # ratiba => M-PESA Ratiba services
+        self.ratiba = AsyncRatibaService(
+            http_client=self.http_client, token_manager=self.token_manager
+        )
+
+    @property
+    def ready(self) -> bool:
+        """Whether warm_up() has completed, e.g. to gate traffic in a health check."""
+        return self._ready
+
+    async def warm_up(
+        self, connections: int = 1, cert_path: Optional[str] = None
+    ) -> None:
+        """Does the one-off work of the first requests ahead of time.
+
+        See MpesaClient.warm_up(); here connections are opened concurrently on the
+        running event loop.
+        """
+        _complete_models()
+        load_public_key(self.environment, cert_path)
+        await self.http_client.warm_up(connections)
+        if self._token_registry is None:
+            await self.token_manager.get_token()
+        self._ready = True
+
+    async def __aenter__(self) -> "AsyncMpesaClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Release pooled connections held by the underlying HTTP client.
+
+        A client passed in through ``http_client`` is left open, since it may be
+        shared with other AsyncMpesaClient instances.
+        """
+        if self._owned_http_client is not None:
+            await self._owned_http_client.aclose()
@@ -10,10 +10,11 @@ from .schemas import (
     StkPushQueryRequest,
     StkPushQueryResponse,
 )
-from .stk_push import StkPush
+from .stk_push import AsyncStkPush, StkPush
 
 
 __all__ = [
+    "AsyncStkPush",
     "StkPush",
     "StkPushSimulateRequest",
     "StkPushSimulateResponse",
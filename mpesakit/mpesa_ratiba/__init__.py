@@ -7,9 +7,10 @@ from .schemas import (
     StandingOrderCallback,
     StandingOrderCallbackResponse,
 )
-from .mpesa_ratiba import MpesaRatiba
+from .mpesa_ratiba import AsyncMpesaRatiba, MpesaRatiba
 
 __all__ = [
+    "AsyncMpesaRatiba",
     "StandingOrderRequest",
     "StandingOrderResponse",
     "StandingOrderCallback",
@@ -5,8 +5,8 @@ using the M-Pesa API. Requires a valid access token for authentication and uses
 """
 
 from pydantic import BaseModel, ConfigDict
-from mpesakit.auth import TokenManager
-from mpesakit.http_client import HttpClient
+from mpesakit.auth import AsyncTokenManager, TokenManager
+from mpesakit.http_client import AsyncHttpClient, HttpClient
 
 from .schemas import (
     StandingOrderRequest,
@@ -49,3 +49,40 @@ class MpesaRatiba(BaseModel):
             url, json=request.model_dump(mode="json"), headers=headers
         )
         return StandingOrderResponse(**response_data)
+
+
+class AsyncMpesaRatiba(BaseModel):
+    """Represents the asynchronous Standing Order (Ratiba) API client for M-Pesa operations.
+
+    https://developer.safaricom.co.ke/APIs/MpesaRatiba
+
+    Attributes:
+        http_client (AsyncHttpClient): HTTP client for making requests to the M-Pesa API.
+        token_manager (AsyncTokenManager): Manages access tokens for authentication.
+    """
+
+    http_client: AsyncHttpClient
+    token_manager: AsyncTokenManager
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    async def create_standing_order(
+        self, request: StandingOrderRequest
+    ) -> StandingOrderResponse:
+        """Initiates a Standing Order transaction.
+
+        Args:
+            request (StandingOrderRequest): The Standing Order request data.
+
+        Returns:
+            StandingOrderResponse: Response from the M-Pesa API.
+        """
+        url = "/standingorder/v1/createStandingOrderExternal"
+        headers = {
+            "Authorization": f"Bearer {await self.token_manager.get_token()}",
+            "Content-Type": "application/json",
+        }
+        response_data = await self.http_client.post(
+            url, json=request.model_dump(mode="json"), headers=headers
+        )
+        return StandingOrderResponse(**response_data)
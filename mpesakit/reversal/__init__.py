@@ -6,9 +6,10 @@ from .schemas import (
     ReversalTimeoutCallback,
     ReversalTimeoutCallbackResponse,
 )
-from .reversal import Reversal
+from .reversal import AsyncReversal, Reversal
 
 __all__ = [
+    "AsyncReversal",
     "Reversal",
     "ReversalRequest",
     "ReversalResponse",
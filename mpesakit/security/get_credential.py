@@ -3,6 +3,7 @@
 import os
 import base64
 from datetime import datetime
+from functools import lru_cache
 from typing import Optional
 
 from cryptography import x509
@@ -23,12 +24,30 @@ def _default_cert_path(environment: str) -> str:
     return os.path.join(DEFAULT_CERT_DIR, filename)
 
 
-def _load_public_key_from_cert(cert_path: str) -> RSAPublicKey:
-    """Load an RSA public key from a certificate file. Supports PEM and DER encoded X.509 certs."""
+def load_public_key(
+    environment: str = "sandbox", cert_path: Optional[str] = None
+) -> RSAPublicKey:
+    """Load the M-Pesa RSA public key used to encrypt security credentials.
+
+    Keys are cached per certificate file and reloaded when the file changes, so
+    loading the key ahead of time (e.g. at startup) saves the first request the work.
+
+    :param environment: "production" or "sandbox"
+    :param cert_path: Path to .cer file. If None, defaults by environment.
+    :return: The certificate's RSA public key
+    """
+    if cert_path is None:
+        cert_path = _default_cert_path(environment)
     if not os.path.isfile(cert_path):
         raise FileNotFoundError(f"Certificate not found at: {cert_path}")
+    return _load_public_key_from_cert(cert_path, os.stat(cert_path).st_mtime_ns)
+
 
-    data = open(cert_path, "rb").read()
+@lru_cache(maxsize=16)
+def _load_public_key_from_cert(cert_path: str, mtime_ns: int) -> RSAPublicKey:
+    """Load an RSA public key from a certificate file. Supports PEM and DER encoded X.509 certs."""
+    with open(cert_path, "rb") as cert_file:
+        data = cert_file.read()
 
     # Load PEM certificate
     try:
@@ -62,10 +81,7 @@ def generate_security_credential(
     if not initiator_password:
         raise ValueError("Initiator password is required.")
 
-    if cert_path is None:
-        cert_path = _default_cert_path(environment)
-
-    public_key = _load_public_key_from_cert(cert_path)
+    public_key = load_public_key(environment, cert_path)
 
     # Step 1: timestamp and unencrypted password bytes
     timestamp = datetime.now().strftime("%Y%m%d%H%M%S")
@@ -1,25 +1,36 @@
-from .b2b import B2BService
-from .b2c import B2CService
-from .balance import BalanceService
-from .bill import BillService
-from .c2b import C2BService
-from .dynamic_qr import DynamicQRCodeService
-from .express import StkPushService
-from .ratiba import RatibaService
-from .reversal import ReversalService
-from .tax import TaxService
-from .transaction import TransactionService
+from .b2b import AsyncB2BService, B2BService
+from .b2c import AsyncB2CService, B2CService
+from .balance import AsyncBalanceService, BalanceService
+from .bill import AsyncBillService, BillService
+from .c2b import AsyncC2BService, C2BService
+from .dynamic_qr import AsyncDynamicQRCodeService, DynamicQRCodeService
+from .express import AsyncStkPushService, StkPushService
+from .ratiba import AsyncRatibaService, RatibaService
+from .reversal import AsyncReversalService, ReversalService
+from .tax import AsyncTaxService, TaxService
+from .transaction import AsyncTransactionService, TransactionService
 
 __all__ = [
+    "AsyncB2BService",
     "B2BService",
+    "AsyncB2CService",
     "B2CService",
+    "AsyncBalanceService",
     "BalanceService",
+    "AsyncBillService",
     "BillService",
+    "AsyncC2BService",
     "C2BService",
+    "AsyncDynamicQRCodeService",
     "DynamicQRCodeService",
+    "AsyncStkPushService",
     "StkPushService",
+    "AsyncRatibaService",
     "RatibaService",
+    "AsyncReversalService",
     "ReversalService",
+    "AsyncTaxService",
     "TaxService",
+    "AsyncTransactionService",
     "TransactionService",
 ]
@@ -1,19 +1,22 @@
 """Facade for M-Pesa B2B APIs (Express Checkout)."""
 
 from typing import Optional
-from mpesakit.auth import TokenManager
-from mpesakit.http_client import HttpClient
+from mpesakit.auth import AsyncTokenManager, TokenManager
+from mpesakit.http_client import AsyncHttpClient, HttpClient, request_deadline
 from mpesakit.business_buy_goods import (
+    AsyncBusinessBuyGoods,
     BusinessBuyGoods,
     BusinessBuyGoodsRequest,
     BusinessBuyGoodsResponse,
 )
 from mpesakit.business_paybill import (
+    AsyncBusinessPayBill,
     BusinessPayBill,
     BusinessPayBillRequest,
     BusinessPayBillResponse,
 )
 from mpesakit.b2b_express_checkout import (
+    AsyncB2BExpressCheckout,
     B2BExpressCheckout,
     B2BExpressCheckoutRequest,
     B2BExpressCheckoutResponse,
@@ -48,6 +51,8 @@ class B2BService:
         callback_url: str,
         partner_name: str,
         request_ref_id: str,
+        timeout: Optional[float] = None,
+        deadline: Optional[float] = None,
         **kwargs,
     ) -> B2BExpressCheckoutResponse:
         """Initiate a B2B Express Checkout USSD Push transaction to another merchant.
@@ -60,6 +65,9 @@ class B2BService:
             callback_url: URL for receiving the callback.
             partner_name: Name of the partner.
             request_ref_id: Unique reference ID for the request.
+            timeout: Seconds the call may take in total, including token refresh,
+                retries and rate-limit waits.
+            deadline: time.monotonic() value by which the call must finish.
             kwargs: Fields for B2BExpressCheckoutRequest.
 
         Returns:
@@ -79,7 +87,8 @@ class B2BService:
                 if k in B2BExpressCheckoutRequest.model_fields
             },
         )
-        return self._express_checkout.ussd_push(request)
+        with request_deadline(timeout, deadline):
+            return self._express_checkout.ussd_push(request)
 
     def paybill(
         self,
@@ -93,6 +102,8 @@ class B2BService:
         remarks: str,
         queue_timeout_url: str,
         result_url: str,
+        timeout: Optional[float] = None,
+        deadline: Optional[float] = None,
         **kwargs,
     ) -> BusinessPayBillResponse:
         """Initiate a Business PayBill transaction to another merchant.
@@ -108,6 +119,9 @@ class B2BService:
             remarks: Remarks for the transaction.
             queue_timeout_url: URL for timeout callback.
             result_url: URL for result callback.
+            timeout: Seconds the call may take in total, including token refresh,
+                retries and rate-limit waits.
+            deadline: time.monotonic() value by which the call must finish.
             kwargs: Additional fields for BusinessPayBillRequest.
 
         Returns:
@@ -131,7 +145,8 @@ class B2BService:
             },
         )
 
-        return self._business_paybill.paybill(request)
+        with request_deadline(timeout, deadline):
+            return self._business_paybill.paybill(request)
 
     def buygoods(
         self,
@@ -146,6 +161,8 @@ class B2BService:
         queue_timeout_url: str,
         result_url: str,
         occassion: Optional[str] = None,
+        timeout: Optional[float] = None,
+        deadline: Optional[float] = None,
         **kwargs,
     ) -> BusinessBuyGoodsResponse:
         """Initiate a Business Buy Goods transaction to another merchant.
@@ -162,6 +179,9 @@ class B2BService:
             queue_timeout_url: URL for timeout callback.
             result_url: URL for result callback.
             occassion: Optional transaction occasion.
+            timeout: Seconds the call may take in total, including token refresh,
+                retries and rate-limit waits.
+            deadline: time.monotonic() value by which the call must finish.
             kwargs: Additional fields for BusinessBuyGoodsRequest.
 
         Returns:
@@ -185,4 +205,193 @@ class B2BService:
                 if k in BusinessBuyGoodsRequest.model_fields
             },
         )
-        return self._business_buygoods.buy_goods(request)
+        with request_deadline(timeout, deadline):
+            return self._business_buygoods.buy_goods(request)
+
+
+class AsyncB2BService:
+    """Asynchronous facade for all M-Pesa B2B APIs."""
+
+    def __init__(
+        self, http_client: AsyncHttpClient, token_manager: AsyncTokenManager
+    ) -> None:
+        """Initialize the B2B service facade."""
+        self.http_client = http_client
+        self.token_manager = token_manager
+        self._express_checkout = AsyncB2BExpressCheckout(
+            http_client=self.http_client, token_manager=self.token_manager
+        )
+        self._business_paybill = AsyncBusinessPayBill(
+            http_client=self.http_client,
+            token_manager=self.token_manager,
+        )
+        self._business_buygoods = AsyncBusinessBuyGoods(
+            http_client=self.http_client,
+            token_manager=self.token_manager,
+        )
+
+    async def express_checkout(
+        self,
+        primary_short_code: str,
+        receiver_short_code: str,
+        amount: int,
+        payment_ref: str,
+        callback_url: str,
+        partner_name: str,
+        request_ref_id: str,
+        timeout: Optional[float] = None,
+        deadline: Optional[float] = None,
+        **kwargs,
+    ) -> B2BExpressCheckoutResponse:
+        """Initiate a B2B Express Checkout USSD Push transaction to another merchant.
+
+        Args:
+            primary_short_code: The primary short code for the transaction.
+            receiver_short_code: The receiver short code for the transaction.
+            amount: The amount to be transacted.
+            payment_ref: Reference for the payment.
+            callback_url: URL for receiving the callback.
+            partner_name: Name of the partner.
+            request_ref_id: Unique reference ID for the request.
+            timeout: Seconds the call may take in total, including token refresh,
+                retries and rate-limit waits.
+            deadline: time.monotonic() value by which the call must finish.
+            kwargs: Fields for B2BExpressCheckoutRequest.
+
+        Returns:
+            B2BExpressCheckoutResponse: Response from M-Pesa API.
+        """
+        request = B2BExpressCheckoutRequest(
+            primaryShortCode=primary_short_code,
+            receiverShortCode=receiver_short_code,
+            amount=amount,
+            paymentRef=payment_ref,
+            callbackUrl=callback_url,
+            partnerName=partner_name,
+            RequestRefID=request_ref_id,
+            **{
+                k: v
+                for k, v in kwargs.items()
+                if k in B2BExpressCheckoutRequest.model_fields
+            },
+        )
+        with request_deadline(timeout, deadline):
+            return await self._express_checkout.ussd_push(request)
+
+    async def paybill(
+        self,
+        initiator: str,
+        security_credential: str,
+        amount: int,
+        party_a: int,
+        party_b: int,
+        account_reference: str,
+        requester: str,
+        remarks: str,
+        queue_timeout_url: str,
+        result_url: str,
+        timeout: Optional[float] = None,
+        deadline: Optional[float] = None,
+        **kwargs,
+    ) -> BusinessPayBillResponse:
+        """Initiate a Business PayBill transaction to another merchant.
+
+        Args:
+            initiator: API username.
+            security_credential: Encrypted credential.
+            amount: The amount to be transacted.
+            party_a: The sender short code.
+            party_b: The receiver short code.
+            account_reference: Reference for the account.
+            requester: Requester phone number.
+            remarks: Remarks for the transaction.
+            queue_timeout_url: URL for timeout callback.
+            result_url: URL for result callback.
+            timeout: Seconds the call may take in total, including token refresh,
+                retries and rate-limit waits.
+            deadline: time.monotonic() value by which the call must finish.
+            kwargs: Additional fields for BusinessPayBillRequest.
+
+        Returns:
+            BusinessPayBillResponse: Response from M-Pesa API.
+        """
+        request = BusinessPayBillRequest(
+            Initiator=initiator,
+            SecurityCredential=security_credential,
+            Amount=amount,
+            PartyA=party_a,
+            PartyB=party_b,
+            AccountReference=account_reference,
+            Requester=requester,
+            Remarks=remarks,
+            QueueTimeOutURL=queue_timeout_url,
+            ResultURL=result_url,
+            **{
+                k: v
+                for k, v in kwargs.items()
+                if k in BusinessPayBillRequest.model_fields
+            },
+        )
+
+        with request_deadline(timeout, deadline):
+            return await self._business_paybill.paybill(request)
+
+    async def buygoods(
+        self,
+        initiator: str,
+        security_credential: str,
+        amount: int,
+        party_a: int,
+        party_b: int,
+        account_reference: str,
+        requester: str,
+        remarks: str,
+        queue_timeout_url: str,
+        result_url: str,
+        occassion: Optional[str] = None,
+        timeout: Optional[float] = None,
+        deadline: Optional[float] = None,
+        **kwargs,
+    ) -> BusinessBuyGoodsResponse:
+        """Initiate a Business Buy Goods transaction to another merchant.
+
+        Args:
+            initiator: API username.
+            security_credential: Encrypted credential.
+            amount: The amount to be transacted.
+            party_a: The sender short code.
+            party_b: The receiver short code.
+            account_reference: Reference for the account.
+            requester: Requester phone number.
+            remarks: Remarks for the transaction.
+            queue_timeout_url: URL for timeout callback.
+            result_url: URL for result callback.
+            occassion: Optional transaction occasion.
+            timeout: Seconds the call may take in total, including token refresh,
+                retries and rate-limit waits.
+            deadline: time.monotonic() value by which the call must finish.
+            kwargs: Additional fields for BusinessBuyGoodsRequest.
+
+        Returns:
+            BusinessBuyGoodsResponse: Response from M-Pesa API.
+        """
+        request = BusinessBuyGoodsRequest(
+            Initiator=initiator,
+            SecurityCredential=security_credential,
+            Amount=amount,
+            PartyA=party_a,
+            PartyB=party_b,
+            AccountReference=account_reference,
+            Requester=requester,
+            Remarks=remarks,
+            QueueTimeOutURL=queue_timeout_url,
+            ResultURL=result_url,
+            Occassion=occassion,
+            **{
+                k: v
+                for k, v in kwargs.items()
+                if k in BusinessBuyGoodsRequest.model_fields
+            },
+        )
+        with request_deadline(timeout, deadline):
+            return await self._business_buygoods.buy_goods(request)
@@ -1,8 +1,9 @@
 """Facade for M-Pesa Account Balance API interactions."""
 
-from mpesakit.auth import TokenManager
-from mpesakit.http_client import HttpClient
+from mpesakit.auth import AsyncTokenManager, TokenManager
+from mpesakit.http_client import AsyncHttpClient, HttpClient, request_deadline
 from mpesakit.account_balance import (
+    AsyncAccountBalance,
     AccountBalance,
     AccountBalanceRequest,
     AccountBalanceResponse,
@@ -31,6 +32,8 @@ class BalanceService:
         remarks: str,
         result_url: str,
         queue_timeout_url: str,
+        timeout: float | None = None,
+        deadline: float | None = None,
         **kwargs,
     ) -> AccountBalanceResponse:
         """Query account balance.
@@ -44,6 +47,9 @@ class BalanceService:
             remarks: Additional remarks.
             result_url: URL for result notification.
             queue_timeout_url: URL for timeout notification.
+            timeout: Seconds the call may take in total, including token refresh,
+                retries and rate-limit waits.
+            deadline: time.monotonic() value by which the call must finish.
             **kwargs: Additional fields for AccountBalanceRequest.
 
         Returns:
@@ -64,4 +70,71 @@ class BalanceService:
                 if k in AccountBalanceRequest.model_fields
             },
         )
-        return self.account_balance.query(request)
+        with request_deadline(timeout, deadline):
+            return self.account_balance.query(request)
+
+
+class AsyncBalanceService:
+    """Asynchronous facade for M-Pesa Account Balance operations."""
+
+    def __init__(
+        self, http_client: AsyncHttpClient, token_manager: AsyncTokenManager
+    ) -> None:
+        """Initialize the Balance service."""
+        self.http_client = http_client
+        self.token_manager = token_manager
+        self.account_balance = AsyncAccountBalance(
+            http_client=self.http_client,
+            token_manager=self.token_manager,
+        )
+
+    async def query(
+        self,
+        initiator: str,
+        security_credential: str,
+        command_id: str,
+        party_a: int,
+        identifier_type: int,
+        remarks: str,
+        result_url: str,
+        queue_timeout_url: str,
+        timeout: float | None = None,
+        deadline: float | None = None,
+        **kwargs,
+    ) -> AccountBalanceResponse:
+        """Query account balance.
+
+        Args:
+            initiator: Name of the initiator.
+            security_credential: Security credential for authentication.
+            command_id: Command ID for the transaction.
+            party_a: Shortcode of the account to query.
+            identifier_type: Type of identifier for PartyA.
+            remarks: Additional remarks.
+            result_url: URL for result notification.
+            queue_timeout_url: URL for timeout notification.
+            timeout: Seconds the call may take in total, including token refresh,
+                retries and rate-limit waits.
+            deadline: time.monotonic() value by which the call must finish.
+            **kwargs: Additional fields for AccountBalanceRequest.
+
+        Returns:
+            AccountBalanceResponse: Response from the M-Pesa API.
+        """
+        request = AccountBalanceRequest(
+            Initiator=initiator,
+            SecurityCredential=security_credential,
+            CommandID=command_id,
+            PartyA=party_a,
+            IdentifierType=identifier_type,
+            Remarks=remarks,
+            ResultURL=result_url,
+            QueueTimeOutURL=queue_timeout_url,
+            **{
+                k: v
+                for k, v in kwargs.items()
+                if k in AccountBalanceRequest.model_fields
+            },
+        )
+        with request_deadline(timeout, deadline):
+            return await self.account_balance.query(request)
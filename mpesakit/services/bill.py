@@ -1,9 +1,10 @@
 """Facade for M-PESA Bill Manager API interactions."""
 
 from typing import Optional, List
-from mpesakit.auth import TokenManager
-from mpesakit.http_client import HttpClient
+from mpesakit.auth import AsyncTokenManager, TokenManager
+from mpesakit.http_client import AsyncHttpClient, HttpClient, request_deadline
 from mpesakit.bill_manager import (
+    AsyncBillManager,
     BillManager,
     BillManagerOptInRequest,
     BillManagerOptInResponse,
@@ -46,8 +47,14 @@ class BillService:
         send_reminders: int,
         logo: Optional[str],
         callback_url: str,
+        timeout: Optional[float] = None,
+        deadline: Optional[float] = None,
     ) -> BillManagerOptInResponse:
-        """Onboard a paybill to Bill Manager."""
+        """Onboard a paybill to Bill Manager.
+
+        The call is abandoned once ``timeout`` seconds have passed or at ``deadline``,
+        a time.monotonic() value, see request_deadline().
+        """
         request = BillManagerOptInRequest(
             shortcode=shortcode,
             email=email,
@@ -56,7 +63,8 @@ class BillService:
             logo=logo,
             callbackurl=callback_url,
         )
-        return self.bill_manager.opt_in(request)
+        with request_deadline(timeout, deadline):
+            return self.bill_manager.opt_in(request)
 
     def update_opt_in(
         self,
@@ -66,8 +74,14 @@ class BillService:
         send_reminders: int,
         logo: Optional[str] = None,
         callback_url: Optional[str] = None,
+        timeout: Optional[float] = None,
+        deadline: Optional[float] = None,
     ) -> BillManagerUpdateOptInResponse:
-        """Update opt-in details for Bill Manager."""
+        """Update opt-in details for Bill Manager.
+
+        The call is abandoned once ``timeout`` seconds have passed or at ``deadline``,
+        a time.monotonic() value, see request_deadline().
+        """
         request = BillManagerUpdateOptInRequest(
             shortcode=shortcode,
             email=email,
@@ -76,7 +90,8 @@ class BillService:
             logo=logo,
             callbackurl=callback_url,
         )
-        return self.bill_manager.update_opt_in(request)
+        with request_deadline(timeout, deadline):
+            return self.bill_manager.update_opt_in(request)
 
     def send_single_invoice(
         self,
@@ -89,8 +104,14 @@ class BillService:
         account_reference: str,
         amount: int,
         invoice_items: Optional[List[InvoiceItem]] = None,
+        timeout: Optional[float] = None,
+        deadline: Optional[float] = None,
     ) -> BillManagerSingleInvoiceResponse:
-        """Send a single invoice via Bill Manager."""
+        """Send a single invoice via Bill Manager.
+
+        The call is abandoned once ``timeout`` seconds have passed or at ``deadline``,
+        a time.monotonic() value, see request_deadline().
+        """
         request = BillManagerSingleInvoiceRequest(
             externalReference=external_reference,
             billedFullName=billed_full_name,
@@ -102,34 +123,213 @@ class BillService:
             amount=amount,
             invoiceItems=invoice_items,
         )
-        return self.bill_manager.send_single_invoice(request)
+        with request_deadline(timeout, deadline):
+            return self.bill_manager.send_single_invoice(request)
 
     def send_bulk_invoice(
         self,
         invoices: List[BillManagerSingleInvoiceRequest],
+        timeout: Optional[float] = None,
+        deadline: Optional[float] = None,
     ) -> BillManagerBulkInvoiceResponse:
-        """Send multiple invoices via Bill Manager."""
+        """Send multiple invoices via Bill Manager.
+
+        The call is abandoned once ``timeout`` seconds have passed or at ``deadline``,
+        a time.monotonic() value, see request_deadline().
+        """
         request = BillManagerBulkInvoiceRequest(invoices=invoices)
-        return self.bill_manager.send_bulk_invoice(request)
+        with request_deadline(timeout, deadline):
+            return self.bill_manager.send_bulk_invoice(request)
 
     def cancel_single_invoice(
         self,
         external_reference: str,
+        timeout: Optional[float] = None,
+        deadline: Optional[float] = None,
     ) -> BillManagerCancelInvoiceResponse:
-        """Cancel a single invoice via Bill Manager."""
+        """Cancel a single invoice via Bill Manager.
+
+        The call is abandoned once ``timeout`` seconds have passed or at ``deadline``,
+        a time.monotonic() value, see request_deadline().
+        """
         request = BillManagerCancelSingleInvoiceRequest(
             externalReference=external_reference
         )
-        return self.bill_manager.cancel_single_invoice(request)
+        with request_deadline(timeout, deadline):
+            return self.bill_manager.cancel_single_invoice(request)
 
     def cancel_bulk_invoice(
         self,
         external_references: List[str],
+        timeout: Optional[float] = None,
+        deadline: Optional[float] = None,
+    ) -> BillManagerCancelInvoiceResponse:
+        """Cancel multiple invoices via Bill Manager.
+
+        The call is abandoned once ``timeout`` seconds have passed or at ``deadline``,
+        a time.monotonic() value, see request_deadline().
+        """
+        invoice_requests = [
+            BillManagerCancelSingleInvoiceRequest(externalReference=ref)
+            for ref in external_references
+        ]
+        request = BillManagerCancelBulkInvoiceRequest(invoices=invoice_requests)
+        with request_deadline(timeout, deadline):
+            return self.bill_manager.cancel_bulk_invoice(request)
+
+
+class AsyncBillService:
+    """Asynchronous facade for M-PESA Bill Manager operations."""
+
+    def __init__(
+        self,
+        http_client: AsyncHttpClient,
+        token_manager: AsyncTokenManager,
+        app_key: Optional[str] = None,
+    ) -> None:
+        """Initialize the Bill service."""
+        self.http_client = http_client
+        self.token_manager = token_manager
+        self.bill_manager = AsyncBillManager(
+            http_client=self.http_client,
+            token_manager=self.token_manager,
+            app_key=app_key,
+        )
+
+    async def opt_in(
+        self,
+        shortcode: int,
+        email: str,
+        official_contact: str,
+        send_reminders: int,
+        logo: Optional[str],
+        callback_url: str,
+        timeout: Optional[float] = None,
+        deadline: Optional[float] = None,
+    ) -> BillManagerOptInResponse:
+        """Onboard a paybill to Bill Manager.
+
+        The call is abandoned once ``timeout`` seconds have passed or at ``deadline``,
+        a time.monotonic() value, see request_deadline().
+        """
+        request = BillManagerOptInRequest(
+            shortcode=shortcode,
+            email=email,
+            officialContact=official_contact,
+            sendReminders=send_reminders,
+            logo=logo,
+            callbackurl=callback_url,
+        )
+        with request_deadline(timeout, deadline):
+            return await self.bill_manager.opt_in(request)
+
+    async def update_opt_in(
+        self,
+        shortcode: int,
+        email: str,
+        official_contact: str,
+        send_reminders: int,
+        logo: Optional[str] = None,
+        callback_url: Optional[str] = None,
+        timeout: Optional[float] = None,
+        deadline: Optional[float] = None,
+    ) -> BillManagerUpdateOptInResponse:
+        """Update opt-in details for Bill Manager.
+
+        The call is abandoned once ``timeout`` seconds have passed or at ``deadline``,
+        a time.monotonic() value, see request_deadline().
+        """
+        request = BillManagerUpdateOptInRequest(
+            shortcode=shortcode,
+            email=email,
+            officialContact=official_contact,
+            sendReminders=send_reminders,
+            logo=logo,
+            callbackurl=callback_url,
+        )
+        with request_deadline(timeout, deadline):
+            return await self.bill_manager.update_opt_in(request)
+
+    async def send_single_invoice(
+        self,
+        external_reference: str,
+        billed_full_name: str,
+        billed_phone_number: str,
+        billed_period: str,
+        invoice_name: str,
+        due_date: str,
+        account_reference: str,
+        amount: int,
+        invoice_items: Optional[List[InvoiceItem]] = None,
+        timeout: Optional[float] = None,
+        deadline: Optional[float] = None,
+    ) -> BillManagerSingleInvoiceResponse:
+        """Send a single invoice via Bill Manager.
+
+        The call is abandoned once ``timeout`` seconds have passed or at ``deadline``,
+        a time.monotonic() value, see request_deadline().
+        """
+        request = BillManagerSingleInvoiceRequest(
+            externalReference=external_reference,
+            billedFullName=billed_full_name,
+            billedPhoneNumber=billed_phone_number,
+            billedPeriod=billed_period,
+            invoiceName=invoice_name,
+            dueDate=due_date,
+            accountReference=account_reference,
+            amount=amount,
+            invoiceItems=invoice_items,
+        )
+        with request_deadline(timeout, deadline):
+            return await self.bill_manager.send_single_invoice(request)
+
+    async def send_bulk_invoice(
+        self,
+        invoices: List[BillManagerSingleInvoiceRequest],
+        timeout: Optional[float] = None,
+        deadline: Optional[float] = None,
+    ) -> BillManagerBulkInvoiceResponse:
+        """Send multiple invoices via Bill Manager.
+
+        The call is abandoned once ``timeout`` seconds have passed or at ``deadline``,
+        a time.monotonic() value, see request_deadline().
+        """
+        request = BillManagerBulkInvoiceRequest(invoices=invoices)
+        with request_deadline(timeout, deadline):
+            return await self.bill_manager.send_bulk_invoice(request)
+
+    async def cancel_single_invoice(
+        self,
+        external_reference: str,
+        timeout: Optional[float] = None,
+        deadline: Optional[float] = None,
+    ) -> BillManagerCancelInvoiceResponse:
+        """Cancel a single invoice via Bill Manager.
+
+        The call is abandoned once ``timeout`` seconds have passed or at ``deadline``,
+        a time.monotonic() value, see request_deadline().
+        """
+        request = BillManagerCancelSingleInvoiceRequest(
+            externalReference=external_reference
+        )
+        with request_deadline(timeout, deadline):
+            return await self.bill_manager.cancel_single_invoice(request)
+
+    async def cancel_bulk_invoice(
+        self,
+        external_references: List[str],
+        timeout: Optional[float] = None,
+        deadline: Optional[float] = None,
     ) -> BillManagerCancelInvoiceResponse:
-        """Cancel multiple invoices via Bill Manager."""
+        """Cancel multiple invoices via Bill Manager.
+
+        The call is abandoned once ``timeout`` seconds have passed or at ``deadline``,
+        a time.monotonic() value, see request_deadline().
+        """
         invoice_requests = [
             BillManagerCancelSingleInvoiceRequest(externalReference=ref)
             for ref in external_references
         ]
         request = BillManagerCancelBulkInvoiceRequest(invoices=invoice_requests)
-        return self.bill_manager.cancel_bulk_invoice(request)
+        with request_deadline(timeout, deadline):
+            return await self.bill_manager.cancel_bulk_invoice(request)
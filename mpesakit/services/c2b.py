@@ -1,9 +1,10 @@
 """Facade for M-Pesa C2B (Customer to Business) API interactions."""
 
-from mpesakit.auth import TokenManager
-from mpesakit.http_client import HttpClient
+from mpesakit.auth import AsyncTokenManager, TokenManager
+from mpesakit.http_client import AsyncHttpClient, HttpClient, request_deadline
 
 from mpesakit.c2b import (
+    AsyncC2B,
     C2B,
     C2BRegisterUrlRequest,
     C2BRegisterUrlResponse,
@@ -28,6 +29,8 @@ class C2BService:
         response_type: str,
         confirmation_url: str,
         validation_url: str,
+        timeout: float | None = None,
+        deadline: float | None = None,
         **kwargs,
     ) -> C2BRegisterUrlResponse:
         """Register validation and confirmation URLs for C2B payments.
@@ -37,6 +40,9 @@ class C2BService:
             response_type: The response type ("Completed" or "Cancelled").
             confirmation_url: The confirmation URL.
             validation_url: The validation URL.
+            timeout: Seconds the call may take in total, including token refresh,
+                retries and rate-limit waits.
+            deadline: time.monotonic() value by which the call must finish.
             **kwargs: Additional fields for C2BRegisterUrlRequest.
 
         Returns:
@@ -53,4 +59,59 @@ class C2BService:
                 if k in C2BRegisterUrlRequest.model_fields
             },
         )
-        return self.c2b.register_url(request)
+        with request_deadline(timeout, deadline):
+            return self.c2b.register_url(request)
+
+
+class AsyncC2BService:
+    """Asynchronous facade for M-Pesa C2B operations."""
+
+    def __init__(
+        self, http_client: AsyncHttpClient, token_manager: AsyncTokenManager
+    ) -> None:
+        """Initialize the C2B service."""
+        self.http_client = http_client
+        self.token_manager = token_manager
+        self.c2b = AsyncC2B(
+            http_client=self.http_client,
+            token_manager=self.token_manager,
+        )
+
+    async def register_url(
+        self,
+        short_code: int,
+        response_type: str,
+        confirmation_url: str,
+        validation_url: str,
+        timeout: float | None = None,
+        deadline: float | None = None,
+        **kwargs,
+    ) -> C2BRegisterUrlResponse:
+        """Register validation and confirmation URLs for C2B payments.
+
+        Args:
+            short_code: The business short code.
+            response_type: The response type ("Completed" or "Cancelled").
+            confirmation_url: The confirmation URL.
+            validation_url: The validation URL.
+            timeout: Seconds the call may take in total, including token refresh,
+                retries and rate-limit waits.
+            deadline: time.monotonic() value by which the call must finish.
+            **kwargs: Additional fields for C2BRegisterUrlRequest.
+
+        Returns:
+            C2BRegisterUrlResponse: Response from the M-Pesa API.
+        """
+        request = C2BRegisterUrlRequest(
+            ShortCode=short_code,
+            ResponseType=response_type,
+            ConfirmationURL=confirmation_url,
+            ValidationURL=validation_url,
+            **{
+                k: v
+                for k, v in kwargs.items()
+                if k in C2BRegisterUrlRequest.model_fields
+            },
+        )
+        with request_deadline(timeout, deadline):
+            return await self.c2b.register_url(request)
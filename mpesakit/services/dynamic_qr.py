@@ -1,10 +1,11 @@
 """Facade for M-Pesa Dynamic QR Code generation service."""
 
-from mpesakit.auth import TokenManager
-from mpesakit.http_client.mpesa_http_client import HttpClient
+from mpesakit.auth import AsyncTokenManager, TokenManager
+from mpesakit.http_client import AsyncHttpClient, HttpClient, request_deadline
 from mpesakit.dynamic_qr_code import (
     DynamicQRGenerateRequest,
     DynamicQRGenerateResponse,
+    AsyncDynamicQRCode,
     DynamicQRCode,
 )
 
@@ -29,6 +30,8 @@ class DynamicQRCodeService:
         trx_code: str,
         cpi: str,
         size: str,
+        timeout: float | None = None,
+        deadline: float | None = None,
         **kwargs,
     ) -> DynamicQRGenerateResponse:
         """Generate a dynamic QR code for payment.
@@ -40,6 +43,9 @@ class DynamicQRCodeService:
             trx_code: Transaction type (DynamicQRTransactionType).
             cpi: CPI code.
             size: Size of the QR code.
+            timeout: Seconds the call may take in total, including token refresh,
+                retries and rate-limit waits.
+            deadline: time.monotonic() value by which the call must finish.
             **kwargs: Additional fields for DynamicQRGenerateRequest.
 
         Returns:
@@ -58,4 +64,65 @@ class DynamicQRCodeService:
                 if k in DynamicQRGenerateRequest.model_fields
             },
         )
-        return self.qr_code.generate(request)
+        with request_deadline(timeout, deadline):
+            return self.qr_code.generate(request)
+
+
+class AsyncDynamicQRCodeService:
+    """Asynchronous facade for M-Pesa Dynamic QR Code generation."""
+
+    def __init__(
+        self, http_client: AsyncHttpClient, token_manager: AsyncTokenManager
+    ) -> None:
+        """Initialize the Dynamic QR Code service."""
+        self.http_client = http_client
+        self.token_manager = token_manager
+        self.qr_code = AsyncDynamicQRCode(
+            http_client=self.http_client,
+            token_manager=self.token_manager,
+        )
+
+    async def generate(
+        self,
+        merchant_name: str,
+        ref_no: str,
+        amount: float,
+        trx_code: str,
+        cpi: str,
+        size: str,
+        timeout: float | None = None,
+        deadline: float | None = None,
+        **kwargs,
+    ) -> DynamicQRGenerateResponse:
+        """Generate a dynamic QR code for payment.
+
+        Args:
+            merchant_name: Name of the merchant.
+            ref_no: Reference number for the transaction.
+            amount: Transaction amount.
+            trx_code: Transaction type (DynamicQRTransactionType).
+            cpi: CPI code.
+            size: Size of the QR code.
+            timeout: Seconds the call may take in total, including token refresh,
+                retries and rate-limit waits.
+            deadline: time.monotonic() value by which the call must finish.
+            **kwargs: Additional fields for DynamicQRGenerateRequest.
+
+        Returns:
+            Response DynamicQRGenerateResponse containing QR code details.
+        """
+        request = DynamicQRGenerateRequest(
+            MerchantName=merchant_name,
+            RefNo=ref_no,
+            Amount=amount,
+            TrxCode=trx_code,
+            CPI=cpi,
+            Size=size,
+            **{
+                k: v
+                for k, v in kwargs.items()
+                if k in DynamicQRGenerateRequest.model_fields
+            },
+        )
+        with request_deadline(timeout, deadline):
+            return await self.qr_code.generate(request)
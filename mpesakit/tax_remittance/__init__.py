@@ -6,9 +6,10 @@ from .schemas import (
     TaxRemittanceTimeoutCallback,
     TaxRemittanceTimeoutCallbackResponse,
 )
-from .tax_remittance import TaxRemittance
+from .tax_remittance import AsyncTaxRemittance, TaxRemittance
 
 __all__ = [
+    "AsyncTaxRemittance",
     "TaxRemittance",
     "TaxRemittanceRequest",
     "TaxRemittanceResponse",
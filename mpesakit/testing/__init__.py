@@ -0,0 +1,9 @@
+from .mock_daraja import ROUTES, Faults, Latency, MockDarajaServer, Route
+
+__all__ = [
+    "Faults",
+    "Latency",
+    "MockDarajaServer",
+    "ROUTES",
+    "Route",
+]
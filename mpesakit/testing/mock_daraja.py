@@ -0,0 +1,491 @@
+"""A local stand-in for the Daraja API, for load tests and offline development.
+
+MockDarajaServer answers the M-Pesa API routes used by mpesakit with responses
+that validate against mpesakit's response schemas, after a configurable latency.
+It can inject errors and throttling, and posts the matching asynchronous result
+to the callback URL given in a request, as Daraja does:
+
+    with MockDarajaServer(latency=Latency(mean=0.2, spread=0.05)) as server:
+        http_client = MpesaHttpClient(base_url=server.url)
+        client = MpesaClient("key", "secret", http_client=http_client)
+        client.stk_push(...)
+
+It runs on the standard library's threading HTTP server with keep-alive
+connections. To serve another process, run it as a script:
+
+    python -m mpesakit.testing.mock_daraja --port 8000 --latency 0.2
+"""
+
+import argparse
+import base64
+import copy
+import json
+import random
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, ClassVar, Dict, List, Literal, NamedTuple, Optional, Set, Type
+
+import requests
+from pydantic import BaseModel, ConfigDict, Field
+
+from mpesakit.account_balance.schemas import (
+    AccountBalanceResponse,
+    AccountBalanceResultCallback,
+)
+from mpesakit.b2b_express_checkout.schemas import (
+    B2BExpressCheckoutCallback,
+    B2BExpressCheckoutResponse,
+)
+from mpesakit.b2c.schemas import B2CResponse, B2CResultCallback
+from mpesakit.bill_manager.schemas import (
+    BillManagerBulkInvoiceResponse,
+    BillManagerCancelInvoiceResponse,
+    BillManagerOptInResponse,
+    BillManagerSingleInvoiceResponse,
+    BillManagerUpdateOptInResponse,
+)
+from mpesakit.business_paybill.schemas import (
+    BusinessPayBillResponse,
+    BusinessPayBillResultCallback,
+)
+from mpesakit.dynamic_qr_code.schemas import DynamicQRGenerateResponse
+from mpesakit.mpesa_express.schemas import (
+    StkPushQueryResponse,
+    StkPushSimulateCallback,
+    StkPushSimulateResponse,
+)
+from mpesakit.mpesa_ratiba.schemas import StandingOrderCallback, StandingOrderResponse
+from mpesakit.reversal.schemas import ReversalResponse, ReversalResultCallback
+from mpesakit.tax_remittance.schemas import (
+    TaxRemittanceResponse,
+    TaxRemittanceResultCallback,
+)
+from mpesakit.transaction_status.schemas import (
+    TransactionStatusResponse,
+    TransactionStatusResultCallback,
+)
+
+OAUTH_PATH = "/oauth/v1/generate"
+
+# Identifiers generated for each request, echoed from the request when it has them
+# and shared by the response and the callback so both can be correlated.
+ID_FIELDS = (
+    "MerchantRequestID",
+    "CheckoutRequestID",
+    "ConversationID",
+    "OriginatorConversationID",
+    "TransactionID",
+    "conversationID",
+    "transactionId",
+    "requestId",
+    "responseRefID",
+    "requestRefID",
+)
+
+
+class Route(NamedTuple):
+    """How the mock server answers requests to one path.
+
+    Attributes:
+        response (Type[BaseModel]): Schema of the response; its example is sent.
+        callback (Optional[Type[BaseModel]]): Schema of the asynchronous result, if
+            Daraja sends one.
+        callback_url_field (Optional[str]): Request field holding the callback URL.
+    """
+
+    response: Type[BaseModel]
+    callback: Optional[Type[BaseModel]] = None
+    callback_url_field: Optional[str] = None
+
+
+ROUTES: Dict[str, Route] = {
+    "/mpesa/stkpush/v1/processrequest": Route(
+        StkPushSimulateResponse, StkPushSimulateCallback, "CallBackURL"
+    ),
+    "/mpesa/stkpushquery/v1/query": Route(StkPushQueryResponse),
+    "/mpesa/b2c/v3/paymentrequest": Route(B2CResponse, B2CResultCallback, "ResultURL"),
+    "/mpesa/b2b/v1/paymentrequest": Route(
+        BusinessPayBillResponse, BusinessPayBillResultCallback, "ResultURL"
+    ),
+    "/mpesa/b2b/v1/remittax": Route(
+        TaxRemittanceResponse, TaxRemittanceResultCallback, "ResultURL"
+    ),
+    "/v1/ussdpush/get-msisdn": Route(
+        B2BExpressCheckoutResponse, B2BExpressCheckoutCallback, "callbackUrl"
+    ),
+    "/mpesa/reversal/v1/request": Route(
+        ReversalResponse, ReversalResultCallback, "ResultURL"
+    ),
+    "/mpesa/accountbalance/v1/query": Route(
+        AccountBalanceResponse, AccountBalanceResultCallback, "ResultURL"
+    ),
+    "/mpesa/transactionstatus/v1/query": Route(
+        TransactionStatusResponse, TransactionStatusResultCallback, "ResultURL"
+    ),
+    "/mpesa/qrcode/v1/generate": Route(DynamicQRGenerateResponse),
+    "/standingorder/v1/createStandingOrderExternal": Route(
+        StandingOrderResponse, StandingOrderCallback, "CallBackURL"
+    ),
+    "/v1/billmanager-invoice/optin": Route(BillManagerOptInResponse),
+    "/v1/billmanager-invoice/change-optin-details": Route(
+        BillManagerUpdateOptInResponse
+    ),
+    "/v1/billmanager-invoice/single-invoicing": Route(
+        BillManagerSingleInvoiceResponse
+    ),
+    "/v1/billmanager-invoice/bulk-invoicing": Route(BillManagerBulkInvoiceResponse),
+    "/v1/billmanager-invoice/cancel-single-invoice": Route(
+        BillManagerCancelInvoiceResponse
+    ),
+    "/v1/billmanager-invoice/cancel-bulk-invoices": Route(
+        BillManagerCancelInvoiceResponse
+    ),
+}
+
+
+class Latency(BaseModel):
+    """Distribution of the time the mock server takes to answer, in seconds.
+
+    Attributes:
+        distribution (str): "constant", "uniform" (mean ± spread), "normal"
+            (standard deviation spread) or "exponential" (spread is ignored).
+        mean (float): Mean latency.
+        spread (float): Width of the distribution, see distribution.
+    """
+
+    distribution: Literal["constant", "uniform", "normal", "exponential"] = "constant"
+    mean: float = Field(default=0.0, ge=0)
+    spread: float = Field(default=0.0, ge=0)
+
+    model_config: ClassVar[ConfigDict] = {"frozen": True}
+
+    def sample(self, rng: random.Random) -> float:
+        """Returns a latency drawn from the distribution, never below zero."""
+        if self.distribution == "uniform":
+            value = rng.uniform(self.mean - self.spread, self.mean + self.spread)
+        elif self.distribution == "normal":
+            value = rng.gauss(self.mean, self.spread)
+        elif self.distribution == "exponential":
+            value = rng.expovariate(1 / self.mean) if self.mean else 0.0
+        else:
+            value = self.mean
+        return max(value, 0.0)
+
+
+class Faults(BaseModel):
+    """Failures the mock server injects into its answers.
+
+    Attributes:
+        error_rate (float): Share of requests answered with a server error.
+        error_status (int): HTTP status of injected server errors.
+        throttle_rate (float): Share of requests answered with HTTP 429 and a
+            spike-arrest error, as Daraja throttles clients.
+        retry_after (float): Retry-After of throttling responses, in seconds.
+        callback_failure_rate (float): Share of callbacks reporting a failed
+            transaction instead of a successful one.
+    """
+
+    error_rate: float = Field(default=0.0, ge=0, le=1)
+    error_status: int = 500
+    throttle_rate: float = Field(default=0.0, ge=0, le=1)
+    retry_after: float = Field(default=1.0, ge=0)
+    callback_failure_rate: float = Field(default=0.0, ge=0, le=1)
+
+    model_config: ClassVar[ConfigDict] = {"frozen": True}
+
+
+def _example(model: Type[BaseModel]) -> Dict[str, Any]:
+    extra = model.model_config.get("json_schema_extra")
+    example = extra.get("example") if isinstance(extra, dict) else None
+    if not isinstance(example, dict):
+        raise ValueError(f"{model.__name__} has no example to answer with.")
+    return copy.deepcopy(example)
+
+
+def _with_ids(value: Any, ids: Dict[str, str]) -> Any:
+    """Returns value with every identifier field in ids replaced by its new value."""
+    if isinstance(value, dict):
+        return {
+            k: ids[k] if k in ids else _with_ids(v, ids) for k, v in value.items()
+        }
+    if isinstance(value, list):
+        return [_with_ids(v, ids) for v in value]
+    return value
+
+
+def _with_failed_result(value: Any) -> Any:
+    """Returns a callback body with its result codes set to a failure."""
+    if isinstance(value, dict):
+        failed = {k: _with_failed_result(v) for k, v in value.items()}
+        for key in ("ResultCode", "resultCode"):
+            if key in failed:
+                failed[key] = 1032 if key == "ResultCode" else "1032"
+        for key in ("ResultDesc", "resultDesc"):
+            if key in failed:
+                failed[key] = "Request cancelled by user"
+        failed.pop("CallbackMetadata", None)
+        return failed
+    if isinstance(value, list):
+        return [_with_failed_result(v) for v in value]
+    return value
+
+
+class MockDarajaServer:
+    """Local HTTP server answering like the Daraja API. Use as a context manager."""
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency: Optional[Latency] = None,
+        faults: Optional[Faults] = None,
+        endpoint_latency: Optional[Dict[str, Latency]] = None,
+        endpoint_faults: Optional[Dict[str, Faults]] = None,
+        callback_delay: Optional[Latency] = None,
+    ):
+        """Initializes the server; it listens once started.
+
+        Args:
+            host (str): Address to listen on.
+            port (int): Port to listen on; 0 picks a free one, see url.
+            latency (Optional[Latency]): Time taken to answer. Defaults to none.
+            faults (Optional[Faults]): Failures to inject. Defaults to none.
+            endpoint_latency (Optional[Dict[str, Latency]]): Latency overriding the
+                default for the given paths.
+            endpoint_faults (Optional[Dict[str, Faults]]): Faults overriding the
+                default for the given paths.
+            callback_delay (Optional[Latency]): Time between answering a request
+                and posting its callback. Defaults to none.
+        """
+        self.latency = latency or Latency()
+        self.faults = faults or Faults()
+        self.endpoint_latency = dict(endpoint_latency or {})
+        self.endpoint_faults = dict(endpoint_faults or {})
+        self.callback_delay = callback_delay or Latency()
+        self._rng = random.SystemRandom()
+        self._rng_lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        self._stats: Dict[str, Any] = {
+            "requests": {},
+            "errors": 0,
+            "throttled": 0,
+            "callbacks": 0,
+            "callback_errors": 0,
+        }
+        self._tokens: Set[str] = set()
+        self._callbacks = ThreadPoolExecutor(thread_name_prefix="mock-daraja-callback")
+        self._httpd = ThreadingHTTPServer((host, port), _handler_for(self))
+        self._httpd.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        """Base URL of the server, for MpesaHttpClient(base_url=...)."""
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host!s}:{port}"
+
+    def __enter__(self) -> "MockDarajaServer":
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.stop()
+
+    def start(self) -> None:
+        """Starts serving in a background thread."""
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._httpd.serve_forever,
+                kwargs={"poll_interval": 0.05},
+                name="mock-daraja",
+                daemon=True,
+            )
+            self._thread.start()
+
+    def serve_forever(self) -> None:
+        """Serves in the calling thread until interrupted."""
+        try:
+            self._httpd.serve_forever()
+        finally:
+            self.stop()
+
+    def stop(self) -> None:
+        """Stops serving and waits for callbacks already scheduled to be sent."""
+        if self._thread is not None:
+            self._httpd.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._httpd.server_close()
+        self._callbacks.shutdown(wait=True)
+
+    def stats(self) -> Dict[str, Any]:
+        """Returns request counts by path and counts of injected faults and callbacks."""
+        with self._stats_lock:
+            stats = dict(self._stats)
+            stats["requests"] = dict(stats["requests"])
+        return stats
+
+    def _count(self, key: str, path: Optional[str] = None) -> None:
+        with self._stats_lock:
+            if path is None:
+                self._stats[key] += 1
+            else:
+                self._stats[key][path] = self._stats[key].get(path, 0) + 1
+
+    def _draw(self, latency: Optional[Latency] = None) -> float:
+        with self._rng_lock:
+            return latency.sample(self._rng) if latency else self._rng.random()
+
+    def handle(
+        self, method: str, path: str, headers: Dict[str, str], body: Any
+    ) -> "_Answer":
+        """Returns the answer to a request, after sleeping for its latency."""
+        self._count("requests", path)
+        time.sleep(self._draw(self.endpoint_latency.get(path, self.latency)))
+
+        if path == OAUTH_PATH:
+            return self._issue_token(method, headers)
+        route = ROUTES.get(path)
+        if route is None or method != "POST":
+            return _error(404, "404.001.01", f"Resource not found: {method} {path}")
+        if headers.get("authorization", "").removeprefix("Bearer ") not in self._tokens:
+            return _error(401, "404.001.03", "Invalid Access Token")
+        if not isinstance(body, dict):
+            return _error(400, "400.002.02", "Bad Request - Invalid JSON body")
+
+        faults = self.endpoint_faults.get(path, self.faults)
+        draw = self._draw()
+        if draw < faults.throttle_rate:
+            self._count("throttled")
+            answer = _error(429, "500.003.02", "Spike arrest violation")
+            answer.headers["Retry-After"] = f"{faults.retry_after:g}"
+            return answer
+        if draw < faults.throttle_rate + faults.error_rate:
+            self._count("errors")
+            return _error(faults.error_status, "500.001.1001", "Internal Server Error")
+
+        ids = {
+            field: str(body.get(field) or uuid.uuid4())
+            for field in ID_FIELDS
+        }
+        if route.callback is not None and route.callback_url_field in body:
+            callback = _with_ids(_example(route.callback), ids)
+            if self._draw() < faults.callback_failure_rate:
+                callback = _with_failed_result(callback)
+            self._callbacks.submit(
+                self._send_callback, str(body[route.callback_url_field]), callback
+            )
+        return _Answer(200, _with_ids(_example(route.response), ids))
+
+    def _issue_token(self, method: str, headers: Dict[str, str]) -> "_Answer":
+        scheme, _, credentials = headers.get("authorization", "").partition(" ")
+        try:
+            valid = method == "GET" and scheme == "Basic" and b":" in base64.b64decode(
+                credentials, validate=True
+            )
+        except ValueError:
+            valid = False
+        if not valid:
+            return _error(400, "400.008.01", "Invalid Authentication passed")
+        token = uuid.uuid4().hex
+        with self._stats_lock:
+            self._tokens.add(token)
+        return _Answer(200, {"access_token": token, "expires_in": "3599"})
+
+    def _send_callback(self, url: str, body: Dict[str, Any]) -> None:
+        time.sleep(self._draw(self.callback_delay))
+        try:
+            requests.post(url, json=body, timeout=10).close()
+            self._count("callbacks")
+        except requests.RequestException:
+            self._count("callback_errors")
+
+
+class _Answer:
+    """Status, body and extra headers of a response of the mock server."""
+
+    def __init__(self, status: int, body: Dict[str, Any]):
+        self.status = status
+        self.body = body
+        self.headers: Dict[str, str] = {}
+
+
+def _error(status: int, error_code: str, error_message: str) -> _Answer:
+    return _Answer(
+        status,
+        {
+            "requestId": str(uuid.uuid4()),
+            "errorCode": error_code,
+            "errorMessage": error_message,
+        },
+    )
+
+
+def _handler_for(server: MockDarajaServer) -> Type[BaseHTTPRequestHandler]:
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self) -> None:
+            self._answer("GET")
+
+        def do_POST(self) -> None:
+            self._answer("POST")
+
+        def do_HEAD(self) -> None:
+            self.send_response(200)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+
+        def log_message(self, format: str, *args: Any) -> None:
+            pass
+
+        def _answer(self, method: str) -> None:
+            length = int(self.headers.get("Content-Length") or 0)
+            raw = self.rfile.read(length) if length else b""
+            try:
+                body = json.loads(raw) if raw else None
+            except ValueError:
+                body = raw
+            path = self.path.split("?", 1)[0]
+            headers = {k.lower(): v for k, v in self.headers.items()}
+            answer = server.handle(method, path, headers, body)
+            content = json.dumps(answer.body).encode("utf-8")
+            self.send_response(answer.status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(content)))
+            for name, value in answer.headers.items():
+                self.send_header(name, value)
+            self.end_headers()
+            self.wfile.write(content)
+
+    return Handler
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Runs the mock server from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--latency", type=float, default=0.0, help="mean seconds")
+    parser.add_argument("--jitter", type=float, default=0.0, help="uniform ± seconds")
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--throttle-rate", type=float, default=0.0)
+    args = parser.parse_args(argv)
+    server = MockDarajaServer(
+        host=args.host,
+        port=args.port,
+        latency=Latency(distribution="uniform", mean=args.latency, spread=args.jitter),
+        faults=Faults(error_rate=args.error_rate, throttle_rate=args.throttle_rate),
+    )
+    print(f"Mock Daraja API listening on {server.url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -9,9 +9,10 @@ from .schemas import (
     TransactionStatusTimeoutCallback,
     TransactionStatusTimeoutCallbackResponse,
 )
-from .transaction_status import TransactionStatus
+from .transaction_status import AsyncTransactionStatus, TransactionStatus
 
 __all__ = [
+    "AsyncTransactionStatus",
     "TransactionStatus",
     "TransactionStatusIdentifierType",
     "TransactionStatusRequest",
@@ -1,4 +1,4 @@
-from .account_balance import AccountBalance as AccountBalance
+from .account_balance import AccountBalance as AccountBalance, AsyncAccountBalance as AsyncAccountBalance
 from .schemas import AccountBalanceIdentifierType as AccountBalanceIdentifierType, AccountBalanceRequest as AccountBalanceRequest, AccountBalanceResponse as AccountBalanceResponse, AccountBalanceResultCallback as AccountBalanceResultCallback, AccountBalanceResultCallbackResponse as AccountBalanceResultCallbackResponse, AccountBalanceTimeoutCallback as AccountBalanceTimeoutCallback, AccountBalanceTimeoutCallbackResponse as AccountBalanceTimeoutCallbackResponse
 
-__all__ = ['AccountBalance', 'AccountBalanceRequest', 'AccountBalanceResponse', 'AccountBalanceIdentifierType', 'AccountBalanceResultCallback', 'AccountBalanceResultCallbackResponse', 'AccountBalanceTimeoutCallback', 'AccountBalanceTimeoutCallbackResponse']
+__all__ = ['AsyncAccountBalance', 'AccountBalance', 'AccountBalanceRequest', 'AccountBalanceResponse', 'AccountBalanceIdentifierType', 'AccountBalanceResultCallback', 'AccountBalanceResultCallbackResponse', 'AccountBalanceTimeoutCallback', 'AccountBalanceTimeoutCallbackResponse']
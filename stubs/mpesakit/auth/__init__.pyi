@@ -1,4 +1,6 @@
 from .access_token import AccessToken as AccessToken
-from .token_manager import TokenManager as TokenManager
+from .token_manager import AsyncTokenManager as AsyncTokenManager, TokenManager as TokenManager
+from .token_registry import AsyncTenantTokenManager as AsyncTenantTokenManager, AsyncTokenRegistry as AsyncTokenRegistry, TenantTokenManager as TenantTokenManager, TokenRegistry as TokenRegistry
+from .token_store import InMemoryTokenStore as InMemoryTokenStore, SQLiteTokenStore as SQLiteTokenStore, TokenStore as TokenStore
 
-__all__ = ['AccessToken', 'TokenManager']
+__all__ = ['AccessToken', 'AsyncTenantTokenManager', 'AsyncTokenManager', 'AsyncTokenRegistry', 'InMemoryTokenStore', 'SQLiteTokenStore', 'TenantTokenManager', 'TokenManager', 'TokenRegistry', 'TokenStore']
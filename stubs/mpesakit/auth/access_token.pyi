@@ -1,10 +1,14 @@
 from datetime import datetime
 from pydantic import BaseModel, ConfigDict as ConfigDict
-from typing import ClassVar
+from typing import Any, ClassVar
 
 class AccessToken(BaseModel):
     token: str
     creation_datetime: datetime
     expiration_time: int
     model_config: ClassVar[ConfigDict]
-    def is_expired(self) -> bool: ...
+    def model_post_init(self, /, __context: Any) -> None: ...
+    def age(self) -> float: ...
+    def remaining(self) -> float: ...
+    def is_expired(self, skew_seconds: float = 0.0) -> bool: ...
+    def refresh_delay(self, refresh_ratio: float) -> float: ...
@@ -1,12 +1,41 @@
+from .token_store import InMemoryTokenStore as InMemoryTokenStore, TokenStore as TokenStore
+from _typeshed import Incomplete
 from mpesakit.auth import AccessToken as AccessToken
 from mpesakit.errors import MpesaApiException as MpesaApiException, MpesaError as MpesaError
-from mpesakit.http_client import HttpClient as HttpClient
+from mpesakit.http_client import AsyncHttpClient as AsyncHttpClient, HttpClient as HttpClient
+from mpesakit.http_client.fork import register_after_fork as register_after_fork
+from mpesakit.http_client.loop_clients import LoopLocal as LoopLocal
+from mpesakit.http_client.timeouts import check_deadline as check_deadline, deadline_exceeded as deadline_exceeded, remaining_time as remaining_time
 from pydantic import BaseModel, ConfigDict as ConfigDict
-from typing import ClassVar
+from typing import Any, ClassVar
+
+OAUTH_URL: str
+OAUTH_PARAMS: Incomplete
 
 class TokenManager(BaseModel):
     consumer_key: str
     consumer_secret: str
     http_client: HttpClient
+    refresh_ratio: float
+    expiry_skew: float
+    token_store: TokenStore
+    model_config: ClassVar[ConfigDict]
+    def model_post_init(self, /, __context: Any) -> None: ...
+    def has_issued(self, token: str) -> bool: ...
+    def get_token(self, force_refresh: bool = False, stale_token: str | None = None) -> str: ...
+    def start_background_refresh(self) -> None: ...
+    def stop_background_refresh(self, timeout: float | None = None) -> None: ...
+
+class AsyncTokenManager(BaseModel):
+    consumer_key: str
+    consumer_secret: str
+    http_client: AsyncHttpClient
+    refresh_ratio: float
+    expiry_skew: float
+    token_store: TokenStore
     model_config: ClassVar[ConfigDict]
-    def get_token(self, force_refresh: bool = False) -> str: ...
+    def model_post_init(self, /, __context: Any) -> None: ...
+    def has_issued(self, token: str) -> bool: ...
+    async def get_token(self, force_refresh: bool = False, stale_token: str | None = None) -> str: ...
+    def start_background_refresh(self) -> None: ...
+    async def stop_background_refresh(self) -> None: ...
@@ -0,0 +1,57 @@
+import abc
+from .token_manager import AsyncTokenManager as AsyncTokenManager, TokenManager as TokenManager
+from .token_store import InMemoryTokenStore as InMemoryTokenStore, TokenStore as TokenStore
+from _typeshed import Incomplete
+from abc import ABC
+from contextlib import contextmanager
+from mpesakit.errors import MpesaApiException as MpesaApiException, MpesaError as MpesaError
+from mpesakit.http_client import AsyncHttpClient as AsyncHttpClient, HttpClient as HttpClient
+from mpesakit.http_client.fork import register_after_fork as register_after_fork
+from typing import Callable, Generic, Iterator, TypeVar
+
+_Manager = TypeVar("_Manager", TokenManager, AsyncTokenManager)
+
+class _Entry(Generic[_Manager]):
+    manager: _Manager
+    last_used: float
+    def __init__(self, manager: _Manager, last_used: float) -> None: ...
+
+class _BaseTokenRegistry(ABC, Generic[_Manager], metaclass=abc.ABCMeta):
+    http_client: Incomplete
+    max_tenants: Incomplete
+    idle_ttl: Incomplete
+    token_store: Incomplete
+    secret_resolver: Incomplete
+    token_manager: _Manager
+    def __init__(self, http_client: HttpClient | AsyncHttpClient, max_tenants: int = 1024, idle_ttl: float | None = 3600.0, token_store: TokenStore | None = None, secret_resolver: Callable[[str], str | None] | None = None) -> None: ...
+    def register(self, consumer_key: str, consumer_secret: str) -> None: ...
+    def unregister(self, consumer_key: str) -> None: ...
+    @contextmanager
+    def tenant(self, consumer_key: str) -> Iterator[None]: ...
+    def current_tenant(self) -> str: ...
+    def get(self, consumer_key: str | None = None) -> _Manager: ...
+    def __len__(self) -> int: ...
+
+class TokenRegistry(_BaseTokenRegistry[TokenManager]):
+    http_client: HttpClient
+    token_manager: TenantTokenManager
+    def get_token(self, force_refresh: bool = False) -> str: ...
+
+class AsyncTokenRegistry(_BaseTokenRegistry[AsyncTokenManager]):
+    http_client: AsyncHttpClient
+    token_manager: AsyncTenantTokenManager
+    async def get_token(self, force_refresh: bool = False) -> str: ...
+
+class TenantTokenManager(TokenManager):
+    consumer_key: str
+    consumer_secret: str
+    def get_token(self, force_refresh: bool = False, stale_token: str | None = None) -> str: ...
+    def start_background_refresh(self) -> None: ...
+    def stop_background_refresh(self, timeout: float | None = None) -> None: ...
+
+class AsyncTenantTokenManager(AsyncTokenManager):
+    consumer_key: str
+    consumer_secret: str
+    async def get_token(self, force_refresh: bool = False, stale_token: str | None = None) -> str: ...
+    def start_background_refresh(self) -> None: ...
+    async def stop_background_refresh(self) -> None: ...
@@ -0,0 +1,47 @@
+import abc
+from .access_token import AccessToken as AccessToken
+from _typeshed import Incomplete
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from mpesakit.errors import MpesaApiException as MpesaApiException, MpesaError as MpesaError
+from mpesakit.http_client.fork import register_after_fork as register_after_fork
+from typing import Iterator
+
+class TokenStore(ABC, metaclass=abc.ABCMeta):
+    @abstractmethod
+    def load(self, key: str) -> AccessToken | None: ...
+    @abstractmethod
+    def save(self, key: str, token: AccessToken) -> None: ...
+    def delete(self, key: str) -> None: ...
+    @abstractmethod
+    def acquire(self, key: str, timeout: float | None = None) -> str: ...
+    @abstractmethod
+    def release(self, key: str, handle: str) -> None: ...
+    @contextmanager
+    def lock(self, key: str, timeout: float | None = None) -> Iterator[None]: ...
+
+class _KeyLock:
+    lock: Incomplete
+    users: int
+    def __init__(self) -> None: ...
+
+class InMemoryTokenStore(TokenStore):
+    max_tokens: Incomplete
+    def __init__(self, max_tokens: int | None = None) -> None: ...
+    def load(self, key: str) -> AccessToken | None: ...
+    def save(self, key: str, token: AccessToken) -> None: ...
+    def delete(self, key: str) -> None: ...
+    def acquire(self, key: str, timeout: float | None = None) -> str: ...
+    def release(self, key: str, handle: str) -> None: ...
+
+class SQLiteTokenStore(TokenStore):
+    path: Incomplete
+    lock_timeout: Incomplete
+    lock_lease: Incomplete
+    poll_interval: Incomplete
+    def __init__(self, path: str, lock_timeout: float = 30.0, lock_lease: float = 30.0, poll_interval: float = 0.05) -> None: ...
+    def load(self, key: str) -> AccessToken | None: ...
+    def save(self, key: str, token: AccessToken) -> None: ...
+    def delete(self, key: str) -> None: ...
+    def acquire(self, key: str, timeout: float | None = None) -> str: ...
+    def release(self, key: str, handle: str) -> None: ...
@@ -1,4 +1,4 @@
-from .b2b_express_checkout import B2BExpressCheckout as B2BExpressCheckout
+from .b2b_express_checkout import AsyncB2BExpressCheckout as AsyncB2BExpressCheckout, B2BExpressCheckout as B2BExpressCheckout
 from .schemas import B2BExpressCallbackResponse as B2BExpressCallbackResponse, B2BExpressCheckoutCallback as B2BExpressCheckoutCallback, B2BExpressCheckoutRequest as B2BExpressCheckoutRequest, B2BExpressCheckoutResponse as B2BExpressCheckoutResponse
 
-__all__ = ['B2BExpressCheckout', 'B2BExpressCheckoutRequest', 'B2BExpressCheckoutResponse', 'B2BExpressCheckoutCallback', 'B2BExpressCallbackResponse']
+__all__ = ['AsyncB2BExpressCheckout', 'B2BExpressCheckout', 'B2BExpressCheckoutRequest', 'B2BExpressCheckoutResponse', 'B2BExpressCheckoutCallback', 'B2BExpressCallbackResponse']
@@ -1,7 +1,7 @@
 from .schemas import B2BExpressCheckoutRequest as B2BExpressCheckoutRequest, B2BExpressCheckoutResponse as B2BExpressCheckoutResponse
 from _typeshed import Incomplete
-from mpesakit.auth import TokenManager as TokenManager
-from mpesakit.http_client import HttpClient as HttpClient
+from mpesakit.auth import AsyncTokenManager as AsyncTokenManager, TokenManager as TokenManager
+from mpesakit.http_client import AsyncHttpClient as AsyncHttpClient, HttpClient as HttpClient
 from pydantic import BaseModel
 
 class B2BExpressCheckout(BaseModel):
@@ -9,3 +9,9 @@ class B2BExpressCheckout(BaseModel):
     token_manager: TokenManager
     model_config: Incomplete
     def ussd_push(self, request: B2BExpressCheckoutRequest) -> B2BExpressCheckoutResponse: ...
+
+class AsyncB2BExpressCheckout(BaseModel):
+    http_client: AsyncHttpClient
+    token_manager: AsyncTokenManager
+    model_config: Incomplete
+    async def ussd_push(self, request: B2BExpressCheckoutRequest) -> B2BExpressCheckoutResponse: ...
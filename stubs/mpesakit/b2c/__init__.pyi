@@ -1,4 +1,4 @@
-from .b2c import B2C as B2C
+from .b2c import AsyncB2C as AsyncB2C, B2C as B2C
 from .schemas import B2CCommandIDType as B2CCommandIDType, B2CRequest as B2CRequest, B2CResponse as B2CResponse, B2CResultCallback as B2CResultCallback, B2CResultMetadata as B2CResultMetadata, B2CResultParameter as B2CResultParameter, B2CTimeoutCallback as B2CTimeoutCallback, B2CTimeoutCallbackResponse as B2CTimeoutCallbackResponse
 
-__all__ = ['B2C', 'B2CCommandIDType', 'B2CRequest', 'B2CResponse', 'B2CResultParameter', 'B2CResultMetadata', 'B2CResultCallback', 'B2CTimeoutCallbackResponse', 'B2CTimeoutCallback']
+__all__ = ['AsyncB2C', 'B2C', 'B2CCommandIDType', 'B2CRequest', 'B2CResponse', 'B2CResultParameter', 'B2CResultMetadata', 'B2CResultCallback', 'B2CTimeoutCallbackResponse', 'B2CTimeoutCallback']
@@ -1,7 +1,7 @@
 from .schemas import B2CRequest as B2CRequest, B2CResponse as B2CResponse
 from _typeshed import Incomplete
-from mpesakit.auth import TokenManager as TokenManager
-from mpesakit.http_client import HttpClient as HttpClient
+from mpesakit.auth import AsyncTokenManager as AsyncTokenManager, TokenManager as TokenManager
+from mpesakit.http_client import AsyncHttpClient as AsyncHttpClient, HttpClient as HttpClient
 from pydantic import BaseModel
 
 class B2C(BaseModel):
@@ -9,3 +9,9 @@ class B2C(BaseModel):
     token_manager: TokenManager
     model_config: Incomplete
     def send_payment(self, request: B2CRequest) -> B2CResponse: ...
+
+class AsyncB2C(BaseModel):
+    http_client: AsyncHttpClient
+    token_manager: AsyncTokenManager
+    model_config: Incomplete
+    async def send_payment(self, request: B2CRequest) -> B2CResponse: ...
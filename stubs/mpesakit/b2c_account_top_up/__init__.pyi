@@ -1,4 +1,4 @@
-from .b2c_account_top_up import B2CAccountTopUp as B2CAccountTopUp
+from .b2c_account_top_up import AsyncB2CAccountTopUp as AsyncB2CAccountTopUp, B2CAccountTopUp as B2CAccountTopUp
 from .schemas import B2CAccountTopUpCallback as B2CAccountTopUpCallback, B2CAccountTopUpCallbackResponse as B2CAccountTopUpCallbackResponse, B2CAccountTopUpRequest as B2CAccountTopUpRequest, B2CAccountTopUpResponse as B2CAccountTopUpResponse, B2CAccountTopUpTimeoutCallback as B2CAccountTopUpTimeoutCallback, B2CAccountTopUpTimeoutCallbackResponse as B2CAccountTopUpTimeoutCallbackResponse
 
-__all__ = ['B2CAccountTopUp', 'B2CAccountTopUpRequest', 'B2CAccountTopUpResponse', 'B2CAccountTopUpCallback', 'B2CAccountTopUpCallbackResponse', 'B2CAccountTopUpTimeoutCallback', 'B2CAccountTopUpTimeoutCallbackResponse']
+__all__ = ['AsyncB2CAccountTopUp', 'B2CAccountTopUp', 'B2CAccountTopUpRequest', 'B2CAccountTopUpResponse', 'B2CAccountTopUpCallback', 'B2CAccountTopUpCallbackResponse', 'B2CAccountTopUpTimeoutCallback', 'B2CAccountTopUpTimeoutCallbackResponse']
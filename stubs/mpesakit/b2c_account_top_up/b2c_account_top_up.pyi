@@ -1,7 +1,7 @@
 from .schemas import B2CAccountTopUpRequest as B2CAccountTopUpRequest, B2CAccountTopUpResponse as B2CAccountTopUpResponse
 from _typeshed import Incomplete
-from mpesakit.auth import TokenManager as TokenManager
-from mpesakit.http_client import HttpClient as HttpClient
+from mpesakit.auth import AsyncTokenManager as AsyncTokenManager, TokenManager as TokenManager
+from mpesakit.http_client import AsyncHttpClient as AsyncHttpClient, HttpClient as HttpClient
 from pydantic import BaseModel
 
 class B2CAccountTopUp(BaseModel):
@@ -9,3 +9,9 @@ class B2CAccountTopUp(BaseModel):
     token_manager: TokenManager
     model_config: Incomplete
     def topup(self, request: B2CAccountTopUpRequest) -> B2CAccountTopUpResponse: ...
+
+class AsyncB2CAccountTopUp(BaseModel):
+    http_client: AsyncHttpClient
+    token_manager: AsyncTokenManager
+    model_config: Incomplete
+    async def topup(self, request: B2CAccountTopUpRequest) -> B2CAccountTopUpResponse: ...
@@ -1,4 +1,4 @@
-from .bill_manager import BillManager as BillManager
+from .bill_manager import AsyncBillManager as AsyncBillManager, BillManager as BillManager
 from .schemas import BillManagerBulkInvoiceRequest as BillManagerBulkInvoiceRequest, BillManagerBulkInvoiceResponse as BillManagerBulkInvoiceResponse, BillManagerCancelBulkInvoiceRequest as BillManagerCancelBulkInvoiceRequest, BillManagerCancelInvoiceResponse as BillManagerCancelInvoiceResponse, BillManagerCancelSingleInvoiceRequest as BillManagerCancelSingleInvoiceRequest, BillManagerOptInRequest as BillManagerOptInRequest, BillManagerOptInResponse as BillManagerOptInResponse, BillManagerPaymentAcknowledgmentRequest as BillManagerPaymentAcknowledgmentRequest, BillManagerPaymentAcknowledgmentResponse as BillManagerPaymentAcknowledgmentResponse, BillManagerPaymentNotificationRequest as BillManagerPaymentNotificationRequest, BillManagerPaymentNotificationResponse as BillManagerPaymentNotificationResponse, BillManagerSingleInvoiceRequest as BillManagerSingleInvoiceRequest, BillManagerSingleInvoiceResponse as BillManagerSingleInvoiceResponse, BillManagerUpdateOptInRequest as BillManagerUpdateOptInRequest, BillManagerUpdateOptInResponse as BillManagerUpdateOptInResponse, InvoiceItem as InvoiceItem
 
-__all__ = ['BillManagerOptInRequest', 'BillManagerOptInResponse', 'BillManagerUpdateOptInRequest', 'BillManagerUpdateOptInResponse', 'BillManagerSingleInvoiceRequest', 'BillManagerSingleInvoiceResponse', 'BillManagerBulkInvoiceRequest', 'BillManagerBulkInvoiceResponse', 'BillManagerCancelSingleInvoiceRequest', 'BillManagerCancelBulkInvoiceRequest', 'BillManagerCancelInvoiceResponse', 'BillManagerPaymentNotificationRequest', 'BillManagerPaymentNotificationResponse', 'BillManagerPaymentAcknowledgmentRequest', 'BillManagerPaymentAcknowledgmentResponse', 'BillManager', 'InvoiceItem']
+__all__ = ['AsyncBillManager', 'BillManagerOptInRequest', 'BillManagerOptInResponse', 'BillManagerUpdateOptInRequest', 'BillManagerUpdateOptInResponse', 'BillManagerSingleInvoiceRequest', 'BillManagerSingleInvoiceResponse', 'BillManagerBulkInvoiceRequest', 'BillManagerBulkInvoiceResponse', 'BillManagerCancelSingleInvoiceRequest', 'BillManagerCancelBulkInvoiceRequest', 'BillManagerCancelInvoiceResponse', 'BillManagerPaymentNotificationRequest', 'BillManagerPaymentNotificationResponse', 'BillManagerPaymentAcknowledgmentRequest', 'BillManagerPaymentAcknowledgmentResponse', 'BillManager', 'InvoiceItem']
@@ -1,7 +1,7 @@
 from .schemas import BillManagerBulkInvoiceRequest as BillManagerBulkInvoiceRequest, BillManagerBulkInvoiceResponse as BillManagerBulkInvoiceResponse, BillManagerCancelBulkInvoiceRequest as BillManagerCancelBulkInvoiceRequest, BillManagerCancelInvoiceResponse as BillManagerCancelInvoiceResponse, BillManagerCancelSingleInvoiceRequest as BillManagerCancelSingleInvoiceRequest, BillManagerOptInRequest as BillManagerOptInRequest, BillManagerOptInResponse as BillManagerOptInResponse, BillManagerSingleInvoiceRequest as BillManagerSingleInvoiceRequest, BillManagerSingleInvoiceResponse as BillManagerSingleInvoiceResponse, BillManagerUpdateOptInRequest as BillManagerUpdateOptInRequest, BillManagerUpdateOptInResponse as BillManagerUpdateOptInResponse
 from _typeshed import Incomplete
-from mpesakit.auth import TokenManager as TokenManager
-from mpesakit.http_client import HttpClient as HttpClient
+from mpesakit.auth import AsyncTokenManager as AsyncTokenManager, TokenManager as TokenManager
+from mpesakit.http_client import AsyncHttpClient as AsyncHttpClient, HttpClient as HttpClient, MpesaAsyncHttpClient as MpesaAsyncHttpClient, MpesaHttpClient as MpesaHttpClient
 from pydantic import BaseModel
 
 class BillManager(BaseModel):
@@ -15,3 +15,15 @@ class BillManager(BaseModel):
     def send_bulk_invoice(self, request: BillManagerBulkInvoiceRequest) -> BillManagerBulkInvoiceResponse: ...
     def cancel_single_invoice(self, request: BillManagerCancelSingleInvoiceRequest) -> BillManagerCancelInvoiceResponse: ...
     def cancel_bulk_invoice(self, request: BillManagerCancelBulkInvoiceRequest) -> BillManagerCancelInvoiceResponse: ...
+
+class AsyncBillManager(BaseModel):
+    http_client: AsyncHttpClient
+    token_manager: AsyncTokenManager
+    app_key: str | None
+    model_config: Incomplete
+    async def opt_in(self, request: BillManagerOptInRequest) -> BillManagerOptInResponse: ...
+    async def update_opt_in(self, request: BillManagerUpdateOptInRequest) -> BillManagerUpdateOptInResponse: ...
+    async def send_single_invoice(self, request: BillManagerSingleInvoiceRequest) -> BillManagerSingleInvoiceResponse: ...
+    async def send_bulk_invoice(self, request: BillManagerBulkInvoiceRequest) -> BillManagerBulkInvoiceResponse: ...
+    async def cancel_single_invoice(self, request: BillManagerCancelSingleInvoiceRequest) -> BillManagerCancelInvoiceResponse: ...
+    async def cancel_bulk_invoice(self, request: BillManagerCancelBulkInvoiceRequest) -> BillManagerCancelInvoiceResponse: ...
@@ -1,4 +1,4 @@
-from .business_buy_goods import BusinessBuyGoods as BusinessBuyGoods
+from .business_buy_goods import AsyncBusinessBuyGoods as AsyncBusinessBuyGoods, BusinessBuyGoods as BusinessBuyGoods
 from .schemas import BusinessBuyGoodsRequest as BusinessBuyGoodsRequest, BusinessBuyGoodsResponse as BusinessBuyGoodsResponse, BusinessBuyGoodsResultCallback as BusinessBuyGoodsResultCallback, BusinessBuyGoodsResultCallbackResponse as BusinessBuyGoodsResultCallbackResponse, BusinessBuyGoodsTimeoutCallback as BusinessBuyGoodsTimeoutCallback, BusinessBuyGoodsTimeoutCallbackResponse as BusinessBuyGoodsTimeoutCallbackResponse
 
-__all__ = ['BusinessBuyGoods', 'BusinessBuyGoodsRequest', 'BusinessBuyGoodsResponse', 'BusinessBuyGoodsResultCallback', 'BusinessBuyGoodsResultCallbackResponse', 'BusinessBuyGoodsTimeoutCallback', 'BusinessBuyGoodsTimeoutCallbackResponse']
+__all__ = ['AsyncBusinessBuyGoods', 'BusinessBuyGoods', 'BusinessBuyGoodsRequest', 'BusinessBuyGoodsResponse', 'BusinessBuyGoodsResultCallback', 'BusinessBuyGoodsResultCallbackResponse', 'BusinessBuyGoodsTimeoutCallback', 'BusinessBuyGoodsTimeoutCallbackResponse']
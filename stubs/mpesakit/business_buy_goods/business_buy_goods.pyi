@@ -1,7 +1,7 @@
 from .schemas import BusinessBuyGoodsRequest as BusinessBuyGoodsRequest, BusinessBuyGoodsResponse as BusinessBuyGoodsResponse
 from _typeshed import Incomplete
-from mpesakit.auth import TokenManager as TokenManager
-from mpesakit.http_client import HttpClient as HttpClient
+from mpesakit.auth import AsyncTokenManager as AsyncTokenManager, TokenManager as TokenManager
+from mpesakit.http_client import AsyncHttpClient as AsyncHttpClient, HttpClient as HttpClient
 from pydantic import BaseModel
 
 class BusinessBuyGoods(BaseModel):
@@ -9,3 +9,9 @@ class BusinessBuyGoods(BaseModel):
     token_manager: TokenManager
     model_config: Incomplete
     def buy_goods(self, request: BusinessBuyGoodsRequest) -> BusinessBuyGoodsResponse: ...
+
+class AsyncBusinessBuyGoods(BaseModel):
+    http_client: AsyncHttpClient
+    token_manager: AsyncTokenManager
+    model_config: Incomplete
+    async def buy_goods(self, request: BusinessBuyGoodsRequest) -> BusinessBuyGoodsResponse: ...
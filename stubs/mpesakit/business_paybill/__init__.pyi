@@ -1,4 +1,4 @@
-from .business_paybill import BusinessPayBill as BusinessPayBill
+from .business_paybill import AsyncBusinessPayBill as AsyncBusinessPayBill, BusinessPayBill as BusinessPayBill
 from .schemas import BusinessPayBillRequest as BusinessPayBillRequest, BusinessPayBillResponse as BusinessPayBillResponse, BusinessPayBillResultCallback as BusinessPayBillResultCallback, BusinessPayBillResultCallbackResponse as BusinessPayBillResultCallbackResponse, BusinessPayBillTimeoutCallback as BusinessPayBillTimeoutCallback, BusinessPayBillTimeoutCallbackResponse as BusinessPayBillTimeoutCallbackResponse
 
-__all__ = ['BusinessPayBill', 'BusinessPayBillRequest', 'BusinessPayBillResponse', 'BusinessPayBillResultCallback', 'BusinessPayBillResultCallbackResponse', 'BusinessPayBillTimeoutCallback', 'BusinessPayBillTimeoutCallbackResponse']
+__all__ = ['AsyncBusinessPayBill', 'BusinessPayBill', 'BusinessPayBillRequest', 'BusinessPayBillResponse', 'BusinessPayBillResultCallback', 'BusinessPayBillResultCallbackResponse', 'BusinessPayBillTimeoutCallback', 'BusinessPayBillTimeoutCallbackResponse']
@@ -1,4 +1,4 @@
-from .c2b import C2B as C2B
+from .c2b import AsyncC2B as AsyncC2B, C2B as C2B
 from .schemas import C2BConfirmationResponse as C2BConfirmationResponse, C2BRegisterUrlRequest as C2BRegisterUrlRequest, C2BRegisterUrlResponse as C2BRegisterUrlResponse, C2BResponseType as C2BResponseType, C2BValidationRequest as C2BValidationRequest, C2BValidationResponse as C2BValidationResponse, C2BValidationResultCodeType as C2BValidationResultCodeType
 
-__all__ = ['C2BResponseType', 'C2BRegisterUrlRequest', 'C2BRegisterUrlResponse', 'C2BValidationRequest', 'C2BValidationResponse', 'C2BConfirmationResponse', 'C2BValidationResultCodeType', 'C2B']
+__all__ = ['AsyncC2B', 'C2BResponseType', 'C2BRegisterUrlRequest', 'C2BRegisterUrlResponse', 'C2BValidationRequest', 'C2BValidationResponse', 'C2BConfirmationResponse', 'C2BValidationResultCodeType', 'C2B']
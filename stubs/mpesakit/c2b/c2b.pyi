@@ -1,7 +1,7 @@
 from .schemas import C2BRegisterUrlRequest as C2BRegisterUrlRequest, C2BRegisterUrlResponse as C2BRegisterUrlResponse
 from _typeshed import Incomplete
-from mpesakit.auth import TokenManager as TokenManager
-from mpesakit.http_client import HttpClient as HttpClient
+from mpesakit.auth import AsyncTokenManager as AsyncTokenManager, TokenManager as TokenManager
+from mpesakit.http_client import AsyncHttpClient as AsyncHttpClient, HttpClient as HttpClient
 from pydantic import BaseModel
 
 class C2B(BaseModel):
@@ -9,3 +9,9 @@ class C2B(BaseModel):
     token_manager: TokenManager
     model_config: Incomplete
     def register_url(self, request: C2BRegisterUrlRequest) -> C2BRegisterUrlResponse: ...
+
+class AsyncC2B(BaseModel):
+    http_client: AsyncHttpClient
+    token_manager: AsyncTokenManager
+    model_config: Incomplete
+    async def register_url(self, request: C2BRegisterUrlRequest) -> C2BRegisterUrlResponse: ...
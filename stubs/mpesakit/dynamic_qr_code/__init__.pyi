@@ -1,4 +1,4 @@
-from .dynamic_qr_code import DynamicQRCode as DynamicQRCode
+from .dynamic_qr_code import AsyncDynamicQRCode as AsyncDynamicQRCode, DynamicQRCode as DynamicQRCode
 from .schemas import DynamicQRGenerateRequest as DynamicQRGenerateRequest, DynamicQRGenerateResponse as DynamicQRGenerateResponse, DynamicQRTransactionType as DynamicQRTransactionType
 
-__all__ = ['DynamicQRCode', 'DynamicQRGenerateRequest', 'DynamicQRGenerateResponse', 'DynamicQRTransactionType']
+__all__ = ['AsyncDynamicQRCode', 'DynamicQRCode', 'DynamicQRGenerateRequest', 'DynamicQRGenerateResponse', 'DynamicQRTransactionType']
@@ -1,7 +1,7 @@
 from .schemas import DynamicQRGenerateRequest as DynamicQRGenerateRequest, DynamicQRGenerateResponse as DynamicQRGenerateResponse
 from _typeshed import Incomplete
-from mpesakit.auth import TokenManager as TokenManager
-from mpesakit.http_client import HttpClient as HttpClient
+from mpesakit.auth import AsyncTokenManager as AsyncTokenManager, TokenManager as TokenManager
+from mpesakit.http_client import AsyncHttpClient as AsyncHttpClient, HttpClient as HttpClient
 from pydantic import BaseModel
 
 class DynamicQRCode(BaseModel):
@@ -9,3 +9,9 @@ class DynamicQRCode(BaseModel):
     token_manager: TokenManager
     model_config: Incomplete
     def generate(self, request: DynamicQRGenerateRequest) -> DynamicQRGenerateResponse: ...
+
+class AsyncDynamicQRCode(BaseModel):
+    http_client: AsyncHttpClient
+    token_manager: AsyncTokenManager
+    model_config: Incomplete
+    async def generate(self, request: DynamicQRGenerateRequest) -> DynamicQRGenerateResponse: ...
@@ -1,5 +1,19 @@
+from .cassette import AsyncCassetteHttpClient as AsyncCassetteHttpClient, Cassette as Cassette, CassetteHttpClient as CassetteHttpClient
+from .circuit_breaker import CircuitBreaker as CircuitBreaker, CircuitBreakerPolicy as CircuitBreakerPolicy, CircuitBreakerStats as CircuitBreakerStats, CircuitBreakers as CircuitBreakers, CircuitState as CircuitState
+from .codec import JsonCodec as JsonCodec, MsgspecCodec as MsgspecCodec, OrjsonCodec as OrjsonCodec, StdlibJsonCodec as StdlibJsonCodec, default_codec as default_codec
+from .concurrency import AIMDPolicy as AIMDPolicy, AsyncConcurrencyLimiter as AsyncConcurrencyLimiter, ConcurrencyLimiter as ConcurrencyLimiter, ConcurrencyStats as ConcurrencyStats
+from .cooldown import CooldownPolicy as CooldownPolicy, Cooldowns as Cooldowns
+from .hedging import AsyncHedger as AsyncHedger, HedgePolicy as HedgePolicy, HedgeStats as HedgeStats, Hedger as Hedger
 from .http_client import AsyncHttpClient as AsyncHttpClient, HttpClient as HttpClient
+from .loop_clients import LoopClientRegistry as LoopClientRegistry, LoopLocal as LoopLocal
+from .middleware import AsyncMiddleware as AsyncMiddleware, Middleware as Middleware, Request as Request
 from .mpesa_async_http_client import MpesaAsyncHttpClient as MpesaAsyncHttpClient
 from .mpesa_http_client import MpesaHttpClient as MpesaHttpClient
+from .rate_limiter import AsyncRateLimiter as AsyncRateLimiter, RateLimit as RateLimit, RateLimiter as RateLimiter, TokenBucket as TokenBucket
+from .response_limits import ResponseLimits as ResponseLimits
+from .retry import RetryPolicy as RetryPolicy, idempotency_key as idempotency_key
+from .single_flight import AsyncSingleFlight as AsyncSingleFlight, SingleFlight as SingleFlight
+from .timeouts import Timeouts as Timeouts, current_deadline as current_deadline, remaining_time as remaining_time, request_deadline as request_deadline
+from .transport_metrics import TransportMetrics as TransportMetrics
 
-__all__ = ['HttpClient', 'MpesaHttpClient', 'AsyncHttpClient', 'MpesaAsyncHttpClient']
+__all__ = ['HttpClient', 'MpesaHttpClient', 'AsyncHttpClient', 'MpesaAsyncHttpClient', 'AsyncCassetteHttpClient', 'Cassette', 'CassetteHttpClient', 'CircuitBreaker', 'CircuitBreakerPolicy', 'CircuitBreakers', 'CircuitBreakerStats', 'CircuitState', 'JsonCodec', 'MsgspecCodec', 'OrjsonCodec', 'StdlibJsonCodec', 'default_codec', 'CooldownPolicy', 'Cooldowns', 'AIMDPolicy', 'AsyncConcurrencyLimiter', 'ConcurrencyLimiter', 'ConcurrencyStats', 'AsyncHedger', 'Hedger', 'HedgePolicy', 'HedgeStats', 'LoopClientRegistry', 'LoopLocal', 'AsyncMiddleware', 'Middleware', 'Request', 'AsyncRateLimiter', 'RateLimit', 'RateLimiter', 'TokenBucket', 'ResponseLimits', 'RetryPolicy', 'idempotency_key', 'AsyncSingleFlight', 'SingleFlight', 'Timeouts', 'current_deadline', 'remaining_time', 'request_deadline', 'TransportMetrics']
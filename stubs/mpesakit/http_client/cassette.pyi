@@ -0,0 +1,59 @@
+import types
+from .http_client import AsyncHttpClient as AsyncHttpClient, HttpClient as HttpClient
+from _typeshed import Incomplete
+from mpesakit.errors import MpesaApiException as MpesaApiException, MpesaError as MpesaError
+from pathlib import Path
+from pydantic import BaseModel
+from typing import Any
+
+VOLATILE_FIELDS: frozenset[str]
+SECRET_RESPONSE_FIELDS: frozenset[str]
+REDACTED: str
+
+class Interaction(BaseModel):
+    method: str
+    url: str
+    payload: Any | None
+    response: dict[str, Any] | None
+    error: MpesaError | None
+    latency: float
+
+class Cassette:
+    path: Incomplete
+    ignore_fields: Incomplete
+    secret_fields: Incomplete
+    def __init__(self, path: str | Path, ignore_fields: frozenset[str] = ..., secret_fields: frozenset[str] = ...) -> None: ...
+    def __len__(self) -> int: ...
+    def normalize(self, payload: Any | None) -> Any | None: ...
+    def record(self, method: str, url: str, payload: Any | None, latency: float, response: dict[str, Any] | None = None, error: MpesaError | None = None) -> None: ...
+    def play(self, method: str, url: str, payload: Any | None) -> Interaction: ...
+
+class CassetteHttpClient(HttpClient):
+    cassette: Incomplete
+    http_client: Incomplete
+    speed: Incomplete
+    def __init__(self, cassette: Cassette | str | Path, http_client: HttpClient | None = None, speed: float | None = 1.0) -> None: ...
+    @property
+    def recording(self) -> bool: ...
+    def __enter__(self) -> CassetteHttpClient: ...
+    def __exit__(self, exc_type: type[BaseException] | None, exc_val: BaseException | None, exc_tb: types.TracebackType | None) -> None: ...
+    def close(self) -> None: ...
+    def register_token_source(self, source: Any) -> None: ...
+    def warm_up(self, connections: int = 1) -> None: ...
+    def post(self, url: str, json: dict[str, Any], headers: dict[str, str]) -> dict[str, Any]: ...
+    def get(self, url: str, params: dict[str, Any] | None = None, headers: dict[str, str] | None = None) -> dict[str, Any]: ...
+
+class AsyncCassetteHttpClient(AsyncHttpClient):
+    cassette: Incomplete
+    http_client: Incomplete
+    speed: Incomplete
+    def __init__(self, cassette: Cassette | str | Path, http_client: AsyncHttpClient | None = None, speed: float | None = 1.0) -> None: ...
+    @property
+    def recording(self) -> bool: ...
+    async def __aenter__(self) -> AsyncCassetteHttpClient: ...
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None: ...
+    async def aclose(self) -> None: ...
+    def register_token_source(self, source: Any) -> None: ...
+    async def warm_up(self, connections: int = 1) -> None: ...
+    async def post(self, url: str, json: dict[str, Any], headers: dict[str, str]) -> dict[str, Any]: ...
+    async def get(self, url: str, params: dict[str, Any] | None = None, headers: dict[str, str] | None = None) -> dict[str, Any]: ...
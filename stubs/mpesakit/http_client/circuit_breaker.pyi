@@ -0,0 +1,49 @@
+from .fork import register_after_fork as register_after_fork
+from _typeshed import Incomplete
+from enum import Enum
+from mpesakit.errors import MpesaApiException as MpesaApiException, MpesaError as MpesaError
+from pydantic import BaseModel, ConfigDict as ConfigDict
+from typing import ClassVar
+
+BREAKER_FAILURE_CODES: frozenset[str]
+
+class CircuitState(str, Enum):
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+class CircuitBreakerPolicy(BaseModel):
+    failure_threshold: int | None
+    failure_rate_threshold: float | None
+    window_size: int
+    minimum_calls: int
+    reset_timeout: float
+    half_open_max_calls: int
+    failure_codes: frozenset[str]
+    model_config: ClassVar[ConfigDict]
+
+class CircuitBreakerStats(BaseModel):
+    state: CircuitState
+    consecutive_failures: int
+    failure_rate: float
+    window_calls: int
+    times_opened: int
+
+class CircuitBreaker:
+    name: Incomplete
+    policy: Incomplete
+    def __init__(self, name: str, policy: CircuitBreakerPolicy | None = None) -> None: ...
+    @property
+    def state(self) -> CircuitState: ...
+    def before_request(self) -> None: ...
+    def record_success(self) -> None: ...
+    def record_failure(self) -> None: ...
+    def record_error(self, exc: MpesaApiException) -> None: ...
+    def release(self) -> None: ...
+    def stats(self) -> CircuitBreakerStats: ...
+
+class CircuitBreakers:
+    policy: Incomplete
+    def __init__(self, policy: CircuitBreakerPolicy | None = None) -> None: ...
+    def get(self, path: str) -> CircuitBreaker: ...
+    def stats(self) -> dict[str, CircuitBreakerStats]: ...
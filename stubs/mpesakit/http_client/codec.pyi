@@ -0,0 +1,29 @@
+import abc
+from abc import ABC, abstractmethod
+from typing import Any
+
+class JsonCodec(ABC, metaclass=abc.ABCMeta):
+    name: str
+    @abstractmethod
+    def dumps(self, obj: Any) -> bytes: ...
+    @abstractmethod
+    def loads(self, data: bytes | str) -> Any: ...
+
+class StdlibJsonCodec(JsonCodec):
+    name: str
+    def dumps(self, obj: Any) -> bytes: ...
+    def loads(self, data: bytes | str) -> Any: ...
+
+class OrjsonCodec(JsonCodec):
+    name: str
+    def __init__(self) -> None: ...
+    def dumps(self, obj: Any) -> bytes: ...
+    def loads(self, data: bytes | str) -> Any: ...
+
+class MsgspecCodec(JsonCodec):
+    name: str
+    def __init__(self) -> None: ...
+    def dumps(self, obj: Any) -> bytes: ...
+    def loads(self, data: bytes | str) -> Any: ...
+
+def default_codec() -> JsonCodec: ...
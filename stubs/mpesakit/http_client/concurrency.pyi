@@ -0,0 +1,67 @@
+from .fork import register_after_fork as register_after_fork
+from _typeshed import Incomplete
+from mpesakit.errors import MpesaApiException as MpesaApiException, MpesaError as MpesaError
+from pydantic import BaseModel, ConfigDict as ConfigDict
+from typing import ClassVar
+
+OVERLOAD_ERROR_CODES: frozenset[str]
+
+class AIMDPolicy(BaseModel):
+    initial_limit: int
+    min_limit: int
+    max_limit: int
+    increase: float
+    backoff_ratio: float
+    latency_target: float
+    max_error_rate: float
+    window_size: int
+    overload_codes: frozenset[str]
+    model_config: ClassVar[ConfigDict]
+
+class ConcurrencyStats(BaseModel):
+    limit: int
+    in_flight: int
+    queued: int
+    p99_latency: float | None
+    error_rate: float
+
+class Permit:
+    started: Incomplete
+    generation: Incomplete
+    def __init__(self, started: float, generation: int) -> None: ...
+
+class _AIMDLimit:
+    policy: Incomplete
+    limit: Incomplete
+    in_flight: int
+    generation: int
+    def __init__(self, policy: AIMDPolicy) -> None: ...
+    def has_capacity(self) -> bool: ...
+    def take(self) -> Permit: ...
+    def cancel(self, permit: Permit) -> None: ...
+    def give_back(self, permit: Permit, error: MpesaApiException | None) -> None: ...
+    def p99(self) -> float | None: ...
+    def error_rate(self) -> float: ...
+    def stats(self, queued: int) -> ConcurrencyStats: ...
+
+class ConcurrencyLimiter:
+    policy: Incomplete
+    max_wait: Incomplete
+    def __init__(self, policy: AIMDPolicy | None = None, max_wait: float | None = None) -> None: ...
+    def acquire(self, deadline: float | None = None) -> Permit: ...
+    def release(self, permit: Permit, error: MpesaApiException | None = None) -> None: ...
+    def cancel(self, permit: Permit) -> None: ...
+    @property
+    def limit(self) -> int: ...
+    def stats(self) -> ConcurrencyStats: ...
+
+class AsyncConcurrencyLimiter:
+    policy: Incomplete
+    max_wait: Incomplete
+    def __init__(self, policy: AIMDPolicy | None = None, max_wait: float | None = None) -> None: ...
+    async def acquire(self, deadline: float | None = None) -> Permit: ...
+    def release(self, permit: Permit, error: MpesaApiException | None = None) -> None: ...
+    def cancel(self, permit: Permit) -> None: ...
+    @property
+    def limit(self) -> int: ...
+    def stats(self) -> ConcurrencyStats: ...
@@ -0,0 +1,25 @@
+from .fork import register_after_fork as register_after_fork
+from _typeshed import Incomplete
+from pydantic import BaseModel, ConfigDict as ConfigDict
+from typing import Any, ClassVar, Mapping
+
+THROTTLING_STATUS_CODES: frozenset[int]
+THROTTLING_ERROR_CODES: frozenset[str]
+
+def parse_retry_after(value: str | None) -> float | None: ...
+
+class CooldownPolicy(BaseModel):
+    default_delay: float
+    max_delay: float
+    status_codes: frozenset[int]
+    error_codes: frozenset[str]
+    model_config: ClassVar[ConfigDict]
+    def delay_for(self, status_code: int, body: Mapping[str, Any], retry_after: str | None = None) -> float | None: ...
+
+class Cooldowns:
+    policy: Incomplete
+    def __init__(self, policy: CooldownPolicy | None = None) -> None: ...
+    def remaining(self, path: str) -> float: ...
+    def record(self, path: str, delay: float) -> None: ...
+    def record_response(self, path: str, status_code: int, body: Mapping[str, Any], retry_after: str | None = None) -> float | None: ...
+    def stats(self) -> dict[str, float]: ...
@@ -0,0 +1,3 @@
+from typing import Any
+
+def register_after_fork(obj: Any) -> None: ...
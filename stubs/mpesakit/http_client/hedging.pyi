@@ -0,0 +1,40 @@
+from .fork import register_after_fork as register_after_fork
+from _typeshed import Incomplete
+from pydantic import BaseModel, ConfigDict as ConfigDict
+from typing import Awaitable, Callable, ClassVar, TypeVar
+
+T = TypeVar('T')
+HEDGEABLE_PATHS: frozenset[str]
+MONEY_MOVING_PATHS: frozenset[str]
+
+class HedgePolicy(BaseModel):
+    delay_percentile: float
+    initial_delay: float
+    min_delay: float
+    min_samples: int
+    window_size: int
+    budget: float
+    hedgeable_paths: frozenset[str]
+    model_config: ClassVar[ConfigDict]
+
+class HedgeStats(BaseModel):
+    requests: int
+    hedges: int
+    hedge_wins: int
+    budget_exhausted: int
+
+class _BaseHedger:
+    policy: Incomplete
+    def __init__(self, policy: HedgePolicy | None = None) -> None: ...
+    def applies_to(self, url: str) -> bool: ...
+    def delay_for(self, url: str) -> float: ...
+    def stats(self) -> HedgeStats: ...
+
+class Hedger(_BaseHedger):
+    max_workers: Incomplete
+    def __init__(self, policy: HedgePolicy | None = None, max_workers: int = 32) -> None: ...
+    def call(self, url: str, attempt: Callable[[], T]) -> T: ...
+    def close(self) -> None: ...
+
+class AsyncHedger(_BaseHedger):
+    async def call(self, url: str, attempt: Callable[[], Awaitable[T]]) -> T: ...
@@ -3,12 +3,16 @@ from abc import ABC, abstractmethod
 from typing import Any
 
 class HttpClient(ABC, metaclass=abc.ABCMeta):
+    def register_token_source(self, source: Any) -> None: ...
+    def warm_up(self, connections: int = 1) -> None: ...
     @abstractmethod
     def post(self, url: str, json: dict[str, Any], headers: dict[str, str]) -> dict[str, Any]: ...
     @abstractmethod
     def get(self, url: str, params: dict[str, Any] | None = None, headers: dict[str, str] | None = None) -> dict[str, Any]: ...
 
 class AsyncHttpClient(ABC, metaclass=abc.ABCMeta):
+    def register_token_source(self, source: Any) -> None: ...
+    async def warm_up(self, connections: int = 1) -> None: ...
     @abstractmethod
     async def post(self, url: str, json: dict[str, Any], headers: dict[str, str]) -> dict[str, Any]: ...
     @abstractmethod
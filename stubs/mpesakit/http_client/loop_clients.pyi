@@ -0,0 +1,15 @@
+import httpx
+from .fork import register_after_fork as register_after_fork
+from typing import Callable, Generic, TypeVar
+
+T = TypeVar('T')
+
+class LoopLocal(Generic[T]):
+    def __init__(self, factory: Callable[[], T]) -> None: ...
+    def get(self) -> T: ...
+
+class LoopClientRegistry:
+    def __init__(self, factory: Callable[[], httpx.AsyncClient]) -> None: ...
+    def get(self) -> httpx.AsyncClient: ...
+    def clients(self) -> list[httpx.AsyncClient]: ...
+    async def aclose(self) -> None: ...
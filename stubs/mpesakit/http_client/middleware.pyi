@@ -0,0 +1,118 @@
+import abc
+from .circuit_breaker import CircuitBreakers as CircuitBreakers
+from .concurrency import AsyncConcurrencyLimiter as AsyncConcurrencyLimiter, ConcurrencyLimiter as ConcurrencyLimiter
+from .cooldown import Cooldowns as Cooldowns
+from .hedging import AsyncHedger as AsyncHedger, Hedger as Hedger
+from .rate_limiter import AsyncRateLimiter as AsyncRateLimiter, RateLimiter as RateLimiter, shortcode_of as shortcode_of
+from .retry import RetryPolicy as RetryPolicy
+from .single_flight import AsyncSingleFlight as AsyncSingleFlight, SingleFlight as SingleFlight, request_key as request_key
+from .timeouts import current_deadline as current_deadline, deadline_exceeded as deadline_exceeded, remaining_time as remaining_time
+from .token_refresh import TokenSources as TokenSources, bearer_token as bearer_token, is_invalid_token_error as is_invalid_token_error, with_bearer_token as with_bearer_token
+from _typeshed import Incomplete
+from abc import ABC, abstractmethod
+from mpesakit.errors import MpesaApiException as MpesaApiException
+from typing import Any, Awaitable, Callable, Sequence
+
+class Request:
+    method: Incomplete
+    url: Incomplete
+    headers: Incomplete
+    json: Incomplete
+    params: Incomplete
+    def __init__(self, method: str, url: str, headers: dict[str, str], json: dict[str, Any] | bytes | None = None, params: dict[str, Any] | None = None) -> None: ...
+    @property
+    def payload(self) -> Any | None: ...
+    def replace(self, **changes: Any) -> Request: ...
+Handler = Callable[[Request], dict[str, Any]]
+AsyncHandler = Callable[[Request], Awaitable[dict[str, Any]]]
+
+class Middleware(ABC, metaclass=abc.ABCMeta):
+    @abstractmethod
+    def __call__(self, request: Request, call_next: Handler) -> dict[str, Any]: ...
+
+class AsyncMiddleware(ABC, metaclass=abc.ABCMeta):
+    @abstractmethod
+    async def __call__(self, request: Request, call_next: AsyncHandler) -> dict[str, Any]: ...
+
+def chain(middlewares: Sequence[Middleware], handler: Handler) -> Handler: ...
+def async_chain(middlewares: Sequence[AsyncMiddleware], handler: AsyncHandler) -> AsyncHandler: ...
+
+class SingleFlightMiddleware(Middleware):
+    single_flight: Incomplete
+    def __init__(self, single_flight: SingleFlight) -> None: ...
+    def __call__(self, request: Request, call_next: Handler) -> dict[str, Any]: ...
+
+class AsyncSingleFlightMiddleware(AsyncMiddleware):
+    single_flight: Incomplete
+    def __init__(self, single_flight: AsyncSingleFlight) -> None: ...
+    async def __call__(self, request: Request, call_next: AsyncHandler) -> dict[str, Any]: ...
+
+class RetryMiddleware(Middleware):
+    policy: Incomplete
+    def __init__(self, policy: RetryPolicy) -> None: ...
+    def __call__(self, request: Request, call_next: Handler) -> dict[str, Any]: ...
+
+class AsyncRetryMiddleware(AsyncMiddleware):
+    policy: Incomplete
+    def __init__(self, policy: RetryPolicy) -> None: ...
+    async def __call__(self, request: Request, call_next: AsyncHandler) -> dict[str, Any]: ...
+
+class HedgingMiddleware(Middleware):
+    hedger: Incomplete
+    def __init__(self, hedger: Hedger) -> None: ...
+    def __call__(self, request: Request, call_next: Handler) -> dict[str, Any]: ...
+
+class AsyncHedgingMiddleware(AsyncMiddleware):
+    hedger: Incomplete
+    def __init__(self, hedger: AsyncHedger) -> None: ...
+    async def __call__(self, request: Request, call_next: AsyncHandler) -> dict[str, Any]: ...
+
+class CooldownMiddleware(Middleware):
+    cooldowns: Incomplete
+    def __init__(self, cooldowns: Cooldowns) -> None: ...
+    def __call__(self, request: Request, call_next: Handler) -> dict[str, Any]: ...
+
+class AsyncCooldownMiddleware(AsyncMiddleware):
+    cooldowns: Incomplete
+    def __init__(self, cooldowns: Cooldowns) -> None: ...
+    async def __call__(self, request: Request, call_next: AsyncHandler) -> dict[str, Any]: ...
+
+class RateLimitMiddleware(Middleware):
+    rate_limiter: Incomplete
+    def __init__(self, rate_limiter: RateLimiter) -> None: ...
+    def __call__(self, request: Request, call_next: Handler) -> dict[str, Any]: ...
+
+class AsyncRateLimitMiddleware(AsyncMiddleware):
+    rate_limiter: Incomplete
+    def __init__(self, rate_limiter: AsyncRateLimiter) -> None: ...
+    async def __call__(self, request: Request, call_next: AsyncHandler) -> dict[str, Any]: ...
+
+class CircuitBreakerMiddleware(Middleware):
+    circuit_breakers: Incomplete
+    def __init__(self, circuit_breakers: CircuitBreakers) -> None: ...
+    def __call__(self, request: Request, call_next: Handler) -> dict[str, Any]: ...
+
+class AsyncCircuitBreakerMiddleware(AsyncMiddleware):
+    circuit_breakers: Incomplete
+    def __init__(self, circuit_breakers: CircuitBreakers) -> None: ...
+    async def __call__(self, request: Request, call_next: AsyncHandler) -> dict[str, Any]: ...
+
+class ConcurrencyLimitMiddleware(Middleware):
+    limiter: Incomplete
+    def __init__(self, limiter: ConcurrencyLimiter) -> None: ...
+    def __call__(self, request: Request, call_next: Handler) -> dict[str, Any]: ...
+
+class AsyncConcurrencyLimitMiddleware(AsyncMiddleware):
+    limiter: Incomplete
+    def __init__(self, limiter: AsyncConcurrencyLimiter) -> None: ...
+    async def __call__(self, request: Request, call_next: AsyncHandler) -> dict[str, Any]: ...
+
+class TokenRefreshMiddleware(Middleware):
+    token_sources: Incomplete
+    def __init__(self, token_sources: TokenSources) -> None: ...
+    def __call__(self, request: Request, call_next: Handler) -> dict[str, Any]: ...
+
+class AsyncTokenRefreshMiddleware(AsyncMiddleware):
+    token_sources: Incomplete
+    def __init__(self, token_sources: TokenSources) -> None: ...
+    async def __call__(self, request: Request, call_next: AsyncHandler) -> dict[str, Any]: ...
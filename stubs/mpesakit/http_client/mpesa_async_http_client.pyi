@@ -1,12 +1,44 @@
+from .circuit_breaker import CircuitBreakerPolicy as CircuitBreakerPolicy, CircuitBreakers as CircuitBreakers
+from .codec import JsonCodec as JsonCodec, default_codec as default_codec
+from .concurrency import AsyncConcurrencyLimiter as AsyncConcurrencyLimiter
+from .cooldown import CooldownPolicy as CooldownPolicy, Cooldowns as Cooldowns
+from .fork import register_after_fork as register_after_fork
+from .hedging import AsyncHedger as AsyncHedger
 from .http_client import AsyncHttpClient as AsyncHttpClient
+from .loop_clients import LoopClientRegistry as LoopClientRegistry
+from .middleware import AsyncCircuitBreakerMiddleware as AsyncCircuitBreakerMiddleware, AsyncConcurrencyLimitMiddleware as AsyncConcurrencyLimitMiddleware, AsyncCooldownMiddleware as AsyncCooldownMiddleware, AsyncHandler as AsyncHandler, AsyncHedgingMiddleware as AsyncHedgingMiddleware, AsyncMiddleware as AsyncMiddleware, AsyncRateLimitMiddleware as AsyncRateLimitMiddleware, AsyncRetryMiddleware as AsyncRetryMiddleware, AsyncSingleFlightMiddleware as AsyncSingleFlightMiddleware, AsyncTokenRefreshMiddleware as AsyncTokenRefreshMiddleware, Request as Request, async_chain as async_chain
+from .rate_limiter import AsyncRateLimiter as AsyncRateLimiter
+from .response_limits import CHUNK_SIZE as CHUNK_SIZE, ResponseLimits as ResponseLimits, aread_limited as aread_limited, decode_body as decode_body, response_too_large as response_too_large
+from .retry import RetryPolicy as RetryPolicy
+from .single_flight import AsyncSingleFlight as AsyncSingleFlight
+from .timeouts import Timeouts as Timeouts, check_deadline as check_deadline, deadline_exceeded as deadline_exceeded, remaining_time as remaining_time
+from .token_refresh import TokenSources as TokenSources
+from .transport_metrics import MeteredAsyncTransport as MeteredAsyncTransport, TransportMetrics as TransportMetrics
 from mpesakit.errors import MpesaApiException as MpesaApiException, MpesaError as MpesaError
-from typing import Any
+from typing import Any, Sequence
 
 class MpesaAsyncHttpClient(AsyncHttpClient):
     base_url: str
-    def __init__(self, env: str = 'sandbox') -> None: ...
+    retry_policy: RetryPolicy
+    circuit_breakers: CircuitBreakers
+    cooldowns: Cooldowns
+    rate_limiter: AsyncRateLimiter | None
+    concurrency_limiter: AsyncConcurrencyLimiter | None
+    hedger: AsyncHedger | None
+    single_flight: AsyncSingleFlight | None
+    codec: JsonCodec
+    timeouts: Timeouts
+    endpoint_timeouts: dict[str, Timeouts]
+    middlewares: list[AsyncMiddleware]
+    response_limits: ResponseLimits
+    transport_metrics: TransportMetrics
+    def __init__(self, env: str = 'sandbox', retry_policy: RetryPolicy | None = None, circuit_breaker_policy: CircuitBreakerPolicy | None = None, rate_limiter: AsyncRateLimiter | None = None, concurrency_limiter: AsyncConcurrencyLimiter | None = None, hedger: AsyncHedger | None = None, single_flight: AsyncSingleFlight | None = None, codec: JsonCodec | None = None, timeouts: Timeouts | None = None, endpoint_timeouts: dict[str, Timeouts] | None = None, cooldown_policy: CooldownPolicy | None = None, middlewares: Sequence[AsyncMiddleware] | None = None, base_url: str | None = None, response_limits: ResponseLimits | None = None) -> None: ...
+    def transport_stats(self) -> dict[str, Any]: ...
     async def __aenter__(self): ...
     async def __aexit__(self, exc_type, exc_val, exc_tb) -> None: ...
-    async def post(self, url: str, json: dict[str, Any], headers: dict[str, str]) -> dict[str, Any]: ...
+    async def warm_up(self, connections: int = 1) -> None: ...
+    def add_middleware(self, middleware: AsyncMiddleware) -> None: ...
+    def register_token_source(self, source: Any) -> None: ...
+    async def post(self, url: str, json: dict[str, Any] | bytes, headers: dict[str, str]) -> dict[str, Any]: ...
     async def get(self, url: str, params: dict[str, Any] | None = None, headers: dict[str, str] | None = None) -> dict[str, Any]: ...
     async def aclose(self) -> None: ...
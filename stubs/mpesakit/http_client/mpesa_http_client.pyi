@@ -1,9 +1,44 @@
+import types
+from .circuit_breaker import CircuitBreakerPolicy as CircuitBreakerPolicy, CircuitBreakers as CircuitBreakers
+from .codec import JsonCodec as JsonCodec, default_codec as default_codec
+from .concurrency import ConcurrencyLimiter as ConcurrencyLimiter
+from .cooldown import CooldownPolicy as CooldownPolicy, Cooldowns as Cooldowns
+from .fork import register_after_fork as register_after_fork
+from .hedging import Hedger as Hedger
 from .http_client import HttpClient as HttpClient
+from .middleware import CircuitBreakerMiddleware as CircuitBreakerMiddleware, ConcurrencyLimitMiddleware as ConcurrencyLimitMiddleware, CooldownMiddleware as CooldownMiddleware, Handler as Handler, HedgingMiddleware as HedgingMiddleware, Middleware as Middleware, RateLimitMiddleware as RateLimitMiddleware, Request as Request, RetryMiddleware as RetryMiddleware, SingleFlightMiddleware as SingleFlightMiddleware, TokenRefreshMiddleware as TokenRefreshMiddleware, chain as chain
+from .rate_limiter import RateLimiter as RateLimiter
+from .response_limits import CHUNK_SIZE as CHUNK_SIZE, ResponseLimits as ResponseLimits, decode_body as decode_body, read_limited as read_limited, response_too_large as response_too_large
+from .retry import RetryPolicy as RetryPolicy
+from .single_flight import SingleFlight as SingleFlight
+from .timeouts import Timeouts as Timeouts, check_deadline as check_deadline, deadline_exceeded as deadline_exceeded, remaining_time as remaining_time
+from .token_refresh import TokenSources as TokenSources
+from .transport_metrics import MeteredHTTPAdapter as MeteredHTTPAdapter, TransportMetrics as TransportMetrics
 from mpesakit.errors import MpesaApiException as MpesaApiException, MpesaError as MpesaError
-from typing import Any
+from typing import Any, Sequence
 
 class MpesaHttpClient(HttpClient):
     base_url: str
-    def __init__(self, env: str = 'sandbox') -> None: ...
-    def post(self, url: str, json: dict[str, Any], headers: dict[str, str]) -> dict[str, Any]: ...
+    retry_policy: RetryPolicy
+    circuit_breakers: CircuitBreakers
+    cooldowns: Cooldowns
+    rate_limiter: RateLimiter | None
+    concurrency_limiter: ConcurrencyLimiter | None
+    hedger: Hedger | None
+    single_flight: SingleFlight | None
+    codec: JsonCodec
+    timeouts: Timeouts
+    endpoint_timeouts: dict[str, Timeouts]
+    middlewares: list[Middleware]
+    response_limits: ResponseLimits
+    transport_metrics: TransportMetrics
+    def __init__(self, env: str = 'sandbox', pool_connections: int = 10, pool_maxsize: int = 10, pool_block: bool = False, retry_policy: RetryPolicy | None = None, circuit_breaker_policy: CircuitBreakerPolicy | None = None, rate_limiter: RateLimiter | None = None, concurrency_limiter: ConcurrencyLimiter | None = None, hedger: Hedger | None = None, single_flight: SingleFlight | None = None, codec: JsonCodec | None = None, timeouts: Timeouts | None = None, endpoint_timeouts: dict[str, Timeouts] | None = None, cooldown_policy: CooldownPolicy | None = None, middlewares: Sequence[Middleware] | None = None, base_url: str | None = None, response_limits: ResponseLimits | None = None) -> None: ...
+    def __enter__(self) -> MpesaHttpClient: ...
+    def __exit__(self, exc_type: type[BaseException] | None, exc_val: BaseException | None, exc_tb: types.TracebackType | None) -> None: ...
+    def close(self) -> None: ...
+    def transport_stats(self) -> dict[str, Any]: ...
+    def warm_up(self, connections: int = 1) -> None: ...
+    def add_middleware(self, middleware: Middleware) -> None: ...
+    def register_token_source(self, source: Any) -> None: ...
+    def post(self, url: str, json: dict[str, Any] | bytes, headers: dict[str, str]) -> dict[str, Any]: ...
     def get(self, url: str, params: dict[str, Any] | None = None, headers: dict[str, str] | None = None) -> dict[str, Any]: ...
@@ -0,0 +1,35 @@
+from .fork import register_after_fork as register_after_fork
+from _typeshed import Incomplete
+from mpesakit.errors import MpesaApiException as MpesaApiException, MpesaError as MpesaError
+from pydantic import BaseModel, ConfigDict as ConfigDict
+from typing import Any, ClassVar
+
+SHORTCODE_FIELDS: tuple[str, ...]
+
+def shortcode_of(payload: Any) -> str | None: ...
+
+class RateLimit(BaseModel):
+    rate: float
+    burst: float | None
+    model_config: ClassVar[ConfigDict]
+
+class TokenBucket:
+    limit: Incomplete
+    capacity: Incomplete
+    def __init__(self, limit: RateLimit) -> None: ...
+    def reserve(self, max_wait: float | None = None) -> float | None: ...
+    def refund(self) -> None: ...
+
+class _BaseRateLimiter:
+    path_limits: Incomplete
+    shortcode_limits: Incomplete
+    per_shortcode: Incomplete
+    max_wait: Incomplete
+    def __init__(self, path_limits: dict[str, RateLimit] | None = None, shortcode_limits: dict[str, RateLimit] | None = None, per_shortcode: bool = True, max_wait: float | None = None) -> None: ...
+    def try_acquire(self, path: str, shortcode: str | None = None) -> bool: ...
+
+class RateLimiter(_BaseRateLimiter):
+    def acquire(self, path: str, shortcode: str | None = None, timeout: float | None = None, deadline: float | None = None) -> None: ...
+
+class AsyncRateLimiter(_BaseRateLimiter):
+    async def acquire(self, path: str, shortcode: str | None = None, timeout: float | None = None, deadline: float | None = None) -> None: ...
@@ -0,0 +1,20 @@
+from .codec import JsonCodec as JsonCodec
+from _typeshed import Incomplete
+from mpesakit.errors import MpesaApiException as MpesaApiException, MpesaError as MpesaError
+from pydantic import BaseModel, ConfigDict as ConfigDict
+from typing import Any, AsyncIterable, ClassVar, Iterable
+
+CHUNK_SIZE: Incomplete
+
+class ResponseLimits(BaseModel):
+    max_body_size: int | None
+    max_error_body_size: int
+    keep_raw_response: bool
+    model_config: ClassVar[ConfigDict]
+    def body_limit(self, is_error: bool) -> int | None: ...
+    def raw_response(self, data: dict[str, Any]) -> dict[str, Any]: ...
+
+def read_limited(chunks: Iterable[bytes], limit: int | None) -> tuple[bytes, bool]: ...
+async def aread_limited(chunks: AsyncIterable[bytes], limit: int | None) -> tuple[bytes, bool]: ...
+def decode_body(codec: JsonCodec, body: bytes, truncated: bool) -> dict[str, Any]: ...
+def response_too_large(status_code: int, limit: int | None) -> MpesaApiException: ...
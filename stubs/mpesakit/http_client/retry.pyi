@@ -0,0 +1,30 @@
+from .timeouts import current_deadline as current_deadline
+from contextlib import contextmanager
+from mpesakit.errors import MpesaApiException as MpesaApiException
+from pydantic import BaseModel, ConfigDict as ConfigDict
+from tenacity import AsyncRetrying, RetryCallState as RetryCallState, Retrying
+from tenacity.stop import stop_base
+from typing import ClassVar, Iterator
+
+IDEMPOTENT_PATHS: frozenset[str]
+RETRYABLE_ERROR_CODES: frozenset[str]
+
+@contextmanager
+def idempotency_key(key: str) -> Iterator[None]: ...
+def current_idempotency_key() -> str | None: ...
+
+class stop_before_deadline(stop_base):
+    def __call__(self, retry_state: RetryCallState) -> bool: ...
+
+class RetryPolicy(BaseModel):
+    max_attempts: int
+    backoff_base: float
+    backoff_max: float
+    total_timeout: float | None
+    retryable_errors: frozenset[str]
+    idempotent_paths: frozenset[str]
+    model_config: ClassVar[ConfigDict]
+    def allows_retry(self, method: str, url: str) -> bool: ...
+    def is_retryable(self, exc: BaseException) -> bool: ...
+    def retrying(self) -> Retrying: ...
+    def async_retrying(self) -> AsyncRetrying: ...
@@ -0,0 +1,31 @@
+from .fork import register_after_fork as register_after_fork
+from .loop_clients import LoopLocal as LoopLocal
+from .timeouts import deadline_exceeded as deadline_exceeded, remaining_time as remaining_time, without_deadline as without_deadline
+from _typeshed import Incomplete
+from mpesakit.errors import MpesaApiException as MpesaApiException
+from typing import Any, Awaitable, Callable, TypeVar
+
+T = TypeVar('T')
+COALESCED_PATHS: frozenset[str]
+
+def request_key(method: str, url: str, headers: dict[str, str], payload: Any | None) -> str: ...
+
+class _Call:
+    done: Incomplete
+    result: Any
+    error: BaseException | None
+    def __init__(self) -> None: ...
+
+class _BaseSingleFlight:
+    paths: Incomplete
+    coalesced: int
+    def __init__(self, paths: frozenset[str] = ...) -> None: ...
+    def applies_to(self, url: str) -> bool: ...
+
+class SingleFlight(_BaseSingleFlight):
+    def __init__(self, paths: frozenset[str] = ...) -> None: ...
+    def do(self, key: str, fn: Callable[[], T]) -> T: ...
+
+class AsyncSingleFlight(_BaseSingleFlight):
+    def __init__(self, paths: frozenset[str] = ...) -> None: ...
+    async def do(self, key: str, fn: Callable[[], Awaitable[T]]) -> T: ...
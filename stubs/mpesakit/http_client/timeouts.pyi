@@ -0,0 +1,21 @@
+from contextlib import contextmanager
+from mpesakit.errors import MpesaApiException as MpesaApiException, MpesaError as MpesaError
+from pydantic import BaseModel, ConfigDict as ConfigDict
+from typing import ClassVar, Iterator
+
+class Timeouts(BaseModel):
+    connect: float
+    read: float
+    write: float
+    pool: float
+    model_config: ClassVar[ConfigDict]
+    def capped(self, limit: float | None) -> Timeouts: ...
+
+@contextmanager
+def request_deadline(timeout: float | None = None, deadline: float | None = None) -> Iterator[None]: ...
+@contextmanager
+def without_deadline() -> Iterator[None]: ...
+def current_deadline() -> float | None: ...
+def remaining_time() -> float | None: ...
+def check_deadline() -> None: ...
+def deadline_exceeded() -> MpesaApiException: ...
@@ -0,0 +1,14 @@
+from .fork import register_after_fork as register_after_fork
+from mpesakit.errors import MpesaError as MpesaError
+from typing import Any
+
+REVOKED_CREDENTIAL_ERROR_CODE: str
+
+def is_invalid_token_error(error: MpesaError) -> bool: ...
+def bearer_token(headers: dict[str, str] | None) -> str | None: ...
+def with_bearer_token(headers: dict[str, str], token: str) -> dict[str, str]: ...
+
+class TokenSources:
+    def __init__(self) -> None: ...
+    def register(self, source: Any) -> None: ...
+    def find(self, token: str) -> Any | None: ...
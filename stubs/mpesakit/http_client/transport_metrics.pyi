@@ -0,0 +1,39 @@
+import httpx
+from _typeshed import Incomplete
+from requests.adapters import HTTPAdapter
+from typing import Any
+from urllib3 import HTTPConnectionPool, HTTPSConnectionPool, PoolManager
+
+class TransportMetrics:
+    def __init__(self) -> None: ...
+    def connection_acquired(self, waited: float, reused: bool, tls: bool) -> None: ...
+    def connection_released(self) -> None: ...
+    def tls_handshake(self) -> None: ...
+    def request_finished(self, status_code: int | None, bytes_sent: int, bytes_received: int = 0) -> None: ...
+    def snapshot(self, idle: int, active: int | None = None) -> dict[str, Any]: ...
+
+class _MeteredPoolMixin:
+    metrics: TransportMetrics
+    def idle_connections(self) -> int: ...
+
+class _MeteredHTTPConnectionPool(_MeteredPoolMixin, HTTPConnectionPool): ...
+class _MeteredHTTPSConnectionPool(_MeteredPoolMixin, HTTPSConnectionPool): ...
+
+class _MeteredPoolManager(PoolManager):
+    metrics: Incomplete
+    pool_classes_by_scheme: Incomplete
+    def __init__(self, metrics: TransportMetrics, **kwargs: Any) -> None: ...
+    def idle_connections(self) -> int: ...
+
+class MeteredHTTPAdapter(HTTPAdapter):
+    metrics: Incomplete
+    def __init__(self, metrics: TransportMetrics, **kwargs: Any) -> None: ...
+    poolmanager: Incomplete
+    def init_poolmanager(self, connections: int, maxsize: int, block: bool = False, **pool_kwargs: Any) -> None: ...
+    def idle_connections(self) -> int: ...
+
+class MeteredAsyncTransport(httpx.AsyncHTTPTransport):
+    metrics: Incomplete
+    def __init__(self, metrics: TransportMetrics, **kwargs: Any) -> None: ...
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response: ...
+    def connection_counts(self) -> tuple[int, int]: ...
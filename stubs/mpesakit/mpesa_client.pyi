@@ -1,11 +1,47 @@
+import types
 from _typeshed import Incomplete
-from mpesakit.auth import TokenManager as TokenManager
-from mpesakit.http_client import MpesaHttpClient as MpesaHttpClient
-from mpesakit.services import B2BService as B2BService, B2CService as B2CService, BalanceService as BalanceService, BillService as BillService, C2BService as C2BService, DynamicQRCodeService as DynamicQRCodeService, RatibaService as RatibaService, ReversalService as ReversalService, StkPushService as StkPushService, TaxService as TaxService, TransactionService as TransactionService
+from concurrent.futures import Future
+from mpesakit.auth import AsyncTokenManager as AsyncTokenManager, AsyncTokenRegistry as AsyncTokenRegistry, TokenManager as TokenManager, TokenRegistry as TokenRegistry
+from mpesakit.http_client import AsyncHttpClient as AsyncHttpClient, HttpClient as HttpClient, MpesaAsyncHttpClient as MpesaAsyncHttpClient, MpesaHttpClient as MpesaHttpClient
+from mpesakit.http_client.fork import register_after_fork as register_after_fork
+from mpesakit.security import load_public_key as load_public_key
+from mpesakit.services import AsyncB2BService as AsyncB2BService, AsyncB2CService as AsyncB2CService, AsyncBalanceService as AsyncBalanceService, AsyncBillService as AsyncBillService, AsyncC2BService as AsyncC2BService, AsyncDynamicQRCodeService as AsyncDynamicQRCodeService, AsyncRatibaService as AsyncRatibaService, AsyncReversalService as AsyncReversalService, AsyncStkPushService as AsyncStkPushService, AsyncTaxService as AsyncTaxService, AsyncTransactionService as AsyncTransactionService, B2BService as B2BService, B2CService as B2CService, BalanceService as BalanceService, BillService as BillService, C2BService as C2BService, DynamicQRCodeService as DynamicQRCodeService, RatibaService as RatibaService, ReversalService as ReversalService, StkPushService as StkPushService, TaxService as TaxService, TransactionService as TransactionService
+from typing import Any, Callable, Iterable, Iterator, TypeVar
+
+T = TypeVar('T')
 
 class MpesaClient:
-    http_client: Incomplete
-    token_manager: Incomplete
+    max_workers: Incomplete
+    http_client: HttpClient
+    token_manager: TokenManager
+    environment: Incomplete
+    express: Incomplete
+    stk_push: Incomplete
+    stk_query: Incomplete
+    b2c: Incomplete
+    b2b: Incomplete
+    transactions: Incomplete
+    tax: Incomplete
+    balance: Incomplete
+    reversal: Incomplete
+    bill: Incomplete
+    dynamic_qr: Incomplete
+    c2b: Incomplete
+    ratiba: Incomplete
+    def __init__(self, consumer_key: str | None = None, consumer_secret: str | None = None, environment: str = 'sandbox', http_client: MpesaHttpClient | None = None, token_registry: TokenRegistry | None = None, max_workers: int = 10) -> None: ...
+    def submit(self, method: str | Callable[..., T], /, **kwargs: Any) -> Future[T]: ...
+    def map(self, method: str | Callable[..., T], kwargs_iterable: Iterable[dict[str, Any]], max_workers: int | None = None, ordered: bool = False) -> Iterator[T | Exception]: ...
+    @property
+    def ready(self) -> bool: ...
+    def warm_up(self, connections: int = 1, cert_path: str | None = None) -> None: ...
+    def __enter__(self) -> MpesaClient: ...
+    def __exit__(self, exc_type: type[BaseException] | None, exc_val: BaseException | None, exc_tb: types.TracebackType | None) -> None: ...
+    def close(self) -> None: ...
+
+class AsyncMpesaClient:
+    http_client: AsyncHttpClient
+    token_manager: AsyncTokenManager
+    environment: Incomplete
     express: Incomplete
     stk_push: Incomplete
     stk_query: Incomplete
@@ -19,4 +55,10 @@ class MpesaClient:
     dynamic_qr: Incomplete
     c2b: Incomplete
     ratiba: Incomplete
-    def __init__(self, consumer_key: str, consumer_secret: str, environment: str = 'sandbox') -> None: ...
+    def __init__(self, consumer_key: str | None = None, consumer_secret: str | None = None, environment: str = 'sandbox', http_client: MpesaAsyncHttpClient | None = None, token_registry: AsyncTokenRegistry | None = None) -> None: ...
+    @property
+    def ready(self) -> bool: ...
+    async def warm_up(self, connections: int = 1, cert_path: str | None = None) -> None: ...
+    async def __aenter__(self) -> AsyncMpesaClient: ...
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None: ...
+    async def aclose(self) -> None: ...
@@ -1,4 +1,4 @@
 from .schemas import StkCallback as StkCallback, StkPushQueryRequest as StkPushQueryRequest, StkPushQueryResponse as StkPushQueryResponse, StkPushSimulateCallback as StkPushSimulateCallback, StkPushSimulateCallbackBody as StkPushSimulateCallbackBody, StkPushSimulateCallbackMetadata as StkPushSimulateCallbackMetadata, StkPushSimulateCallbackMetadataItem as StkPushSimulateCallbackMetadataItem, StkPushSimulateRequest as StkPushSimulateRequest, StkPushSimulateResponse as StkPushSimulateResponse, TransactionType as TransactionType
-from .stk_push import StkPush as StkPush
+from .stk_push import AsyncStkPush as AsyncStkPush, StkPush as StkPush
 
-__all__ = ['StkPush', 'StkPushSimulateRequest', 'StkPushSimulateResponse', 'TransactionType', 'StkPushSimulateCallbackMetadataItem', 'StkPushSimulateCallbackMetadata', 'StkPushSimulateCallback', 'StkPushSimulateCallbackBody', 'StkCallback', 'StkPushQueryRequest', 'StkPushQueryResponse']
+__all__ = ['AsyncStkPush', 'StkPush', 'StkPushSimulateRequest', 'StkPushSimulateResponse', 'TransactionType', 'StkPushSimulateCallbackMetadataItem', 'StkPushSimulateCallbackMetadata', 'StkPushSimulateCallback', 'StkPushSimulateCallbackBody', 'StkCallback', 'StkPushQueryRequest', 'StkPushQueryResponse']
@@ -1,7 +1,7 @@
 from .schemas import StkPushQueryRequest as StkPushQueryRequest, StkPushQueryResponse as StkPushQueryResponse, StkPushSimulateRequest as StkPushSimulateRequest, StkPushSimulateResponse as StkPushSimulateResponse
 from _typeshed import Incomplete
-from mpesakit.auth import TokenManager as TokenManager
-from mpesakit.http_client import HttpClient as HttpClient
+from mpesakit.auth import AsyncTokenManager as AsyncTokenManager, TokenManager as TokenManager
+from mpesakit.http_client import AsyncHttpClient as AsyncHttpClient, HttpClient as HttpClient
 from pydantic import BaseModel
 
 class StkPush(BaseModel):
@@ -10,3 +10,10 @@ class StkPush(BaseModel):
     model_config: Incomplete
     def push(self, request: StkPushSimulateRequest) -> StkPushSimulateResponse: ...
     def query(self, request: StkPushQueryRequest) -> StkPushQueryResponse: ...
+
+class AsyncStkPush(BaseModel):
+    http_client: AsyncHttpClient
+    token_manager: AsyncTokenManager
+    model_config: Incomplete
+    async def push(self, request: StkPushSimulateRequest) -> StkPushSimulateResponse: ...
+    async def query(self, request: StkPushQueryRequest) -> StkPushQueryResponse: ...
@@ -1,4 +1,4 @@
-from .mpesa_ratiba import MpesaRatiba as MpesaRatiba
+from .mpesa_ratiba import AsyncMpesaRatiba as AsyncMpesaRatiba, MpesaRatiba as MpesaRatiba
 from .schemas import FrequencyEnum as FrequencyEnum, ReceiverPartyIdentifierTypeEnum as ReceiverPartyIdentifierTypeEnum, StandingOrderCallback as StandingOrderCallback, StandingOrderCallbackResponse as StandingOrderCallbackResponse, StandingOrderRequest as StandingOrderRequest, StandingOrderResponse as StandingOrderResponse, TransactionTypeEnum as TransactionTypeEnum
 
-__all__ = ['StandingOrderRequest', 'StandingOrderResponse', 'StandingOrderCallback', 'StandingOrderCallbackResponse', 'FrequencyEnum', 'TransactionTypeEnum', 'ReceiverPartyIdentifierTypeEnum', 'MpesaRatiba']
+__all__ = ['AsyncMpesaRatiba', 'StandingOrderRequest', 'StandingOrderResponse', 'StandingOrderCallback', 'StandingOrderCallbackResponse', 'FrequencyEnum', 'TransactionTypeEnum', 'ReceiverPartyIdentifierTypeEnum', 'MpesaRatiba']
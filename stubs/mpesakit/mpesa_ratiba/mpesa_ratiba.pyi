@@ -1,7 +1,7 @@
 from .schemas import StandingOrderRequest as StandingOrderRequest, StandingOrderResponse as StandingOrderResponse
 from _typeshed import Incomplete
-from mpesakit.auth import TokenManager as TokenManager
-from mpesakit.http_client import HttpClient as HttpClient
+from mpesakit.auth import AsyncTokenManager as AsyncTokenManager, TokenManager as TokenManager
+from mpesakit.http_client import AsyncHttpClient as AsyncHttpClient, HttpClient as HttpClient
 from pydantic import BaseModel
 
 class MpesaRatiba(BaseModel):
@@ -9,3 +9,9 @@ class MpesaRatiba(BaseModel):
     token_manager: TokenManager
     model_config: Incomplete
     def create_standing_order(self, request: StandingOrderRequest) -> StandingOrderResponse: ...
+
+class AsyncMpesaRatiba(BaseModel):
+    http_client: AsyncHttpClient
+    token_manager: AsyncTokenManager
+    model_config: Incomplete
+    async def create_standing_order(self, request: StandingOrderRequest) -> StandingOrderResponse: ...
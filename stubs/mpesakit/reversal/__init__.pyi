@@ -1,4 +1,4 @@
-from .reversal import Reversal as Reversal
+from .reversal import AsyncReversal as AsyncReversal, Reversal as Reversal
 from .schemas import ReversalRequest as ReversalRequest, ReversalResponse as ReversalResponse, ReversalResultCallback as ReversalResultCallback, ReversalResultCallbackResponse as ReversalResultCallbackResponse, ReversalTimeoutCallback as ReversalTimeoutCallback, ReversalTimeoutCallbackResponse as ReversalTimeoutCallbackResponse
 
-__all__ = ['Reversal', 'ReversalRequest', 'ReversalResponse', 'ReversalResultCallback', 'ReversalResultCallbackResponse', 'ReversalTimeoutCallback', 'ReversalTimeoutCallbackResponse']
+__all__ = ['AsyncReversal', 'Reversal', 'ReversalRequest', 'ReversalResponse', 'ReversalResultCallback', 'ReversalResultCallbackResponse', 'ReversalTimeoutCallback', 'ReversalTimeoutCallbackResponse']
@@ -1,7 +1,7 @@
 from .schemas import ReversalRequest as ReversalRequest, ReversalResponse as ReversalResponse
 from _typeshed import Incomplete
-from mpesakit.auth import TokenManager as TokenManager
-from mpesakit.http_client import HttpClient as HttpClient
+from mpesakit.auth import AsyncTokenManager as AsyncTokenManager, TokenManager as TokenManager
+from mpesakit.http_client import AsyncHttpClient as AsyncHttpClient, HttpClient as HttpClient
 from pydantic import BaseModel
 
 class Reversal(BaseModel):
@@ -9,3 +9,9 @@ class Reversal(BaseModel):
     token_manager: TokenManager
     model_config: Incomplete
     def reverse(self, request: ReversalRequest) -> ReversalResponse: ...
+
+class AsyncReversal(BaseModel):
+    http_client: AsyncHttpClient
+    token_manager: AsyncTokenManager
+    model_config: Incomplete
+    async def reverse(self, request: ReversalRequest) -> ReversalResponse: ...
@@ -1,4 +1,4 @@
-from .get_credential import generate_security_credential as generate_security_credential
+from .get_credential import generate_security_credential as generate_security_credential, load_public_key as load_public_key
 from .ip_whitelist import is_mpesa_ip_allowed as is_mpesa_ip_allowed
 
-__all__ = ['generate_security_credential', 'is_mpesa_ip_allowed']
+__all__ = ['generate_security_credential', 'is_mpesa_ip_allowed', 'load_public_key']
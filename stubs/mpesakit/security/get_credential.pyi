@@ -1,5 +1,7 @@
 from _typeshed import Incomplete
+from cryptography.hazmat.primitives.asymmetric.rsa import RSAPublicKey
 
 DEFAULT_CERT_DIR: Incomplete
 
+def load_public_key(environment: str = 'sandbox', cert_path: str | None = None) -> RSAPublicKey: ...
 def generate_security_credential(initiator_password: str, cert_path: str | None = None, environment: str = 'sandbox') -> str: ...
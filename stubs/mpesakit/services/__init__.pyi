@@ -1,13 +1,13 @@
-from .b2b import B2BService as B2BService
-from .b2c import B2CService as B2CService
-from .balance import BalanceService as BalanceService
-from .bill import BillService as BillService
-from .c2b import C2BService as C2BService
-from .dynamic_qr import DynamicQRCodeService as DynamicQRCodeService
-from .express import StkPushService as StkPushService
-from .ratiba import RatibaService as RatibaService
-from .reversal import ReversalService as ReversalService
-from .tax import TaxService as TaxService
-from .transaction import TransactionService as TransactionService
+from .b2b import AsyncB2BService as AsyncB2BService, B2BService as B2BService
+from .b2c import AsyncB2CService as AsyncB2CService, B2CService as B2CService
+from .balance import AsyncBalanceService as AsyncBalanceService, BalanceService as BalanceService
+from .bill import AsyncBillService as AsyncBillService, BillService as BillService
+from .c2b import AsyncC2BService as AsyncC2BService, C2BService as C2BService
+from .dynamic_qr import AsyncDynamicQRCodeService as AsyncDynamicQRCodeService, DynamicQRCodeService as DynamicQRCodeService
+from .express import AsyncStkPushService as AsyncStkPushService, StkPushService as StkPushService
+from .ratiba import AsyncRatibaService as AsyncRatibaService, RatibaService as RatibaService
+from .reversal import AsyncReversalService as AsyncReversalService, ReversalService as ReversalService
+from .tax import AsyncTaxService as AsyncTaxService, TaxService as TaxService
+from .transaction import AsyncTransactionService as AsyncTransactionService, TransactionService as TransactionService
 
-__all__ = ['B2BService', 'B2CService', 'BalanceService', 'BillService', 'C2BService', 'DynamicQRCodeService', 'StkPushService', 'RatibaService', 'ReversalService', 'TaxService', 'TransactionService']
+__all__ = ['AsyncB2BService', 'B2BService', 'AsyncB2CService', 'B2CService', 'AsyncBalanceService', 'BalanceService', 'AsyncBillService', 'BillService', 'AsyncC2BService', 'C2BService', 'AsyncDynamicQRCodeService', 'DynamicQRCodeService', 'AsyncStkPushService', 'StkPushService', 'AsyncRatibaService', 'RatibaService', 'AsyncReversalService', 'ReversalService', 'AsyncTaxService', 'TaxService', 'AsyncTransactionService', 'TransactionService']
@@ -1,11 +1,18 @@
 from _typeshed import Incomplete
-from mpesakit.auth import TokenManager as TokenManager
-from mpesakit.c2b import C2B as C2B, C2BRegisterUrlRequest as C2BRegisterUrlRequest, C2BRegisterUrlResponse as C2BRegisterUrlResponse
-from mpesakit.http_client import HttpClient as HttpClient
+from mpesakit.auth import AsyncTokenManager as AsyncTokenManager, TokenManager as TokenManager
+from mpesakit.c2b import AsyncC2B as AsyncC2B, C2B as C2B, C2BRegisterUrlRequest as C2BRegisterUrlRequest, C2BRegisterUrlResponse as C2BRegisterUrlResponse
+from mpesakit.http_client import AsyncHttpClient as AsyncHttpClient, HttpClient as HttpClient, request_deadline as request_deadline
 
 class C2BService:
     http_client: Incomplete
     token_manager: Incomplete
     c2b: Incomplete
     def __init__(self, http_client: HttpClient, token_manager: TokenManager) -> None: ...
-    def register_url(self, short_code: int, response_type: str, confirmation_url: str, validation_url: str, **kwargs) -> C2BRegisterUrlResponse: ...
+    def register_url(self, short_code: int, response_type: str, confirmation_url: str, validation_url: str, timeout: float | None = None, deadline: float | None = None, **kwargs) -> C2BRegisterUrlResponse: ...
+
+class AsyncC2BService:
+    http_client: Incomplete
+    token_manager: Incomplete
+    c2b: Incomplete
+    def __init__(self, http_client: AsyncHttpClient, token_manager: AsyncTokenManager) -> None: ...
+    async def register_url(self, short_code: int, response_type: str, confirmation_url: str, validation_url: str, timeout: float | None = None, deadline: float | None = None, **kwargs) -> C2BRegisterUrlResponse: ...
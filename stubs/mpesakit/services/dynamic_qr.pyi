@@ -1,11 +1,18 @@
 from _typeshed import Incomplete
-from mpesakit.auth import TokenManager as TokenManager
-from mpesakit.dynamic_qr_code import DynamicQRCode as DynamicQRCode, DynamicQRGenerateRequest as DynamicQRGenerateRequest, DynamicQRGenerateResponse as DynamicQRGenerateResponse
-from mpesakit.http_client.mpesa_http_client import HttpClient as HttpClient
+from mpesakit.auth import AsyncTokenManager as AsyncTokenManager, TokenManager as TokenManager
+from mpesakit.dynamic_qr_code import AsyncDynamicQRCode as AsyncDynamicQRCode, DynamicQRCode as DynamicQRCode, DynamicQRGenerateRequest as DynamicQRGenerateRequest, DynamicQRGenerateResponse as DynamicQRGenerateResponse
+from mpesakit.http_client import AsyncHttpClient as AsyncHttpClient, HttpClient as HttpClient, request_deadline as request_deadline
 
 class DynamicQRCodeService:
     http_client: Incomplete
     token_manager: Incomplete
     qr_code: Incomplete
     def __init__(self, http_client: HttpClient, token_manager: TokenManager) -> None: ...
-    def generate(self, merchant_name: str, ref_no: str, amount: float, trx_code: str, cpi: str, size: str, **kwargs) -> DynamicQRGenerateResponse: ...
+    def generate(self, merchant_name: str, ref_no: str, amount: float, trx_code: str, cpi: str, size: str, timeout: float | None = None, deadline: float | None = None, **kwargs) -> DynamicQRGenerateResponse: ...
+
+class AsyncDynamicQRCodeService:
+    http_client: Incomplete
+    token_manager: Incomplete
+    qr_code: Incomplete
+    def __init__(self, http_client: AsyncHttpClient, token_manager: AsyncTokenManager) -> None: ...
+    async def generate(self, merchant_name: str, ref_no: str, amount: float, trx_code: str, cpi: str, size: str, timeout: float | None = None, deadline: float | None = None, **kwargs) -> DynamicQRGenerateResponse: ...
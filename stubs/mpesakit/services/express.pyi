@@ -1,12 +1,20 @@
 from _typeshed import Incomplete
-from mpesakit.auth import TokenManager as TokenManager
-from mpesakit.http_client import HttpClient as HttpClient
-from mpesakit.mpesa_express import StkPush as StkPush, StkPushQueryRequest as StkPushQueryRequest, StkPushQueryResponse as StkPushQueryResponse, StkPushSimulateRequest as StkPushSimulateRequest, StkPushSimulateResponse as StkPushSimulateResponse
+from mpesakit.auth import AsyncTokenManager as AsyncTokenManager, TokenManager as TokenManager
+from mpesakit.http_client import AsyncHttpClient as AsyncHttpClient, HttpClient as HttpClient, request_deadline as request_deadline
+from mpesakit.mpesa_express import AsyncStkPush as AsyncStkPush, StkPush as StkPush, StkPushQueryRequest as StkPushQueryRequest, StkPushQueryResponse as StkPushQueryResponse, StkPushSimulateRequest as StkPushSimulateRequest, StkPushSimulateResponse as StkPushSimulateResponse
 
 class StkPushService:
     http_client: Incomplete
     token_manager: Incomplete
     stk_push: Incomplete
     def __init__(self, http_client: HttpClient, token_manager: TokenManager) -> None: ...
-    def push(self, business_short_code: int, transaction_type: str, amount: float, party_a: str, party_b: str, phone_number: str, callback_url: str, account_reference: str, transaction_desc: str, passkey: str | None = None, timestamp: str | None = None, password: str | None = None, **kwargs) -> StkPushSimulateResponse: ...
-    def query(self, business_short_code: int, checkout_request_id: str, passkey: str | None = None, password: str | None = None, timestamp: str | None = None, **kwargs) -> StkPushQueryResponse: ...
+    def push(self, business_short_code: int, transaction_type: str, amount: float, party_a: str, party_b: str, phone_number: str, callback_url: str, account_reference: str, transaction_desc: str, passkey: str | None = None, timestamp: str | None = None, password: str | None = None, timeout: float | None = None, deadline: float | None = None, **kwargs) -> StkPushSimulateResponse: ...
+    def query(self, business_short_code: int, checkout_request_id: str, passkey: str | None = None, password: str | None = None, timestamp: str | None = None, timeout: float | None = None, deadline: float | None = None, **kwargs) -> StkPushQueryResponse: ...
+
+class AsyncStkPushService:
+    http_client: Incomplete
+    token_manager: Incomplete
+    stk_push: Incomplete
+    def __init__(self, http_client: AsyncHttpClient, token_manager: AsyncTokenManager) -> None: ...
+    async def push(self, business_short_code: int, transaction_type: str, amount: float, party_a: str, party_b: str, phone_number: str, callback_url: str, account_reference: str, transaction_desc: str, passkey: str | None = None, timestamp: str | None = None, password: str | None = None, timeout: float | None = None, deadline: float | None = None, **kwargs) -> StkPushSimulateResponse: ...
+    async def query(self, business_short_code: int, checkout_request_id: str, passkey: str | None = None, password: str | None = None, timestamp: str | None = None, timeout: float | None = None, deadline: float | None = None, **kwargs) -> StkPushQueryResponse: ...
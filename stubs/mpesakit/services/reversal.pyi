@@ -1,10 +1,16 @@
 from _typeshed import Incomplete
-from mpesakit.auth import TokenManager as TokenManager
-from mpesakit.http_client import HttpClient as HttpClient
-from mpesakit.reversal import Reversal as Reversal, ReversalRequest as ReversalRequest, ReversalResponse as ReversalResponse
+from mpesakit.auth import AsyncTokenManager as AsyncTokenManager, TokenManager as TokenManager
+from mpesakit.http_client import AsyncHttpClient as AsyncHttpClient, HttpClient as HttpClient, request_deadline as request_deadline
+from mpesakit.reversal import AsyncReversal as AsyncReversal, Reversal as Reversal, ReversalRequest as ReversalRequest, ReversalResponse as ReversalResponse
 
 class ReversalService:
     http_client: Incomplete
     token_manager: Incomplete
     def __init__(self, http_client: HttpClient, token_manager: TokenManager) -> None: ...
-    def reverse(self, initiator: str, security_credential: str, transaction_id: str, amount: int, receiver_party: int, result_url: str, queue_timeout_url: str, remarks: str, occasion: str | None = None, **kwargs) -> ReversalResponse: ...
+    def reverse(self, initiator: str, security_credential: str, transaction_id: str, amount: int, receiver_party: int, result_url: str, queue_timeout_url: str, remarks: str, occasion: str | None = None, timeout: float | None = None, deadline: float | None = None, **kwargs) -> ReversalResponse: ...
+
+class AsyncReversalService:
+    http_client: Incomplete
+    token_manager: Incomplete
+    def __init__(self, http_client: AsyncHttpClient, token_manager: AsyncTokenManager) -> None: ...
+    async def reverse(self, initiator: str, security_credential: str, transaction_id: str, amount: int, receiver_party: int, result_url: str, queue_timeout_url: str, remarks: str, occasion: str | None = None, timeout: float | None = None, deadline: float | None = None, **kwargs) -> ReversalResponse: ...
@@ -1,11 +1,18 @@
 from _typeshed import Incomplete
-from mpesakit.auth import TokenManager as TokenManager
-from mpesakit.http_client import HttpClient as HttpClient
-from mpesakit.tax_remittance import TaxRemittance as TaxRemittance, TaxRemittanceRequest as TaxRemittanceRequest, TaxRemittanceResponse as TaxRemittanceResponse
+from mpesakit.auth import AsyncTokenManager as AsyncTokenManager, TokenManager as TokenManager
+from mpesakit.http_client import AsyncHttpClient as AsyncHttpClient, HttpClient as HttpClient, request_deadline as request_deadline
+from mpesakit.tax_remittance import AsyncTaxRemittance as AsyncTaxRemittance, TaxRemittance as TaxRemittance, TaxRemittanceRequest as TaxRemittanceRequest, TaxRemittanceResponse as TaxRemittanceResponse
 
 class TaxService:
     http_client: Incomplete
     token_manager: Incomplete
     tax_remittance: Incomplete
     def __init__(self, http_client: HttpClient, token_manager: TokenManager) -> None: ...
-    def remittance(self, initiator: str, security_credential: str, amount: int, party_a: int, remarks: str, account_reference: str, result_url: str, queue_timeout_url: str, **kwargs) -> TaxRemittanceResponse: ...
+    def remittance(self, initiator: str, security_credential: str, amount: int, party_a: int, remarks: str, account_reference: str, result_url: str, queue_timeout_url: str, timeout: float | None = None, deadline: float | None = None, **kwargs) -> TaxRemittanceResponse: ...
+
+class AsyncTaxService:
+    http_client: Incomplete
+    token_manager: Incomplete
+    tax_remittance: Incomplete
+    def __init__(self, http_client: AsyncHttpClient, token_manager: AsyncTokenManager) -> None: ...
+    async def remittance(self, initiator: str, security_credential: str, amount: int, party_a: int, remarks: str, account_reference: str, result_url: str, queue_timeout_url: str, timeout: float | None = None, deadline: float | None = None, **kwargs) -> TaxRemittanceResponse: ...
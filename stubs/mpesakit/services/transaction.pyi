@@ -1,11 +1,18 @@
 from _typeshed import Incomplete
-from mpesakit.auth import TokenManager as TokenManager
-from mpesakit.http_client import HttpClient as HttpClient
-from mpesakit.transaction_status import TransactionStatus as TransactionStatus, TransactionStatusRequest as TransactionStatusRequest, TransactionStatusResponse as TransactionStatusResponse
+from mpesakit.auth import AsyncTokenManager as AsyncTokenManager, TokenManager as TokenManager
+from mpesakit.http_client import AsyncHttpClient as AsyncHttpClient, HttpClient as HttpClient, request_deadline as request_deadline
+from mpesakit.transaction_status import AsyncTransactionStatus as AsyncTransactionStatus, TransactionStatus as TransactionStatus, TransactionStatusRequest as TransactionStatusRequest, TransactionStatusResponse as TransactionStatusResponse
 
 class TransactionService:
     http_client: Incomplete
     token_manager: Incomplete
     transaction_status: Incomplete
     def __init__(self, http_client: HttpClient, token_manager: TokenManager) -> None: ...
-    def query_status(self, initiator: str, security_credential: str, transaction_id: str, party_a: int, identifier_type: int, result_url: str, queue_timeout_url: str, occasion: str = '', command_id: str | None = None, remarks: str | None = None, original_conversation_id: str | None = None, **kwargs) -> TransactionStatusResponse: ...
+    def query_status(self, initiator: str, security_credential: str, transaction_id: str, party_a: int, identifier_type: int, result_url: str, queue_timeout_url: str, occasion: str = '', command_id: str | None = None, remarks: str | None = None, original_conversation_id: str | None = None, timeout: float | None = None, deadline: float | None = None, **kwargs) -> TransactionStatusResponse: ...
+
+class AsyncTransactionService:
+    http_client: Incomplete
+    token_manager: Incomplete
+    transaction_status: Incomplete
+    def __init__(self, http_client: AsyncHttpClient, token_manager: AsyncTokenManager) -> None: ...
+    async def query_status(self, initiator: str, security_credential: str, transaction_id: str, party_a: int, identifier_type: int, result_url: str, queue_timeout_url: str, occasion: str = '', command_id: str | None = None, remarks: str | None = None, original_conversation_id: str | None = None, timeout: float | None = None, deadline: float | None = None, **kwargs) -> TransactionStatusResponse: ...
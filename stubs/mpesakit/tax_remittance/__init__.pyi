@@ -1,4 +1,4 @@
 from .schemas import TaxRemittanceRequest as TaxRemittanceRequest, TaxRemittanceResponse as TaxRemittanceResponse, TaxRemittanceResultCallback as TaxRemittanceResultCallback, TaxRemittanceResultCallbackResponse as TaxRemittanceResultCallbackResponse, TaxRemittanceTimeoutCallback as TaxRemittanceTimeoutCallback, TaxRemittanceTimeoutCallbackResponse as TaxRemittanceTimeoutCallbackResponse
-from .tax_remittance import TaxRemittance as TaxRemittance
+from .tax_remittance import AsyncTaxRemittance as AsyncTaxRemittance, TaxRemittance as TaxRemittance
 
-__all__ = ['TaxRemittance', 'TaxRemittanceRequest', 'TaxRemittanceResponse', 'TaxRemittanceResultCallback', 'TaxRemittanceResultCallbackResponse', 'TaxRemittanceTimeoutCallback', 'TaxRemittanceTimeoutCallbackResponse']
+__all__ = ['AsyncTaxRemittance', 'TaxRemittance', 'TaxRemittanceRequest', 'TaxRemittanceResponse', 'TaxRemittanceResultCallback', 'TaxRemittanceResultCallbackResponse', 'TaxRemittanceTimeoutCallback', 'TaxRemittanceTimeoutCallbackResponse']
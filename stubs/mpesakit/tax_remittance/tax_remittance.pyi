@@ -1,7 +1,7 @@
 from .schemas import TaxRemittanceRequest as TaxRemittanceRequest, TaxRemittanceResponse as TaxRemittanceResponse
 from _typeshed import Incomplete
-from mpesakit.auth import TokenManager as TokenManager
-from mpesakit.http_client import HttpClient as HttpClient
+from mpesakit.auth import AsyncTokenManager as AsyncTokenManager, TokenManager as TokenManager
+from mpesakit.http_client import AsyncHttpClient as AsyncHttpClient, HttpClient as HttpClient
 from pydantic import BaseModel
 
 class TaxRemittance(BaseModel):
@@ -9,3 +9,9 @@ class TaxRemittance(BaseModel):
     token_manager: TokenManager
     model_config: Incomplete
     def remittance(self, request: TaxRemittanceRequest) -> TaxRemittanceResponse: ...
+
+class AsyncTaxRemittance(BaseModel):
+    http_client: AsyncHttpClient
+    token_manager: AsyncTokenManager
+    model_config: Incomplete
+    async def remittance(self, request: TaxRemittanceRequest) -> TaxRemittanceResponse: ...
@@ -1,4 +1,4 @@
 from .schemas import TransactionStatusIdentifierType as TransactionStatusIdentifierType, TransactionStatusRequest as TransactionStatusRequest, TransactionStatusResponse as TransactionStatusResponse, TransactionStatusResultCallback as TransactionStatusResultCallback, TransactionStatusResultCallbackResponse as TransactionStatusResultCallbackResponse, TransactionStatusResultMetadata as TransactionStatusResultMetadata, TransactionStatusResultParameter as TransactionStatusResultParameter, TransactionStatusTimeoutCallback as TransactionStatusTimeoutCallback, TransactionStatusTimeoutCallbackResponse as TransactionStatusTimeoutCallbackResponse
-from .transaction_status import TransactionStatus as TransactionStatus
+from .transaction_status import AsyncTransactionStatus as AsyncTransactionStatus, TransactionStatus as TransactionStatus
 
-__all__ = ['TransactionStatus', 'TransactionStatusIdentifierType', 'TransactionStatusRequest', 'TransactionStatusResponse', 'TransactionStatusResultParameter', 'TransactionStatusResultMetadata', 'TransactionStatusResultCallback', 'TransactionStatusResultCallbackResponse', 'TransactionStatusTimeoutCallback', 'TransactionStatusTimeoutCallbackResponse']
+__all__ = ['AsyncTransactionStatus', 'TransactionStatus', 'TransactionStatusIdentifierType', 'TransactionStatusRequest', 'TransactionStatusResponse', 'TransactionStatusResultParameter', 'TransactionStatusResultMetadata', 'TransactionStatusResultCallback', 'TransactionStatusResultCallbackResponse', 'TransactionStatusTimeoutCallback', 'TransactionStatusTimeoutCallbackResponse']
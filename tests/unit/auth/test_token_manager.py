@@ -3,10 +3,20 @@
 These tests cover token retrieval, caching, and error handling.
 """
 
+import asyncio
+import threading
+import time
+from datetime import datetime, timedelta
+
 import pytest
 from unittest.mock import MagicMock
-from mpesakit.http_client import HttpClient
-from mpesakit.auth import TokenManager
+from mpesakit.http_client import AsyncHttpClient, HttpClient, request_deadline
+from mpesakit.auth import (
+    AccessToken,
+    AsyncTokenManager,
+    InMemoryTokenStore,
+    TokenManager,
+)
 from mpesakit.errors import MpesaApiException, MpesaError
 
 
@@ -83,6 +93,37 @@ def test_force_refresh_token(valid_credentials, mock_http_client):
     assert token2 == "token2"
 
 
+def test_force_refresh_skips_already_replaced_stale_token(
+    valid_credentials, mock_http_client
+):
+    """Test that a forced refresh for an already-replaced token reuses the new one."""
+    mock_http_client.get.side_effect = [
+        {"access_token": "token1", "expires_in": 3600},
+        {"access_token": "token2", "expires_in": 3600},
+    ]
+    tm = TokenManager(
+        consumer_key=valid_credentials["consumer_key"],
+        consumer_secret=valid_credentials["consumer_secret"],
+        http_client=mock_http_client,
+    )
+    tm.get_token()
+    assert tm.get_token(force_refresh=True, stale_token="token1") == "token2"
+    assert tm.get_token(force_refresh=True, stale_token="token1") == "token2"
+    assert mock_http_client.get.call_count == 2
+    assert tm.has_issued("token1") and tm.has_issued("token2")
+    assert not tm.has_issued("other")
+
+
+def test_registers_with_http_client(valid_credentials, mock_http_client):
+    """Test that a TokenManager registers itself as a token source."""
+    tm = TokenManager(
+        consumer_key=valid_credentials["consumer_key"],
+        consumer_secret=valid_credentials["consumer_secret"],
+        http_client=mock_http_client,
+    )
+    mock_http_client.register_token_source.assert_called_once_with(tm)
+
+
 def test_invalid_credentials_raises(mock_http_client, invalid_credentials):
     """Test that invalid credentials raise an exception."""
     mock_http_client.get.side_effect = MpesaApiException(
@@ -192,3 +233,418 @@ def test_token_missing_raises_exception(
     assert err.error_code == "TOKEN_MISSING"
     assert "No access token returned" in err.error_message
     assert err.raw_response == {"expires_in": 3600}
+
+
+@pytest.fixture
+def mock_async_http_client():
+    """Provide a MagicMock AsyncHttpClient for testing."""
+    return MagicMock(spec=AsyncHttpClient)
+
+
+@pytest.mark.asyncio
+async def test_async_token_caching(valid_credentials, mock_async_http_client):
+    """Test that AsyncTokenManager caches the token until it expires."""
+    mock_async_http_client.get.return_value = {
+        "access_token": "async_token",
+        "expires_in": 3600,
+    }
+    tm = AsyncTokenManager(
+        consumer_key=valid_credentials["consumer_key"],
+        consumer_secret=valid_credentials["consumer_secret"],
+        http_client=mock_async_http_client,
+    )
+    assert await tm.get_token() == "async_token"
+    assert await tm.get_token() == "async_token"
+    mock_async_http_client.get.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_async_force_refresh_token(valid_credentials, mock_async_http_client):
+    """Test that AsyncTokenManager refreshes the token when forced."""
+    mock_async_http_client.get.side_effect = [
+        {"access_token": "token1", "expires_in": 3600},
+        {"access_token": "token2", "expires_in": 3600},
+    ]
+    tm = AsyncTokenManager(
+        consumer_key=valid_credentials["consumer_key"],
+        consumer_secret=valid_credentials["consumer_secret"],
+        http_client=mock_async_http_client,
+    )
+    assert await tm.get_token() == "token1"
+    assert await tm.get_token(force_refresh=True) == "token2"
+
+
+@pytest.mark.asyncio
+async def test_async_empty_400_maps_to_invalid_credentials(
+    valid_credentials, mock_async_http_client
+):
+    """Test that AsyncTokenManager maps an empty 400 to AUTH_INVALID_CREDENTIALS."""
+    mock_async_http_client.get.side_effect = MpesaApiException(
+        MpesaError(error_code="HTTP_400", error_message="", status_code=400)
+    )
+    tm = AsyncTokenManager(
+        consumer_key=valid_credentials["consumer_key"],
+        consumer_secret=valid_credentials["consumer_secret"],
+        http_client=mock_async_http_client,
+    )
+    with pytest.raises(MpesaApiException) as excinfo:
+        await tm.get_token()
+    assert excinfo.value.error.error_code == "AUTH_INVALID_CREDENTIALS"
+
+
+@pytest.mark.asyncio
+async def test_async_token_missing_raises_exception(
+    valid_credentials, mock_async_http_client
+):
+    """Test that AsyncTokenManager raises TOKEN_MISSING when no token is returned."""
+    mock_async_http_client.get.return_value = {"expires_in": 3600}
+    tm = AsyncTokenManager(
+        consumer_key=valid_credentials["consumer_key"],
+        consumer_secret=valid_credentials["consumer_secret"],
+        http_client=mock_async_http_client,
+    )
+    with pytest.raises(MpesaApiException) as excinfo:
+        await tm.get_token()
+    assert excinfo.value.error.error_code == "TOKEN_MISSING"
+
+
+def test_concurrent_refresh_is_single_flight(valid_credentials, mock_http_client):
+    """Test that 64 threads racing on an empty cache trigger exactly one OAuth call."""
+    calls = []
+
+    def slow_get(*args, **kwargs):
+        calls.append(threading.get_ident())
+        time.sleep(0.05)
+        return {"access_token": f"token_{len(calls)}", "expires_in": 3600}
+
+    mock_http_client.get.side_effect = slow_get
+    tm = TokenManager(
+        consumer_key=valid_credentials["consumer_key"],
+        consumer_secret=valid_credentials["consumer_secret"],
+        http_client=mock_http_client,
+    )
+
+    barrier = threading.Barrier(64)
+    results = []
+
+    def worker():
+        barrier.wait()
+        results.append(tm.get_token())
+
+    threads = [threading.Thread(target=worker) for _ in range(64)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert len(calls) == 1
+    assert results == ["token_1"] * 64
+
+
+def test_refresh_gives_up_at_deadline(valid_credentials, mock_http_client):
+    """Test that a caller waiting for another thread's refresh stops at its deadline."""
+    release = threading.Event()
+    started = threading.Event()
+
+    def slow_get(*args, **kwargs):
+        started.set()
+        release.wait(2)
+        return {"access_token": "token_1", "expires_in": 3600}
+
+    mock_http_client.get.side_effect = slow_get
+    tm = TokenManager(
+        consumer_key=valid_credentials["consumer_key"],
+        consumer_secret=valid_credentials["consumer_secret"],
+        http_client=mock_http_client,
+    )
+    refresher = threading.Thread(target=tm.get_token)
+    refresher.start()
+    started.wait(2)
+    try:
+        with request_deadline(timeout=0.05):
+            with pytest.raises(MpesaApiException) as excinfo:
+                tm.get_token()
+        assert excinfo.value.error_code == "DEADLINE_EXCEEDED"
+    finally:
+        release.set()
+        refresher.join()
+    assert tm.get_token() == "token_1"
+
+
+def _hold_store_lock(valid_credentials, store, release):
+    """Starts a refresh by another manager that holds the store lock until release."""
+    started = threading.Event()
+
+    def slow_get(*args, **kwargs):
+        started.set()
+        release.wait(2)
+        return {"access_token": "token_1", "expires_in": 3600}
+
+    http_client = MagicMock(spec=HttpClient)
+    http_client.get.side_effect = slow_get
+    other = TokenManager(**valid_credentials, http_client=http_client, token_store=store)
+    refresher = threading.Thread(target=other.get_token)
+    refresher.start()
+    started.wait(2)
+    return refresher
+
+
+def test_store_lock_wait_gives_up_at_deadline(valid_credentials, mock_http_client):
+    """Test that waiting for another manager's store lock stops at the deadline."""
+    store, release = InMemoryTokenStore(), threading.Event()
+    tm = TokenManager(
+        **valid_credentials, http_client=mock_http_client, token_store=store
+    )
+    refresher = _hold_store_lock(valid_credentials, store, release)
+    try:
+        with request_deadline(timeout=0.05):
+            with pytest.raises(MpesaApiException) as excinfo:
+                tm.get_token()
+        assert excinfo.value.error_code == "DEADLINE_EXCEEDED"
+    finally:
+        release.set()
+        refresher.join()
+    assert tm.get_token() == "token_1"
+    mock_http_client.get.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_async_store_lock_wait_gives_up_at_deadline(
+    valid_credentials, mock_async_http_client
+):
+    """Test that an async wait for another manager's store lock stops at the deadline."""
+    store, release = InMemoryTokenStore(), threading.Event()
+    tm = AsyncTokenManager(
+        **valid_credentials, http_client=mock_async_http_client, token_store=store
+    )
+    refresher = _hold_store_lock(valid_credentials, store, release)
+    try:
+        with request_deadline(timeout=0.05):
+            with pytest.raises(MpesaApiException) as excinfo:
+                await tm.get_token()
+        assert excinfo.value.error_code == "DEADLINE_EXCEEDED"
+    finally:
+        release.set()
+        refresher.join()
+    assert await tm.get_token() == "token_1"
+    mock_async_http_client.get.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_async_refresh_gives_up_at_deadline(
+    valid_credentials, mock_async_http_client
+):
+    """Test that a task waiting for another task's refresh stops at its deadline."""
+    release = asyncio.Event()
+    started = asyncio.Event()
+
+    async def slow_get(*args, **kwargs):
+        started.set()
+        await release.wait()
+        return {"access_token": "token_1", "expires_in": 3600}
+
+    mock_async_http_client.get.side_effect = slow_get
+    tm = AsyncTokenManager(
+        consumer_key=valid_credentials["consumer_key"],
+        consumer_secret=valid_credentials["consumer_secret"],
+        http_client=mock_async_http_client,
+    )
+    refresher = asyncio.ensure_future(tm.get_token())
+    await started.wait()
+    try:
+        with request_deadline(timeout=0.05):
+            with pytest.raises(MpesaApiException) as excinfo:
+                await tm.get_token()
+        assert excinfo.value.error_code == "DEADLINE_EXCEEDED"
+    finally:
+        release.set()
+        await refresher
+    assert await tm.get_token() == "token_1"
+
+
+def test_concurrent_force_refresh_is_coalesced(valid_credentials, mock_http_client):
+    """Test that concurrent forced refreshes share one OAuth call."""
+    calls = []
+
+    def slow_get(*args, **kwargs):
+        calls.append(1)
+        time.sleep(0.05)
+        return {"access_token": f"token_{len(calls)}", "expires_in": 3600}
+
+    mock_http_client.get.side_effect = slow_get
+    tm = TokenManager(
+        consumer_key=valid_credentials["consumer_key"],
+        consumer_secret=valid_credentials["consumer_secret"],
+        http_client=mock_http_client,
+    )
+    assert tm.get_token() == "token_1"
+
+    barrier = threading.Barrier(16)
+    results = []
+
+    def worker():
+        barrier.wait()
+        results.append(tm.get_token(force_refresh=True))
+
+    threads = [threading.Thread(target=worker) for _ in range(16)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert len(calls) == 2
+    assert set(results) == {"token_2"}
+
+
+@pytest.mark.asyncio
+async def test_async_concurrent_refresh_is_single_flight(
+    valid_credentials, mock_async_http_client
+):
+    """Test that concurrent tasks racing on an empty cache trigger one OAuth call."""
+    calls = []
+
+    async def slow_get(*args, **kwargs):
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return {"access_token": "async_token", "expires_in": 3600}
+
+    mock_async_http_client.get.side_effect = slow_get
+    tm = AsyncTokenManager(
+        consumer_key=valid_credentials["consumer_key"],
+        consumer_secret=valid_credentials["consumer_secret"],
+        http_client=mock_async_http_client,
+    )
+
+    results = await asyncio.gather(*(tm.get_token() for _ in range(200)))
+
+    assert len(calls) == 1
+    assert set(results) == {"async_token"}
+
+
+def test_access_token_expiry_skew():
+    """Test that a token close to expiry is considered expired within the skew."""
+    token = AccessToken(
+        token="t",
+        creation_datetime=datetime.now() - timedelta(seconds=3570),
+        expiration_time=3600,
+    )
+    assert token.is_expired() is False
+    assert token.is_expired(skew_seconds=60) is True
+
+
+def test_access_token_refresh_delay():
+    """Test that refresh_delay counts down to the configured fraction of the lifetime."""
+    token = AccessToken(
+        token="t",
+        creation_datetime=datetime.now() - timedelta(seconds=1000),
+        expiration_time=3600,
+    )
+    assert 1870 < token.refresh_delay(0.8) <= 1880
+    assert token.refresh_delay(0.25) == 0.0
+
+
+def test_access_token_ignores_wall_clock_changes(monkeypatch):
+    """Test that expiry is measured on the monotonic clock once the token exists."""
+    token = AccessToken(token="t", creation_datetime=datetime.now(), expiration_time=60)
+    real_monotonic = time.monotonic
+    monkeypatch.setattr(
+        "mpesakit.auth.access_token.time.monotonic", lambda: real_monotonic() + 61
+    )
+    assert token.is_expired() is True
+
+
+def test_expiry_skew_triggers_early_refresh(valid_credentials, mock_http_client):
+    """Test that TokenManager refreshes a token that is inside the expiry skew."""
+    mock_http_client.get.side_effect = [
+        {"access_token": "token1", "expires_in": 3600},
+        {"access_token": "token2", "expires_in": 3600},
+    ]
+    tm = TokenManager(
+        consumer_key=valid_credentials["consumer_key"],
+        consumer_secret=valid_credentials["consumer_secret"],
+        http_client=mock_http_client,
+        expiry_skew=120,
+    )
+    assert tm.get_token() == "token1"
+    aged = AccessToken(
+        token="token1",
+        creation_datetime=datetime.now() - timedelta(seconds=3500),
+        expiration_time=3600,
+    )
+    tm._access_token = aged
+    tm.token_store = InMemoryTokenStore()
+    assert tm.get_token() == "token2"
+
+
+def test_background_refresh_renews_token(valid_credentials, mock_http_client):
+    """Test that the background refresher fetches and renews the token ahead of expiry."""
+    calls = []
+
+    def fake_get(*args, **kwargs):
+        calls.append(1)
+        return {"access_token": f"token{len(calls)}", "expires_in": 2}
+
+    mock_http_client.get.side_effect = fake_get
+    tm = TokenManager(
+        consumer_key=valid_credentials["consumer_key"],
+        consumer_secret=valid_credentials["consumer_secret"],
+        http_client=mock_http_client,
+        refresh_ratio=0.5,
+        expiry_skew=0,
+    )
+    tm.start_background_refresh()
+    try:
+        deadline = time.monotonic() + 5
+        while len(calls) < 2 and time.monotonic() < deadline:
+            time.sleep(0.05)
+        assert len(calls) >= 2
+        # The hot path is served from the proactively renewed token.
+        before = len(calls)
+        assert tm.get_token().startswith("token")
+        assert len(calls) == before
+    finally:
+        tm.stop_background_refresh(timeout=2)
+    assert tm._refresher is None
+
+
+def test_background_refresh_survives_errors(valid_credentials, mock_http_client):
+    """Test that a failing refresh does not kill the refresher thread."""
+    mock_http_client.get.side_effect = MpesaApiException(
+        MpesaError(error_code="REQUEST_TIMEOUT", status_code=None)
+    )
+    tm = TokenManager(
+        consumer_key=valid_credentials["consumer_key"],
+        consumer_secret=valid_credentials["consumer_secret"],
+        http_client=mock_http_client,
+    )
+    tm.start_background_refresh()
+    try:
+        time.sleep(0.1)
+        assert tm._refresher is not None and tm._refresher.is_alive()
+    finally:
+        tm.stop_background_refresh(timeout=2)
+
+
+@pytest.mark.asyncio
+async def test_async_background_refresh(valid_credentials, mock_async_http_client):
+    """Test that AsyncTokenManager renews the token in a background task."""
+    mock_async_http_client.get.return_value = {
+        "access_token": "async_token",
+        "expires_in": 3600,
+    }
+    tm = AsyncTokenManager(
+        consumer_key=valid_credentials["consumer_key"],
+        consumer_secret=valid_credentials["consumer_secret"],
+        http_client=mock_async_http_client,
+    )
+    tm.start_background_refresh()
+    try:
+        for _ in range(50):
+            if tm._access_token is not None:
+                break
+            await asyncio.sleep(0.01)
+        assert await tm.get_token() == "async_token"
+        mock_async_http_client.get.assert_awaited_once()
+    finally:
+        await tm.stop_background_refresh()
+    assert tm._refresher is None
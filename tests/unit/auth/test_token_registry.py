@@ -0,0 +1,187 @@
+"""Unit tests for the TokenRegistry classes in the mpesakit.auth module.
+
+These tests cover per-call tenant selection, LRU and idle eviction, and secret
+resolution for registries serving many consumer keys.
+"""
+
+import asyncio
+import time
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from mpesakit.auth import (
+    AsyncTokenRegistry,
+    InMemoryTokenStore,
+    TokenManager,
+    TokenRegistry,
+)
+from mpesakit.errors import MpesaApiException
+from mpesakit.http_client import AsyncHttpClient, HttpClient
+
+
+def _token_for_credentials(url, params=None, headers=None):
+    return {"access_token": f"token-{headers['Authorization']}", "expires_in": 3600}
+
+
+@pytest.fixture
+def http_client():
+    """Mock HttpClient returning a token derived from the Authorization header."""
+    client = MagicMock(spec=HttpClient)
+    client.get.side_effect = _token_for_credentials
+    return client
+
+
+@pytest.fixture
+def registry(http_client):
+    """Registry with two tenants."""
+    registry = TokenRegistry(http_client)
+    registry.register("key-a", "secret-a")
+    registry.register("key-b", "secret-b")
+    return registry
+
+
+def test_tenant_selects_credentials_per_call(registry):
+    """Test that the proxy token manager follows the selected tenant."""
+    proxy = registry.token_manager
+
+    with registry.tenant("key-a"):
+        token_a = proxy.get_token()
+        with registry.tenant("key-b"):
+            token_b = proxy.get_token()
+        assert proxy.get_token() == token_a
+
+    assert token_a != token_b
+    assert registry.get("key-a").get_token() == token_a
+
+
+def test_proxy_is_a_token_manager(registry):
+    """Test that the proxy can be used wherever a TokenManager is expected."""
+    assert isinstance(registry.token_manager, TokenManager)
+    assert registry.token_manager.http_client is registry.http_client
+
+
+def test_no_tenant_selected_raises(registry):
+    """Test that calls outside a tenant() block raise TENANT_NOT_SELECTED."""
+    with pytest.raises(MpesaApiException) as excinfo:
+        registry.get_token()
+    assert excinfo.value.error_code == "TENANT_NOT_SELECTED"
+
+
+def test_unknown_tenant_raises(registry):
+    """Test that an unregistered consumer key raises UNKNOWN_TENANT."""
+    with pytest.raises(MpesaApiException) as excinfo:
+        registry.get("missing")
+    assert excinfo.value.error_code == "UNKNOWN_TENANT"
+
+
+def test_secret_resolver_is_used_for_unregistered_keys(http_client):
+    """Test that secrets are resolved lazily for unregistered consumer keys."""
+    resolver = MagicMock(side_effect=lambda key: "resolved" if key == "vault" else None)
+    registry = TokenRegistry(http_client, secret_resolver=resolver)
+
+    assert registry.get("vault").consumer_secret == "resolved"
+    registry.get("vault")
+    resolver.assert_called_once_with("vault")
+    with pytest.raises(MpesaApiException):
+        registry.get("other")
+
+
+def test_lru_eviction_bounds_memory(http_client):
+    """Test that the least recently used tenant is dropped past max_tenants."""
+    registry = TokenRegistry(http_client, max_tenants=2)
+    for key in ("a", "b", "c"):
+        registry.register(key, "secret")
+
+    manager_a = registry.get("a")
+    registry.get("b")
+    registry.get("a")
+    registry.get("c")
+
+    assert len(registry) == 2
+    assert registry.get("a") is manager_a
+    assert len(registry) == 2
+
+
+def test_idle_tenants_are_evicted(http_client):
+    """Test that managers idle for longer than idle_ttl are dropped."""
+    registry = TokenRegistry(http_client, idle_ttl=0.05)
+    registry.register("a", "secret")
+    registry.register("b", "secret")
+
+    registry.get("a")
+    time.sleep(0.1)
+    registry.get("b")
+
+    assert len(registry) == 1
+
+
+def test_evicted_tenant_reuses_stored_token(http_client):
+    """Test that a recreated manager adopts the token from the shared store."""
+    registry = TokenRegistry(http_client, max_tenants=1, token_store=InMemoryTokenStore())
+    registry.register("a", "secret-a")
+    registry.register("b", "secret-b")
+
+    token = registry.get("a").get_token()
+    registry.get("b").get_token()
+    assert registry.get("a").get_token() == token
+    assert http_client.get.call_count == 2
+
+
+def test_default_store_is_bounded(http_client):
+    """Test that the default store keeps the tokens of max_tenants tenants only."""
+    registry = TokenRegistry(http_client, max_tenants=2)
+    for key in ("a", "b", "c"):
+        registry.register(key, "secret")
+        registry.get(key).get_token()
+
+    assert len(registry.token_store._tokens) == 2
+
+
+def test_register_new_secret_replaces_manager(registry):
+    """Test that changing a tenant's secret discards its cached manager."""
+    manager = registry.get("key-a")
+    registry.register("key-a", "rotated")
+
+    assert registry.get("key-a") is not manager
+    assert registry.get("key-a").consumer_secret == "rotated"
+
+
+def test_unregister_removes_tenant(registry):
+    """Test that an unregistered tenant can no longer be used."""
+    registry.get("key-a").get_token()
+    registry.unregister("key-a")
+
+    assert len(registry) == 0
+    assert registry.token_store._tokens == {}
+    with pytest.raises(MpesaApiException):
+        registry.get("key-a")
+
+
+def test_invalid_max_tenants(http_client):
+    """Test that max_tenants must be positive."""
+    with pytest.raises(ValueError):
+        TokenRegistry(http_client, max_tenants=0)
+
+
+@pytest.mark.asyncio
+async def test_async_registry_tenant_is_inherited_by_tasks():
+    """Test that tasks created inside tenant() authenticate as that tenant."""
+    http_client = MagicMock(spec=AsyncHttpClient)
+    http_client.get = AsyncMock(side_effect=_token_for_credentials)
+    registry = AsyncTokenRegistry(http_client)
+    registry.register("key-a", "secret-a")
+    registry.register("key-b", "secret-b")
+
+    async def fetch(key):
+        with registry.tenant(key):
+            return await asyncio.gather(
+                registry.token_manager.get_token(), registry.get_token()
+            )
+
+    tokens_a, tokens_b = await asyncio.gather(fetch("key-a"), fetch("key-b"))
+
+    assert len(set(tokens_a)) == 1
+    assert len(set(tokens_b)) == 1
+    assert tokens_a != tokens_b
+    assert http_client.get.await_count == 2
@@ -0,0 +1,296 @@
+"""Unit tests for the token stores in the mpesakit.auth module.
+
+These tests cover persistence, refresh locking, and token sharing between
+TokenManager instances and worker processes.
+"""
+
+import multiprocessing
+import threading
+import time
+from datetime import datetime
+
+import pytest
+from unittest.mock import MagicMock
+
+from mpesakit.auth import (
+    AccessToken,
+    AsyncTokenManager,
+    InMemoryTokenStore,
+    SQLiteTokenStore,
+    TokenManager,
+)
+from mpesakit.errors import MpesaApiException
+from mpesakit.http_client import AsyncHttpClient, HttpClient
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    """Provide a path for a temporary SQLite token database."""
+    return str(tmp_path / "tokens.db")
+
+
+def _slow_http_client(calls):
+    client = MagicMock(spec=HttpClient)
+
+    def fake_get(*args, **kwargs):
+        calls.append(1)
+        time.sleep(0.05)
+        return {"access_token": f"token{len(calls)}", "expires_in": 3600}
+
+    client.get.side_effect = fake_get
+    return client
+
+
+def test_sqlite_store_round_trip(db_path):
+    """Test that a saved token is loaded back with its value and lifetime."""
+    store = SQLiteTokenStore(db_path)
+    token = AccessToken(token="abc", creation_datetime=datetime.now(), expiration_time=3599)
+
+    store.save("key", token)
+    loaded = SQLiteTokenStore(db_path).load("key")
+
+    assert loaded is not None
+    assert loaded.token == "abc"
+    assert loaded.expiration_time == 3599
+    assert loaded.is_expired() is False
+    assert store.load("missing") is None
+
+
+def test_stores_delete_tokens(db_path):
+    """Test that a deleted token is no longer loaded."""
+    token = AccessToken(token="abc", creation_datetime=datetime.now(), expiration_time=3599)
+    for store in (InMemoryTokenStore(), SQLiteTokenStore(db_path)):
+        store.save("key", token)
+        store.delete("key")
+        store.delete("missing")
+        assert store.load("key") is None
+
+
+def test_in_memory_store_drops_least_recently_used_tokens():
+    """Test that max_tokens bounds the in-memory store, dropping unused tokens first."""
+    store = InMemoryTokenStore(max_tokens=2)
+    token = AccessToken(token="abc", creation_datetime=datetime.now(), expiration_time=3599)
+    store.save("a", token)
+    store.save("b", token)
+    store.load("a")
+    store.save("c", token)
+
+    assert store.load("b") is None
+    assert store.load("a") is token and store.load("c") is token
+    with pytest.raises(ValueError):
+        InMemoryTokenStore(max_tokens=0)
+
+
+def test_sqlite_lock_is_exclusive(db_path):
+    """Test that a held lock blocks other store instances until released."""
+    holder = SQLiteTokenStore(db_path)
+    waiter = SQLiteTokenStore(db_path, lock_timeout=0.2, poll_interval=0.01)
+
+    handle = holder.acquire("key")
+    with pytest.raises(MpesaApiException) as excinfo:
+        waiter.acquire("key")
+    assert excinfo.value.error_code == "TOKEN_LOCK_TIMEOUT"
+
+    with pytest.raises(MpesaApiException) as excinfo:
+        SQLiteTokenStore(db_path, lock_timeout=30).acquire("key", timeout=0.05)
+    assert excinfo.value.error_code == "TOKEN_LOCK_TIMEOUT"
+
+    holder.release("key", handle)
+    with waiter.lock("key"):
+        pass
+
+
+def test_in_memory_lock_wait_is_bounded_by_timeout():
+    """Test that acquire() gives up after timeout and leaves no lock behind."""
+    store = InMemoryTokenStore()
+    handle = store.acquire("key")
+    with pytest.raises(MpesaApiException) as excinfo:
+        store.acquire("key", timeout=0.05)
+    assert excinfo.value.error_code == "TOKEN_LOCK_TIMEOUT"
+
+    store.release("key", handle)
+    with store.lock("key", timeout=0.05):
+        pass
+    assert store._locks == {}
+
+
+def test_in_memory_lock_awaited_by_a_caller_survives_token_deletion():
+    """Test that deleting a token never hands a second caller a lock that is in use."""
+    store = InMemoryTokenStore()
+    token = AccessToken(token="abc", creation_datetime=datetime.now(), expiration_time=3599)
+    store.save("key", token)
+    events = []
+
+    def refresh(name):
+        with store.lock("key"):
+            events.append(name)
+            time.sleep(0.05)
+            events.append(name)
+
+    handle = store.acquire("key")
+    waiter = threading.Thread(target=refresh, args=("waiter",))
+    waiter.start()
+    while store._locks["key"].users < 2:
+        time.sleep(0.001)
+    store.release("key", handle)
+    store.delete("key")
+    refresh("caller")
+    waiter.join()
+
+    assert events in (
+        ["waiter", "waiter", "caller", "caller"],
+        ["caller", "caller", "waiter", "waiter"],
+    )
+    assert store._locks == {} and store._held == {}
+    with pytest.raises(KeyError):
+        store.release("key", handle)
+
+
+def test_sqlite_abandoned_lock_is_taken_over(db_path):
+    """Test that a lock whose lease expired is taken over by another process."""
+    crashed = SQLiteTokenStore(db_path, lock_lease=0.05)
+    crashed.acquire("key")
+
+    store = SQLiteTokenStore(db_path, lock_timeout=1.0, poll_interval=0.01)
+    time.sleep(0.1)
+    with store.lock("key"):
+        pass
+
+
+def test_in_memory_store_shared_between_managers():
+    """Test that managers sharing an in-memory store reuse a single token."""
+    calls = []
+    store = InMemoryTokenStore()
+    managers = [
+        TokenManager(
+            consumer_key="key",
+            consumer_secret="secret",
+            http_client=_slow_http_client(calls),
+            token_store=store,
+        )
+        for _ in range(3)
+    ]
+
+    assert {tm.get_token() for tm in managers} == {"token1"}
+    assert len(calls) == 1
+
+
+def test_sqlite_store_coordinates_concurrent_managers(db_path):
+    """Test that independent managers on one database refresh exactly once."""
+    calls = []
+    managers = [
+        TokenManager(
+            consumer_key="key",
+            consumer_secret="secret",
+            http_client=_slow_http_client(calls),
+            token_store=SQLiteTokenStore(db_path),
+        )
+        for _ in range(8)
+    ]
+    barrier = threading.Barrier(len(managers))
+    results = []
+
+    def worker(tm):
+        barrier.wait()
+        results.append(tm.get_token())
+
+    threads = [threading.Thread(target=worker, args=(tm,)) for tm in managers]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert len(calls) == 1
+    assert set(results) == {"token1"}
+
+
+def test_force_refresh_adopts_token_refreshed_elsewhere(db_path):
+    """Test that a forced refresh reuses a newer token another process stored."""
+    calls = []
+    first = TokenManager(
+        consumer_key="key",
+        consumer_secret="secret",
+        http_client=_slow_http_client(calls),
+        token_store=SQLiteTokenStore(db_path),
+    )
+    second = TokenManager(
+        consumer_key="key",
+        consumer_secret="secret",
+        http_client=_slow_http_client(calls),
+        token_store=SQLiteTokenStore(db_path),
+    )
+    assert first.get_token() == "token1"
+    assert second.get_token() == "token1"
+
+    assert first.get_token(force_refresh=True) == "token2"
+    assert second.get_token(force_refresh=True) == "token2"
+    assert len(calls) == 2
+
+
+def _worker_process(db_path, log_path, start):
+    class FileLoggingClient(HttpClient):
+        def post(self, url, json, headers):
+            raise NotImplementedError
+
+        def get(self, url, params=None, headers=None):
+            with open(log_path, "a") as log:
+                log.write("call\n")
+            time.sleep(0.1)
+            return {"access_token": "shared", "expires_in": 3600}
+
+    tm = TokenManager(
+        consumer_key="key",
+        consumer_secret="secret",
+        http_client=FileLoggingClient(),
+        token_store=SQLiteTokenStore(db_path),
+    )
+    start.wait()
+    assert tm.get_token() == "shared"
+
+
+@pytest.mark.skipif(
+    "fork" not in multiprocessing.get_all_start_methods(),
+    reason="requires the fork start method",
+)
+def test_sqlite_store_single_refresh_across_processes(db_path, tmp_path):
+    """Test that several worker processes sharing a database mint one token."""
+    log_path = str(tmp_path / "calls.log")
+    ctx = multiprocessing.get_context("fork")
+    start = ctx.Event()
+    processes = [
+        ctx.Process(target=_worker_process, args=(db_path, log_path, start))
+        for _ in range(4)
+    ]
+    for p in processes:
+        p.start()
+    start.set()
+    for p in processes:
+        p.join(timeout=10)
+
+    assert [p.exitcode for p in processes] == [0, 0, 0, 0]
+    with open(log_path) as log:
+        assert log.read().count("call") == 1
+
+
+@pytest.mark.asyncio
+async def test_async_manager_reads_through_store(db_path):
+    """Test that AsyncTokenManager adopts a token already present in the store."""
+    store = SQLiteTokenStore(db_path)
+    sync_calls = []
+    TokenManager(
+        consumer_key="key",
+        consumer_secret="secret",
+        http_client=_slow_http_client(sync_calls),
+        token_store=store,
+    ).get_token()
+
+    async_client = MagicMock(spec=AsyncHttpClient)
+    tm = AsyncTokenManager(
+        consumer_key="key",
+        consumer_secret="secret",
+        http_client=async_client,
+        token_store=store,
+    )
+
+    assert await tm.get_token() == "token1"
+    async_client.get.assert_not_called()
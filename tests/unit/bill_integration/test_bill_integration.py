@@ -7,7 +7,7 @@ invoicing, cancellation, and error cases.
 import pytest
 from unittest.mock import MagicMock
 from mpesakit.auth import TokenManager
-from mpesakit.http_client import HttpClient
+from mpesakit.http_client import HttpClient, MpesaHttpClient
 from mpesakit.bill_manager.bill_manager import BillManager
 from datetime import datetime
 from pydantic import ValidationError
@@ -168,6 +168,27 @@ def test_send_bulk_invoice_success(bill_manager, mock_http_client):
     response = bill_manager.send_bulk_invoice(request)
     assert isinstance(response, BillManagerBulkInvoiceResponse)
     assert response.Status_Message == response_data["Status_Message"]
+    body = mock_http_client.post.call_args.kwargs["json"]
+    assert body == request.model_dump(mode="json")
+
+
+def test_send_bulk_invoice_posts_encoded_body_to_bundled_client(mock_token_manager):
+    """Test that MpesaHttpClient gets the bulk invoices as pre-encoded JSON."""
+    http_client = MagicMock(spec=MpesaHttpClient)
+    http_client.post.return_value = {
+        "Status_Message": "Invoice sent successfully",
+        "resmsg": "Success",
+        "rescode": "200",
+    }
+    bill_manager = BillManager(
+        http_client=http_client, token_manager=mock_token_manager, app_key="key"
+    )
+    request = valid_bulk_invoice_request()
+
+    bill_manager.send_bulk_invoice(request)
+
+    body = http_client.post.call_args.kwargs["json"]
+    assert body == request.model_dump_json().encode()
 
 
 def test_cancel_single_invoice_success(bill_manager, mock_http_client):
@@ -4,9 +4,10 @@ import pytest
 from unittest.mock import MagicMock
 import warnings
 
-from mpesakit.auth import TokenManager
-from mpesakit.http_client import HttpClient
+from mpesakit.auth import AsyncTokenManager, TokenManager
+from mpesakit.http_client import AsyncHttpClient, HttpClient
 from mpesakit.c2b import (
+    AsyncC2B,
     C2B,
     C2BRegisterUrlRequest,
     C2BRegisterUrlResponse,
@@ -87,6 +88,34 @@ def test_register_url_handles_typo_field(c2b, mock_http_client):
     assert response.OriginatorConversationID == "typo123"
 
 
+@pytest.mark.asyncio
+async def test_async_register_url_handles_typo_field():
+    """Test that AsyncC2B awaits the HTTP client and handles the response typo."""
+    token_manager = MagicMock(spec=AsyncTokenManager)
+    token_manager.get_token.return_value = "test_token"
+    http_client = MagicMock(spec=AsyncHttpClient)
+    http_client.post.return_value = {
+        "ResponseDescription": "Success",
+        "OriginatorCoversationID": "typo123",
+        "ConversationID": "conv456",
+        "CustomerMessage": "URLs registered",
+        "ResponseCode": "0",
+    }
+    c2b = AsyncC2B(http_client=http_client, token_manager=token_manager)
+    request = C2BRegisterUrlRequest(
+        ShortCode=600997,
+        ResponseType="Completed",
+        ConfirmationURL="https://domainpath.com/c2b/confirmation",
+        ValidationURL="https://domainpath.com/c2b/validation",
+    )
+
+    response = await c2b.register_url(request)
+
+    assert response.OriginatorConversationID == "typo123"
+    token_manager.get_token.assert_awaited_once()
+    http_client.post.assert_awaited_once()
+
+
 def test_register_url_handles_http_error(c2b, mock_http_client):
     """Test that the C2B URL registration handles HTTP errors gracefully."""
     request = C2BRegisterUrlRequest(
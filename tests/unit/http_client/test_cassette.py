@@ -0,0 +1,183 @@
+"""Unit tests for the record/replay cassette HTTP clients."""
+
+import json
+import time
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from mpesakit.auth import TokenManager
+from mpesakit.errors import MpesaApiException, MpesaError
+from mpesakit.http_client import (
+    AsyncCassetteHttpClient,
+    AsyncHttpClient,
+    Cassette,
+    CassetteHttpClient,
+    HttpClient,
+)
+
+STK_PUSH = "/mpesa/stkpush/v1/processrequest"
+QUERY = "/mpesa/stkpushquery/v1/query"
+
+
+def _stk_payload(timestamp="20260101120000", amount=10):
+    return {
+        "BusinessShortCode": 174379,
+        "Password": "c2VjcmV0",
+        "Timestamp": timestamp,
+        "Amount": amount,
+        "PhoneNumber": 254712345678,
+    }
+
+
+def _recorder(tmp_path, **responses):
+    inner = MagicMock(spec=HttpClient)
+    inner.post.side_effect = lambda url, json, headers: responses[url]
+    return CassetteHttpClient(tmp_path / "stk.ndjson", http_client=inner), inner
+
+
+def test_record_writes_one_line_per_interaction_without_secrets(tmp_path):
+    """Test that recording forwards requests and writes them without secrets."""
+    client, inner = _recorder(tmp_path, **{STK_PUSH: {"ResponseCode": "0"}})
+    assert client.recording
+
+    response = client.post(STK_PUSH, json=_stk_payload(), headers={"A": "1"})
+
+    assert response == {"ResponseCode": "0"}
+    inner.post.assert_called_once_with(STK_PUSH, _stk_payload(), {"A": "1"})
+    lines = (tmp_path / "stk.ndjson").read_text().splitlines()
+    assert len(lines) == 1
+    recorded = json.loads(lines[0])
+    assert recorded["url"] == STK_PUSH
+    assert recorded["response"] == {"ResponseCode": "0"}
+    assert "Password" not in recorded["payload"]
+    assert "Timestamp" not in recorded["payload"]
+    assert recorded["latency"] >= 0
+
+
+def test_recorded_file_contains_no_secrets(tmp_path):
+    """Test that tokens, passkeys and credentials never reach the cassette file."""
+    inner = MagicMock(spec=HttpClient)
+    inner.get.return_value = {"access_token": "LIVE_BEARER", "expires_in": "3599"}
+    inner.post.return_value = {"ResponseCode": "0"}
+    client = CassetteHttpClient(tmp_path / "flow.ndjson", http_client=inner)
+    token_manager = TokenManager(
+        consumer_key="key", consumer_secret="secret", http_client=client
+    )
+    assert token_manager.get_token() == "LIVE_BEARER"
+    payload = {
+        **_stk_payload(),
+        "Passkey": "SECRETPASSKEY",
+        "Initiator": "API_OPERATOR",
+        "SecurityCredential": "ENCRYPTEDCREDENTIAL",
+    }
+    client.post(STK_PUSH, json=payload, headers={"Authorization": "Bearer LIVE_BEARER"})
+
+    recorded = (tmp_path / "flow.ndjson").read_text()
+    for secret in (
+        "LIVE_BEARER",
+        "SECRETPASSKEY",
+        "API_OPERATOR",
+        "ENCRYPTEDCREDENTIAL",
+        "c2VjcmV0",
+    ):
+        assert secret not in recorded
+
+    replay = CassetteHttpClient(tmp_path / "flow.ndjson", speed=None)
+    token_manager = TokenManager(
+        consumer_key="key", consumer_secret="secret", http_client=replay
+    )
+    assert token_manager.get_token() == "REDACTED"
+    assert replay.post(STK_PUSH, json=payload, headers={}) == {"ResponseCode": "0"}
+
+
+def test_replay_matches_on_path_and_normalized_payload(tmp_path):
+    """Test that replay ignores volatile fields and key order but not values."""
+    client, _ = _recorder(tmp_path, **{STK_PUSH: {"ResponseCode": "0"}})
+    client.post(STK_PUSH, json=_stk_payload(), headers={})
+
+    replay = CassetteHttpClient(tmp_path / "stk.ndjson")
+    assert not replay.recording
+    payload = dict(reversed(_stk_payload(timestamp="20270101000000").items()))
+    assert replay.post(STK_PUSH, json=payload, headers={}) == {"ResponseCode": "0"}
+    assert replay.post(STK_PUSH, json=json.dumps(payload).encode(), headers={}) == {
+        "ResponseCode": "0"
+    }
+
+    with pytest.raises(MpesaApiException) as excinfo:
+        replay.post(STK_PUSH, json=_stk_payload(amount=11), headers={})
+    assert excinfo.value.error_code == "CASSETTE_MISS"
+    with pytest.raises(MpesaApiException):
+        replay.post(QUERY, json=_stk_payload(), headers={})
+
+
+def test_recorded_errors_are_raised_again(tmp_path):
+    """Test that a recorded error is replayed as the same exception."""
+    inner = MagicMock(spec=HttpClient)
+    inner.get.side_effect = MpesaApiException(
+        MpesaError(error_code="HTTP_404", error_message="Not Found", status_code=404)
+    )
+    client = CassetteHttpClient(tmp_path / "c.ndjson", http_client=inner)
+    with pytest.raises(MpesaApiException):
+        client.get("/missing", params={"id": 1})
+
+    replay = CassetteHttpClient(tmp_path / "c.ndjson")
+    with pytest.raises(MpesaApiException) as excinfo:
+        replay.get("/missing", params={"id": 1})
+    assert excinfo.value.error_code == "HTTP_404"
+    assert excinfo.value.error.status_code == 404
+
+
+def test_repeated_requests_replay_in_recorded_order(tmp_path):
+    """Test that identical requests get their recorded responses in turn."""
+    inner = MagicMock(spec=HttpClient)
+    inner.post.side_effect = [{"ResultCode": "4999"}, {"ResultCode": "0"}]
+    client = CassetteHttpClient(tmp_path / "q.ndjson", http_client=inner)
+    for _ in range(2):
+        client.post(QUERY, json={"CheckoutRequestID": "ws_1"}, headers={})
+
+    cassette = Cassette(tmp_path / "q.ndjson")
+    assert len(cassette) == 2
+    replay = CassetteHttpClient(cassette)
+    codes = [
+        replay.post(QUERY, json={"CheckoutRequestID": "ws_1"}, headers={})[
+            "ResultCode"
+        ]
+        for _ in range(3)
+    ]
+    assert codes == ["4999", "0", "4999"]
+
+
+def test_replay_delay_follows_recorded_latency_and_speed(tmp_path):
+    """Test that replay waits latency divided by speed, or not at all."""
+    cassette = Cassette(tmp_path / "slow.ndjson")
+    cassette.record("GET", "/slow", None, latency=0.2, response={"ok": True})
+
+    started = time.monotonic()
+    CassetteHttpClient(cassette, speed=4.0).get("/slow")
+    assert 0.04 <= time.monotonic() - started < 0.15
+
+    started = time.monotonic()
+    CassetteHttpClient(cassette, speed=None).get("/slow")
+    assert time.monotonic() - started < 0.04
+
+
+@pytest.mark.asyncio
+async def test_async_record_and_replay(tmp_path):
+    """Test that the async client records and replays like the sync one."""
+    inner = MagicMock(spec=AsyncHttpClient)
+    inner.post = AsyncMock(return_value={"ResponseCode": "0"})
+    inner.aclose = AsyncMock()
+    async with AsyncCassetteHttpClient(
+        tmp_path / "a.ndjson", http_client=inner
+    ) as client:
+        await client.post(STK_PUSH, json=_stk_payload(), headers={})
+    inner.aclose.assert_awaited_once()
+
+    replay = AsyncCassetteHttpClient(tmp_path / "a.ndjson", speed=None)
+    assert await replay.post(STK_PUSH, json=_stk_payload(), headers={}) == {
+        "ResponseCode": "0"
+    }
+    with pytest.raises(MpesaApiException) as excinfo:
+        await replay.get(QUERY)
+    assert excinfo.value.error_code == "CASSETTE_MISS"
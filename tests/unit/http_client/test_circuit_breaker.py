@@ -0,0 +1,133 @@
+"""Unit tests for the per-endpoint circuit breakers of the M-Pesa HTTP clients."""
+
+import time
+
+import pytest
+import requests
+from unittest.mock import patch
+
+from mpesakit.errors import MpesaApiException, MpesaError
+from mpesakit.http_client import (
+    CircuitBreaker,
+    CircuitBreakerPolicy,
+    CircuitState,
+    MpesaHttpClient,
+    RetryPolicy,
+)
+
+
+def _error(code, status_code=None):
+    return MpesaApiException(MpesaError(error_code=code, status_code=status_code))
+
+
+def test_opens_after_consecutive_failures():
+    """Test that the breaker opens after failure_threshold consecutive failures."""
+    breaker = CircuitBreaker("/x", CircuitBreakerPolicy(failure_threshold=3))
+    for _ in range(2):
+        breaker.before_request()
+        breaker.record_failure()
+    assert breaker.state is CircuitState.CLOSED
+
+    breaker.record_failure()
+    assert breaker.state is CircuitState.OPEN
+    with pytest.raises(MpesaApiException) as excinfo:
+        breaker.before_request()
+    assert excinfo.value.error_code == "CIRCUIT_OPEN"
+
+
+def test_opens_on_failure_rate():
+    """Test that the breaker opens once the windowed failure rate crosses the threshold."""
+    breaker = CircuitBreaker(
+        "/x",
+        CircuitBreakerPolicy(
+            failure_threshold=None,
+            failure_rate_threshold=0.5,
+            window_size=4,
+            minimum_calls=4,
+        ),
+    )
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_success()
+    assert breaker.state is CircuitState.CLOSED
+    breaker.record_failure()
+    assert breaker.state is CircuitState.OPEN
+    assert breaker.stats().failure_rate == 0.5
+
+
+def test_business_errors_count_as_success():
+    """Test that non-outage errors such as HTTP 400 do not trip the breaker."""
+    breaker = CircuitBreaker("/x", CircuitBreakerPolicy(failure_threshold=1))
+    breaker.record_error(_error("HTTP_400", 400))
+    assert breaker.state is CircuitState.CLOSED
+    assert breaker.stats().window_calls == 1
+    breaker.record_error(_error("HTTP_503", 503))
+    assert breaker.state is CircuitState.OPEN
+
+
+def test_local_errors_are_not_recorded():
+    """Test that errors raised before a request was sent leave the breaker untouched."""
+    breaker = CircuitBreaker(
+        "/x", CircuitBreakerPolicy(failure_threshold=1, reset_timeout=0)
+    )
+    breaker.record_failure()
+    breaker.before_request()
+    breaker.record_error(_error("RATE_LIMITED"))
+    assert breaker.stats().window_calls == 1
+    breaker.before_request()  # the probe permission was returned
+
+
+def test_half_open_probe_recovers():
+    """Test that a successful probe after reset_timeout closes the breaker."""
+    breaker = CircuitBreaker(
+        "/x", CircuitBreakerPolicy(failure_threshold=1, reset_timeout=0.05)
+    )
+    breaker.record_failure()
+    time.sleep(0.06)
+
+    assert breaker.state is CircuitState.HALF_OPEN
+    breaker.before_request()
+    with pytest.raises(MpesaApiException):
+        breaker.before_request()  # only one probe at a time
+    breaker.record_success()
+    assert breaker.state is CircuitState.CLOSED
+    assert breaker.stats().consecutive_failures == 0
+
+
+def test_half_open_probe_failure_reopens():
+    """Test that a failed probe re-opens the breaker."""
+    breaker = CircuitBreaker(
+        "/x", CircuitBreakerPolicy(failure_threshold=1, reset_timeout=0.05)
+    )
+    breaker.record_failure()
+    time.sleep(0.06)
+    breaker.before_request()
+    breaker.record_failure()
+
+    assert breaker.state is CircuitState.OPEN
+    assert breaker.stats().times_opened == 2
+
+
+def test_client_fails_fast_while_open():
+    """Test that the HTTP client stops sending to an endpoint whose breaker is open."""
+    client = MpesaHttpClient(
+        retry_policy=RetryPolicy(max_attempts=1),
+        circuit_breaker_policy=CircuitBreakerPolicy(failure_threshold=2),
+    )
+    url = "/mpesa/b2c/v3/paymentrequest"
+    with patch.object(client._session, "post", side_effect=requests.Timeout()) as mock_post:
+        for _ in range(2):
+            with pytest.raises(MpesaApiException) as excinfo:
+                client.post(url, json={}, headers={})
+            assert excinfo.value.error_code == "REQUEST_TIMEOUT"
+
+        with pytest.raises(MpesaApiException) as excinfo:
+            client.post(url, json={}, headers={})
+        assert excinfo.value.error_code == "CIRCUIT_OPEN"
+        assert mock_post.call_count == 2
+
+    stats = client.circuit_breakers.stats()
+    assert stats[url].state is CircuitState.OPEN
+    assert client.circuit_breakers.get("/mpesa/stkpushquery/v1/query").state is (
+        CircuitState.CLOSED
+    )
@@ -0,0 +1,71 @@
+"""Unit tests for the pluggable JSON codecs of the M-Pesa HTTP clients."""
+
+import json
+
+import pytest
+from unittest.mock import Mock, patch
+
+from mpesakit.http_client import (
+    MpesaHttpClient,
+    MsgspecCodec,
+    OrjsonCodec,
+    StdlibJsonCodec,
+    default_codec,
+)
+
+BODY = {"Amount": 10, "Remarks": "Malipo ya ada", "Items": [1, 2]}
+
+
+@pytest.mark.parametrize(
+    "module, codec_class",
+    [("json", StdlibJsonCodec), ("orjson", OrjsonCodec), ("msgspec", MsgspecCodec)],
+)
+def test_codecs_round_trip(module, codec_class):
+    """Test that every installed codec encodes to bytes and decodes back."""
+    pytest.importorskip(module)
+    codec = codec_class()
+    encoded = codec.dumps(BODY)
+    assert isinstance(encoded, bytes)
+    assert json.loads(encoded) == BODY
+    assert codec.loads(encoded) == BODY
+    with pytest.raises(ValueError):
+        codec.loads(b"<html>Bad Gateway</html>")
+
+
+def test_default_codec_prefers_fast_implementations():
+    """Test that default_codec() picks orjson when installed and falls back to json."""
+    pytest.importorskip("orjson")
+    assert default_codec().name == "orjson"
+    with patch(
+        "mpesakit.http_client.codec.importlib.import_module", side_effect=ImportError
+    ):
+        assert isinstance(default_codec(), StdlibJsonCodec)
+
+
+def test_client_sends_pre_encoded_body_unchanged():
+    """Test that a bytes body is sent as-is and the response decoded by the codec."""
+    codec = Mock(wraps=StdlibJsonCodec())
+    client = MpesaHttpClient(codec=codec)
+    response = Mock(status_code=200, ok=True, content=b'{"ResponseCode": "0"}')
+    response.iter_content.return_value = [response.content]
+    body = b'{"invoices": []}'
+    with patch.object(client._session, "post", return_value=response) as mock_post:
+        assert client.post("/v1/billmanager-invoice/bulk-invoicing", body, {}) == {
+            "ResponseCode": "0"
+        }
+    assert mock_post.call_args.kwargs["data"] is body
+    assert mock_post.call_args.kwargs["headers"]["Content-Type"] == "application/json"
+    codec.dumps.assert_not_called()
+    codec.loads.assert_called_once_with(response.content)
+
+
+def test_client_encodes_dict_body_with_codec():
+    """Test that a dict body is encoded with the client's codec."""
+    client = MpesaHttpClient(codec=StdlibJsonCodec())
+    response = Mock(status_code=200, ok=True, content=b"{}")
+    response.iter_content.return_value = [response.content]
+    with patch.object(client._session, "post", return_value=response) as mock_post:
+        client.post("/mpesa/b2c/v3/paymentrequest", BODY, {"Authorization": "Bearer t"})
+    kwargs = mock_post.call_args.kwargs
+    assert json.loads(kwargs["data"]) == BODY
+    assert kwargs["headers"]["Authorization"] == "Bearer t"
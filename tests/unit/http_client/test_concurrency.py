@@ -0,0 +1,254 @@
+"""Unit tests for the adaptive concurrency limiters of the M-Pesa HTTP clients."""
+
+import asyncio
+import threading
+import time
+
+import httpx
+import pytest
+import requests
+from unittest.mock import AsyncMock, patch
+
+from mpesakit.auth import AsyncTokenManager, TokenManager
+from mpesakit.errors import MpesaApiException, MpesaError
+from mpesakit.http_client import (
+    AIMDPolicy,
+    AsyncConcurrencyLimiter,
+    ConcurrencyLimiter,
+    MpesaAsyncHttpClient,
+    MpesaHttpClient,
+    RetryPolicy,
+)
+from mpesakit.testing import MockDarajaServer
+
+QUERY = "/mpesa/stkpushquery/v1/query"
+
+
+def _error(code, status_code=None):
+    return MpesaApiException(MpesaError(error_code=code, status_code=status_code))
+
+
+def test_limit_grows_while_healthy():
+    """Test that healthy requests raise the limit additively."""
+    limiter = ConcurrencyLimiter(AIMDPolicy(initial_limit=4))
+    for _ in range(8):
+        limiter.release(limiter.acquire())
+    assert limiter.limit == 5
+    assert limiter.stats().p99_latency is not None
+
+
+def test_limit_shrinks_on_overload():
+    """Test that timeouts and 5xx responses cut the limit multiplicatively."""
+    limiter = ConcurrencyLimiter(AIMDPolicy(initial_limit=16))
+    limiter.release(limiter.acquire(), _error("HTTP_503", 503))
+    assert limiter.limit == 8
+    limiter.release(limiter.acquire(), _error("REQUEST_TIMEOUT"))
+    assert limiter.limit == 4
+    assert limiter.stats().error_rate == 1.0
+
+
+def test_burst_of_failures_cuts_limit_once():
+    """Test that requests in flight when the limit was cut do not cut it again."""
+    limiter = ConcurrencyLimiter(AIMDPolicy(initial_limit=8))
+    permits = [limiter.acquire() for _ in range(4)]
+    for permit in permits:
+        limiter.release(permit, _error("HTTP_429", 429))
+    assert limiter.limit == 4
+
+
+def test_limit_stays_within_bounds():
+    """Test that the limit never leaves [min_limit, max_limit]."""
+    policy = AIMDPolicy(initial_limit=2, min_limit=2, max_limit=3, increase=10)
+    shrinking = ConcurrencyLimiter(policy)
+    shrinking.release(shrinking.acquire(), _error("HTTP_500", 500))
+    assert shrinking.limit == 2
+
+    growing = ConcurrencyLimiter(policy)
+    for _ in range(5):
+        growing.release(growing.acquire())
+    assert growing.limit == 3
+
+
+def test_slow_requests_stop_growth():
+    """Test that the limit does not grow while p99 latency is over target."""
+    limiter = ConcurrencyLimiter(AIMDPolicy(initial_limit=1, latency_target=0.01))
+    permit = limiter.acquire()
+    time.sleep(0.02)
+    limiter.release(permit)
+    limiter.release(limiter.acquire())
+    assert limiter.limit == 1
+
+
+def test_business_and_local_errors_do_not_shrink_limit():
+    """Test that only overload errors count against the limit."""
+    limiter = ConcurrencyLimiter(AIMDPolicy(initial_limit=4))
+    limiter.release(limiter.acquire(), _error("HTTP_400", 400))
+    limiter.release(limiter.acquire(), _error("CONNECTION_ERROR"))
+    stats = limiter.stats()
+    assert stats.limit == 4
+    assert stats.in_flight == 0
+    assert stats.error_rate == 0.0
+
+
+def test_acquire_times_out_when_full():
+    """Test that a request waiting longer than max_wait fails with CONCURRENCY_LIMITED."""
+    limiter = ConcurrencyLimiter(AIMDPolicy(initial_limit=1), max_wait=0.05)
+    limiter.acquire()
+    with pytest.raises(MpesaApiException) as excinfo:
+        limiter.acquire()
+    assert excinfo.value.error_code == "CONCURRENCY_LIMITED"
+    assert limiter.stats().queued == 0
+
+
+def test_acquire_gives_up_at_deadline():
+    """Test that a request waits for a slot no longer than its deadline."""
+    limiter = ConcurrencyLimiter(AIMDPolicy(initial_limit=1))
+    limiter.acquire()
+    started = time.monotonic()
+    with pytest.raises(MpesaApiException) as excinfo:
+        limiter.acquire(deadline=started + 0.05)
+    assert excinfo.value.error_code == "CONCURRENCY_LIMITED"
+    assert time.monotonic() - started < 1
+
+
+def test_threads_never_exceed_limit():
+    """Test that concurrent threads queue instead of exceeding the limit."""
+    limiter = ConcurrencyLimiter(AIMDPolicy(initial_limit=3, max_limit=3))
+    lock = threading.Lock()
+    active = []
+    peak = []
+
+    def worker():
+        permit = limiter.acquire()
+        with lock:
+            active.append(1)
+            peak.append(len(active))
+        time.sleep(0.01)
+        with lock:
+            active.pop()
+        limiter.release(permit)
+
+    threads = [threading.Thread(target=worker) for _ in range(12)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert max(peak) == 3
+    assert limiter.stats().in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_async_limiter_queues_waiters():
+    """Test that async requests over the limit wait and report as queued."""
+    limiter = AsyncConcurrencyLimiter(AIMDPolicy(initial_limit=1))
+    permit = await limiter.acquire()
+    waiter = asyncio.create_task(limiter.acquire())
+    await asyncio.sleep(0)
+    assert limiter.stats().queued == 1
+    assert not waiter.done()
+
+    limiter.release(permit)
+    limiter.release(await waiter)
+    assert limiter.stats().in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_async_limiter_times_out():
+    """Test that the async limiter honours max_wait."""
+    limiter = AsyncConcurrencyLimiter(AIMDPolicy(initial_limit=1), max_wait=0.01)
+    await limiter.acquire()
+    with pytest.raises(MpesaApiException) as excinfo:
+        await limiter.acquire()
+    assert excinfo.value.error_code == "CONCURRENCY_LIMITED"
+    assert limiter.stats().queued == 0
+
+
+@pytest.mark.asyncio
+async def test_async_acquire_gives_up_at_deadline():
+    """Test that the async limiter honours the deadline."""
+    limiter = AsyncConcurrencyLimiter(AIMDPolicy(initial_limit=1))
+    await limiter.acquire()
+    with pytest.raises(MpesaApiException) as excinfo:
+        await limiter.acquire(deadline=time.monotonic() + 0.01)
+    assert excinfo.value.error_code == "CONCURRENCY_LIMITED"
+
+
+def test_http_client_feeds_outcomes_to_limiter():
+    """Test that MpesaHttpClient releases its permits with each request's outcome."""
+    limiter = ConcurrencyLimiter(AIMDPolicy(initial_limit=8))
+    client = MpesaHttpClient(
+        retry_policy=RetryPolicy(max_attempts=1), concurrency_limiter=limiter
+    )
+    with patch.object(client._session, "post", side_effect=requests.Timeout()):
+        with pytest.raises(MpesaApiException):
+            client.post("/mpesa/b2c/v3/paymentrequest", json={}, headers={})
+    assert limiter.limit == 4
+    assert limiter.stats().in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_async_http_client_feeds_outcomes_to_limiter():
+    """Test that MpesaAsyncHttpClient acquires and releases its permits."""
+    limiter = AsyncConcurrencyLimiter(AIMDPolicy(initial_limit=1))
+    with patch("mpesakit.http_client.mpesa_async_http_client.httpx.AsyncClient"):
+        client = MpesaAsyncHttpClient(concurrency_limiter=limiter)
+    response = httpx.Response(200, json={"ResponseCode": "0"})
+    with patch.object(
+        client._client, "send", new_callable=AsyncMock, return_value=response
+    ):
+        await asyncio.gather(
+            *(
+                client.post("/mpesa/b2c/v3/paymentrequest", json={}, headers={})
+                for _ in range(3)
+            )
+        )
+    stats = limiter.stats()
+    assert stats.in_flight == 0
+    assert stats.limit == 2  # 1 -> 2 -> 2.5 -> 2.9
+
+
+def test_token_refresh_does_not_wait_for_the_permit_of_its_request():
+    """Test that a request rejected for a revoked token refreshes it at limit 1."""
+    limiter = ConcurrencyLimiter(AIMDPolicy(initial_limit=1, max_limit=1))
+    results = []
+    with MockDarajaServer() as server:
+        client = MpesaHttpClient(base_url=server.url, concurrency_limiter=limiter)
+        token_manager = TokenManager(
+            consumer_key="key", consumer_secret="secret", http_client=client
+        )
+        headers = {"Authorization": f"Bearer {token_manager.get_token()}"}
+        server._tokens.clear()
+
+        thread = threading.Thread(
+            target=lambda: results.append(client.post(QUERY, json={}, headers=headers)),
+            daemon=True,
+        )
+        thread.start()
+        thread.join(timeout=5)
+        client.close()
+
+    assert not thread.is_alive()
+    assert results[0]["ResponseCode"] == 0
+    assert limiter.stats().in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_async_token_refresh_does_not_wait_for_the_permit_of_its_request():
+    """Test that the async client refreshes a revoked token at limit 1."""
+    limiter = AsyncConcurrencyLimiter(AIMDPolicy(initial_limit=1, max_limit=1))
+    with MockDarajaServer() as server:
+        client = MpesaAsyncHttpClient(base_url=server.url, concurrency_limiter=limiter)
+        token_manager = AsyncTokenManager(
+            consumer_key="key", consumer_secret="secret", http_client=client
+        )
+        headers = {"Authorization": f"Bearer {await token_manager.get_token()}"}
+        server._tokens.clear()
+
+        result = await asyncio.wait_for(
+            client.post(QUERY, json={}, headers=headers), timeout=5
+        )
+        await client.aclose()
+
+    assert result["ResponseCode"] == 0
+    assert limiter.stats().in_flight == 0
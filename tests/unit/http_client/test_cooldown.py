@@ -0,0 +1,131 @@
+"""Unit tests for the shared back-off after throttling responses."""
+
+import json
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from unittest.mock import AsyncMock, Mock, patch
+
+import httpx
+import pytest
+
+from mpesakit.errors import MpesaApiException
+from mpesakit.http_client import (
+    CooldownPolicy,
+    Cooldowns,
+    MpesaAsyncHttpClient,
+    MpesaHttpClient,
+    RetryPolicy,
+    request_deadline,
+)
+from mpesakit.http_client.cooldown import parse_retry_after
+
+QUERY = "/mpesa/stkpushquery/v1/query"
+
+
+def _response(status_code, body, headers=None):
+    response = Mock(status_code=status_code, ok=status_code < 400)
+    response.is_success = status_code < 400
+    response.headers = headers or {}
+    response.content = json.dumps(body).encode()
+    response.iter_content.return_value = [response.content]
+    return response
+
+
+def test_parse_retry_after_seconds_and_date():
+    """Test that both Retry-After formats are understood."""
+    assert parse_retry_after("3") == 3.0
+    assert parse_retry_after(" 1.5 ") == 1.5
+    assert parse_retry_after("-2") == 0.0
+    when = datetime.now(timezone.utc) + timedelta(seconds=30)
+    assert 28 <= parse_retry_after(format_datetime(when, usegmt=True)) <= 30
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("soon") is None
+
+
+def test_policy_detects_throttling_responses():
+    """Test which responses start a cool-down and for how long."""
+    policy = CooldownPolicy(default_delay=2, max_delay=10)
+    assert policy.delay_for(429, {}) == 2
+    assert policy.delay_for(429, {}, "5") == 5
+    assert policy.delay_for(503, {}, "60") == 10
+    assert policy.delay_for(503, {}) is None
+    assert policy.delay_for(500, {"errorCode": "500.003.02"}) == 2
+    assert policy.delay_for(500, {"errorCode": "500.001.1001"}) is None
+    assert policy.delay_for(400, {}, "5") is None
+
+
+def test_cooldowns_keep_the_longest_and_expire():
+    """Test that a shorter cool-down does not cut a longer one short."""
+    cooldowns = Cooldowns()
+    cooldowns.record("/a", 0.05)
+    cooldowns.record("/a", 0.01)
+    assert 0.03 < cooldowns.remaining("/a") <= 0.05
+    assert cooldowns.remaining("/b") == 0.0
+    assert set(cooldowns.stats()) == {"/a"}
+    time.sleep(0.06)
+    assert cooldowns.remaining("/a") == 0.0
+    assert cooldowns.stats() == {}
+
+
+def test_throttled_endpoint_is_backed_off_by_every_thread():
+    """Test that one 429 makes all threads wait before sending to that endpoint."""
+    client = MpesaHttpClient(retry_policy=RetryPolicy(max_attempts=1))
+    sent_at = []
+
+    def post(*args, **kwargs):
+        sent_at.append(time.monotonic())
+        if len(sent_at) == 1:
+            return _response(429, {"errorMessage": "Too Many"}, {"Retry-After": "0.2"})
+        return _response(200, {"ok": True})
+
+    with patch.object(client._session, "post", side_effect=post):
+        with pytest.raises(MpesaApiException) as excinfo:
+            client.post(QUERY, json={}, headers={})
+        assert excinfo.value.error_code == "HTTP_429"
+        throttled_at = sent_at[0]
+        client.post("/other", json={}, headers={})
+
+        threads = [
+            threading.Thread(target=client.post, args=(QUERY, {}, {}))
+            for _ in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    assert sent_at[1] - throttled_at < 0.19
+    assert len(sent_at) == 6
+    assert all(t - throttled_at >= 0.19 for t in sent_at[2:])
+
+
+def test_cooldown_longer_than_deadline_abandons_request():
+    """Test that a request is not held past its deadline by a cool-down."""
+    client = MpesaHttpClient()
+    client.cooldowns.record(QUERY, 30)
+    with patch.object(client._session, "post") as post:
+        with request_deadline(timeout=1):
+            with pytest.raises(MpesaApiException) as excinfo:
+                client.post(QUERY, json={}, headers={})
+    assert excinfo.value.error_code == "DEADLINE_EXCEEDED"
+    post.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_async_client_waits_out_cooldown():
+    """Test that the async client records and honours cool-downs."""
+    client = MpesaAsyncHttpClient(retry_policy=RetryPolicy(max_attempts=1))
+    with patch.object(client._client, "send", new_callable=AsyncMock) as send:
+        send.side_effect = [
+            httpx.Response(429, json={}, headers={"Retry-After": "0.1"}),
+            httpx.Response(200, json={"ok": True}),
+        ]
+        with pytest.raises(MpesaApiException):
+            await client.post(QUERY, json={}, headers={})
+        assert client.cooldowns.remaining(QUERY) > 0
+        started = time.monotonic()
+        assert await client.post(QUERY, json={}, headers={}) == {"ok": True}
+    assert time.monotonic() - started >= 0.05
+    await client.aclose()
@@ -0,0 +1,183 @@
+"""Multiprocess tests of clients created before os.fork(), as with gunicorn --preload."""
+
+import asyncio
+import multiprocessing
+import os
+import threading
+
+import pytest
+
+from mpesakit import MpesaClient
+from mpesakit.http_client import (
+    AIMDPolicy,
+    ConcurrencyLimiter,
+    Hedger,
+    MpesaAsyncHttpClient,
+    MpesaHttpClient,
+    SingleFlight,
+)
+from mpesakit.testing import MockDarajaServer
+
+pytestmark = pytest.mark.skipif(
+    not hasattr(os, "register_at_fork"), reason="requires os.fork()"
+)
+
+OAUTH = "/oauth/v1/generate"
+
+
+def _run_forked(target, *args):
+    """Runs target in a forked child and returns what it put on the queue."""
+    context = multiprocessing.get_context("fork")
+    results = context.Queue()
+    child = context.Process(target=target, args=(results, *args))
+    child.start()
+    child.join(timeout=20)
+    if child.is_alive():
+        child.kill()
+        pytest.fail("forked child hung")
+    assert child.exitcode == 0
+    return results.get(timeout=1)
+
+
+def _query(client):
+    return client.stk_query(
+        business_short_code=174379, checkout_request_id="ws_CO_1", passkey="passkey"
+    ).CheckoutRequestID
+
+
+def _use_preloaded_client(results, client, parent_session):
+    results.put(
+        (
+            client.http_client._session is not parent_session,
+            _query(client),
+            _query(client),
+        )
+    )
+
+
+def test_forked_workers_get_own_pool_and_keep_token():
+    """Test that each child rebuilds the pool but reuses the parent's token."""
+    with MockDarajaServer() as server:
+        client = MpesaClient(
+            "key", "secret", http_client=MpesaHttpClient(base_url=server.url)
+        )
+        _query(client)
+        parent_session = client.http_client._session
+
+        for _ in range(2):
+            new_pool, *queried = _run_forked(
+                _use_preloaded_client, client, parent_session
+            )
+            assert new_pool
+            assert queried == ["ws_CO_1", "ws_CO_1"]
+
+        assert _query(client) == "ws_CO_1"
+        assert client.http_client._session is parent_session
+        assert server.stats()["requests"][OAUTH] == 1
+
+
+def _refresh_while_parent_held_locks(results, client, hedger):
+    token = client.token_manager.get_token(force_refresh=True)
+    results.put((token, hedger.call("/x", lambda: "hedged")))
+
+
+def test_locks_held_by_parent_threads_do_not_block_children():
+    """Test that a child can refresh while a parent thread held the refresh locks."""
+    with MockDarajaServer() as server:
+        client = MpesaClient(
+            "key", "secret", http_client=MpesaHttpClient(base_url=server.url)
+        )
+        old_token = client.token_manager.get_token()
+        hedger = Hedger()
+        hedger.call("/x", lambda: "warm")
+
+        manager = client.token_manager
+        key = next(iter(manager.token_store._tokens))
+        held, release = threading.Event(), threading.Event()
+
+        def hold_locks():
+            with manager._refresh_lock, manager.token_store.lock(key):
+                held.set()
+                release.wait()
+
+        holder = threading.Thread(target=hold_locks)
+        holder.start()
+        held.wait()
+        try:
+            new_token, hedged = _run_forked(
+                _refresh_while_parent_held_locks, client, hedger
+            )
+        finally:
+            release.set()
+            holder.join()
+
+    assert new_token != old_token
+    assert hedged == "hedged"
+
+
+def _query_while_parent_held_call_and_permit(results, client, key):
+    single_flight = client.http_client.single_flight
+    results.put((single_flight.do(key, lambda: "child"), _query(client)))
+
+
+def test_calls_and_permits_held_by_parent_threads_are_freed_in_children():
+    """Test that a child neither joins a parent's coalesced call nor lacks its permit."""
+    with MockDarajaServer() as server:
+        limiter = ConcurrencyLimiter(AIMDPolicy(initial_limit=1, max_limit=1))
+        single_flight = SingleFlight()
+        client = MpesaClient(
+            "key",
+            "secret",
+            http_client=MpesaHttpClient(
+                base_url=server.url,
+                concurrency_limiter=limiter,
+                single_flight=single_flight,
+            ),
+        )
+        client.token_manager.get_token()
+        held, release = threading.Event(), threading.Event()
+
+        def send_slowly():
+            permit = limiter.acquire()
+            held.set()
+            release.wait()
+            limiter.release(permit)
+            return "parent"
+
+        holder = threading.Thread(target=single_flight.do, args=("query", send_slowly))
+        holder.start()
+        held.wait()
+        try:
+            from_child = _run_forked(
+                _query_while_parent_held_call_and_permit, client, "query"
+            )
+        finally:
+            release.set()
+            holder.join()
+
+    assert from_child == ("child", "ws_CO_1")
+    assert limiter.stats().in_flight == 0
+
+
+def _check_async_client(results, client, parent_clients):
+    results.put((client._clients is not parent_clients, client._clients.clients()))
+
+
+def test_async_client_rebuilt_in_child():
+    """Test that the async client's httpx clients are replaced after a fork."""
+    client = MpesaAsyncHttpClient()
+
+    async def use_client():
+        return client._client
+
+    loop = asyncio.new_event_loop()
+    try:
+        loop.run_until_complete(use_client())
+        assert len(client._clients.clients()) == 1
+        new_registry, inherited = _run_forked(
+            _check_async_client, client, client._clients
+        )
+    finally:
+        loop.close()
+    assert new_registry
+    assert inherited == []
@@ -0,0 +1,197 @@
+"""Unit tests for hedged read-only requests of the M-Pesa HTTP clients."""
+
+import asyncio
+import json
+import threading
+import time
+
+import httpx
+import pytest
+from pydantic import ValidationError
+from unittest.mock import AsyncMock, Mock, patch
+
+from mpesakit.errors import MpesaApiException, MpesaError
+from mpesakit.http_client import (
+    AsyncHedger,
+    Hedger,
+    HedgePolicy,
+    MpesaAsyncHttpClient,
+    MpesaHttpClient,
+)
+
+QUERY = "/mpesa/stkpushquery/v1/query"
+
+# Hedge after 10ms with budget for every request, so tests need no warm-up.
+FAST = HedgePolicy(initial_delay=0.01, min_delay=0, budget=1.0)
+
+
+def test_money_moving_paths_cannot_be_hedged():
+    """Test that a policy hedging a payment endpoint is rejected."""
+    with pytest.raises(ValidationError):
+        HedgePolicy(hedgeable_paths=frozenset({"/mpesa/b2c/v3/paymentrequest"}))
+    assert not Hedger(FAST).applies_to("/mpesa/stkpush/v1/processrequest")
+    assert Hedger(FAST).applies_to(QUERY)
+
+
+def test_fast_request_is_not_hedged():
+    """Test that a request answered before the delay is sent only once."""
+    hedger = Hedger(FAST)
+    attempt = Mock(return_value="ok")
+    assert hedger.call(QUERY, attempt) == "ok"
+    attempt.assert_called_once()
+    assert hedger.stats().hedges == 0
+
+
+def test_slow_request_is_hedged_and_hedge_wins():
+    """Test that a hedge answering first is used without waiting for the original."""
+    hedger = Hedger(FAST)
+    release = threading.Event()
+    threads = []
+
+    def attempt():
+        threads.append(threading.current_thread().name)
+        if len(threads) == 1:
+            release.wait(2)
+            return "slow"
+        return "fast"
+
+    start = time.monotonic()
+    assert hedger.call(QUERY, attempt) == "fast"
+    assert time.monotonic() - start < 0.5
+    release.set()
+    assert threads[0].startswith("mpesakit-hedged")
+    assert threads[1].startswith("mpesakit-hedge_")
+    stats = hedger.stats()
+    assert (stats.requests, stats.hedges, stats.hedge_wins) == (1, 1, 1)
+
+
+def test_hedge_answers_for_a_failed_original():
+    """Test that the hedge's response is used when the original request fails."""
+    hedger = Hedger(FAST)
+    calls = []
+
+    def attempt():
+        calls.append(1)
+        if len(calls) == 1:
+            time.sleep(0.05)
+            raise MpesaApiException(MpesaError(error_code="HTTP_503", status_code=503))
+        time.sleep(0.1)
+        return "hedge"
+
+    assert hedger.call(QUERY, attempt) == "hedge"
+    assert hedger.stats().hedge_wins == 1
+
+
+def test_original_error_is_raised_when_every_copy_fails():
+    """Test that the caller gets the original request's error."""
+    hedger = Hedger(FAST)
+    calls = []
+
+    def attempt():
+        calls.append(1)
+        error_code = f"HTTP_50{len(calls)}"
+        time.sleep(0.03)
+        raise MpesaApiException(MpesaError(error_code=error_code, status_code=503))
+
+    with pytest.raises(MpesaApiException) as excinfo:
+        hedger.call(QUERY, attempt)
+    assert excinfo.value.error_code == "HTTP_501"
+    assert len(calls) == 2
+
+
+def test_failed_copy_waits_for_the_other():
+    """Test that an error from one copy does not hide the other's success."""
+    hedger = Hedger(FAST)
+    calls = []
+
+    def attempt():
+        calls.append(1)
+        if len(calls) == 1:
+            time.sleep(0.05)
+            return "original"
+        raise MpesaApiException(MpesaError(error_code="HTTP_503", status_code=503))
+
+    assert hedger.call(QUERY, attempt) == "original"
+    assert hedger.stats().hedge_wins == 0
+
+
+def test_budget_limits_hedges():
+    """Test that hedges stay within the configured share of requests."""
+    hedger = Hedger(HedgePolicy(initial_delay=0.01, min_delay=0, budget=0.5))
+
+    def attempt():
+        time.sleep(0.02)
+        return "ok"
+
+    for _ in range(4):
+        hedger.call(QUERY, attempt)
+    stats = hedger.stats()
+    assert stats.hedges == 2
+    assert stats.budget_exhausted == 2
+
+
+def test_delay_follows_latency_percentile():
+    """Test that the hedge delay moves from initial_delay to the observed percentile."""
+    hedger = Hedger(HedgePolicy(min_samples=2, delay_percentile=0.5, min_delay=0))
+    assert hedger.delay_for(QUERY) == 1.0
+    hedger.call(QUERY, lambda: None)
+    hedger.call(QUERY, lambda: None)
+    assert hedger.delay_for(QUERY) < 0.5
+
+
+def test_http_client_hedges_query_but_not_payment():
+    """Test that MpesaHttpClient hedges only read-only paths."""
+    hedger = Hedger(FAST)
+    client = MpesaHttpClient(hedger=hedger)
+    response = Mock(status_code=200, ok=True)
+    response.content = json.dumps({"ResponseCode": "0"}).encode()
+    response.iter_content.return_value = [response.content]
+
+    def slow_post(*args, **kwargs):
+        time.sleep(0.05)
+        return response
+
+    with patch.object(client._session, "post", side_effect=slow_post) as mock_post:
+        client.post(QUERY, json={}, headers={})
+        assert mock_post.call_count == 2
+        client.post("/mpesa/b2c/v3/paymentrequest", json={}, headers={})
+        assert mock_post.call_count == 3
+    assert hedger.stats().requests == 1
+
+
+@pytest.mark.asyncio
+async def test_async_hedge_cancels_loser():
+    """Test that the async hedger cancels the copy that lost the race."""
+    hedger = AsyncHedger(FAST)
+    cancelled = asyncio.Event()
+    calls = []
+
+    async def attempt():
+        calls.append(1)
+        if len(calls) == 1:
+            try:
+                await asyncio.sleep(5)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+        return "fast"
+
+    assert await hedger.call(QUERY, attempt) == "fast"
+    await asyncio.wait_for(cancelled.wait(), 1)
+    assert hedger.stats().hedge_wins == 1
+
+
+@pytest.mark.asyncio
+async def test_async_http_client_hedges_slow_query():
+    """Test that MpesaAsyncHttpClient sends a second copy of a slow query."""
+    with patch("mpesakit.http_client.mpesa_async_http_client.httpx.AsyncClient"):
+        client = MpesaAsyncHttpClient(hedger=AsyncHedger(FAST))
+    delays = [1.0, 0.0]
+
+    async def send(*args, **kwargs):
+        await asyncio.sleep(delays.pop(0))
+        return httpx.Response(200, json={"ResponseCode": "0"})
+
+    with patch.object(client._client, "send", new=AsyncMock(side_effect=send)) as mock_send:
+        assert await client.post(QUERY, json={}, headers={}) == {"ResponseCode": "0"}
+    assert mock_send.await_count == 2
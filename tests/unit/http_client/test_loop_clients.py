@@ -0,0 +1,188 @@
+"""Unit tests for the per-event-loop httpx clients of MpesaAsyncHttpClient."""
+
+import asyncio
+import base64
+import threading
+
+import httpx
+import pytest
+
+from mpesakit.auth import AsyncTokenManager
+from mpesakit.http_client import (
+    AIMDPolicy,
+    AsyncConcurrencyLimiter,
+    AsyncSingleFlight,
+    LoopClientRegistry,
+    LoopLocal,
+    MpesaAsyncHttpClient,
+)
+from mpesakit.testing import MockDarajaServer
+
+OAUTH = "/oauth/v1/generate"
+QUERY = "/mpesa/stkpushquery/v1/query"
+BASIC = {"Authorization": "Basic " + base64.b64encode(b"key:secret").decode()}
+
+
+@pytest.fixture
+def registry():
+    """A registry creating plain httpx clients."""
+    return LoopClientRegistry(httpx.AsyncClient)
+
+
+def test_one_client_per_loop_closed_with_the_loop(registry):
+    """Test that each loop gets its own client, closed when asyncio.run() ends."""
+
+    async def get_twice():
+        first = registry.get()
+        assert registry.get() is first
+        return first
+
+    first = asyncio.run(get_twice())
+    second = asyncio.run(get_twice())
+
+    assert first is not second
+    assert first.is_closed and second.is_closed
+    assert registry.clients() == []
+
+
+def test_clients_of_loops_closed_without_shutdown_are_dropped(registry):
+    """Test that a loop closed without shutdown_asyncgens() does not leak its client."""
+    loop = asyncio.new_event_loop()
+
+    async def get():
+        return registry.get()
+
+    stale = loop.run_until_complete(get())
+    loop.close()
+    assert registry.clients() == [stale]
+
+    current = asyncio.run(get())
+    assert current is not stale
+    assert stale not in registry.clients()
+
+
+def test_aclose_closes_the_running_loops_client(registry):
+    """Test that aclose() closes the loop's client and a later get() replaces it."""
+
+    async def close_and_reopen():
+        first = registry.get()
+        await registry.aclose()
+        return first, registry.get()
+
+    first, second = asyncio.run(close_and_reopen())
+    assert first.is_closed
+    assert second is not first
+
+
+def test_get_needs_a_running_loop(registry):
+    """Test that no client is handed out outside an event loop."""
+    with pytest.raises(RuntimeError):
+        registry.get()
+
+
+def test_client_shared_by_asyncio_run_calls_and_threads():
+    """Test that one MpesaAsyncHttpClient serves many loops, reusing connections per loop."""
+    with MockDarajaServer() as server:
+        client = MpesaAsyncHttpClient(base_url=server.url)
+
+        async def task():
+            for _ in range(3):
+                await client.get(OAUTH, headers=BASIC)
+
+        asyncio.run(task())
+        asyncio.run(task())
+        threads = [threading.Thread(target=asyncio.run, args=(task(),)) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        stats = client.transport_stats()
+
+    assert stats["requests"] == {"2xx": 18}
+    assert stats["connections_opened"] == 6
+    assert stats["connections_reused"] == 12
+    assert stats["idle_connections"] == 0
+    assert client._clients.clients() == []
+
+
+def test_loop_local_values_are_per_loop():
+    """Test that each loop gets its own value, reused within the loop."""
+    local = LoopLocal(asyncio.Lock)
+
+    async def get_twice():
+        first = local.get()
+        assert local.get() is first
+        return first
+
+    assert asyncio.run(get_twice()) is not asyncio.run(get_twice())
+
+
+def _shared_client(server):
+    return MpesaAsyncHttpClient(
+        base_url=server.url,
+        concurrency_limiter=AsyncConcurrencyLimiter(
+            AIMDPolicy(initial_limit=1, max_limit=1)
+        ),
+        single_flight=AsyncSingleFlight(),
+    )
+
+
+async def _revoked_queries(server, token_manager, count=4):
+    """Revokes the current token, then sends count queries that refresh it."""
+    await token_manager.get_token()
+    server._tokens.clear()
+    headers = {"Authorization": f"Bearer {await token_manager.get_token()}"}
+    return await asyncio.gather(
+        *(
+            token_manager.http_client.post(
+                QUERY, json={"CheckoutRequestID": f"ws_{i}"}, headers=headers
+            )
+            for i in range(count)
+        )
+    )
+
+
+def test_token_refreshes_on_successive_asyncio_run_calls():
+    """Test that a client and token manager refresh a revoked token in each loop."""
+    with MockDarajaServer() as server:
+        client = _shared_client(server)
+        token_manager = AsyncTokenManager(
+            consumer_key="key", consumer_secret="secret", http_client=client
+        )
+        for _ in range(2):
+            results = asyncio.run(_revoked_queries(server, token_manager))
+            assert [r["ResponseCode"] for r in results] == [0] * 4
+        oauth_requests = server.stats()["requests"][OAUTH]
+
+    assert oauth_requests == 3
+    assert client.concurrency_limiter.stats().in_flight == 0
+
+
+def test_limit_and_token_shared_by_loops_in_threads():
+    """Test that loops in several threads share the limit and the token refreshes."""
+    with MockDarajaServer() as server:
+        client = _shared_client(server)
+        token_manager = AsyncTokenManager(
+            consumer_key="key", consumer_secret="secret", http_client=client
+        )
+        asyncio.run(token_manager.get_token())
+        headers = {"Authorization": f"Bearer {asyncio.run(token_manager.get_token())}"}
+        server._tokens.clear()
+        results = []
+
+        async def queries():
+            results.extend(
+                await asyncio.gather(
+                    *(client.post(QUERY, json={}, headers=headers) for _ in range(4))
+                )
+            )
+
+        threads = [threading.Thread(target=asyncio.run, args=(queries(),)) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=10)
+        stats = client.concurrency_limiter.stats()
+
+    assert [r["ResponseCode"] for r in results] == [0] * 16
+    assert stats.in_flight == 0 and stats.queued == 0
@@ -0,0 +1,157 @@
+"""Unit tests for the request middleware chain of the HTTP clients."""
+
+import json
+from unittest.mock import AsyncMock, Mock, patch
+
+import httpx
+import pytest
+import requests
+
+from mpesakit.http_client import (
+    AsyncMiddleware,
+    Middleware,
+    MpesaAsyncHttpClient,
+    MpesaHttpClient,
+    RateLimit,
+    RateLimiter,
+    Request,
+    RetryPolicy,
+)
+from mpesakit.http_client.middleware import (
+    RateLimitMiddleware,
+    RetryMiddleware,
+    TokenRefreshMiddleware,
+    chain,
+)
+
+QUERY = "/mpesa/stkpushquery/v1/query"
+
+
+def _response(status_code, body):
+    response = Mock(status_code=status_code, ok=status_code < 400)
+    response.is_success = status_code < 400
+    response.headers = {}
+    response.content = json.dumps(body).encode()
+    response.iter_content.return_value = [response.content]
+    return response
+
+
+class _Recorder(Middleware):
+    def __init__(self, name, log):
+        self.name = name
+        self.log = log
+
+    def __call__(self, request, call_next):
+        self.log.append(f"{self.name}>{request.method} {request.url}")
+        response = call_next(request)
+        self.log.append(f"{self.name}<{sorted(response)}")
+        return response
+
+
+class _AddHeader(Middleware):
+    def __call__(self, request, call_next):
+        return call_next(request.replace(headers={**request.headers, "X-Trace": "1"}))
+
+
+class _Cache(Middleware):
+    def __init__(self):
+        self.responses = {}
+
+    def __call__(self, request, call_next):
+        if request.url not in self.responses:
+            self.responses[request.url] = call_next(request)
+        return self.responses[request.url]
+
+
+def test_chain_without_middlewares_is_the_handler():
+    """Test that composing no middlewares adds no layer at all."""
+    handler = Mock()
+    assert chain([], handler) is handler
+
+
+def test_middlewares_run_in_order_around_the_call():
+    """Test that the first middleware is the outermost one."""
+    log = []
+    client = MpesaHttpClient(middlewares=[_Recorder("a", log)])
+    client.add_middleware(_Recorder("b", log))
+    with patch.object(client._session, "post", return_value=_response(200, {"ok": 1})):
+        assert client.post("/test", json={}, headers={}) == {"ok": 1}
+    assert log == ["a>POST /test", "b>POST /test", "b<['ok']", "a<['ok']"]
+
+
+def test_middleware_can_change_the_request():
+    """Test that a middleware can add headers before the request is sent."""
+    client = MpesaHttpClient(middlewares=[_AddHeader()])
+    with patch.object(client._session, "get", return_value=_response(200, {})) as get:
+        client.get("/test", params={"a": 1}, headers={"h": "v"})
+    assert get.call_args.kwargs["headers"] == {"h": "v", "X-Trace": "1"}
+    assert get.call_args.kwargs["params"] == {"a": 1}
+
+
+def test_middleware_can_answer_without_sending():
+    """Test that a middleware can skip the network, e.g. to serve from a cache."""
+    client = MpesaHttpClient(middlewares=[_Cache()])
+    with patch.object(client._session, "post", return_value=_response(200, {"a": 1})) as post:
+        client.post("/test", json={}, headers={})
+        assert client.post("/test", json={}, headers={}) == {"a": 1}
+    post.assert_called_once()
+
+
+def test_client_middlewares_see_each_call_once_despite_retries():
+    """Test that client middlewares wrap the built-in retries."""
+    log = []
+    client = MpesaHttpClient(middlewares=[_Recorder("m", log)])
+    with patch.object(client._session, "post") as post:
+        post.side_effect = [requests.Timeout(), _response(200, {"ok": 1})]
+        client.post(QUERY, json={}, headers={})
+    assert post.call_count == 2
+    assert log == [f"m>POST {QUERY}", "m<['ok']"]
+
+
+def test_unconfigured_features_are_left_out_of_the_chain():
+    """Test that only configured features become middlewares."""
+    bare = MpesaHttpClient(retry_policy=RetryPolicy(max_attempts=1))
+    limited = MpesaHttpClient(rate_limiter=RateLimiter([RateLimit(rate=10)]))
+
+    def layers(client):
+        with patch("mpesakit.http_client.mpesa_http_client.chain") as compose:
+            client._build_handler()
+        return [type(m) for m in compose.call_args.args[0]]
+
+    assert RetryMiddleware not in layers(bare)
+    assert RateLimitMiddleware not in layers(bare)
+    assert RetryMiddleware in layers(limited)
+    assert RateLimitMiddleware in layers(limited)
+    assert layers(bare)[-1] is TokenRefreshMiddleware
+
+
+def test_request_replace_keeps_other_fields():
+    """Test that replace() copies the request with only the given changes."""
+    request = Request("POST", "/a", {"h": "v"}, json={"x": 1})
+    copy = request.replace(url="/b")
+    assert (copy.method, copy.url, copy.headers, copy.json) == ("POST", "/b", {"h": "v"}, {"x": 1})
+    assert request.url == "/a"
+    assert copy.payload == {"x": 1}
+
+
+@pytest.mark.asyncio
+async def test_async_middlewares_run_in_order():
+    """Test that async middlewares wrap the request, outermost first."""
+    log = []
+
+    class AsyncRecorder(AsyncMiddleware):
+        def __init__(self, name):
+            self.name = name
+
+        async def __call__(self, request, call_next):
+            log.append(f"{self.name}>")
+            response = await call_next(request)
+            log.append(f"{self.name}<")
+            return response
+
+    client = MpesaAsyncHttpClient(middlewares=[AsyncRecorder("a"), AsyncRecorder("b")])
+    with patch.object(client._client, "send", new_callable=AsyncMock) as send:
+        send.return_value = httpx.Response(200, json={"ok": 1})
+        assert await client.post(QUERY, json={}, headers={}) == {"ok": 1}
+    assert log == ["a>", "b>", "b<", "a<"]
+    await client.aclose()
@@ -8,6 +8,8 @@ import pytest
 from unittest.mock import Mock, AsyncMock, patch
 import httpx
 
+from mpesakit.auth import AsyncTokenManager
+from mpesakit.http_client import RetryPolicy, idempotency_key
 from mpesakit.http_client.mpesa_async_http_client import MpesaAsyncHttpClient
 from mpesakit.errors import MpesaApiException
 
@@ -17,7 +19,9 @@ from mpesakit.errors import MpesaApiException
 def async_client():
     """Fixture to provide a MpesaAsyncHttpClient instance in sandbox environment."""
     with patch("mpesakit.http_client.mpesa_async_http_client.httpx.AsyncClient"):
-        client = MpesaAsyncHttpClient(env="sandbox")
+        client = MpesaAsyncHttpClient(
+            env="sandbox", retry_policy=RetryPolicy(backoff_base=0.001)
+        )
         yield client
 
 
@@ -37,27 +41,31 @@ def test_base_url_production():
 @pytest.mark.asyncio
 async def test_post_success(async_client):
     """Test successful ASYNC POST request returns expected JSON."""
-    with patch.object(async_client._client, "post", new_callable=AsyncMock) as mock_post:
+    with patch.object(async_client._client, "send", new_callable=AsyncMock) as mock_send:
 
-        mock_response = Mock(status_code=200, is_success=True)
-        mock_response.json.return_value = {"foo": "bar"}
-        mock_post.return_value = mock_response
+        mock_send.return_value = httpx.Response(200, json={"foo": "bar"})
 
 
         result = await async_client.post("/test", json={"a": 1}, headers={"h": "v"})
 
         assert result == {"foo": "bar"}
-        mock_post.assert_called_once()
-        mock_post.assert_called_with("/test", json={"a": 1}, headers={"h": "v"}, timeout=10)
+        mock_send.assert_called_once()
+        async_client._client.build_request.assert_called_with(
+            "POST",
+            "/test",
+            content=async_client.codec.dumps({"a": 1}),
+            headers={"h": "v", "Content-Type": "application/json"},
+            timeout=httpx.Timeout(10.0),
+        )
 
 
 @pytest.mark.asyncio
 async def test_post_http_error(async_client):
     """Test ASYNC POST request returns MpesaApiException on HTTP error."""
-    with patch.object(async_client._client, "post", new_callable=AsyncMock) as mock_post:
-        mock_response = Mock(status_code=400, is_success=False)
-        mock_response.json.return_value = {"errorMessage": "Bad Async Request"}
-        mock_post.return_value = mock_response
+    with patch.object(async_client._client, "send", new_callable=AsyncMock) as mock_send:
+        mock_send.return_value = httpx.Response(
+            400, json={"errorMessage": "Bad Async Request"}
+        )
 
         with pytest.raises(MpesaApiException) as exc:
             await async_client.post("/fail", json={}, headers={})
@@ -69,11 +77,8 @@ async def test_post_http_error(async_client):
 @pytest.mark.asyncio
 async def test_post_json_decode_error(async_client):
     """Test ASYNC POST request handles JSON decode error gracefully on HTTP error."""
-    with patch.object(async_client._client, "post", new_callable=AsyncMock) as mock_post:
-        mock_response = Mock(status_code=500, is_success=False)
-        mock_response.json.side_effect = ValueError()
-        mock_response.text = "Internal Server Error"
-        mock_post.return_value = mock_response
+    with patch.object(async_client._client, "send", new_callable=AsyncMock) as mock_send:
+        mock_send.return_value = httpx.Response(500, content=b"Internal Server Error")
 
         with pytest.raises(MpesaApiException) as exc:
             await async_client.post("/fail", json={}, headers={})
@@ -88,7 +93,7 @@ async def test_post_timeout(async_client):
     """Test ASYNC POST request raises MpesaApiException on timeout."""
     with patch.object(
         async_client._client,
-        "post",
+        "send",
         new_callable=AsyncMock,
         side_effect=httpx.TimeoutException("timeout"),
     ):
@@ -103,7 +108,7 @@ async def test_post_connection_error(async_client):
     """Test ASYNC POST request raises MpesaApiException on connection error."""
     with patch.object(
         async_client._client,
-        "post",
+        "send",
         new_callable=AsyncMock,
         side_effect=httpx.ConnectError("conn error", request=Mock()),
     ):
@@ -118,7 +123,7 @@ async def test_post_generic_httpx_error(async_client):
     """Test ASYNC POST request raises MpesaApiException on generic httpx error."""
     with patch.object(
         async_client._client,
-        "post",
+        "send",
         new_callable=AsyncMock,
         side_effect=httpx.ProtocolError("protocol error"),
     ):
@@ -132,25 +137,29 @@ async def test_post_generic_httpx_error(async_client):
 @pytest.mark.asyncio
 async def test_get_success(async_client):
     """Test successful ASYNC GET request returns expected JSON."""
-    with patch.object(async_client._client, "get", new_callable=AsyncMock) as mock_get:
-        mock_response = Mock(status_code=200, is_success=True)
-        mock_response.json.return_value = {"foo": "bar"}
-        mock_get.return_value = mock_response
+    with patch.object(async_client._client, "send", new_callable=AsyncMock) as mock_send:
+        mock_send.return_value = httpx.Response(200, json={"foo": "bar"})
 
         result = await async_client.get("/test", params={"a": 1}, headers={"h": "v"})
 
         assert result == {"foo": "bar"}
-        mock_get.assert_called_once()
-        mock_get.assert_called_with("/test", params={"a": 1}, headers={"h": "v"}, timeout=10)
+        mock_send.assert_called_once()
+        async_client._client.build_request.assert_called_with(
+            "GET",
+            "/test",
+            params={"a": 1},
+            headers={"h": "v"},
+            timeout=httpx.Timeout(10.0),
+        )
 
 
 @pytest.mark.asyncio
 async def test_get_http_error(async_client):
     """Test ASYNC GET request returns MpesaApiException on HTTP error."""
-    with patch.object(async_client._client, "get", new_callable=AsyncMock) as mock_get:
-        mock_response = Mock(status_code=404, is_success=False)
-        mock_response.json.return_value = {"errorMessage": "Async Not Found"}
-        mock_get.return_value = mock_response
+    with patch.object(async_client._client, "send", new_callable=AsyncMock) as mock_send:
+        mock_send.return_value = httpx.Response(
+            404, json={"errorMessage": "Async Not Found"}
+        )
 
         with pytest.raises(MpesaApiException) as exc:
             await async_client.get("/fail")
@@ -163,7 +172,7 @@ async def test_get_timeout(async_client):
     """Test ASYNC GET request raises MpesaApiException on timeout."""
     with patch.object(
         async_client._client,
-        "get",
+        "send",
         new_callable=AsyncMock,
         side_effect=httpx.TimeoutException("Test Timeout"),
     ):
@@ -179,7 +188,7 @@ async def test_get_connection_error(async_client):
     """Test ASYNC GET request raises MpesaApiException on connection error."""
     with patch.object(
         async_client._client,
-        "get",
+        "send",
         new_callable=AsyncMock,
         side_effect=httpx.ConnectError("conn error", request=Mock()), # Use httpx's ConnectError
     ):
@@ -195,7 +204,7 @@ async def test_get_generic_httpx_error(async_client):
     """Test ASYNC GET request raises MpesaApiException on a generic httpx error."""
     with patch.object(
         async_client._client,
-        "get",
+        "send",
         new_callable=AsyncMock,
         side_effect=httpx.ProtocolError("protocol error"),
     ):
@@ -204,3 +213,73 @@ async def test_get_generic_httpx_error(async_client):
 
         assert exc.value.error.error_code == "REQUEST_FAILED"
         assert "HTTP request failed" in exc.value.error.error_message
+
+
+@pytest.mark.asyncio
+async def test_post_replays_once_after_token_revoked(async_client):
+    """Test that a 401 refreshes the issuing AsyncTokenManager's token and replays."""
+    token_manager = AsyncTokenManager(
+        consumer_key="key", consumer_secret="secret", http_client=async_client
+    )
+
+    with patch.object(async_client._client, "send", new_callable=AsyncMock) as mock_send:
+        mock_send.side_effect = [
+            httpx.Response(200, json={"access_token": "old", "expires_in": 3600}),
+            httpx.Response(401, json={"errorMessage": "Invalid Access Token"}),
+            httpx.Response(200, json={"access_token": "new", "expires_in": 3600}),
+            httpx.Response(200, json={"ResponseCode": "0"}),
+        ]
+        headers = {"Authorization": f"Bearer {await token_manager.get_token()}"}
+
+        assert await async_client.post("/pay", json={}, headers=headers) == {
+            "ResponseCode": "0"
+        }
+
+    replayed = async_client._client.build_request.call_args_list[3]
+    assert replayed.kwargs["headers"]["Authorization"] == "Bearer new"
+    assert await token_manager.get_token() == "new"
+
+
+@pytest.mark.asyncio
+async def test_async_idempotent_call_is_retried(async_client):
+    """Test that an async query failing with a timeout is retried."""
+    success = httpx.Response(200, json={"ResultCode": "0"})
+    with patch.object(async_client._client, "send", new_callable=AsyncMock) as mock_send:
+        mock_send.side_effect = [httpx.ReadTimeout("slow"), success]
+        result = await async_client.post(
+            "/mpesa/transactionstatus/v1/query", json={}, headers={}
+        )
+    assert result == {"ResultCode": "0"}
+    assert mock_send.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_async_payment_retried_only_with_idempotency_key(async_client):
+    """Test that async payment requests retry only under an idempotency key."""
+    with patch.object(async_client._client, "send", new_callable=AsyncMock) as mock_send:
+        mock_send.side_effect = httpx.ConnectError("down")
+        with pytest.raises(MpesaApiException):
+            await async_client.post("/mpesa/stkpush/v1/processrequest", json={}, headers={})
+        assert mock_send.await_count == 1
+
+        with idempotency_key("order-42"), pytest.raises(MpesaApiException):
+            await async_client.post("/mpesa/stkpush/v1/processrequest", json={}, headers={})
+        assert mock_send.await_count == 1 + async_client.retry_policy.max_attempts
+
+
+@pytest.mark.asyncio
+async def test_warm_up_opens_connections_concurrently(async_client):
+    """Test that warm_up() issues one request per connection and maps failures."""
+    with patch.object(async_client._client, "head", new_callable=AsyncMock) as mock_head:
+        await async_client.warm_up(connections=3)
+    assert mock_head.await_count == 3
+
+    with patch.object(
+        async_client._client,
+        "head",
+        new_callable=AsyncMock,
+        side_effect=httpx.ConnectError("down"),
+    ):
+        with pytest.raises(MpesaApiException) as excinfo:
+            await async_client.warm_up()
+    assert excinfo.value.error_code == "CONNECTION_ERROR"
@@ -4,9 +4,15 @@ This module tests the MpesaHttpClient class for correct base URL selection,
 HTTP POST and GET request handling, and error handling for various scenarios.
 """
 
+import json
+import threading
+import time
+
 import requests
 import pytest
 from unittest.mock import Mock, patch
+from mpesakit.auth import TokenManager
+from mpesakit.http_client import RetryPolicy, idempotency_key
 from mpesakit.http_client.mpesa_http_client import MpesaHttpClient
 from mpesakit.errors import MpesaApiException
 
@@ -14,7 +20,9 @@ from mpesakit.errors import MpesaApiException
 @pytest.fixture
 def client():
     """Fixture to provide a MpesaHttpClient instance in sandbox environment."""
-    client = MpesaHttpClient(env="sandbox")
+    client = MpesaHttpClient(
+        env="sandbox", retry_policy=RetryPolicy(backoff_base=0.001)
+    )
     return client
 
 
@@ -30,12 +38,55 @@ def test_base_url_production():
     assert client.base_url == "https://api.safaricom.co.ke"
 
 
+def test_session_uses_configured_pool():
+    """Test that the session mounts an HTTPAdapter with the configured pool sizes."""
+    client = MpesaHttpClient(pool_connections=4, pool_maxsize=32, pool_block=True)
+    adapter = client._session.get_adapter(client.base_url)
+    assert adapter._pool_connections == 4
+    assert adapter._pool_maxsize == 32
+    assert adapter._pool_block is True
+
+
+def test_requests_share_one_session(client):
+    """Test that consecutive requests are sent through the same pooled session."""
+    with patch.object(client._session, "post") as mock_post:
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.ok = True
+        mock_response.content = json.dumps({}).encode()
+        mock_response.iter_content.return_value = [mock_response.content]
+        mock_post.return_value = mock_response
+
+        client.post("/one", json={}, headers={})
+        client.post("/two", json={}, headers={})
+        assert mock_post.call_count == 2
+        assert mock_post.call_args_list[0].args[0] == f"{client.base_url}/one"
+
+
+def test_close_closes_session(client):
+    """Test that close() releases the underlying session."""
+    with patch.object(client._session, "close") as mock_close:
+        client.close()
+        mock_close.assert_called_once()
+
+
+def test_context_manager_closes_session():
+    """Test that leaving the context manager closes the session."""
+    client = MpesaHttpClient()
+    with patch.object(client._session, "close") as mock_close:
+        with client as entered:
+            assert entered is client
+        mock_close.assert_called_once()
+
+
 def test_post_success(client):
     """Test successful POST request returns expected JSON."""
-    with patch("mpesakit.http_client.mpesa_http_client.requests.post") as mock_post:
+    with patch.object(client._session, "post") as mock_post:
         mock_response = Mock()
+        mock_response.status_code = 200
         mock_response.ok = True
-        mock_response.json.return_value = {"foo": "bar"}
+        mock_response.content = json.dumps({"foo": "bar"}).encode()
+        mock_response.iter_content.return_value = [mock_response.content]
         mock_post.return_value = mock_response
 
         result = client.post("/test", json={"a": 1}, headers={"h": "v"})
@@ -45,11 +96,12 @@ def test_post_success(client):
 
 def test_post_http_error(client):
     """Test POST request returns MpesaApiException on HTTP error."""
-    with patch("mpesakit.http_client.mpesa_http_client.requests.post") as mock_post:
+    with patch.object(client._session, "post") as mock_post:
         mock_response = Mock()
         mock_response.ok = False
         mock_response.status_code = 400
-        mock_response.json.return_value = {"errorMessage": "Bad Request"}
+        mock_response.content = json.dumps({"errorMessage": "Bad Request"}).encode()
+        mock_response.iter_content.return_value = [mock_response.content]
         mock_post.return_value = mock_response
 
         with pytest.raises(MpesaApiException) as exc:
@@ -60,11 +112,12 @@ def test_post_http_error(client):
 
 def test_post_json_decode_error(client):
     """Test POST request handles JSON decode error gracefully."""
-    with patch("mpesakit.http_client.mpesa_http_client.requests.post") as mock_post:
+    with patch.object(client._session, "post") as mock_post:
         mock_response = Mock()
         mock_response.ok = False
         mock_response.status_code = 500
-        mock_response.json.side_effect = ValueError()
+        mock_response.content = b"Internal Server Error"
+        mock_response.iter_content.return_value = [mock_response.content]
         mock_response.text = "Internal Server Error"
         mock_post.return_value = mock_response
 
@@ -76,8 +129,9 @@ def test_post_json_decode_error(client):
 
 def test_post_request_exception(client):
     """Test POST request raises MpesaApiException on generic exception."""
-    with patch(
-        "mpesakit.http_client.mpesa_http_client.requests.post",
+    with patch.object(
+        client._session,
+        "post",
         side_effect=requests.RequestException("boom"),
     ):
         with pytest.raises(MpesaApiException) as exc:
@@ -87,8 +141,9 @@ def test_post_request_exception(client):
 
 def test_post_timeout(client):
     """Test POST request raises MpesaApiException on timeout."""
-    with patch(
-        "mpesakit.http_client.mpesa_http_client.requests.post",
+    with patch.object(
+        client._session,
+        "post",
         side_effect=requests.Timeout,
     ):
         with pytest.raises(MpesaApiException) as exc:
@@ -98,8 +153,9 @@ def test_post_timeout(client):
 
 def test_post_connection_error(client):
     """Test POST request raises MpesaApiException on connection error."""
-    with patch(
-        "mpesakit.http_client.mpesa_http_client.requests.post",
+    with patch.object(
+        client._session,
+        "post",
         side_effect=requests.ConnectionError,
     ):
         with pytest.raises(MpesaApiException) as exc:
@@ -109,10 +165,11 @@ def test_post_connection_error(client):
 
 def test_get_success(client):
     """Test successful GET request returns expected JSON."""
-    with patch("mpesakit.http_client.mpesa_http_client.requests.get") as mock_get:
+    with patch.object(client._session, "get") as mock_get:
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {"foo": "bar"}
+        mock_response.content = json.dumps({"foo": "bar"}).encode()
+        mock_response.iter_content.return_value = [mock_response.content]
         mock_get.return_value = mock_response
 
         result = client.get("/test", params={"a": 1}, headers={"h": "v"})
@@ -122,11 +179,12 @@ def test_get_success(client):
 
 def test_get_http_error(client):
     """Test GET request returns MpesaApiException on HTTP error."""
-    with patch("mpesakit.http_client.mpesa_http_client.requests.get") as mock_get:
+    with patch.object(client._session, "get") as mock_get:
         mock_response = Mock()
         mock_response.ok = False
         mock_response.status_code = 404
-        mock_response.json.return_value = {"errorMessage": "Not Found"}
+        mock_response.content = json.dumps({"errorMessage": "Not Found"}).encode()
+        mock_response.iter_content.return_value = [mock_response.content]
         mock_get.return_value = mock_response
 
         with pytest.raises(MpesaApiException) as exc:
@@ -137,11 +195,12 @@ def test_get_http_error(client):
 
 def test_get_json_decode_error(client):
     """Test GET request handles JSON decode error gracefully."""
-    with patch("mpesakit.http_client.mpesa_http_client.requests.get") as mock_get:
+    with patch.object(client._session, "get") as mock_get:
         mock_response = Mock()
         mock_response.ok = False
         mock_response.status_code = 500
-        mock_response.json.side_effect = ValueError()
+        mock_response.content = b"Internal Server Error"
+        mock_response.iter_content.return_value = [mock_response.content]
         mock_response.text = "Internal Server Error"
         mock_get.return_value = mock_response
 
@@ -153,8 +212,9 @@ def test_get_json_decode_error(client):
 
 def test_get_request_exception(client):
     """Test GET request raises MpesaApiException on generic exception."""
-    with patch(
-        "mpesakit.http_client.mpesa_http_client.requests.get",
+    with patch.object(
+        client._session,
+        "get",
         side_effect=requests.RequestException("boom"),
     ):
         with pytest.raises(MpesaApiException) as exc:
@@ -164,8 +224,9 @@ def test_get_request_exception(client):
 
 def test_get_timeout(client):
     """Test GET request raises MpesaApiException on timeout."""
-    with patch(
-        "mpesakit.http_client.mpesa_http_client.requests.get",
+    with patch.object(
+        client._session,
+        "get",
         side_effect=requests.Timeout,
     ):
         with pytest.raises(MpesaApiException) as exc:
@@ -175,10 +236,223 @@ def test_get_timeout(client):
 
 def test_get_connection_error(client):
     """Test GET request raises MpesaApiException on connection error."""
-    with patch(
-        "mpesakit.http_client.mpesa_http_client.requests.get",
+    with patch.object(
+        client._session,
+        "get",
         side_effect=requests.ConnectionError,
     ):
         with pytest.raises(MpesaApiException) as exc:
             client.get("/conn")
         assert exc.value.error.error_code == "CONNECTION_ERROR"
+
+
+def _response(status_code, body):
+    response = Mock()
+    response.ok = status_code < 400
+    response.status_code = status_code
+    response.headers = {}
+    response.content = json.dumps(body).encode()
+    response.iter_content.return_value = [response.content]
+    return response
+
+
+def _oauth_responses(*tokens):
+    return [_response(200, {"access_token": t, "expires_in": 3600}) for t in tokens]
+
+
+def test_post_replays_once_after_token_revoked(client):
+    """Test that a 401 refreshes the issuing TokenManager's token and replays the request."""
+    token_manager = TokenManager(
+        consumer_key="key", consumer_secret="secret", http_client=client
+    )
+    with (
+        patch.object(client._session, "get", side_effect=_oauth_responses("old", "new")),
+        patch.object(client._session, "post") as mock_post,
+    ):
+        headers = {"Authorization": f"Bearer {token_manager.get_token()}"}
+        mock_post.side_effect = [
+            _response(401, {"errorMessage": "Invalid Access Token"}),
+            _response(200, {"ResponseCode": "0"}),
+        ]
+
+        assert client.post("/pay", json={}, headers=headers) == {"ResponseCode": "0"}
+
+    assert mock_post.call_args_list[1].kwargs["headers"]["Authorization"] == "Bearer new"
+    assert headers["Authorization"] == "Bearer old"
+    assert token_manager.get_token() == "new"
+
+
+def test_invalid_token_error_code_triggers_replay(client):
+    """Test that Daraja's 404.001.03 invalid token error is also replayed."""
+    token_manager = TokenManager(
+        consumer_key="key", consumer_secret="secret", http_client=client
+    )
+    with patch.object(client._session, "get") as mock_get:
+        mock_get.side_effect = [
+            *_oauth_responses("old"),
+            _response(404, {"errorCode": "404.001.03"}),
+            *_oauth_responses("new"),
+            _response(200, {"Result": "ok"}),
+        ]
+        headers = {"Authorization": f"Bearer {token_manager.get_token()}"}
+        assert client.get("/query", headers=headers) == {"Result": "ok"}
+        assert mock_get.call_count == 4
+
+
+def test_replay_happens_only_once(client):
+    """Test that a request rejected again after the refresh raises."""
+    token_manager = TokenManager(
+        consumer_key="key", consumer_secret="secret", http_client=client
+    )
+    with (
+        patch.object(client._session, "get", side_effect=_oauth_responses("old", "new")),
+        patch.object(client._session, "post") as mock_post,
+    ):
+        headers = {"Authorization": f"Bearer {token_manager.get_token()}"}
+        mock_post.return_value = _response(401, {"errorMessage": "Invalid Access Token"})
+
+        with pytest.raises(MpesaApiException) as excinfo:
+            client.post("/pay", json={}, headers=headers)
+    assert excinfo.value.error.status_code == 401
+    assert mock_post.call_count == 2
+
+
+def test_no_replay_for_unknown_token(client):
+    """Test that a 401 for a token no registered manager issued is raised as-is."""
+    with patch.object(client._session, "post") as mock_post:
+        mock_post.return_value = _response(401, {"errorMessage": "Invalid Access Token"})
+        with pytest.raises(MpesaApiException):
+            client.post("/pay", json={}, headers={"Authorization": "Bearer foreign"})
+        mock_post.assert_called_once()
+
+
+def test_concurrent_revoked_requests_refresh_once(client):
+    """Test that many requests rejected for the same token trigger a single refresh."""
+    token_manager = TokenManager(
+        consumer_key="key", consumer_secret="secret", http_client=client
+    )
+    oauth_calls = []
+
+    def fake_get(url, **kwargs):
+        oauth_calls.append(url)
+        time.sleep(0.05)
+        return _response(200, {"access_token": f"t{len(oauth_calls)}", "expires_in": 3600})
+
+    def fake_post(url, data, headers, timeout, stream):
+        if headers["Authorization"] == "Bearer t1":
+            return _response(401, {"errorMessage": "Invalid Access Token"})
+        return _response(200, {"token": headers["Authorization"]})
+
+    with (
+        patch.object(client._session, "get", side_effect=fake_get),
+        patch.object(client._session, "post", side_effect=fake_post),
+    ):
+        headers = {"Authorization": f"Bearer {token_manager.get_token()}"}
+        results = []
+        threads = [
+            threading.Thread(
+                target=lambda: results.append(client.post("/pay", json={}, headers=headers))
+            )
+            for _ in range(16)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+    assert len(oauth_calls) == 2
+    assert results == [{"token": "Bearer t2"}] * 16
+
+
+def test_idempotent_call_is_retried(client):
+    """Test that a query failing with a transient error is retried until it succeeds."""
+    with patch.object(client._session, "post") as mock_post:
+        mock_post.side_effect = [
+            requests.Timeout(),
+            _response(503, {"errorMessage": "Service Unavailable"}),
+            _response(200, {"ResultCode": "0"}),
+        ]
+        result = client.post(
+            "/mpesa/stkpushquery/v1/query", json={}, headers={"h": "v"}
+        )
+    assert result == {"ResultCode": "0"}
+    assert mock_post.call_count == 3
+
+
+def test_money_moving_call_is_not_retried_by_default(client):
+    """Test that a payment request is sent only once without an idempotency key."""
+    with patch.object(client._session, "post", side_effect=requests.Timeout()) as mock_post:
+        with pytest.raises(MpesaApiException) as excinfo:
+            client.post("/mpesa/b2c/v3/paymentrequest", json={}, headers={})
+    assert excinfo.value.error_code == "REQUEST_TIMEOUT"
+    mock_post.assert_called_once()
+
+
+def test_money_moving_call_is_retried_with_idempotency_key(client):
+    """Test that an idempotency key opts a payment request into retries."""
+    with patch.object(client._session, "post") as mock_post:
+        mock_post.side_effect = [
+            requests.ConnectionError(),
+            _response(200, {"ResponseCode": "0"}),
+        ]
+        with idempotency_key("conversation-1"):
+            result = client.post("/mpesa/b2c/v3/paymentrequest", json={}, headers={})
+    assert result == {"ResponseCode": "0"}
+    assert mock_post.call_count == 2
+
+
+def test_retries_stop_after_max_attempts(client):
+    """Test that the last error is raised once max_attempts is exhausted."""
+    with patch.object(client._session, "get", side_effect=requests.Timeout()) as mock_get:
+        with pytest.raises(MpesaApiException) as excinfo:
+            client.get("/oauth/v1/generate")
+    assert excinfo.value.error_code == "REQUEST_TIMEOUT"
+    assert mock_get.call_count == client.retry_policy.max_attempts
+
+
+def test_non_transient_errors_are_not_retried(client):
+    """Test that client errors such as HTTP 400 are raised without retrying."""
+    with patch.object(client._session, "post") as mock_post:
+        mock_post.return_value = _response(400, {"errorMessage": "Bad Request"})
+        with pytest.raises(MpesaApiException):
+            client.post("/mpesa/stkpushquery/v1/query", json={}, headers={})
+    mock_post.assert_called_once()
+
+
+def test_total_timeout_bounds_retries():
+    """Test that no retry starts once its backoff would exceed the time budget."""
+    client = MpesaHttpClient(
+        retry_policy=RetryPolicy(
+            max_attempts=10, backoff_base=5.0, backoff_max=5.0, total_timeout=0.01
+        )
+    )
+    with patch.object(client._session, "get", side_effect=requests.Timeout()) as mock_get:
+        with patch("random.uniform", return_value=5.0):
+            with pytest.raises(MpesaApiException):
+                client.get("/oauth/v1/generate")
+    mock_get.assert_called_once()
+
+
+def test_retry_disabled_with_single_attempt():
+    """Test that max_attempts=1 disables retries."""
+    client = MpesaHttpClient(retry_policy=RetryPolicy(max_attempts=1))
+    with patch.object(client._session, "get", side_effect=requests.Timeout()) as mock_get:
+        with pytest.raises(MpesaApiException):
+            client.get("/oauth/v1/generate")
+    mock_get.assert_called_once()
+
+
+def test_warm_up_opens_pooled_connections(client):
+    """Test that warm_up() sends one lightweight request per connection."""
+    with patch.object(client._session, "head") as mock_head:
+        client.warm_up(connections=3)
+    assert mock_head.call_count == 3
+    mock_head.assert_called_with(client.base_url, timeout=(10.0, 10.0))
+
+
+def test_warm_up_reports_unreachable_api(client):
+    """Test that a failed warm-up raises CONNECTION_ERROR."""
+    with patch.object(client._session, "head", side_effect=requests.ConnectionError()):
+        with pytest.raises(MpesaApiException) as excinfo:
+            client.warm_up()
+    assert excinfo.value.error_code == "CONNECTION_ERROR"
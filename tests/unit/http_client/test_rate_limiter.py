@@ -0,0 +1,148 @@
+"""Unit tests for the client-side rate limiters of the M-Pesa HTTP clients."""
+
+import json
+import time
+
+import httpx
+import pytest
+from unittest.mock import AsyncMock, Mock, patch
+
+from mpesakit.errors import MpesaApiException
+from mpesakit.http_client import (
+    AsyncRateLimiter,
+    MpesaAsyncHttpClient,
+    MpesaHttpClient,
+    RateLimit,
+    RateLimiter,
+    TokenBucket,
+)
+from mpesakit.http_client.rate_limiter import shortcode_of
+
+STK_PUSH = "/mpesa/stkpush/v1/processrequest"
+
+
+def test_token_bucket_allows_burst_then_paces():
+    """Test that a bucket allows a burst and then reserves future tokens."""
+    bucket = TokenBucket(RateLimit(rate=10, burst=2))
+    assert bucket.reserve() == 0.0
+    assert bucket.reserve() == 0.0
+    wait = bucket.reserve()
+    assert 0.05 < wait <= 0.1
+    assert bucket.reserve(max_wait=0.1) is None
+
+
+def test_try_acquire_is_non_blocking():
+    """Test that try_acquire() fails immediately once the burst is used up."""
+    limiter = RateLimiter(path_limits={STK_PUSH: RateLimit(rate=1)})
+    assert limiter.try_acquire(STK_PUSH, "174379") is True
+    assert limiter.try_acquire(STK_PUSH, "174379") is False
+
+
+def test_path_limits_apply_per_shortcode():
+    """Test that each shortcode gets its own bucket for a path limit."""
+    limiter = RateLimiter(path_limits={STK_PUSH: RateLimit(rate=1)})
+    assert limiter.try_acquire(STK_PUSH, "111111")
+    assert limiter.try_acquire(STK_PUSH, "222222")
+    assert not limiter.try_acquire(STK_PUSH, "111111")
+
+    shared = RateLimiter(path_limits={STK_PUSH: RateLimit(rate=1)}, per_shortcode=False)
+    assert shared.try_acquire(STK_PUSH, "111111")
+    assert not shared.try_acquire(STK_PUSH, "222222")
+
+
+def test_shortcode_limit_spans_paths():
+    """Test that a shortcode limit is shared by every path."""
+    limiter = RateLimiter(shortcode_limits={"174379": RateLimit(rate=1)})
+    assert limiter.try_acquire(STK_PUSH, "174379")
+    assert not limiter.try_acquire("/mpesa/b2c/v3/paymentrequest", "174379")
+    assert limiter.try_acquire("/mpesa/b2c/v3/paymentrequest", "600000")
+
+
+def test_failed_reservation_takes_nothing():
+    """Test that a permit refused by one bucket is refunded to the others."""
+    limiter = RateLimiter(
+        path_limits={STK_PUSH: RateLimit(rate=1, burst=2)},
+        shortcode_limits={"174379": RateLimit(rate=1)},
+        per_shortcode=False,
+    )
+    assert limiter.try_acquire(STK_PUSH, "174379")
+    assert not limiter.try_acquire(STK_PUSH, "174379")
+    assert limiter.try_acquire(STK_PUSH, "other")
+    assert not limiter.try_acquire(STK_PUSH, "other")
+
+
+def test_acquire_blocks_until_allowed():
+    """Test that a blocking acquire waits for the next token."""
+    limiter = RateLimiter(path_limits={STK_PUSH: RateLimit(rate=20)})
+    start = time.monotonic()
+    for _ in range(21):
+        limiter.acquire(STK_PUSH)
+    assert time.monotonic() - start >= 0.04
+
+
+def test_acquire_respects_timeout_and_deadline():
+    """Test that acquire raises RATE_LIMITED instead of waiting past its budget."""
+    limiter = RateLimiter(path_limits={STK_PUSH: RateLimit(rate=1)})
+    limiter.acquire(STK_PUSH)
+    with pytest.raises(MpesaApiException) as excinfo:
+        limiter.acquire(STK_PUSH, timeout=0.1)
+    assert excinfo.value.error_code == "RATE_LIMITED"
+    with pytest.raises(MpesaApiException):
+        limiter.acquire(STK_PUSH, deadline=time.monotonic() + 0.1)
+
+
+def test_shortcode_of_payload():
+    """Test that the shortcode is read from the request body."""
+    assert shortcode_of({"BusinessShortCode": 174379}) == "174379"
+    assert shortcode_of({"PartyA": "600000", "PartyB": "254700000000"}) == "600000"
+    assert shortcode_of({"Amount": 1}) is None
+    assert shortcode_of(None) is None
+
+
+def test_http_client_consults_rate_limiter():
+    """Test that MpesaHttpClient does not send requests refused by its limiter."""
+    client = MpesaHttpClient(
+        rate_limiter=RateLimiter(
+            path_limits={STK_PUSH: RateLimit(rate=1)}, max_wait=0
+        )
+    )
+    response = Mock(status_code=200, ok=True)
+    response.content = json.dumps({"ResponseCode": "0"}).encode()
+    response.iter_content.return_value = [response.content]
+    with patch.object(client._session, "post", return_value=response) as mock_post:
+        client.post(STK_PUSH, json={"BusinessShortCode": 174379}, headers={})
+        with pytest.raises(MpesaApiException) as excinfo:
+            client.post(STK_PUSH, json={"BusinessShortCode": 174379}, headers={})
+        assert excinfo.value.error_code == "RATE_LIMITED"
+        client.post(STK_PUSH, json={"BusinessShortCode": 600000}, headers={})
+    assert mock_post.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_async_rate_limiter_waits():
+    """Test that the async limiter paces requests without blocking."""
+    limiter = AsyncRateLimiter(path_limits={STK_PUSH: RateLimit(rate=20)})
+    start = time.monotonic()
+    for _ in range(21):
+        await limiter.acquire(STK_PUSH, "174379")
+    assert time.monotonic() - start >= 0.04
+    assert not limiter.try_acquire(STK_PUSH, "174379")
+
+
+@pytest.mark.asyncio
+async def test_async_http_client_consults_rate_limiter():
+    """Test that MpesaAsyncHttpClient applies its limiter before sending."""
+    with patch("mpesakit.http_client.mpesa_async_http_client.httpx.AsyncClient"):
+        client = MpesaAsyncHttpClient(
+            rate_limiter=AsyncRateLimiter(
+                path_limits={STK_PUSH: RateLimit(rate=1)}, max_wait=0
+            )
+        )
+    response = httpx.Response(200, json={"ResponseCode": "0"})
+    with patch.object(
+        client._client, "send", new_callable=AsyncMock, return_value=response
+    ) as mock_send:
+        await client.post(STK_PUSH, json={"BusinessShortCode": 1}, headers={})
+        with pytest.raises(MpesaApiException):
+            await client.post(STK_PUSH, json={"BusinessShortCode": 1}, headers={})
+    mock_send.assert_awaited_once()
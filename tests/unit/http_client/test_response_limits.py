@@ -0,0 +1,170 @@
+"""Unit tests for the size limits on responses read by the HTTP clients."""
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from mpesakit.errors import MpesaApiException
+from mpesakit.http_client import (
+    MpesaAsyncHttpClient,
+    MpesaHttpClient,
+    ResponseLimits,
+    RetryPolicy,
+)
+from mpesakit.http_client.codec import StdlibJsonCodec
+from mpesakit.http_client.response_limits import decode_body, read_limited
+
+BODY_SIZE = 4 * 1024 * 1024
+REVOKED = (
+    b'{"requestId": "r-1", "errorCode": "404.001.03",'
+    b' "errorMessage": "Invalid Access Token"}'
+)
+LIMITS = ResponseLimits(max_body_size=64 * 1024, max_error_body_size=1024)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Answers /large with a huge JSON body and /proxy-error with a huge HTML page."""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        if self.path == "/large":
+            self._send(200, "application/json", b'{"a": "' + b"x" * BODY_SIZE + b'"}')
+        elif self.path == "/proxy-error":
+            self._send(502, "text/html", b"<html>" + b"Bad Gateway " * BODY_SIZE)
+        else:
+            self._send(404, "application/json", REVOKED)
+
+    def _send(self, status, content_type, body):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        try:
+            self.wfile.write(body)
+        except (BrokenPipeError, ConnectionResetError):
+            pass  # The client stopped reading.
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture(scope="module")
+def server_url():
+    """A local server sending oversized responses."""
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    httpd.daemon_threads = True
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def test_body_limits():
+    """Test the limits applying to success and error responses."""
+    assert LIMITS.body_limit(is_error=False) == 64 * 1024
+    assert LIMITS.body_limit(is_error=True) == 1024
+    assert ResponseLimits(max_body_size=None).body_limit(is_error=False) is None
+    assert ResponseLimits(max_body_size=100).body_limit(is_error=True) == 100
+
+
+def test_read_limited_stops_after_limit():
+    """Test that reading stops at the first chunk crossing the limit."""
+    chunks = iter([b"abc", b"def", b"ghi"])
+    assert read_limited(chunks, 4) == (b"abcd", True)
+    assert next(chunks) == b"ghi"
+    assert read_limited([b"ab", b"cd"], 4) == (b"abcd", False)
+    assert read_limited([b"ab", b"cd"], None) == (b"abcd", False)
+
+
+def test_truncated_body_is_reported_as_text():
+    """Test that a cut-off body is not decoded as JSON."""
+    codec = StdlibJsonCodec()
+    assert decode_body(codec, b'{"a": 1}', truncated=False) == {"a": 1}
+    assert decode_body(codec, b"  oops ", truncated=False) == {"errorMessage": "oops"}
+    assert decode_body(codec, b'{"a": ', truncated=True) == {
+        "errorMessage": '{"a": [truncated]'
+    }
+
+
+def test_raw_response_retention():
+    """Test that only requestId and errorCode are kept without keep_raw_response."""
+    data = {"requestId": "r-1", "errorCode": "500.001.1001", "errorMessage": "x" * 100}
+    assert LIMITS.raw_response(data) is data
+    assert ResponseLimits(keep_raw_response=False).raw_response(data) == {
+        "requestId": "r-1",
+        "errorCode": "500.001.1001",
+    }
+
+
+def _client(server_url, limits=LIMITS):
+    return MpesaHttpClient(
+        base_url=server_url,
+        retry_policy=RetryPolicy(max_attempts=1),
+        response_limits=limits,
+    )
+
+
+def test_oversized_response_is_rejected(server_url):
+    """Test that a success response over max_body_size fails without being read."""
+    with _client(server_url) as client:
+        with pytest.raises(MpesaApiException) as excinfo:
+            client.get("/large")
+        stats = client.transport_stats()
+    assert excinfo.value.error_code == "RESPONSE_TOO_LARGE"
+    assert excinfo.value.error.status_code == 200
+    assert stats["bytes_received"] == 64 * 1024
+
+
+def test_oversized_error_page_is_truncated(server_url):
+    """Test that a huge error page is cut off in the error message."""
+    with _client(server_url) as client:
+        with pytest.raises(MpesaApiException) as excinfo:
+            client.get("/proxy-error")
+    error = excinfo.value.error
+    assert error.error_code == "HTTP_502"
+    assert error.error_message.startswith("<html>Bad Gateway")
+    assert error.error_message.endswith("[truncated]")
+    assert len(error.error_message) < 1100
+
+
+def test_raw_response_can_be_dropped(server_url):
+    """Test that keep_raw_response=False keeps only the error's identifiers."""
+    limits = ResponseLimits(keep_raw_response=False)
+    with _client(server_url, limits) as client:
+        with pytest.raises(MpesaApiException) as excinfo:
+            client.get("/token-revoked")
+    assert excinfo.value.error.error_message == "Invalid Access Token"
+    assert excinfo.value.error.raw_response == {
+        "requestId": "r-1",
+        "errorCode": "404.001.03",
+    }
+
+
+def test_unlimited_responses_are_read_whole(server_url):
+    """Test that max_body_size=None reads a response of any size."""
+    with _client(server_url, ResponseLimits(max_body_size=None)) as client:
+        assert len(client.get("/large")["a"]) == BODY_SIZE
+
+
+@pytest.mark.asyncio
+async def test_async_client_applies_limits(server_url):
+    """Test that the async client rejects and truncates oversized responses."""
+    client = MpesaAsyncHttpClient(
+        base_url=server_url,
+        retry_policy=RetryPolicy(max_attempts=1),
+        response_limits=LIMITS,
+    )
+    with pytest.raises(MpesaApiException) as too_large:
+        await client.get("/large")
+    with pytest.raises(MpesaApiException) as proxy_error:
+        await client.get("/proxy-error")
+    stats = client.transport_stats()
+    await client.aclose()
+
+    assert too_large.value.error_code == "RESPONSE_TOO_LARGE"
+    assert proxy_error.value.error_code == "HTTP_502"
+    assert proxy_error.value.error.error_message.endswith("[truncated]")
+    assert stats["bytes_received"] == 64 * 1024 + 1024
@@ -0,0 +1,250 @@
+"""Unit tests for coalescing identical in-flight queries."""
+
+import asyncio
+import json
+import threading
+import time
+
+import httpx
+import pytest
+from unittest.mock import AsyncMock, Mock, patch
+
+from mpesakit.errors import MpesaApiException, MpesaError
+from mpesakit.http_client import (
+    AsyncSingleFlight,
+    MpesaAsyncHttpClient,
+    MpesaHttpClient,
+    SingleFlight,
+    remaining_time,
+    request_deadline,
+)
+from mpesakit.http_client.single_flight import request_key
+from mpesakit.http_client.timeouts import check_deadline
+
+QUERY = "/mpesa/stkpushquery/v1/query"
+
+
+def test_request_key_is_canonical():
+    """Test that key order does not matter but payload and credentials do."""
+    headers = {"Authorization": "Bearer a"}
+    key = request_key("POST", QUERY, headers, {"A": 1, "B": 2})
+    assert key == request_key("POST", QUERY, headers, {"B": 2, "A": 1})
+    assert key != request_key("POST", QUERY, headers, {"A": 1, "B": 3})
+    assert key != request_key("POST", QUERY, {"Authorization": "Bearer b"}, {"A": 1, "B": 2})
+
+
+def test_concurrent_calls_share_one_request():
+    """Test that threads making the same call run it once and get equal copies."""
+    flight = SingleFlight()
+    started = threading.Event()
+    release = threading.Event()
+    fn = Mock(side_effect=lambda: (started.set(), release.wait(2), {"ok": True})[2])
+    results = []
+
+    def call():
+        results.append(flight.do("k", fn))
+
+    threads = [threading.Thread(target=call) for _ in range(5)]
+    threads[0].start()
+    started.wait(2)
+    for thread in threads[1:]:
+        thread.start()
+    time.sleep(0.05)
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    fn.assert_called_once()
+    assert results == [{"ok": True}] * 5
+    assert len({id(result) for result in results}) == 5
+    assert flight.coalesced == 4
+
+
+def test_follower_waits_no_longer_than_its_deadline():
+    """Test that a caller joining a slow call gives up at its own deadline."""
+    flight = SingleFlight()
+    started = threading.Event()
+    release = threading.Event()
+    fn = Mock(side_effect=lambda: (started.set(), release.wait(2), {"ok": True})[2])
+    leader = threading.Thread(target=lambda: flight.do("k", fn))
+    leader.start()
+    started.wait(2)
+    try:
+        with request_deadline(timeout=0.05):
+            with pytest.raises(MpesaApiException) as excinfo:
+                flight.do("k", fn)
+        assert excinfo.value.error_code == "DEADLINE_EXCEEDED"
+    finally:
+        release.set()
+        leader.join()
+    fn.assert_called_once()
+
+
+def test_leader_deadline_does_not_fail_followers():
+    """Test that a follower sends the call itself once its leader's deadline passed."""
+    flight = SingleFlight()
+    started = threading.Event()
+    outcomes = []
+
+    def send():
+        started.set()
+        time.sleep(remaining_time() or 0.0)
+        check_deadline()
+        return {"ok": True}
+
+    def lead():
+        with request_deadline(timeout=0.1):
+            try:
+                flight.do("k", send)
+            except MpesaApiException as e:
+                outcomes.append(e.error_code)
+
+    leader = threading.Thread(target=lead)
+    leader.start()
+    started.wait(2)
+    with request_deadline(timeout=2):
+        result = flight.do("k", lambda: {"ok": "follower"})
+    leader.join()
+
+    assert outcomes == ["DEADLINE_EXCEEDED"]
+    assert result == {"ok": "follower"}
+    assert flight.coalesced == 1
+
+
+def test_error_is_shared_and_key_released():
+    """Test that waiting callers get the error and the next call runs again."""
+    flight = SingleFlight()
+    started = threading.Event()
+    release = threading.Event()
+    error = MpesaApiException(MpesaError(error_code="HTTP_500", status_code=500))
+
+    def fail():
+        started.set()
+        release.wait(2)
+        raise error
+
+    errors = []
+
+    def call():
+        try:
+            flight.do("k", fail)
+        except MpesaApiException as e:
+            errors.append(e)
+
+    leader = threading.Thread(target=call)
+    leader.start()
+    started.wait(2)
+    follower = threading.Thread(target=call)
+    follower.start()
+    time.sleep(0.05)
+    release.set()
+    leader.join()
+    follower.join()
+
+    assert errors == [error, error]
+    assert flight.do("k", lambda: "again") == "again"
+
+
+def test_http_client_coalesces_identical_queries_only():
+    """Test that MpesaHttpClient shares identical queries but not other requests."""
+    client = MpesaHttpClient(single_flight=SingleFlight())
+    response = Mock(status_code=200, ok=True)
+    response.content = json.dumps({"ResultCode": "0"}).encode()
+    response.iter_content.return_value = [response.content]
+
+    def slow_post(*args, **kwargs):
+        time.sleep(0.1)
+        return response
+
+    body = {"CheckoutRequestID": "ws_CO_1"}
+    with patch.object(client._session, "post", side_effect=slow_post) as mock_post:
+        threads = [
+            threading.Thread(target=client.post, args=(QUERY, body, {}))
+            for _ in range(3)
+        ]
+        threads.append(
+            threading.Thread(
+                target=client.post, args=(QUERY, {"CheckoutRequestID": "ws_CO_2"}, {})
+            )
+        )
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    assert mock_post.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_async_calls_share_one_request():
+    """Test that concurrent tasks making the same call await one request."""
+    flight = AsyncSingleFlight()
+    calls = []
+
+    async def query():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return {"ok": True}
+
+    results = await asyncio.gather(*(flight.do("k", query) for _ in range(4)))
+    assert results == [{"ok": True}] * 4
+    assert len(calls) == 1
+    assert flight.coalesced == 3
+
+
+@pytest.mark.asyncio
+async def test_async_leader_cancellation_does_not_fail_followers():
+    """Test that cancelling the first caller leaves the shared request running."""
+    flight = AsyncSingleFlight()
+
+    async def query():
+        await asyncio.sleep(0.02)
+        return "ok"
+
+    leader = asyncio.create_task(flight.do("k", query))
+    await asyncio.sleep(0)
+    follower = asyncio.create_task(flight.do("k", query))
+    await asyncio.sleep(0)
+    leader.cancel()
+    assert await follower == "ok"
+
+
+@pytest.mark.asyncio
+async def test_async_leader_deadline_does_not_fail_followers():
+    """Test that the shared request outlives the deadline of the caller that sent it."""
+    flight = AsyncSingleFlight()
+    calls = []
+
+    async def query():
+        calls.append(remaining_time())
+        await asyncio.sleep(0.1)
+        return "ok"
+
+    async def call(timeout):
+        with request_deadline(timeout=timeout):
+            return await flight.do("k", query)
+
+    leader = asyncio.create_task(call(0.02))
+    await asyncio.sleep(0)
+    follower = asyncio.create_task(call(2))
+    with pytest.raises(MpesaApiException) as excinfo:
+        await leader
+    assert excinfo.value.error_code == "DEADLINE_EXCEEDED"
+    assert await follower == "ok"
+    assert calls == [None]
+
+
+@pytest.mark.asyncio
+async def test_async_http_client_coalesces_queries():
+    """Test that MpesaAsyncHttpClient sends one request for identical queries."""
+    with patch("mpesakit.http_client.mpesa_async_http_client.httpx.AsyncClient"):
+        client = MpesaAsyncHttpClient(single_flight=AsyncSingleFlight())
+
+    async def send(*args, **kwargs):
+        await asyncio.sleep(0.01)
+        return httpx.Response(200, json={"ResultCode": "0"})
+
+    body = {"CheckoutRequestID": "ws_CO_1"}
+    with patch.object(client._client, "send", new=AsyncMock(side_effect=send)) as mock_send:
+        results = await asyncio.gather(*(client.post(QUERY, body, {}) for _ in range(3)))
+    assert results == [{"ResultCode": "0"}] * 3
+    assert mock_send.await_count == 1
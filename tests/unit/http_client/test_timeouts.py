@@ -0,0 +1,176 @@
+"""Unit tests for request timeouts and per-call deadlines."""
+
+import json
+import time
+from unittest.mock import AsyncMock, Mock, patch
+
+import httpx
+import pytest
+import requests
+
+from mpesakit.errors import MpesaApiException
+from mpesakit.http_client import (
+    MpesaAsyncHttpClient,
+    MpesaHttpClient,
+    RetryPolicy,
+    Timeouts,
+    current_deadline,
+    remaining_time,
+    request_deadline,
+)
+from mpesakit.http_client.retry import stop_before_deadline
+
+QUERY = "/mpesa/stkpushquery/v1/query"
+
+
+def _ok_response(body=None):
+    response = Mock(status_code=200, ok=True)
+    response.content = json.dumps(body or {"ok": True}).encode()
+    response.iter_content.return_value = [response.content]
+    return response
+
+
+def test_no_deadline_by_default():
+    """Test that no deadline applies outside request_deadline()."""
+    assert current_deadline() is None
+    assert remaining_time() is None
+
+
+def test_request_deadline_from_timeout():
+    """Test that timeout is converted to a deadline and reset afterwards."""
+    before = time.monotonic()
+    with request_deadline(timeout=5):
+        deadline = current_deadline()
+        assert deadline is not None
+        assert before + 5 <= deadline <= time.monotonic() + 5
+        assert 0 < remaining_time() <= 5
+    assert current_deadline() is None
+
+
+def test_nested_deadline_never_extends_enclosing_one():
+    """Test that an inner, later deadline does not extend the outer one."""
+    with request_deadline(timeout=1):
+        outer = current_deadline()
+        with request_deadline(timeout=60):
+            assert current_deadline() == outer
+        with request_deadline(deadline=outer - 0.5):
+            assert current_deadline() == outer - 0.5
+        with request_deadline():
+            assert current_deadline() == outer
+
+
+def test_timeouts_capped():
+    """Test that capped() limits every timeout, and None leaves them unchanged."""
+    timeouts = Timeouts(connect=3, read=30)
+    assert timeouts.capped(None) is timeouts
+    assert timeouts.capped(5) == Timeouts(connect=3, read=5, write=5, pool=5)
+    with pytest.raises(MpesaApiException) as exc_info:
+        timeouts.capped(0.0)
+    assert exc_info.value.error_code == "DEADLINE_EXCEEDED"
+
+
+def test_timeouts_reject_non_positive_values():
+    """Test that timeouts must be positive."""
+    with pytest.raises(ValueError):
+        Timeouts(read=0)
+
+
+def test_endpoint_timeouts_are_applied():
+    """Test that per-endpoint timeouts override the defaults."""
+    client = MpesaHttpClient(
+        timeouts=Timeouts(connect=2, read=8),
+        endpoint_timeouts={"/slow": Timeouts(connect=2, read=30)},
+    )
+    with patch.object(client._session, "post", return_value=_ok_response()) as post:
+        client.post("/slow", json={}, headers={})
+        assert post.call_args.kwargs["timeout"] == (2, 30)
+        client.post("/fast", json={}, headers={})
+        assert post.call_args.kwargs["timeout"] == (2, 8)
+
+
+def test_timeouts_are_capped_by_deadline():
+    """Test that a request never waits longer than the time left."""
+    client = MpesaHttpClient()
+    with patch.object(client._session, "post", return_value=_ok_response()) as post:
+        with request_deadline(timeout=1):
+            client.post("/test", json={}, headers={})
+    connect, read = post.call_args.kwargs["timeout"]
+    assert connect <= 1 and read <= 1
+
+
+def test_expired_deadline_abandons_request():
+    """Test that a request past its deadline is not sent."""
+    client = MpesaHttpClient()
+    with patch.object(client._session, "post") as post:
+        with request_deadline(deadline=time.monotonic() - 1):
+            with pytest.raises(MpesaApiException) as exc_info:
+                client.post("/test", json={}, headers={})
+    assert exc_info.value.error_code == "DEADLINE_EXCEEDED"
+    post.assert_not_called()
+
+
+def test_timeout_at_deadline_is_not_retried():
+    """Test that a timeout that used up the deadline is reported and not retried."""
+    client = MpesaHttpClient(retry_policy=RetryPolicy(max_attempts=5))
+
+    def slow_timeout(*args, **kwargs):
+        time.sleep(0.06)
+        raise requests.Timeout()
+
+    with patch.object(client._session, "post", side_effect=slow_timeout) as post:
+        with request_deadline(timeout=0.05):
+            with pytest.raises(MpesaApiException) as exc_info:
+                client.post(QUERY, json={}, headers={})
+    assert exc_info.value.error_code == "DEADLINE_EXCEEDED"
+    post.assert_called_once()
+
+
+def test_retry_stops_before_deadline():
+    """Test that no retry is started if its backoff would end after the deadline."""
+    stop = stop_before_deadline()
+    state = Mock(upcoming_sleep=2.0)
+    assert stop(state) is False
+    with request_deadline(timeout=1):
+        assert stop(state) is True
+        state.upcoming_sleep = 0.0
+        assert stop(state) is False
+
+
+def test_rate_limiter_wait_is_bounded_by_deadline():
+    """Test that the rate limiter is given the current deadline."""
+    limiter = Mock()
+    client = MpesaHttpClient(rate_limiter=limiter)
+    with patch.object(client._session, "post", return_value=_ok_response()):
+        with request_deadline(timeout=3):
+            deadline = current_deadline()
+            client.post("/test", json={"ShortCode": "600000"}, headers={})
+    limiter.acquire.assert_called_once_with("/test", "600000", deadline=deadline)
+
+
+@pytest.mark.asyncio
+async def test_async_endpoint_timeouts_are_applied():
+    """Test that the async client passes all four timeouts to httpx."""
+    client = MpesaAsyncHttpClient(
+        endpoint_timeouts={"/slow": Timeouts(connect=1, read=30, write=2, pool=3)}
+    )
+    with patch.object(client._client, "send", new_callable=AsyncMock) as send:
+        send.return_value = httpx.Response(200, content=b"{}")
+        await client.post("/slow", json={}, headers={})
+    request = send.call_args.args[0]
+    assert request.extensions["timeout"] == httpx.Timeout(
+        connect=1, read=30, write=2, pool=3
+    ).as_dict()
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_async_expired_deadline_abandons_request():
+    """Test that the async client does not send a request past its deadline."""
+    client = MpesaAsyncHttpClient()
+    with patch.object(client._client, "send") as send:
+        with request_deadline(deadline=time.monotonic() - 1):
+            with pytest.raises(MpesaApiException) as exc_info:
+                await client.post("/test", json={}, headers={})
+    assert exc_info.value.error_code == "DEADLINE_EXCEEDED"
+    send.assert_not_called()
+    await client.aclose()
@@ -0,0 +1,146 @@
+"""Unit tests for the connection pool and transport statistics of the HTTP clients."""
+
+import asyncio
+import base64
+import threading
+
+import pytest
+
+from mpesakit.errors import MpesaApiException
+from mpesakit.http_client import (
+    MpesaAsyncHttpClient,
+    MpesaHttpClient,
+    RetryPolicy,
+    TransportMetrics,
+)
+from mpesakit.testing import Latency, MockDarajaServer
+
+OAUTH = "/oauth/v1/generate"
+QUERY = "/mpesa/stkpushquery/v1/query"
+BASIC = {"Authorization": "Basic " + base64.b64encode(b"key:secret").decode()}
+
+
+@pytest.fixture
+def server():
+    """A running mock server."""
+    with MockDarajaServer() as server:
+        yield server
+
+
+def _bearer(token):
+    return {"Authorization": f"Bearer {token['access_token']}"}
+
+
+def test_metrics_snapshot():
+    """Test how the counters add up in a snapshot."""
+    metrics = TransportMetrics()
+    metrics.connection_acquired(0.5, reused=False, tls=True)
+    metrics.connection_acquired(0.1, reused=True, tls=True)
+    metrics.connection_released()
+    metrics.request_finished(200, 10, 100)
+    metrics.request_finished(429, 10, 20)
+    metrics.request_finished(None, 10)
+
+    stats = metrics.snapshot(idle=3)
+
+    assert stats["active_connections"] == 1
+    assert stats["idle_connections"] == 3
+    assert stats["connections_acquired"] == 2
+    assert stats["connections_opened"] == 1
+    assert stats["reuse_ratio"] == 0.5
+    assert stats["tls_handshakes"] == 1
+    assert stats["pool_wait_seconds"] == pytest.approx(0.6)
+    assert stats["pool_wait_seconds_max"] == 0.5
+    assert stats["bytes_sent"] == 30 and stats["bytes_received"] == 120
+    assert stats["requests"] == {"2xx": 1, "4xx": 1, "failed": 1}
+    assert metrics.snapshot(idle=0, active=7)["active_connections"] == 7
+
+
+def test_sync_client_reports_connection_reuse(server):
+    """Test that the sync client counts requests, bytes and reused connections."""
+    with MpesaHttpClient(
+        base_url=server.url, retry_policy=RetryPolicy(max_attempts=1)
+    ) as client:
+        token = client.get(OAUTH, headers=BASIC)
+        for _ in range(3):
+            client.post(QUERY, json={"CheckoutRequestID": "ws_1"}, headers=_bearer(token))
+        with pytest.raises(MpesaApiException):
+            client.post(QUERY, json={}, headers={"Authorization": "Bearer nope"})
+
+        stats = client.transport_stats()
+
+    assert stats["requests"] == {"2xx": 4, "4xx": 1}
+    assert stats["connections_acquired"] == 5
+    assert stats["connections_opened"] == 1
+    assert stats["reuse_ratio"] == 0.8
+    assert stats["active_connections"] == 0
+    assert stats["idle_connections"] == 1
+    assert stats["tls_handshakes"] == 0
+    assert stats["bytes_sent"] == 3 * len(b'{"CheckoutRequestID":"ws_1"}') + 2
+    assert stats["bytes_received"] > 0
+
+
+def test_sync_client_reports_pool_waits():
+    """Test that time spent waiting for a pooled connection is measured."""
+    with MockDarajaServer(latency=Latency(mean=0.2)) as server:
+        client = MpesaHttpClient(base_url=server.url, pool_maxsize=1, pool_block=True)
+        threads = [
+            threading.Thread(target=client.get, args=(OAUTH, None, BASIC))
+            for _ in range(2)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        stats = client.transport_stats()
+        client.close()
+
+    assert stats["connections_acquired"] == 2
+    assert stats["pool_wait_seconds_max"] >= 0.15
+
+
+def test_unreachable_api_is_counted_as_failed():
+    """Test that requests without a response are counted as failed."""
+    client = MpesaHttpClient(
+        base_url="http://127.0.0.1:9", retry_policy=RetryPolicy(max_attempts=1)
+    )
+    with pytest.raises(MpesaApiException):
+        client.get(OAUTH, headers=BASIC)
+    assert client.transport_stats()["requests"] == {"failed": 1}
+
+
+@pytest.mark.asyncio
+async def test_async_client_reports_connection_reuse(server):
+    """Test that the async client counts requests and reused connections."""
+    client = MpesaAsyncHttpClient(base_url=server.url)
+    token = await client.get(OAUTH, headers=BASIC)
+    for _ in range(3):
+        await client.post(QUERY, json={}, headers=_bearer(token))
+
+    stats = client.transport_stats()
+    await client.aclose()
+
+    assert stats["requests"] == {"2xx": 4}
+    assert stats["connections_acquired"] == 4
+    assert stats["connections_reused"] == 3
+    assert stats["active_connections"] == 0
+    assert stats["idle_connections"] == 1
+    assert stats["bytes_sent"] == 3 * len(b"{}")
+
+
+@pytest.mark.asyncio
+async def test_async_client_reports_active_and_closed_connections():
+    """Test that connections are active during a request and gone once closed."""
+    with MockDarajaServer(latency=Latency(mean=0.2)) as server:
+        client = MpesaAsyncHttpClient(base_url=server.url)
+        request = asyncio.ensure_future(client.get(OAUTH, headers=BASIC))
+        await asyncio.sleep(0.1)
+        during = client.transport_stats()
+        await request
+        after = client.transport_stats()
+        await client.aclose()
+        closed = client.transport_stats()
+
+    assert (during["active_connections"], during["idle_connections"]) == (1, 0)
+    assert (after["active_connections"], after["idle_connections"]) == (0, 1)
+    assert (closed["active_connections"], closed["idle_connections"]) == (0, 0)
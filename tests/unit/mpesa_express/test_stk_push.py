@@ -6,14 +6,15 @@ This module tests the StkPush class for initiating and querying M-Pesa STK Push
 import pytest
 from unittest.mock import MagicMock
 from mpesakit.mpesa_express.stk_push import (
+    AsyncStkPush,
     StkPush,
     StkPushSimulateRequest,
     StkPushSimulateResponse,
     StkPushQueryRequest,
     StkPushQueryResponse,
 )
-from mpesakit.auth import TokenManager
-from mpesakit.http_client import HttpClient
+from mpesakit.auth import AsyncTokenManager, TokenManager
+from mpesakit.http_client import AsyncHttpClient, HttpClient
 
 
 @pytest.fixture
@@ -156,3 +157,72 @@ def test_stk_push_simulate_request_invalid_transaction_type():
     with pytest.raises(ValueError) as excinfo:
         StkPushSimulateRequest(**valid_kwargs)
     assert "TransactionType must be one of:" in str(excinfo.value)
+
+
+@pytest.fixture
+def async_stk_push():
+    """Fixture to create an instance of AsyncStkPush with mocked dependencies."""
+    token_manager = MagicMock(spec=AsyncTokenManager)
+    token_manager.get_token.return_value = "test_token"
+    return AsyncStkPush(
+        http_client=MagicMock(spec=AsyncHttpClient), token_manager=token_manager
+    )
+
+
+@pytest.mark.asyncio
+async def test_async_push_success(async_stk_push):
+    """Test that an STK Push transaction can be initiated asynchronously."""
+    request = StkPushSimulateRequest(
+        BusinessShortCode=174379,
+        Password="test_password",
+        Timestamp="20220101010101",
+        TransactionType="CustomerPayBillOnline",
+        Amount=10,
+        PartyA="254700000000",
+        PartyB="174379",
+        PhoneNumber="254700000000",
+        CallBackURL="https://test.com/callback",
+        AccountReference="TestAccount",
+        TransactionDesc="Test Payment",
+    )
+    async_stk_push.http_client.post.return_value = {
+        "MerchantRequestID": "12345",
+        "CheckoutRequestID": "67890",
+        "ResponseCode": 0,
+        "ResponseDescription": "Success",
+        "CustomerMessage": "Success",
+    }
+
+    response = await async_stk_push.push(request)
+
+    assert isinstance(response, StkPushSimulateResponse)
+    assert response.is_successful() is True
+    args, kwargs = async_stk_push.http_client.post.call_args
+    assert args[0] == "/mpesa/stkpush/v1/processrequest"
+    assert kwargs["headers"]["Authorization"] == "Bearer test_token"
+
+
+@pytest.mark.asyncio
+async def test_async_query_success(async_stk_push):
+    """Test that an STK Push transaction can be queried asynchronously."""
+    request = StkPushQueryRequest(
+        BusinessShortCode=174379,
+        Password="test_password",
+        Timestamp="20220101010101",
+        CheckoutRequestID="ws_CO_260520211133524545",
+    )
+    async_stk_push.http_client.post.return_value = {
+        "MerchantRequestID": "12345",
+        "CheckoutRequestID": "ws_CO_260520211133524545",
+        "ResponseCode": 0,
+        "ResponseDescription": "Success",
+        "ResultCode": 0,
+        "ResultDesc": "The service request is processed successfully.",
+    }
+
+    response = await async_stk_push.query(request)
+
+    assert isinstance(response, StkPushQueryResponse)
+    assert response.CheckoutRequestID == "ws_CO_260520211133524545"
+    args, _ = async_stk_push.http_client.post.call_args
+    assert args[0] == "/mpesa/stkpushquery/v1/query"
@@ -1,13 +1,17 @@
 """Unit tests for generate_security_credential in mpesakit.security.get_credential."""
 
 import base64
+import os
 from datetime import datetime, timedelta, timezone
 import pytest
 from cryptography import x509
 from cryptography.hazmat.primitives import hashes, serialization
 from cryptography.hazmat.primitives.asymmetric import ec, padding as asym_padding, rsa
 from cryptography.x509.oid import NameOID
-from mpesakit.security.get_credential import generate_security_credential
+from mpesakit.security.get_credential import (
+    generate_security_credential,
+    load_public_key,
+)
 
 
 def _create_self_signed_cert_rsa(tmp_path):
@@ -111,3 +115,22 @@ def test_generate_security_credential_with_invalid_cert_bytes(tmp_path):
     bad_path.write_bytes(b"not a certificate")
     with pytest.raises(ValueError):
         generate_security_credential("pw", cert_path=str(bad_path))
+
+
+def test_load_public_key_is_cached_until_file_changes(tmp_path):
+    """The public key is loaded once per certificate file version."""
+    _, cert_path = _create_self_signed_cert_rsa(tmp_path)
+    key = load_public_key(cert_path=cert_path)
+    assert load_public_key(cert_path=cert_path) is key
+
+    private_key, _ = _create_self_signed_cert_rsa(tmp_path)
+    os.utime(cert_path, ns=(0, os.stat(cert_path).st_mtime_ns + 1_000_000))
+    reloaded = load_public_key(cert_path=cert_path)
+    assert reloaded is not key
+    assert reloaded.public_numbers() == private_key.public_key().public_numbers()
+
+
+def test_load_public_key_defaults_to_bundled_certificates():
+    """The bundled sandbox and production certificates contain RSA keys."""
+    assert load_public_key("sandbox").key_size >= 2048
+    assert load_public_key("production").key_size >= 2048
@@ -1,10 +1,12 @@
 """Unit tests for the StkPushService facade in mpesakit.services.express module."""
 
+import time
+
 import pytest
 from unittest.mock import MagicMock
-from mpesakit.services.express import StkPushService
-from mpesakit.auth import TokenManager
-from mpesakit.http_client import HttpClient
+from mpesakit.services.express import AsyncStkPushService, StkPushService
+from mpesakit.auth import AsyncTokenManager, TokenManager
+from mpesakit.http_client import AsyncHttpClient, HttpClient, current_deadline
 
 from mpesakit.mpesa_express import (
     StkPushSimulateResponse,
@@ -139,6 +141,34 @@ def test_query_filters_kwargs(stk_push_service, mock_http_client):
     assert not hasattr(resp, "ExtraField")
 
 
+def test_query_applies_timeout(stk_push_service, mock_http_client):
+    """Test that timeout= bounds the request and is not sent to M-Pesa."""
+    deadlines = []
+
+    def post(*args, **kwargs):
+        deadlines.append(current_deadline())
+        return {
+            "MerchantRequestID": "22205-34066-1",
+            "CheckoutRequestID": "ws_CO_13012021093521236557",
+            "ResponseCode": 0,
+            "ResponseDescription": "Accepted",
+            "ResultCode": 0,
+            "ResultDesc": "Processed successfully.",
+        }
+
+    mock_http_client.post.side_effect = post
+    started = time.monotonic()
+    stk_push_service.query(
+        business_short_code=654321,
+        passkey="testpasskey",
+        checkout_request_id="ws_CO_13012021093521236557",
+        timeout=5,
+    )
+    assert started + 5 <= deadlines[0] <= time.monotonic() + 5
+    assert "timeout" not in mock_http_client.post.call_args.kwargs["json"]
+    assert current_deadline() is None
+
+
 def test_stk_push_service_initializes_stk_push_correctly(
     mock_http_client, mock_token_manager
 ):
@@ -151,3 +181,78 @@ def test_stk_push_service_initializes_stk_push_correctly(
     assert service.token_manager is mock_token_manager
     assert service.stk_push.http_client is mock_http_client
     assert service.stk_push.token_manager is mock_token_manager
+
+
+@pytest.fixture
+def mock_async_token_manager():
+    """Creates a mock AsyncTokenManager."""
+    mock = MagicMock(spec=AsyncTokenManager)
+    mock.get_token.return_value = "test_token"
+    return mock
+
+
+@pytest.fixture
+def mock_async_http_client():
+    """Creates a mock AsyncHttpClient."""
+    return MagicMock(spec=AsyncHttpClient)
+
+
+@pytest.fixture
+def async_stk_push_service(mock_async_http_client, mock_async_token_manager):
+    """Creates an AsyncStkPushService instance for testing."""
+    return AsyncStkPushService(
+        http_client=mock_async_http_client,
+        token_manager=mock_async_token_manager,
+    )
+
+
+@pytest.mark.asyncio
+async def test_async_push_success(async_stk_push_service, mock_async_http_client):
+    """Test successful asynchronous STK Push transaction."""
+    mock_async_http_client.post.return_value = {
+        "MerchantRequestID": "16813-1590513-1",
+        "CheckoutRequestID": "ws_CO_DMZ_123212312_2342347678234",
+        "ResponseCode": 0,
+        "ResponseDescription": "Accepted",
+        "CustomerMessage": "Success. Request accepted for processing.",
+    }
+
+    resp = await async_stk_push_service.push(
+        business_short_code=654321,
+        passkey="testpasskey",
+        transaction_type=TransactionType.CUSTOMER_PAYBILL_ONLINE.value,
+        amount=10,
+        party_a="254712345678",
+        party_b="654321",
+        phone_number="254712345678",
+        callback_url="https://example.com/callback",
+        account_reference="Test",
+        transaction_desc="Payment",
+    )
+
+    assert isinstance(resp, StkPushSimulateResponse)
+    assert resp.is_successful() is True
+    mock_async_http_client.post.assert_awaited_once()
+    headers = mock_async_http_client.post.call_args.kwargs["headers"]
+    assert headers["Authorization"] == "Bearer test_token"
+
+
+@pytest.mark.asyncio
+async def test_async_query_success(async_stk_push_service, mock_async_http_client):
+    """Test successful asynchronous STK Push query."""
+    mock_async_http_client.post.return_value = {
+        "MerchantRequestID": "22205-34066-1",
+        "CheckoutRequestID": "ws_CO_13012021093521236557",
+        "ResponseCode": 0,
+        "ResponseDescription": "Accepted",
+        "ResultCode": 0,
+        "ResultDesc": "Processed successfully.",
+    }
+
+    resp = await async_stk_push_service.query(
+        business_short_code=654321,
+        passkey="testpasskey",
+        checkout_request_id="ws_CO_13012021093521236557",
+    )
+    assert isinstance(resp, StkPushQueryResponse)
+    assert resp.is_successful() is True
@@ -2,10 +2,10 @@
 
 import pytest
 from unittest.mock import MagicMock
-from mpesakit.services.transaction import TransactionService
+from mpesakit.services.transaction import AsyncTransactionService, TransactionService
 from mpesakit.transaction_status import TransactionStatusResponse
-from mpesakit.auth import TokenManager
-from mpesakit.http_client import HttpClient
+from mpesakit.auth import AsyncTokenManager, TokenManager
+from mpesakit.http_client import AsyncHttpClient, HttpClient
 
 
 @pytest.fixture
@@ -154,3 +154,32 @@ def test_transaction_service_initializes_correctly(
     )
     assert service.http_client is mock_http_client
     assert service.token_manager is mock_token_manager
+
+
+@pytest.mark.asyncio
+async def test_async_query_status():
+    """Test that AsyncTransactionService awaits the async HTTP client."""
+    token_manager = MagicMock(spec=AsyncTokenManager)
+    token_manager.get_token.return_value = "test_token"
+    http_client = MagicMock(spec=AsyncHttpClient)
+    http_client.post.return_value = {
+        "ConversationID": "AG_20170717_00006c6f7f5b8b6b1a62",
+        "OriginatorConversationID": "12345-67890-1",
+        "ResponseCode": "0",
+        "ResponseDescription": "Accept the service request successfully.",
+    }
+    service = AsyncTransactionService(http_client=http_client, token_manager=token_manager)
+
+    resp = await service.query_status(
+        initiator="testapi",
+        security_credential="encrypted_credential",
+        transaction_id="LKXXXX1234",
+        party_a=600999,
+        identifier_type=4,
+        result_url="https://example.com/result",
+        queue_timeout_url="https://example.com/timeout",
+    )
+    assert isinstance(resp, TransactionStatusResponse)
+    assert resp.is_successful() is True
+    http_client.post.assert_awaited_once()
+    assert http_client.post.call_args.args[0] == "/mpesa/transactionstatus/v1/query"
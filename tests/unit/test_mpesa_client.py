@@ -1,11 +1,29 @@
 """Unit tests for MpesaClient and its services."""
 
+import threading
+import time
+
 import pytest
-from mpesakit.mpesa_client import MpesaClient
-from mpesakit.auth import TokenManager
-from mpesakit.http_client import MpesaHttpClient
+from unittest.mock import AsyncMock, patch
+from mpesakit.mpesa_client import AsyncMpesaClient, MpesaClient
+from mpesakit.auth import AsyncTokenManager, TokenManager, TokenRegistry
+from mpesakit.errors import MpesaApiException, MpesaError
+from mpesakit.http_client import MpesaAsyncHttpClient, MpesaHttpClient, current_deadline
+from mpesakit.http_client.timeouts import request_deadline
+from mpesakit.testing import MockDarajaServer
 
 from mpesakit.services import (
+    AsyncB2BService,
+    AsyncB2CService,
+    AsyncBalanceService,
+    AsyncBillService,
+    AsyncC2BService,
+    AsyncDynamicQRCodeService,
+    AsyncStkPushService,
+    AsyncRatibaService,
+    AsyncReversalService,
+    AsyncTaxService,
+    AsyncTransactionService,
     B2BService,
     B2CService,
     BalanceService,
@@ -89,3 +107,280 @@ def test_c2b_service_instance(client):
 def test_ratiba_service_instance(client):
     """Test that the ratiba service is an instance of RatibaService."""
     assert isinstance(client.ratiba, RatibaService)
+
+
+def test_services_share_http_client(client):
+    """Test that every service facade uses the client's pooled HTTP client."""
+    services = [
+        client.express,
+        client.b2c,
+        client.b2b,
+        client.transactions,
+        client.tax,
+        client.balance,
+        client.reversal,
+        client.bill,
+        client.dynamic_qr,
+        client.c2b,
+        client.ratiba,
+    ]
+    assert all(service.http_client is client.http_client for service in services)
+
+
+def test_shared_http_client_is_used():
+    """Test that a supplied http_client is used instead of creating a new one."""
+    http_client = MpesaHttpClient(pool_maxsize=50)
+    client = MpesaClient("dummy_key", "dummy_secret", http_client=http_client)
+    assert client.http_client is http_client
+    assert client.token_manager.http_client is http_client
+
+
+def test_close_closes_owned_http_client(client):
+    """Test that close() closes an http client created by MpesaClient."""
+    with patch.object(client.http_client, "close") as mock_close:
+        with client:
+            pass
+        mock_close.assert_called_once()
+
+
+def test_close_leaves_shared_http_client_open():
+    """Test that close() does not close an http client supplied by the caller."""
+    http_client = MpesaHttpClient()
+    client = MpesaClient("dummy_key", "dummy_secret", http_client=http_client)
+    with patch.object(http_client, "close") as mock_close:
+        client.close()
+        mock_close.assert_not_called()
+
+
+def test_client_with_token_registry_resolves_tenant_per_call():
+    """Test that a registry-backed client authenticates as the selected tenant."""
+    http_client = MpesaHttpClient()
+    registry = TokenRegistry(http_client)
+    registry.register("key-a", "secret-a")
+    registry.register("key-b", "secret-b")
+    client = MpesaClient(token_registry=registry)
+
+    assert client.http_client is http_client
+    assert client.b2c.token_manager is registry.token_manager
+    with patch.object(
+        http_client,
+        "get",
+        side_effect=lambda url, params=None, headers=None: {
+            "access_token": headers["Authorization"],
+            "expires_in": 3600,
+        },
+    ):
+        with registry.tenant("key-a"):
+            token_a = client.token_manager.get_token()
+        with registry.tenant("key-b"):
+            token_b = client.token_manager.get_token()
+    assert token_a != token_b
+
+    with patch.object(http_client, "close") as mock_close:
+        client.close()
+        mock_close.assert_not_called()
+
+
+def test_client_requires_credentials_or_registry():
+    """Test that MpesaClient rejects missing credentials without a registry."""
+    with pytest.raises(ValueError):
+        MpesaClient()
+
+
+def test_async_client_services():
+    """Test that AsyncMpesaClient wires async facades around one async HTTP client."""
+    client = AsyncMpesaClient("dummy_key", "dummy_secret")
+    assert isinstance(client.http_client, MpesaAsyncHttpClient)
+    assert isinstance(client.token_manager, AsyncTokenManager)
+    expected = {
+        "express": AsyncStkPushService,
+        "b2c": AsyncB2CService,
+        "b2b": AsyncB2BService,
+        "transactions": AsyncTransactionService,
+        "tax": AsyncTaxService,
+        "balance": AsyncBalanceService,
+        "reversal": AsyncReversalService,
+        "bill": AsyncBillService,
+        "dynamic_qr": AsyncDynamicQRCodeService,
+        "c2b": AsyncC2BService,
+        "ratiba": AsyncRatibaService,
+    }
+    for name, service_cls in expected.items():
+        service = getattr(client, name)
+        assert isinstance(service, service_cls)
+        assert service.http_client is client.http_client
+        assert service.token_manager is client.token_manager
+
+
+@pytest.mark.asyncio
+async def test_async_client_context_manager_closes_http_client():
+    """Test that leaving the async context manager closes an owned http client."""
+    client = AsyncMpesaClient("dummy_key", "dummy_secret")
+    with patch.object(client.http_client, "aclose", new_callable=AsyncMock) as mock_close:
+        async with client:
+            pass
+        mock_close.assert_awaited_once()
+
+
+def test_warm_up_prepares_client_and_sets_ready(client):
+    """Test that warm_up() opens connections, fetches a token and marks the client ready."""
+    assert client.ready is False
+    with (
+        patch.object(client.http_client, "warm_up") as mock_warm_up,
+        patch.object(TokenManager, "get_token") as mock_get_token,
+        patch("mpesakit.mpesa_client.load_public_key") as mock_load_key,
+    ):
+        client.warm_up(connections=4)
+    mock_warm_up.assert_called_once_with(4)
+    mock_get_token.assert_called_once_with()
+    mock_load_key.assert_called_once_with("sandbox", None)
+    assert client.ready is True
+
+
+def test_environment_follows_supplied_http_client():
+    """Test that warm_up() loads the certificate of the supplied client's environment."""
+    client = MpesaClient(
+        "key", "secret", http_client=MpesaHttpClient(env="production")
+    )
+    assert client.environment == "production"
+    with (
+        patch.object(client.http_client, "warm_up"),
+        patch.object(TokenManager, "get_token"),
+        patch("mpesakit.mpesa_client.load_public_key") as mock_load_key,
+    ):
+        client.warm_up()
+    mock_load_key.assert_called_once_with("production", None)
+
+    custom = MpesaHttpClient(base_url="http://127.0.0.1:8080")
+    assert MpesaClient("key", "secret", "production", custom).environment == "production"
+    async_client = AsyncMpesaClient(
+        "key", "secret", http_client=MpesaAsyncHttpClient(env="production")
+    )
+    assert async_client.environment == "production"
+
+
+def test_failed_warm_up_leaves_client_not_ready(client):
+    """Test that the client stays not ready if warm-up fails."""
+    with patch.object(client.http_client, "warm_up", side_effect=RuntimeError("down")):
+        with pytest.raises(RuntimeError):
+            client.warm_up()
+    assert client.ready is False
+
+
+def test_warm_up_with_registry_skips_token():
+    """Test that a registry-backed client warms up without selecting a tenant."""
+    http_client = MpesaHttpClient()
+    client = MpesaClient(token_registry=TokenRegistry(http_client))
+    with patch.object(http_client, "warm_up"), patch.object(http_client, "get") as mock_get:
+        client.warm_up()
+    mock_get.assert_not_called()
+    assert client.ready
+
+
+@pytest.mark.asyncio
+async def test_async_warm_up():
+    """Test that AsyncMpesaClient.warm_up() awaits connection and token warm-up."""
+    client = AsyncMpesaClient("dummy_key", "dummy_secret")
+    with (
+        patch.object(client.http_client, "warm_up", new_callable=AsyncMock) as mock_warm_up,
+        patch.object(AsyncTokenManager, "get_token", new_callable=AsyncMock),
+    ):
+        await client.warm_up(connections=2)
+    mock_warm_up.assert_awaited_once_with(2)
+    assert client.ready
+
+
+def _failing_call(delay, fail=False):
+    time.sleep(delay)
+    if fail:
+        raise MpesaApiException(MpesaError(error_code="HTTP_500", status_code=500))
+    return delay
+
+
+def test_map_yields_results_and_errors_as_they_complete(client):
+    """Test that map() yields each call's outcome, fastest first."""
+    outcomes = list(
+        client.map(
+            _failing_call,
+            [{"delay": 0.2}, {"delay": 0.0, "fail": True}, {"delay": 0.1}],
+        )
+    )
+    assert isinstance(outcomes[0], MpesaApiException)
+    assert outcomes[1:] == [0.1, 0.2]
+
+
+def test_ordered_map_keeps_input_order(client):
+    """Test that ordered=True yields outcomes in the order of the arguments."""
+    delays = [0.1, 0.0, 0.05]
+    outcomes = client.map(_failing_call, ({"delay": d} for d in delays), ordered=True)
+    assert list(outcomes) == delays
+
+
+def test_map_bounds_calls_in_flight(client):
+    """Test that at most max_workers calls of a map run at a time."""
+    lock = threading.Lock()
+    running = []
+    peak = []
+
+    def call(i):
+        with lock:
+            running.append(i)
+            peak.append(len(running))
+        time.sleep(0.01)
+        with lock:
+            running.remove(i)
+        return i
+
+    results = client.map(call, ({"i": i} for i in range(20)), max_workers=3)
+    assert sorted(results) == list(range(20))
+    assert max(peak) == 3
+
+
+def test_map_stopped_early_cancels_pending_calls(client):
+    """Test that abandoning the iterator leaves later arguments unsent."""
+    started = []
+
+    def call(i):
+        started.append(i)
+        return i
+
+    outcomes = client.map(call, ({"i": i} for i in range(100)), max_workers=2, ordered=True)
+    assert next(outcomes) == 0
+    outcomes.close()
+    assert len(started) <= 4
+
+
+def test_map_rejects_empty_window(client):
+    """Test that max_workers must allow at least one call."""
+    with pytest.raises(ValueError):
+        list(client.map(_failing_call, [{"delay": 0}], max_workers=0))
+    with pytest.raises(ValueError):
+        MpesaClient("dummy_key", "dummy_secret", max_workers=0)
+
+
+def test_submit_runs_in_callers_context(client):
+    """Test that a submitted call sees the caller's request deadline."""
+    with request_deadline(timeout=30):
+        future = client.submit(current_deadline)
+        assert future.result() == current_deadline()
+    assert client.submit(current_deadline).result() is None
+
+
+def test_map_service_method_by_name():
+    """Test fanning out STK push queries by method name over the pooled client."""
+    with MockDarajaServer() as server:
+        with MpesaClient(
+            "key", "secret", http_client=MpesaHttpClient(base_url=server.url)
+        ) as client:
+            queries = [
+                {
+                    "business_short_code": 174379,
+                    "checkout_request_id": f"ws_CO_{i}",
+                    "passkey": "passkey",
+                }
+                for i in range(20)
+            ]
+            responses = list(client.map("express.query", queries, ordered=True))
+            stats = client.http_client.transport_stats()
+    assert [r.CheckoutRequestID for r in responses] == [f"ws_CO_{i}" for i in range(20)]
+    assert stats["connections_opened"] <= client.max_workers
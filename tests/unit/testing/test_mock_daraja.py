@@ -0,0 +1,217 @@
+"""Unit tests for the local mock Daraja server."""
+
+import base64
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+import pytest
+import requests
+
+from mpesakit import MpesaClient
+from mpesakit.errors import MpesaApiException
+from mpesakit.http_client import MpesaAsyncHttpClient, MpesaHttpClient, RetryPolicy
+from mpesakit.mpesa_express.schemas import StkPushSimulateCallback
+from mpesakit.testing import ROUTES, Faults, Latency, MockDarajaServer
+
+STK_PUSH = "/mpesa/stkpush/v1/processrequest"
+QUERY = "/mpesa/stkpushquery/v1/query"
+
+
+@pytest.fixture
+def server():
+    """A running mock server without latency or faults."""
+    with MockDarajaServer() as server:
+        yield server
+
+
+@pytest.fixture
+def callbacks():
+    """A local endpoint collecting the callbacks posted to it."""
+    received = []
+    arrived = threading.Event()
+
+    class _Receiver(BaseHTTPRequestHandler):
+        def do_POST(self):
+            length = int(self.headers["Content-Length"])
+            received.append(json.loads(self.rfile.read(length)))
+            self.send_response(200)
+            self.end_headers()
+            arrived.set()
+
+        def log_message(self, *args):
+            pass
+
+    httpd = HTTPServer(("127.0.0.1", 0), _Receiver)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    url = f"http://127.0.0.1:{httpd.server_address[1]}/callback"
+    yield url, received, arrived
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def _token(server):
+    credentials = base64.b64encode(b"key:secret").decode()
+    response = requests.get(
+        f"{server.url}/oauth/v1/generate?grant_type=client_credentials",
+        headers={"Authorization": f"Basic {credentials}"},
+        timeout=5,
+    )
+    return response.json()["access_token"]
+
+
+def _stk_push(client, callback_url="https://example.com/callback"):
+    return client.stk_push(
+        business_short_code=174379,
+        transaction_type="CustomerPayBillOnline",
+        amount=10,
+        party_a="254712345678",
+        party_b="174379",
+        phone_number="254712345678",
+        callback_url=callback_url,
+        account_reference="order-1",
+        transaction_desc="Payment",
+        passkey="passkey",
+    )
+
+
+@pytest.mark.parametrize("path", sorted(ROUTES))
+def test_every_route_answers_with_a_schema_valid_response(server, path):
+    """Test that each route's response validates against its mpesakit schema."""
+    response = requests.post(
+        f"{server.url}{path}",
+        json={"CheckoutRequestID": "ws_CO_1"},
+        headers={"Authorization": f"Bearer {_token(server)}"},
+        timeout=5,
+    )
+    assert response.status_code == 200
+    ROUTES[path].response.model_validate(response.json())
+
+
+def test_requests_need_an_issued_token(server):
+    """Test that an unknown token is rejected like Daraja rejects it."""
+    response = requests.post(
+        f"{server.url}{QUERY}", json={}, headers={"Authorization": "Bearer nope"}, timeout=5
+    )
+    assert response.status_code == 401
+    assert response.json()["errorCode"] == "404.001.03"
+    response = requests.get(f"{server.url}/oauth/v1/generate", timeout=5)
+    assert response.status_code == 400
+
+
+def test_client_flow_with_callback(server, callbacks):
+    """Test an STK push and query through MpesaClient, and the push's callback."""
+    url, received, arrived = callbacks
+    with MpesaHttpClient(base_url=server.url) as http_client:
+        client = MpesaClient("key", "secret", http_client=http_client)
+        pushed = _stk_push(client, callback_url=url)
+        queried = client.stk_query(
+            business_short_code=174379,
+            checkout_request_id=pushed.CheckoutRequestID,
+            passkey="passkey",
+        )
+    assert pushed.is_successful()
+    assert queried.CheckoutRequestID == pushed.CheckoutRequestID
+
+    assert arrived.wait(5)
+    callback = StkPushSimulateCallback.model_validate(received[0])
+    assert callback.Body.stkCallback.CheckoutRequestID == pushed.CheckoutRequestID
+    assert server.stats()["requests"] == {
+        "/oauth/v1/generate": 1,
+        STK_PUSH: 1,
+        QUERY: 1,
+    }
+
+
+def test_failed_callbacks_are_injected(callbacks):
+    """Test that callback_failure_rate makes callbacks report a failure."""
+    url, received, arrived = callbacks
+    with MockDarajaServer(faults=Faults(callback_failure_rate=1)) as server:
+        client = MpesaClient(
+            "key", "secret", http_client=MpesaHttpClient(base_url=server.url)
+        )
+        _stk_push(client, callback_url=url)
+        assert arrived.wait(5)
+    callback = StkPushSimulateCallback.model_validate(received[0])
+    assert callback.Body.stkCallback.ResultCode == 1032
+    assert callback.Body.stkCallback.CallbackMetadata is None
+
+
+def test_throttling_and_errors_are_injected():
+    """Test that injected throttling carries Retry-After and errors their status."""
+    faults = {STK_PUSH: Faults(throttle_rate=1, retry_after=7), QUERY: Faults(error_rate=1)}
+    with MockDarajaServer(endpoint_faults=faults) as server:
+        headers = {"Authorization": f"Bearer {_token(server)}"}
+        throttled = requests.post(
+            f"{server.url}{STK_PUSH}", json={}, headers=headers, timeout=5
+        )
+        failed = requests.post(f"{server.url}{QUERY}", json={}, headers=headers, timeout=5)
+        stats = server.stats()
+    assert throttled.status_code == 429
+    assert throttled.headers["Retry-After"] == "7"
+    assert throttled.json()["errorCode"] == "500.003.02"
+    assert failed.status_code == 500
+    assert stats["throttled"] == 1 and stats["errors"] == 1
+
+
+def test_client_backs_off_after_injected_throttling():
+    """Test that the client's cool-down reacts to the mock's throttling."""
+    faults = Faults(throttle_rate=1, retry_after=30)
+    with MockDarajaServer(endpoint_faults={STK_PUSH: faults}) as server:
+        http_client = MpesaHttpClient(
+            base_url=server.url, retry_policy=RetryPolicy(max_attempts=1)
+        )
+        client = MpesaClient("key", "secret", http_client=http_client)
+        with pytest.raises(MpesaApiException) as excinfo:
+            _stk_push(client)
+    assert excinfo.value.error_code == "HTTP_429"
+    assert http_client.cooldowns.remaining(STK_PUSH) > 25
+
+
+def test_latency_distributions():
+    """Test that samples follow the configured distribution and are never negative."""
+    rng = random.SystemRandom()
+    assert Latency(mean=0.3).sample(rng) == 0.3
+    assert all(
+        0.1 <= Latency(distribution="uniform", mean=0.2, spread=0.1).sample(rng) <= 0.3
+        for _ in range(100)
+    )
+    assert all(
+        Latency(distribution="normal", mean=0.0, spread=1.0).sample(rng) >= 0
+        for _ in range(100)
+    )
+    assert Latency(distribution="exponential").sample(rng) == 0.0
+
+
+def test_endpoint_latency_delays_answers():
+    """Test that per-endpoint latency applies only to its endpoint."""
+    with MockDarajaServer(endpoint_latency={QUERY: Latency(mean=0.2)}) as server:
+        headers = {"Authorization": f"Bearer {_token(server)}"}
+        started = time.monotonic()
+        requests.post(f"{server.url}{STK_PUSH}", json={}, headers=headers, timeout=5)
+        fast = time.monotonic() - started
+        started = time.monotonic()
+        requests.post(f"{server.url}{QUERY}", json={}, headers=headers, timeout=5)
+        slow = time.monotonic() - started
+    assert fast < 0.15 <= slow
+
+
+@pytest.mark.asyncio
+async def test_async_client_against_mock(server):
+    """Test that the async client can use the mock server too."""
+    client = MpesaAsyncHttpClient(base_url=server.url)
+    token = await client.get(
+        "/oauth/v1/generate",
+        params={"grant_type": "client_credentials"},
+        headers={"Authorization": "Basic " + base64.b64encode(b"k:s").decode()},
+    )
+    response = await client.post(
+        QUERY,
+        json={"CheckoutRequestID": "ws_CO_1"},
+        headers={"Authorization": f"Bearer {token['access_token']}"},
+    )
+    assert response["CheckoutRequestID"] == "ws_CO_1"
+    await client.aclose()